@@ -0,0 +1,30 @@
+"""Add lower(name) index on cpu for case-insensitive lookups
+
+Revision ID: 0031
+Revises: 0030
+Create Date: 2026-10-18 00:00:00.000000
+
+Import commits match auto-created CPU names against the catalog with
+``lower(name) IN (...)``; this expression index serves that lookup.
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0031"
+down_revision: str | Sequence[str] | None = "0030"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index("ix_cpu_name_lower", "cpu", [sa.text("lower(name)")], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_cpu_name_lower", table_name="cpu")
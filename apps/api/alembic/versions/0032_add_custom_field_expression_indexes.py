@@ -0,0 +1,90 @@
+"""Add expression indexes for custom field values in attributes_json
+
+Revision ID: 0032
+Revises: 0031
+Create Date: 2026-10-18 00:00:00.000000
+
+Custom field values live in ``attributes_json``; usage counts, distinct
+value autocomplete and filters on them scanned every row. This creates a
+B-tree index on ``attributes_json ->> '<key>'`` for each existing custom
+field and, when ``pg_trgm`` is available, a trigram GIN index on its
+lower-cased value for substring search. Fields defined later get their
+indexes from ``CustomFieldService``.
+"""
+
+import hashlib
+import re
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0032"
+down_revision: str | Sequence[str] | None = "0031"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+ENTITY_TABLES = {
+    "listing": "listing",
+    "cpu": "cpu",
+    "gpu": "gpu",
+    "ports_profile": "ports_profile",
+}
+
+
+def _index_name(table: str, key: str, suffix: str = "") -> str:
+    # Mirrors dealbrain_api.services.custom_field_indexes.index_name
+    safe_key = re.sub(r"[^a-z0-9_]+", "_", key.lower())
+    digest = hashlib.sha256(key.encode()).hexdigest()[:8]
+    prefix = f"ix_cf_{table}_"
+    safe_key = safe_key[: 63 - len(prefix) - len(suffix) - 9]
+    return f"{prefix}{safe_key}_{digest}{suffix}"
+
+
+def _has_trigram(bind) -> bool:
+    if bind.dialect.name != "postgresql":
+        return False
+    # The extension needs privileges the migration role may lack; indexes
+    # fall back to B-tree only in that case
+    try:
+        with bind.begin_nested():
+            bind.execute(sa.text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+    except sa.exc.DBAPIError:
+        return False
+    return True
+
+
+def _custom_fields(bind) -> list[tuple[str, str]]:
+    rows = bind.execute(
+        sa.text("SELECT entity, key FROM custom_field_definition WHERE deleted_at IS NULL")
+    )
+    return [(entity, key) for entity, key in rows if entity in ENTITY_TABLES]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    bind = op.get_bind()
+    if bind.dialect.name not in {"postgresql", "sqlite"}:
+        return
+    trigram = _has_trigram(bind)
+    for entity, key in _custom_fields(bind):
+        table = ENTITY_TABLES[entity]
+        value = "(attributes_json ->> '{}')".format(key.replace("'", "''"))
+        op.execute(f"CREATE INDEX IF NOT EXISTS {_index_name(table, key)} ON {table} ({value})")
+        if trigram:
+            op.execute(
+                f"CREATE INDEX IF NOT EXISTS {_index_name(table, key, '_trgm')} "
+                f"ON {table} USING gin (lower{value} gin_trgm_ops)"
+            )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    bind = op.get_bind()
+    if bind.dialect.name not in {"postgresql", "sqlite"}:
+        return
+    for entity, key in _custom_fields(bind):
+        table = ENTITY_TABLES[entity]
+        op.execute(f"DROP INDEX IF EXISTS {_index_name(table, key)}")
+        op.execute(f"DROP INDEX IF EXISTS {_index_name(table, key, '_trgm')}")
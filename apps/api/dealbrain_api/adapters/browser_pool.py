@@ -1,45 +1,162 @@
-"""Browser pool for managing reusable Playwright browser instances."""
+"""Shared Playwright browser pool that multiplexes contexts for several tenants.
+
+Scraping (PlaywrightAdapter) and card rendering (ImageGenerationService) both
+lend contexts from the same few Chromium processes, each as a separate tenant
+with its own concurrency quota and context defaults.
+"""
 
 from __future__ import annotations
 
 import asyncio
-import logging
+from dataclasses import dataclass, field
 from typing import Any
+from urllib.parse import urlparse
+
+from dealbrain_api.settings import get_settings
+from dealbrain_api.telemetry import get_logger
+from playwright.async_api import Browser, BrowserContext, Route, async_playwright
+
+logger = get_logger("dealbrain.adapters.browser_pool")
+
+# Anti-detection defaults applied to every context
+DEFAULT_VIEWPORT = {"width": 1920, "height": 1080}
+DEFAULT_USER_AGENT = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+    "(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+)
+WEBDRIVER_OVERRIDE_SCRIPT = """
+Object.defineProperty(navigator, 'webdriver', {
+    get: () => undefined
+});
+"""
+
+# Upper bound on concurrent contexts multiplexed over one browser
+MAX_CONTEXTS_PER_BROWSER = 32
+
+# Built-in tenants
+SCRAPING_TENANT = "scraping"
+RENDERING_TENANT = "rendering"
+
+# Resource types that are never needed for data extraction
+BLOCKED_RESOURCE_TYPES = frozenset({"image", "font", "media"})
+
+# Ad/tracking hosts blocked by request interception (matched by domain suffix)
+BLOCKED_HOST_SUFFIXES = (
+    "doubleclick.net",
+    "googlesyndication.com",
+    "googleadservices.com",
+    "google-analytics.com",
+    "googletagmanager.com",
+    "googletagservices.com",
+    "amazon-adsystem.com",
+    "adnxs.com",
+    "adsrvr.org",
+    "criteo.com",
+    "criteo.net",
+    "facebook.net",
+    "scorecardresearch.com",
+    "taboola.com",
+    "outbrain.com",
+    "moatads.com",
+)
+
+
+def is_blocked_request(resource_type: str, url: str) -> bool:
+    """
+    Decide whether a browser request should be aborted.
+
+    Args:
+        resource_type: Playwright resource type (document, image, font, ...)
+        url: Request URL
+
+    Returns:
+        True if the request is an image/font/media asset or targets an ad host
+    """
+    if resource_type in BLOCKED_RESOURCE_TYPES:
+        return True
+
+    host = (urlparse(url).hostname or "").lower()
+    return any(host == suffix or host.endswith(f".{suffix}") for suffix in BLOCKED_HOST_SUFFIXES)
+
+
+@dataclass
+class BrowserTenant:
+    """
+    A use case sharing the pool, with its own quota and context defaults.
+
+    Attributes:
+        name: Tenant identifier (e.g. "scraping", "rendering")
+        max_contexts: Maximum contexts this tenant may hold concurrently
+        block_resources: Abort image/font/media and ad requests in its contexts
+        stealth: Apply anti-detection user agent, viewport and webdriver override
+        timeout_ms: Default operation timeout for its contexts (None uses the pool's)
+    """
+
+    name: str
+    max_contexts: int
+    block_resources: bool = True
+    stealth: bool = True
+    timeout_ms: int | None = None
+    in_use: int = 0
+    acquired_total: int = 0
+    waits_total: int = 0
+
 
-from playwright.async_api import Browser, async_playwright
+@dataclass
+class _BrowserSlot:
+    """Bookkeeping for one pooled browser and the contexts it is serving."""
 
-logger = logging.getLogger(__name__)
+    browser: Browser
+    active_contexts: int = 0
+    request_count: int = 0
+    memory_mb: float | None = None
+    draining: bool = False
+    relaunching: bool = False
+    generation: int = 0
+    contexts: set[BrowserContext] = field(default_factory=set)
 
 
 class BrowserPool:
     """
-    Singleton browser pool for application-wide browser reuse.
+    Singleton pool that lends lightweight browser contexts from a few browsers.
 
-    Maintains a pool of 2-3 reusable Chromium browser instances to amortize
-    the high startup cost (~1-2s per browser launch). This is critical for
-    achieving <10s latency per Playwright request.
+    The pool is shared by every Playwright use case in the process. Each use
+    case registers as a tenant with its own concurrency quota, so a burst of
+    scraping cannot starve card rendering (or vice versa) and both share a
+    single set of warm Chromium processes.
+
+    Launching a Chromium process costs ~1-2s and 150-300MB of RAM, while a
+    ``BrowserContext`` (an isolated, incognito-like session) costs a few MB
+    and ~10-30ms. The pool therefore launches a small number of browsers and
+    multiplexes many concurrent contexts over each one.
 
     Architecture:
     ------------
     - Singleton pattern: One pool per application lifecycle
-    - Async context manager: Proper cleanup on shutdown
-    - Auto-restart: Crashed browsers are automatically restarted
-    - Thread-safe: Uses asyncio.Lock for concurrent access
+    - Slots: One slot per browser, each with its own context concurrency limit
+    - Tenants: Per-use-case quotas and context defaults (scraping, rendering)
+    - Least-loaded routing: New contexts go to the slot with fewest active contexts
+    - Request interception: Images, fonts, media and ad hosts are aborted
+    - Recycling: Slots drain and relaunch after ``max_requests_per_browser``
+      contexts or when browser RSS exceeds ``max_browser_memory_mb``
+    - Auto-restart: Crashed browsers are relaunched on next acquire or health check
+    - Loop affinity: The pool re-initializes when used from a new event loop
+      (Celery tasks share one persistent loop per worker process to keep it warm)
 
     Usage:
     -----
     ```python
-    pool = BrowserPool.get_instance(pool_size=3)
-    await pool.initialize()
+    pool = BrowserPool.shared()
+    await pool.warm_up()
 
-    # Acquire browser for use
-    browser = await pool.acquire()
+    # Acquire an isolated context for one scrape
+    context = await pool.acquire(tenant=SCRAPING_TENANT)
     try:
-        page = await browser.new_page()
+        page = await context.new_page()
         await page.goto("https://example.com")
         # ... use page ...
     finally:
-        await pool.release(browser)
+        await pool.release(context)
 
     # Cleanup on shutdown
     await pool.close_all()
@@ -48,21 +165,17 @@ class BrowserPool:
     Performance:
     -----------
     - Browser launch: ~1-2s (amortized across pool)
-    - Page creation: ~50-100ms (per request)
-    - Pool reuse: ~10-20ms overhead (lock acquisition)
-    - Target latency: <10s per full extraction
-
-    Configuration:
-    -------------
-    - pool_size: Number of browser instances (default: 3)
-    - headless: Run in headless mode (default: True)
-    - timeout_ms: Browser operation timeout (default: 30000)
+    - Context creation: ~10-30ms (per request)
+    - Capacity: pool_size * max_contexts_per_browser concurrent scrapes
+    - Blocking images/fonts cuts page weight and load time substantially
 
     Thread Safety:
     -------------
-    - acquire() uses asyncio.Lock to prevent race conditions
-    - release() is thread-safe
-    - close_all() can be called from any async context
+    - Slot selection and bookkeeping happen under an asyncio.Condition
+    - acquire() waits on the condition until a slot has free capacity
+    - release() wakes waiters once a context slot frees up
+    - Browser relaunches run outside the lock on slots marked as relaunching,
+      so a slow restart does not block the healthy slots
     """
 
     _instance: BrowserPool | None = None
@@ -74,6 +187,10 @@ class BrowserPool:
         headless: bool = True,
         timeout_ms: int = 30000,
         max_requests_per_browser: int = 50,
+        max_contexts_per_browser: int = 8,
+        block_resources: bool = True,
+        max_browser_memory_mb: int | None = 1024,
+        memory_check_interval: int = 10,
     ):
         """
         Initialize browser pool.
@@ -82,31 +199,55 @@ class BrowserPool:
             pool_size: Number of browser instances to maintain (1-10)
             headless: Run browsers in headless mode (required for Docker)
             timeout_ms: Browser operation timeout in milliseconds
-            max_requests_per_browser: Maximum requests before recycling browser (default: 50)
+            max_requests_per_browser: Contexts served before recycling a browser (default: 50)
+            max_contexts_per_browser: Concurrent contexts allowed per browser (1-32)
+            block_resources: Abort image/font/media and ad requests (default: True)
+            max_browser_memory_mb: Recycle a browser once its RSS exceeds this (None disables)
+            memory_check_interval: Sample browser memory every N released contexts
         """
         if not 1 <= pool_size <= 10:
             raise ValueError(f"pool_size must be between 1-10, got {pool_size}")
+        if not 1 <= max_contexts_per_browser <= MAX_CONTEXTS_PER_BROWSER:
+            raise ValueError(
+                f"max_contexts_per_browser must be between 1-{MAX_CONTEXTS_PER_BROWSER}, "
+                f"got {max_contexts_per_browser}"
+            )
 
         self.pool_size = pool_size
         self.headless = headless
         self.timeout_ms = timeout_ms
         self.max_requests_per_browser = max_requests_per_browser
+        self.max_contexts_per_browser = max_contexts_per_browser
+        self.block_resources = block_resources
+        self.max_browser_memory_mb = max_browser_memory_mb
+        self.memory_check_interval = max(1, memory_check_interval)
 
         # Pool state
         self._playwright_context: Any = None
-        self._browsers: list[Browser] = []
-        self._available: asyncio.Queue[Browser] = asyncio.Queue()
-        self._in_use: set[Browser] = set()
+        self._slots: list[_BrowserSlot] = []
+        self._context_slots: dict[BrowserContext, _BrowserSlot] = {}
         self._initialized = False
         self._access_lock = asyncio.Lock()
+        self._slot_available = asyncio.Condition(self._access_lock)
+        self._loop: asyncio.AbstractEventLoop | None = None
+        # Keeps background browser relaunches referenced until they finish
+        self._relaunch_tasks: set[asyncio.Task[None]] = set()
 
-        # Tracking for browser recycling
-        self._browser_request_counts: dict[Browser, int] = {}
+        # Tenants sharing the pool; scraping may use the full capacity by default
+        self._tenants: dict[str, BrowserTenant] = {}
+        self._context_tenants: dict[BrowserContext, BrowserTenant] = {}
+        self.register_tenant(SCRAPING_TENANT, max_contexts=self.capacity)
+
+        # Counters for monitoring
+        self._recycled_total = 0
+        self._blocked_requests_total = 0
 
         logger.info(
             f"BrowserPool created with pool_size={pool_size}, "
+            f"max_contexts_per_browser={max_contexts_per_browser}, "
             f"headless={headless}, timeout_ms={timeout_ms}, "
-            f"max_requests_per_browser={max_requests_per_browser}"
+            f"max_requests_per_browser={max_requests_per_browser}, "
+            f"max_browser_memory_mb={max_browser_memory_mb}"
         )
 
     @classmethod
@@ -116,6 +257,9 @@ class BrowserPool:
         headless: bool = True,
         timeout_ms: int = 30000,
         max_requests_per_browser: int = 50,
+        max_contexts_per_browser: int = 8,
+        block_resources: bool = True,
+        max_browser_memory_mb: int | None = 1024,
     ) -> BrowserPool:
         """
         Get or create singleton BrowserPool instance.
@@ -128,6 +272,9 @@ class BrowserPool:
             headless: Run in headless mode (only used on first call)
             timeout_ms: Browser timeout (only used on first call)
             max_requests_per_browser: Max requests before recycling (only used on first call)
+            max_contexts_per_browser: Concurrent contexts per browser (only used on first call)
+            block_resources: Abort heavy/ad requests (only used on first call)
+            max_browser_memory_mb: Memory recycling threshold (only used on first call)
 
         Returns:
             Singleton BrowserPool instance
@@ -138,10 +285,115 @@ class BrowserPool:
                 headless=headless,
                 timeout_ms=timeout_ms,
                 max_requests_per_browser=max_requests_per_browser,
+                max_contexts_per_browser=max_contexts_per_browser,
+                block_resources=block_resources,
+                max_browser_memory_mb=max_browser_memory_mb,
             )
             logger.info("Created singleton BrowserPool instance")
         return cls._instance
 
+    @classmethod
+    def shared(cls) -> BrowserPool:
+        """
+        Get the process-wide pool configured from settings with both tenants.
+
+        Browser-level settings come from ``settings.ingestion.playwright``;
+        the rendering tenant quota and timeout come from ``settings.playwright``.
+        Each browser gets extra context slots for the rendering quota on top
+        of scraping's ``max_contexts_per_browser``, so scraping keeps its full
+        configured capacity and cannot starve rendering. Only when that would
+        exceed the per-browser limit of 32 contexts is the rendering quota
+        taken out of scraping's. Each tenant's contexts use its own timeout.
+
+        Returns:
+            Singleton BrowserPool with scraping and rendering tenants registered
+        """
+        settings = get_settings()
+        scraping = settings.ingestion.playwright
+        rendering = settings.playwright
+        rendering_quota = rendering.max_concurrent_browsers
+        # Spread the rendering quota over the browsers, rounding up
+        rendering_per_browser = -(-rendering_quota // scraping.pool_size)
+        pool = cls.get_instance(
+            pool_size=scraping.pool_size,
+            # Browsers are shared, so run headed only when no tenant needs headless
+            headless=scraping.headless or rendering.headless,
+            timeout_ms=scraping.timeout_s * 1000,
+            max_contexts_per_browser=min(
+                scraping.max_contexts_per_browser + rendering_per_browser,
+                MAX_CONTEXTS_PER_BROWSER,
+            ),
+            block_resources=scraping.block_resources,
+            max_browser_memory_mb=scraping.max_browser_memory_mb,
+        )
+        if RENDERING_TENANT not in pool._tenants:
+            # Scraping always keeps at least one slot
+            reserved = min(rendering_quota, pool.capacity - 1)
+            pool.register_tenant(
+                SCRAPING_TENANT,
+                max_contexts=min(
+                    scraping.pool_size * scraping.max_contexts_per_browser,
+                    pool.capacity - reserved,
+                ),
+                block_resources=scraping.block_resources,
+                timeout_ms=scraping.timeout_s * 1000,
+            )
+            pool.register_tenant(
+                RENDERING_TENANT,
+                max_contexts=max(reserved, 1),
+                block_resources=False,
+                stealth=False,
+                timeout_ms=rendering.browser_timeout_ms,
+            )
+        return pool
+
+    def register_tenant(
+        self,
+        name: str,
+        max_contexts: int,
+        block_resources: bool = True,
+        stealth: bool = True,
+        timeout_ms: int | None = None,
+    ) -> BrowserTenant:
+        """
+        Register (or reconfigure) a tenant sharing this pool.
+
+        Args:
+            name: Tenant identifier
+            max_contexts: Concurrent context quota for the tenant
+            block_resources: Abort heavy/ad requests in the tenant's contexts
+            stealth: Apply anti-detection context defaults
+            timeout_ms: Default timeout for the tenant's contexts (None uses the pool's)
+
+        Returns:
+            The registered BrowserTenant
+
+        Raises:
+            ValueError: If max_contexts is not positive
+        """
+        if max_contexts < 1:
+            raise ValueError(f"max_contexts must be positive, got {max_contexts}")
+
+        tenant = self._tenants.get(name)
+        if tenant is None:
+            tenant = BrowserTenant(name=name, max_contexts=max_contexts)
+            self._tenants[name] = tenant
+        tenant.max_contexts = max_contexts
+        tenant.block_resources = block_resources
+        tenant.stealth = stealth
+        tenant.timeout_ms = timeout_ms
+        return tenant
+
+    @property
+    def capacity(self) -> int:
+        """Maximum number of concurrent contexts the pool can lend."""
+        return self.pool_size * self.max_contexts_per_browser
+
+    @property
+    def _browsers(self) -> list[Browser]:
+        """Browsers currently owned by the pool."""
+        return [slot.browser for slot in self._slots]
+
     async def initialize(self) -> None:
         """
         Initialize the browser pool by launching all browser instances.
@@ -150,12 +402,13 @@ class BrowserPool:
         the pool. It launches all browsers concurrently to minimize startup time.
 
         Raises:
-            RuntimeError: If pool is already initialized
             Exception: If browser launch fails
         """
+        self._check_event_loop()
+
         async with self._access_lock:
             if self._initialized:
-                logger.warning("BrowserPool already initialized, skipping")
+                logger.debug("BrowserPool already initialized, skipping")
                 return
 
             logger.info(f"Initializing BrowserPool with {self.pool_size} browsers...")
@@ -168,33 +421,109 @@ class BrowserPool:
                 launch_tasks = [self._launch_browser() for _ in range(self.pool_size)]
                 browsers = await asyncio.gather(*launch_tasks)
 
-                # Add browsers to pool and initialize request counts
-                self._browsers = browsers
-                for browser in browsers:
-                    await self._available.put(browser)
-                    self._browser_request_counts[browser] = 0
-
+                self._slots = [_BrowserSlot(browser=browser) for browser in browsers]
+                self._loop = asyncio.get_running_loop()
                 self._initialized = True
                 logger.info(
-                    f"BrowserPool initialized successfully with {len(self._browsers)} browsers"
+                    f"BrowserPool initialized successfully with {len(self._slots)} browsers "
+                    f"({self.capacity} context slots)"
                 )
 
             except Exception as e:
                 logger.error(f"Failed to initialize BrowserPool: {e}", exc_info=True)
                 # Cleanup any partially launched browsers
                 await self._cleanup_browsers()
+                self._slots.clear()
                 raise
 
+    def _check_event_loop(self) -> None:
+        """
+        Drop pool state that belongs to a different (usually closed) event loop.
+
+        Playwright connections and asyncio primitives are bound to the loop
+        they were created on. A pool initialized on another loop (e.g. one
+        that has since been closed) cannot be reused and must be
+        re-initialized on the current loop.
+        """
+        loop = asyncio.get_running_loop()
+        if self._loop is None or self._loop is loop:
+            return
+
+        logger.warning("BrowserPool bound to a previous event loop, re-initializing")
+        self._playwright_context = None
+        self._slots = []
+        self._context_slots.clear()
+        self._context_tenants.clear()
+        for tenant in self._tenants.values():
+            tenant.in_use = 0
+        self._access_lock = asyncio.Lock()
+        self._slot_available = asyncio.Condition(self._access_lock)
+        self._initialized = False
+        self._loop = None
+
+    async def warm_up(self) -> dict[str, Any]:
+        """
+        Launch browsers ahead of the first request and verify they are healthy.
+
+        Intended for process startup so the first scrape or card render does
+        not pay browser launch cost.
+
+        Returns:
+            Result of health_check() after initialization
+        """
+        await self.initialize()
+        health = await self.health_check()
+        logger.info("BrowserPool warmed up", **health)
+        return health
+
+    async def health_check(self) -> dict[str, Any]:
+        """
+        Check browser liveness and repair crashed browsers.
+
+        Idle browsers that are no longer connected are relaunched right away;
+        busy ones are marked as draining so they are replaced once idle.
+
+        Returns:
+            Dictionary with healthy flag, connected/total browsers and relaunch count
+        """
+        if not self._initialized:
+            return {"healthy": False, "connected": 0, "total": 0, "relaunched": 0}
+
+        stale: list[_BrowserSlot] = []
+        async with self._slot_available:
+            for slot in self._slots:
+                if slot.relaunching or slot.browser.is_connected():
+                    continue
+                if slot.active_contexts == 0:
+                    self._mark_relaunching(slot)
+                    stale.append(slot)
+                else:
+                    slot.draining = True
+            self._slot_available.notify_all()
+
+        results = await asyncio.gather(
+            *(self._relaunch_slot(slot, reason="health_check") for slot in stale),
+            return_exceptions=True,
+        )
+        relaunched = 0
+        for result in results:
+            if isinstance(result, Exception):
+                logger.error(f"Health check failed to relaunch browser: {result}")
+            else:
+                relaunched += 1
+
+        connected = sum(1 for slot in self._slots if slot.browser.is_connected())
+        return {
+            "healthy": connected == len(self._slots),
+            "connected": connected,
+            "total": len(self._slots),
+            "relaunched": relaunched,
+        }
+
     async def _launch_browser(self) -> Browser:
         """
         Launch a single browser instance with anti-detection settings.
 
-        Configures browser with:
-        - Realistic User-Agent
-        - Standard viewport (1920x1080)
-        - Disabled automation signals
-        - WebDriver override via init script
-
         Returns:
             Launched Browser instance
 
@@ -218,106 +547,325 @@ class BrowserPool:
             logger.error(f"Failed to launch browser: {e}", exc_info=True)
             raise
 
-    async def acquire(self) -> Browser:
+    def _needs_recycle(self, slot: _BrowserSlot) -> bool:
+        """Check whether a slot has hit its request or memory budget."""
+        if slot.request_count >= self.max_requests_per_browser:
+            return True
+        return (
+            self.max_browser_memory_mb is not None
+            and slot.memory_mb is not None
+            and slot.memory_mb >= self.max_browser_memory_mb
+        )
+
+    def _mark_relaunching(self, slot: _BrowserSlot) -> None:
+        """
+        Take an idle slot out of rotation ahead of ``_relaunch_slot``.
+
+        Must be called with ``_access_lock`` held; the relaunch itself then
+        runs without the lock so the other slots keep serving.
+        """
+        slot.draining = True
+        slot.relaunching = True
+
+    async def _relaunch_slot(self, slot: _BrowserSlot, reason: str) -> None:
+        """
+        Replace a slot's browser with a freshly launched one.
+
+        Must be called without ``_access_lock`` held, on a slot marked by
+        ``_mark_relaunching``. On failure the slot is left draining so the
+        next acquire or health check retries, and the error is re-raised.
+        """
+        logger.info(
+            "Recycling browser",
+            reason=reason,
+            browser_id=id(slot.browser),
+            request_count=slot.request_count,
+            memory_mb=slot.memory_mb,
+        )
+        try:
+            if slot.browser.is_connected():
+                await slot.browser.close()
+        except Exception as e:
+            logger.warning(f"Error closing browser during recycle: {e}")
+
+        try:
+            browser = await self._launch_browser()
+        except Exception:
+            async with self._slot_available:
+                slot.relaunching = False
+                self._slot_available.notify_all()
+            raise
+
+        async with self._slot_available:
+            if not any(current is slot for current in self._slots):
+                # The pool was closed meanwhile
+                await browser.close()
+                return
+            slot.browser = browser
+            slot.request_count = 0
+            slot.memory_mb = None
+            slot.draining = False
+            slot.relaunching = False
+            slot.generation += 1
+            self._recycled_total += 1
+            self._slot_available.notify_all()
+        logger.info("Browser recycled successfully", browser_id=id(slot.browser))
+
+    async def _try_relaunch_slot(self, slot: _BrowserSlot, reason: str) -> None:
+        """Relaunch a marked slot, logging instead of raising on failure."""
+        try:
+            await self._relaunch_slot(slot, reason=reason)
+        except Exception as e:
+            logger.error(f"Failed to recycle browser: {e}", exc_info=True)
+
+    def _claim_slot(
+        self, tenant: BrowserTenant
+    ) -> tuple[_BrowserSlot | None, tuple[_BrowserSlot, str] | None]:
         """
-        Acquire a browser from the pool.
+        Pick the least-loaded healthy slot and reserve one context on it.
+
+        Must be called with ``_access_lock`` held. The first idle slot that
+        needs recycling (or has crashed) is marked for relaunch and returned
+        for the caller to relaunch once the lock is released; busy ones are
+        marked as draining so they stop receiving new contexts.
 
-        This method blocks if no browsers are available until one is released.
-        If a browser has crashed, it automatically restarts it before returning.
-        Recycles browsers that have exceeded max_requests_per_browser.
+        Args:
+            tenant: Tenant requesting the context (its quota is enforced)
 
         Returns:
-            Browser instance ready for use
+            Reserved slot (None if the tenant is at quota or every slot is
+            saturated, draining or relaunching) and the slot to relaunch with
+            the reason (None if there is nothing to relaunch)
+        """
+        if tenant.in_use >= tenant.max_contexts:
+            return None, None
+
+        relaunch: tuple[_BrowserSlot, str] | None = None
+        for slot in sorted(self._slots, key=lambda s: s.active_contexts):
+            if slot.relaunching:
+                continue
+            if slot.active_contexts == 0:
+                reason = None
+                if not slot.browser.is_connected():
+                    logger.warning("Browser crashed, restarting...")
+                    reason = "crashed"
+                elif slot.draining or self._needs_recycle(slot):
+                    reason = "budget_exceeded"
+                if reason is not None:
+                    if relaunch is None:
+                        self._mark_relaunching(slot)
+                        relaunch = (slot, reason)
+                    continue
+            elif self._needs_recycle(slot):
+                slot.draining = True
+
+            if slot.draining or slot.active_contexts >= self.max_contexts_per_browser:
+                continue
+
+            slot.active_contexts += 1
+            slot.request_count += 1
+            tenant.in_use += 1
+            tenant.acquired_total += 1
+            return slot, relaunch
+
+        return None, relaunch
+
+    async def _new_context(
+        self,
+        browser: Browser,
+        tenant: BrowserTenant,
+        context_options: dict[str, Any],
+    ) -> BrowserContext:
+        """
+        Create an isolated context configured for the tenant.
+
+        Args:
+            browser: Browser that will own the context
+            tenant: Tenant whose defaults (stealth, interception) apply
+            context_options: Extra ``new_context`` options overriding defaults
+
+        Returns:
+            Configured BrowserContext
+        """
+        options: dict[str, Any] = {}
+        if tenant.stealth:
+            options.update(viewport=DEFAULT_VIEWPORT, user_agent=DEFAULT_USER_AGENT)
+        options.update(context_options)
+
+        context = await browser.new_context(**options)
+        context.set_default_timeout(tenant.timeout_ms or self.timeout_ms)
+
+        if tenant.stealth:
+            # Override navigator.webdriver to avoid detection
+            await context.add_init_script(WEBDRIVER_OVERRIDE_SCRIPT)
+
+        if self.block_resources and tenant.block_resources:
+            await context.route("**/*", self._intercept_request)
+
+        return context
+
+    async def _intercept_request(self, route: Route) -> None:
+        """Abort heavy or ad requests, let everything else through."""
+        request = route.request
+        if is_blocked_request(request.resource_type, request.url):
+            self._blocked_requests_total += 1
+            await route.abort()
+        else:
+            await route.continue_()
+
+    async def acquire(
+        self,
+        tenant: str = SCRAPING_TENANT,
+        **context_options: Any,
+    ) -> BrowserContext:
+        """
+        Acquire a browser context from the pool on behalf of a tenant.
+
+        Blocks until the tenant is under its quota and some browser has a free
+        context slot. Crashed browsers are restarted and over-budget browsers
+        are recycled once idle.
+
+        Args:
+            tenant: Registered tenant name (default: scraping)
+            **context_options: Options forwarded to ``Browser.new_context``
+                (e.g. ``viewport`` for card rendering)
+
+        Returns:
+            Fresh BrowserContext ready for use; pass it back to release()
 
         Raises:
             RuntimeError: If pool is not initialized
-            Exception: If browser restart fails
+            KeyError: If the tenant is not registered
+            Exception: If browser restart or context creation fails
         """
+        if self._loop is not None and self._loop is not asyncio.get_running_loop():
+            self._check_event_loop()
+            await self.initialize()
+
         if not self._initialized:
             raise RuntimeError("BrowserPool not initialized. Call initialize() first.")
 
-        logger.debug("Acquiring browser from pool...")
-
-        # Wait for available browser (blocks if pool is empty)
-        browser = await self._available.get()
+        tenant_state = self._tenants[tenant]
+        logger.debug("Acquiring browser context from pool...", tenant=tenant)
+
+        waited = False
+        while True:
+            async with self._slot_available:
+                slot, relaunch = self._claim_slot(tenant_state)
+                if slot is None and relaunch is None:
+                    if not waited:
+                        tenant_state.waits_total += 1
+                        waited = True
+                    await self._slot_available.wait()
+                    continue
+            if relaunch is None:
+                break
+            if slot is not None:
+                # Already served; let the replacement launch without delaying this caller
+                task = asyncio.create_task(self._try_relaunch_slot(*relaunch))
+                self._relaunch_tasks.add(task)
+                task.add_done_callback(self._relaunch_tasks.discard)
+                break
+            # Relaunch outside the lock, then claim again (likely the fresh browser)
+            await self._relaunch_slot(*relaunch)
 
-        # Check if browser needs recycling
-        request_count = self._browser_request_counts.get(browser, 0)
-        if request_count >= self.max_requests_per_browser:
-            logger.info(
-                f"Browser reached max requests ({request_count}/{self.max_requests_per_browser}), recycling...",
-                browser_id=id(browser),
-                request_count=request_count,
-            )
-            try:
-                # Close old browser
-                if browser.is_connected():
-                    await browser.close()
-                # Launch new browser
-                browser = await self._launch_browser()
-                # Reset request count
-                self._browser_request_counts[browser] = 0
-                logger.info("Browser recycled successfully", browser_id=id(browser))
-            except Exception as e:
-                logger.error(f"Failed to recycle browser: {e}", exc_info=True)
-                # Try to put browser back for next acquire attempt
-                await self._available.put(browser)
-                raise
-
-        # Check if browser is still connected (not crashed)
-        elif not browser.is_connected():
-            logger.warning("Browser crashed, restarting...", browser_id=id(browser))
-            try:
-                browser = await self._launch_browser()
-                # Reset request count for new browser
-                self._browser_request_counts[browser] = 0
-                logger.info("Crashed browser restarted successfully", browser_id=id(browser))
-            except Exception as e:
-                logger.error(f"Failed to restart crashed browser: {e}", exc_info=True)
-                # Try to put browser back for next acquire attempt
-                await self._available.put(browser)
-                raise
-
-        # Increment request count
-        self._browser_request_counts[browser] = self._browser_request_counts.get(browser, 0) + 1
+        try:
+            context = await self._new_context(slot.browser, tenant_state, context_options)
+        except Exception:
+            async with self._slot_available:
+                slot.active_contexts -= 1
+                tenant_state.in_use -= 1
+                self._slot_available.notify_all()
+            raise
 
-        # Mark as in-use
-        async with self._access_lock:
-            self._in_use.add(browser)
+        slot.contexts.add(context)
+        self._context_slots[context] = slot
+        self._context_tenants[context] = tenant_state
 
         logger.debug(
-            "Acquired browser",
-            browser_id=id(browser),
-            request_count=self._browser_request_counts[browser],
-            in_use=len(self._in_use),
-            available=self._available.qsize(),
+            "Acquired browser context",
+            tenant=tenant,
+            browser_id=id(slot.browser),
+            active_contexts=slot.active_contexts,
+            request_count=slot.request_count,
         )
-        return browser
+        return context
 
-    async def release(self, browser: Browser) -> None:
+    async def release(self, context: BrowserContext) -> None:
         """
-        Release a browser back to the pool.
-
-        The browser is returned to the available queue for reuse by other requests.
+        Close a context and return its slot to the pool.
 
         Args:
-            browser: Browser instance to release
+            context: BrowserContext previously returned by acquire()
         """
-        async with self._access_lock:
-            if browser in self._in_use:
-                self._in_use.remove(browser)
+        slot = self._context_slots.pop(context, None)
+        tenant = self._context_tenants.pop(context, None)
 
-        # Return to available queue
-        await self._available.put(browser)
+        try:
+            await context.close()
+        except Exception as e:
+            logger.warning(f"Error closing browser context: {e}")
+
+        if slot is None:
+            logger.warning("Released context does not belong to this pool")
+            return
+
+        slot.contexts.discard(context)
+
+        if (
+            self.max_browser_memory_mb is not None
+            and slot.request_count % self.memory_check_interval == 0
+        ):
+            slot.memory_mb = await self._sample_memory_mb(slot.browser)
+
+        relaunch = False
+        async with self._slot_available:
+            slot.active_contexts = max(0, slot.active_contexts - 1)
+            if tenant is not None:
+                tenant.in_use = max(0, tenant.in_use - 1)
+            if (
+                slot.active_contexts == 0
+                and not slot.relaunching
+                and (slot.draining or self._needs_recycle(slot))
+            ):
+                self._mark_relaunching(slot)
+                relaunch = True
+            self._slot_available.notify_all()
+
+        if relaunch:
+            # Leaves the slot draining on failure; next acquire retries the relaunch
+            await self._try_relaunch_slot(slot, reason="budget_exceeded")
 
         logger.debug(
-            "Released browser",
-            browser_id=id(browser),
-            request_count=self._browser_request_counts.get(browser, 0),
-            in_use=len(self._in_use),
-            available=self._available.qsize(),
+            "Released browser context",
+            browser_id=id(slot.browser),
+            active_contexts=slot.active_contexts,
         )
 
+    async def _sample_memory_mb(self, browser: Browser) -> float | None:
+        """
+        Estimate resident memory of a browser and its child processes.
+
+        Uses the CDP ``SystemInfo.getProcessInfo`` call to enumerate Chromium
+        processes and sums their ``VmRSS`` from ``/proc``. Returns None when
+        the measurement is unavailable (non-Linux hosts, non-Chromium browsers).
+        """
+        try:
+            session = await browser.new_browser_cdp_session()
+            try:
+                info = await session.send("SystemInfo.getProcessInfo")
+            finally:
+                await session.detach()
+
+            total_kb = 0
+            for process in info.get("processInfo", []):
+                total_kb += _read_rss_kb(int(process["id"]))
+            return total_kb / 1024 if total_kb else None
+
+        except Exception as e:
+            logger.debug(f"Browser memory sampling unavailable: {e}")
+            return None
+
     async def close_all(self) -> None:
         """
         Close all browsers and cleanup Playwright context.
@@ -332,7 +880,7 @@ class BrowserPool:
 
             logger.info("Closing all browsers in pool...")
 
-            # Close all browsers
+            # Close all browsers (closing a browser closes its contexts)
             await self._cleanup_browsers()
 
             # Stop Playwright context
@@ -342,16 +890,12 @@ class BrowserPool:
 
             # Reset state
             self._initialized = False
-            self._browsers.clear()
-            self._in_use.clear()
-            self._browser_request_counts.clear()
-
-            # Clear queue
-            while not self._available.empty():
-                try:
-                    self._available.get_nowait()
-                except asyncio.QueueEmpty:
-                    break
+            self._loop = None
+            self._slots.clear()
+            self._context_slots.clear()
+            self._context_tenants.clear()
+            for tenant in self._tenants.values():
+                tenant.in_use = 0
 
             logger.info("BrowserPool closed successfully")
 
@@ -379,21 +923,54 @@ class BrowserPool:
         Returns:
             Dictionary with pool statistics:
                 - pool_size: Total browser instances
-                - in_use: Currently in-use browsers
-                - available: Available browsers in queue
+                - capacity: Maximum concurrent contexts
+                - in_use: Currently open contexts
+                - available: Free context slots on non-draining browsers
                 - initialized: Whether pool is initialized
-                - total_requests: Sum of all request counts
+                - total_requests: Contexts served by the current browsers
+                - recycled_total: Browsers recycled since startup
+                - blocked_requests_total: Requests aborted by interception
                 - browser_request_counts: Request counts per browser
+                - browsers: Per-browser slot details
+                - tenants: Per-tenant quota, usage and wait counters
         """
+        in_use = sum(slot.active_contexts for slot in self._slots)
+        available = sum(
+            self.max_contexts_per_browser - slot.active_contexts
+            for slot in self._slots
+            if not slot.draining
+        )
         return {
             "pool_size": self.pool_size,
-            "in_use": len(self._in_use),
-            "available": self._available.qsize(),
+            "capacity": self.capacity,
+            "in_use": in_use,
+            "available": available,
             "initialized": self._initialized,
-            "total_requests": sum(self._browser_request_counts.values()),
+            "total_requests": sum(slot.request_count for slot in self._slots),
+            "recycled_total": self._recycled_total,
+            "blocked_requests_total": self._blocked_requests_total,
             "browser_request_counts": {
-                f"browser_{id(browser)}": count
-                for browser, count in self._browser_request_counts.items()
+                f"browser_{id(slot.browser)}": slot.request_count for slot in self._slots
+            },
+            "browsers": [
+                {
+                    "browser_id": f"browser_{id(slot.browser)}",
+                    "active_contexts": slot.active_contexts,
+                    "request_count": slot.request_count,
+                    "memory_mb": slot.memory_mb,
+                    "draining": slot.draining,
+                    "generation": slot.generation,
+                }
+                for slot in self._slots
+            ],
+            "tenants": {
+                name: {
+                    "max_contexts": tenant.max_contexts,
+                    "in_use": tenant.in_use,
+                    "acquired_total": tenant.acquired_total,
+                    "waits_total": tenant.waits_total,
+                }
+                for name, tenant in self._tenants.items()
             },
         }
 
@@ -407,4 +984,22 @@ class BrowserPool:
         await self.close_all()
 
 
-__all__ = ["BrowserPool"]
+def _read_rss_kb(pid: int) -> int:
+    """Read resident set size (kB) for a process from /proc, 0 if unavailable."""
+    try:
+        with open(f"/proc/{pid}/status", encoding="ascii") as status:
+            for line in status:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1])
+    except (OSError, ValueError, IndexError):
+        return 0
+    return 0
+
+
+__all__ = [
+    "RENDERING_TENANT",
+    "SCRAPING_TENANT",
+    "BrowserPool",
+    "BrowserTenant",
+    "is_blocked_request",
+]
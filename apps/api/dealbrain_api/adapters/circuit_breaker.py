@@ -0,0 +1,376 @@
+"""Per-adapter, per-domain circuit breakers for AdapterRouter.
+
+Each (adapter, domain) pair has a breaker with the usual three states:
+
+- CLOSED: requests flow normally; failures are counted
+- OPEN: the adapter is skipped for that domain until ``open_duration_s`` passes
+- HALF_OPEN: one worker is allowed a probe request; success closes the
+  circuit, failure re-opens it
+
+Breaker state also tracks an exponentially weighted success rate and latency,
+which AdapterRouter uses to try healthy adapters before degraded ones.
+
+State lives in Redis so that all API and Celery workers see the same picture
+of which retailers are currently failing. If Redis is unavailable the
+registry degrades to process-local state and retries Redis after
+``REDIS_RETRY_SECONDS``; with ``use_redis`` off it stays local.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import time
+from dataclasses import asdict, dataclass
+from enum import StrEnum
+from typing import Any
+
+from dealbrain_api.adapters.base import AdapterError
+from dealbrain_api.settings import AdapterCircuitBreakerConfig, get_settings
+from prometheus_client import Counter
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+logger = logging.getLogger(__name__)
+
+adapter_circuit_transitions = Counter(
+    "adapter_circuit_transitions_total",
+    "Adapter circuit breaker state transitions",
+    ["adapter", "state"],  # state: open, half_open, closed
+)
+
+# Errors that say something about the health of an adapter/host. Errors such as
+# ITEM_NOT_FOUND or CONFIGURATION_ERROR are properties of the request or the
+# deployment and must not trip a breaker.
+BREAKER_FAILURE_ERRORS = frozenset(
+    {
+        AdapterError.TIMEOUT,
+        AdapterError.NETWORK_ERROR,
+        AdapterError.RATE_LIMITED,
+    }
+)
+
+_KEY_PREFIX = "dealbrain:adapter_breaker"
+
+# Seconds to wait before retrying Redis after a connection failure
+REDIS_RETRY_SECONDS = 30
+
+
+class CircuitState(StrEnum):
+    """Circuit breaker states."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+@dataclass
+class AdapterHealth:
+    """
+    Breaker state and recent health of one adapter on one domain.
+
+    Attributes:
+        state: Current circuit state
+        consecutive_failures: Failures since the last success
+        success_rate: EWMA of attempt outcomes (1.0 = always succeeds)
+        latency_s: EWMA of successful extraction latency, if any
+        samples: Number of recorded attempts
+        opened_at: Unix time the circuit last opened
+    """
+
+    state: CircuitState = CircuitState.CLOSED
+    consecutive_failures: int = 0
+    success_rate: float = 1.0
+    latency_s: float | None = None
+    samples: int = 0
+    opened_at: float | None = None
+
+    def to_json(self) -> str:
+        data = asdict(self)
+        data["state"] = self.state.value
+        return json.dumps(data)
+
+    @classmethod
+    def from_json(cls, raw: str) -> AdapterHealth:
+        data = json.loads(raw)
+        data["state"] = CircuitState(data.get("state", CircuitState.CLOSED.value))
+        return cls(**data)
+
+
+class CircuitBreakerRegistry:
+    """
+    Shared registry of adapter circuit breakers.
+
+    The router calls ``refresh()`` once per extraction to pull the current
+    state for a domain, then reads it synchronously through ``is_available()``
+    and ``health()`` while ordering adapters. Outcomes are written back with
+    ``record_success()`` / ``record_failure()``.
+
+    Updates are read-modify-write without a lock: two workers finishing at the
+    same moment can lose one sample, which is harmless for a health heuristic.
+    Half-open probes are claimed with ``SET NX`` so that only one worker probes
+    a recovering host at a time.
+
+    Args:
+        config: Breaker configuration
+        redis_client: Optional Redis client (created from settings if omitted)
+    """
+
+    def __init__(
+        self,
+        config: AdapterCircuitBreakerConfig,
+        redis_client: Redis | None = None,
+    ):
+        self.config = config
+        self._redis_client = redis_client
+        self._retry_at = 0.0
+        self._redis_loop: asyncio.AbstractEventLoop | None = None
+        self._health: dict[tuple[str, str], AdapterHealth] = {}
+        self._local_probes: dict[tuple[str, str], float] = {}
+
+    @classmethod
+    def from_settings(cls) -> CircuitBreakerRegistry:
+        """Build a registry from application settings."""
+        return cls(get_settings().ingestion.circuit_breaker)
+
+    @property
+    def enabled(self) -> bool:
+        return self.config.enabled
+
+    async def _get_redis_client(self) -> Redis | None:
+        """Get or initialize the Redis client, or None when running locally."""
+        # Celery tasks each run on a fresh event loop; a client created on a
+        # previous (closed) loop cannot be reused.
+        loop = asyncio.get_running_loop()
+        if self._redis_client is not None and self._redis_loop not in (None, loop):
+            self._redis_client = None
+        if not self.config.use_redis or time.monotonic() < self._retry_at:
+            return None
+        if self._redis_client is None:
+            self._redis_loop = loop
+            try:
+                client = Redis.from_url(
+                    get_settings().redis_url,
+                    encoding="utf-8",
+                    decode_responses=True,
+                )
+                await client.ping()
+            except (RedisError, OSError) as e:
+                self._mark_unavailable(e)
+                return None
+            self._redis_client = client
+        return self._redis_client
+
+    def _mark_unavailable(self, exc: Exception) -> None:
+        """Use process-local state until ``REDIS_RETRY_SECONDS`` have passed."""
+        logger.warning(f"Circuit breaker Redis unavailable, using local state: {exc}")
+        self._retry_at = time.monotonic() + REDIS_RETRY_SECONDS
+
+    @staticmethod
+    def _state_key(adapter_name: str, domain: str) -> str:
+        return f"{_KEY_PREFIX}:{adapter_name}:{domain}"
+
+    @staticmethod
+    def _probe_key(adapter_name: str, domain: str) -> str:
+        return f"{_KEY_PREFIX}:probe:{adapter_name}:{domain}"
+
+    async def _load(self, adapter_name: str, domain: str) -> AdapterHealth:
+        """Load breaker state from Redis, falling back to the local copy."""
+        key = (adapter_name, domain)
+        client = await self._get_redis_client()
+        if client is not None:
+            try:
+                raw = await client.get(self._state_key(adapter_name, domain))
+                health = AdapterHealth.from_json(raw) if raw else AdapterHealth()
+                self._health[key] = health
+                return health
+            except RedisError as e:
+                self._mark_unavailable(e)
+            except (ValueError, TypeError) as e:
+                logger.warning(
+                    f"Circuit breaker state read failed for {adapter_name}/{domain}: {e}"
+                )
+
+        return self._health.setdefault(key, AdapterHealth())
+
+    async def _store(self, adapter_name: str, domain: str, health: AdapterHealth) -> None:
+        """Persist breaker state locally and (if available) in Redis."""
+        self._health[(adapter_name, domain)] = health
+        client = await self._get_redis_client()
+        if client is None:
+            return
+        try:
+            await client.set(
+                self._state_key(adapter_name, domain),
+                health.to_json(),
+                ex=self.config.state_ttl_s,
+            )
+        except RedisError as e:
+            self._mark_unavailable(e)
+
+    async def _claim_probe(self, adapter_name: str, domain: str) -> bool:
+        """Claim the half-open probe for an adapter/domain (one worker at a time)."""
+        client = await self._get_redis_client()
+        if client is not None:
+            try:
+                claimed = await client.set(
+                    self._probe_key(adapter_name, domain),
+                    "1",
+                    nx=True,
+                    ex=self.config.open_duration_s,
+                )
+                return bool(claimed)
+            except RedisError as e:
+                self._mark_unavailable(e)
+
+        key = (adapter_name, domain)
+        now = time.time()
+        if self._local_probes.get(key, 0.0) > now:
+            return False
+        self._local_probes[key] = now + self.config.open_duration_s
+        return True
+
+    async def refresh(self, domain: str, adapter_names: list[str]) -> None:
+        """
+        Load current breaker state for a domain before routing.
+
+        Open circuits whose cool-down has elapsed move to HALF_OPEN for this
+        worker if it wins the probe claim; other workers keep skipping them.
+
+        Args:
+            domain: Normalized domain being extracted
+            adapter_names: Adapters that match the domain
+        """
+        now = time.time()
+        for adapter_name in adapter_names:
+            health = await self._load(adapter_name, domain)
+            if health.state != CircuitState.OPEN:
+                continue
+            if now - (health.opened_at or 0.0) < self.config.open_duration_s:
+                continue
+            if await self._claim_probe(adapter_name, domain):
+                health.state = CircuitState.HALF_OPEN
+                adapter_circuit_transitions.labels(adapter=adapter_name, state="half_open").inc()
+                logger.info(f"Circuit half-open for {adapter_name} on {domain}, probing")
+
+    def health(self, adapter_name: str, domain: str) -> AdapterHealth:
+        """Last known health of an adapter on a domain."""
+        return self._health.get((adapter_name, domain)) or AdapterHealth()
+
+    def is_available(self, adapter_name: str, domain: str) -> bool:
+        """True unless the adapter's circuit is open for the domain."""
+        return self.health(adapter_name, domain).state != CircuitState.OPEN
+
+    def is_degraded(self, adapter_name: str, domain: str) -> bool:
+        """
+        True if the adapter should be tried after healthy adapters.
+
+        An adapter is degraded while half-open, or once it has enough samples
+        and its success rate or latency is worse than the configured limits.
+        """
+        health = self.health(adapter_name, domain)
+        if health.state == CircuitState.HALF_OPEN:
+            return True
+        if health.samples < self.config.min_samples:
+            return False
+        if health.success_rate < self.config.degraded_success_rate:
+            return True
+        return health.latency_s is not None and health.latency_s > self.config.slow_latency_s
+
+    def _ewma(self, previous: float | None, value: float) -> float:
+        if previous is None:
+            return value
+        alpha = self.config.ewma_alpha
+        return alpha * value + (1 - alpha) * previous
+
+    async def record_success(self, adapter_name: str, domain: str, latency_s: float) -> None:
+        """Record a successful extraction; closes the circuit if it was open."""
+        health = await self._load(adapter_name, domain)
+        health.samples += 1
+        health.consecutive_failures = 0
+        health.success_rate = self._ewma(health.success_rate, 1.0)
+        health.latency_s = self._ewma(health.latency_s, latency_s)
+
+        if health.state != CircuitState.CLOSED:
+            health.state = CircuitState.CLOSED
+            health.opened_at = None
+            adapter_circuit_transitions.labels(adapter=adapter_name, state="closed").inc()
+            logger.info(f"Circuit closed for {adapter_name} on {domain}")
+
+        await self._store(adapter_name, domain, health)
+
+    async def record_failure(
+        self,
+        adapter_name: str,
+        domain: str,
+        error_type: AdapterError,
+    ) -> None:
+        """
+        Record a failed extraction.
+
+        Only errors in BREAKER_FAILURE_ERRORS count. A failed half-open probe
+        re-opens the circuit immediately; a closed circuit opens after
+        ``failure_threshold`` consecutive failures or when the success rate
+        drops below ``min_success_rate``.
+        """
+        if error_type not in BREAKER_FAILURE_ERRORS:
+            return
+
+        health = await self._load(adapter_name, domain)
+        health.samples += 1
+        health.consecutive_failures += 1
+        health.success_rate = self._ewma(health.success_rate, 0.0)
+
+        should_open = health.state != CircuitState.CLOSED or (
+            health.consecutive_failures >= self.config.failure_threshold
+            or (
+                health.samples >= self.config.min_samples
+                and health.success_rate < self.config.min_success_rate
+            )
+        )
+        if should_open:
+            if health.state != CircuitState.OPEN:
+                adapter_circuit_transitions.labels(adapter=adapter_name, state="open").inc()
+                logger.warning(
+                    f"Circuit opened for {adapter_name} on {domain} "
+                    f"({health.consecutive_failures} consecutive failures, "
+                    f"success rate {health.success_rate:.2f})"
+                )
+            health.state = CircuitState.OPEN
+            health.opened_at = time.time()
+
+        await self._store(adapter_name, domain, health)
+
+    def get_stats(self) -> dict[str, dict[str, Any]]:
+        """Locally known breaker state, keyed by ``adapter:domain``."""
+        return {
+            f"{adapter_name}:{domain}": {
+                "state": health.state.value,
+                "consecutive_failures": health.consecutive_failures,
+                "success_rate": round(health.success_rate, 3),
+                "latency_s": health.latency_s,
+                "samples": health.samples,
+            }
+            for (adapter_name, domain), health in self._health.items()
+        }
+
+
+_registry: CircuitBreakerRegistry | None = None
+
+
+def get_circuit_breaker_registry() -> CircuitBreakerRegistry:
+    """Process-wide registry shared by all AdapterRouter instances."""
+    global _registry
+    if _registry is None:
+        _registry = CircuitBreakerRegistry.from_settings()
+    return _registry
+
+
+__all__ = [
+    "BREAKER_FAILURE_ERRORS",
+    "AdapterHealth",
+    "CircuitBreakerRegistry",
+    "CircuitState",
+    "get_circuit_breaker_registry",
+]
@@ -0,0 +1,165 @@
+"""Adapter latency tracking and hedge-delay policy for AdapterRouter."""
+
+from __future__ import annotations
+
+import logging
+import threading
+from collections import deque
+from dataclasses import dataclass
+
+from dealbrain_api.settings import AdapterHedgingConfig, get_settings
+from prometheus_client import Histogram
+
+logger = logging.getLogger(__name__)
+
+adapter_extraction_latency = Histogram(
+    "adapter_extraction_latency_seconds",
+    "Duration of adapter extraction attempts in seconds",
+    ["adapter", "outcome"],  # outcome: success, error, cancelled
+    buckets=[0.1, 0.25, 0.5, 1, 2, 3, 5, 8, 10, 15, 20, 30],
+)
+
+
+class AdapterLatencyTracker:
+    """
+    Rolling window of extraction latencies per adapter.
+
+    Only successful extractions feed the percentile estimates, since the
+    hedge delay should reflect how long a *working* adapter usually takes.
+    Every attempt is also exported to Prometheus.
+
+    Args:
+        window_size: Number of recent successful samples kept per adapter
+    """
+
+    def __init__(self, window_size: int = 200):
+        self.window_size = window_size
+        self._samples: dict[str, deque[float]] = {}
+        self._lock = threading.Lock()
+
+    def record(self, adapter_name: str, duration_s: float, outcome: str = "success") -> None:
+        """
+        Record one extraction attempt.
+
+        Args:
+            adapter_name: Adapter that ran the extraction
+            duration_s: Wall-clock duration in seconds
+            outcome: "success", "error" or "cancelled"
+        """
+        adapter_extraction_latency.labels(adapter=adapter_name, outcome=outcome).observe(duration_s)
+        if outcome != "success":
+            return
+
+        with self._lock:
+            samples = self._samples.get(adapter_name)
+            if samples is None:
+                samples = deque(maxlen=self.window_size)
+                self._samples[adapter_name] = samples
+            samples.append(duration_s)
+
+    def sample_count(self, adapter_name: str) -> int:
+        """Number of successful samples currently held for an adapter."""
+        with self._lock:
+            return len(self._samples.get(adapter_name, ()))
+
+    def percentile(self, adapter_name: str, q: float) -> float | None:
+        """
+        Latency percentile (nearest-rank) of recent successful extractions.
+
+        Args:
+            adapter_name: Adapter name
+            q: Quantile between 0 and 1 (e.g. 0.9 for p90)
+
+        Returns:
+            Latency in seconds, or None if no samples are recorded
+        """
+        with self._lock:
+            samples = sorted(self._samples.get(adapter_name, ()))
+        if not samples:
+            return None
+        index = min(len(samples) - 1, max(0, int(round(q * len(samples))) - 1))
+        return samples[index]
+
+    def get_stats(self) -> dict[str, dict[str, float | int | None]]:
+        """Per-adapter sample counts and p50/p90 latencies for monitoring."""
+        with self._lock:
+            names = list(self._samples)
+        return {
+            name: {
+                "samples": self.sample_count(name),
+                "p50_s": self.percentile(name, 0.5),
+                "p90_s": self.percentile(name, 0.9),
+            }
+            for name in names
+        }
+
+    def reset(self) -> None:
+        """Drop all recorded samples."""
+        with self._lock:
+            self._samples.clear()
+
+
+# Process-wide tracker shared by all AdapterRouter instances
+adapter_latency_tracker = AdapterLatencyTracker()
+
+
+@dataclass
+class HedgingPolicy:
+    """
+    Decides whether to hedge and how long to wait before starting the next adapter.
+
+    With ``adaptive`` enabled, the delay for a running adapter is its recorded
+    latency percentile (clamped to ``[min_delay_ms, max_delay_ms]``) once
+    ``min_samples`` successes are recorded; until then ``delay_ms`` is used.
+    """
+
+    enabled: bool = False
+    delay_ms: int = 2000
+    adaptive: bool = True
+    latency_percentile: float = 0.9
+    min_delay_ms: int = 250
+    max_delay_ms: int = 8000
+    min_samples: int = 20
+
+    @classmethod
+    def from_config(cls, config: AdapterHedgingConfig) -> HedgingPolicy:
+        """Build a policy from the ingestion hedging settings block."""
+        return cls(
+            enabled=config.enabled,
+            delay_ms=config.delay_ms,
+            adaptive=config.adaptive,
+            latency_percentile=config.latency_percentile,
+            min_delay_ms=config.min_delay_ms,
+            max_delay_ms=config.max_delay_ms,
+            min_samples=config.min_samples,
+        )
+
+    @classmethod
+    def from_settings(cls) -> HedgingPolicy:
+        """Build a policy from application settings."""
+        return cls.from_config(get_settings().ingestion.hedging)
+
+    def hedge_delay_s(self, adapter_name: str, tracker: AdapterLatencyTracker) -> float:
+        """
+        Seconds to wait on ``adapter_name`` before starting the next adapter.
+
+        Args:
+            adapter_name: Adapter currently running
+            tracker: Latency tracker holding recent samples
+
+        Returns:
+            Hedge delay in seconds
+        """
+        if self.adaptive and tracker.sample_count(adapter_name) >= self.min_samples:
+            observed = tracker.percentile(adapter_name, self.latency_percentile)
+            if observed is not None:
+                delay_ms = min(max(observed * 1000, self.min_delay_ms), self.max_delay_ms)
+                return delay_ms / 1000
+        return self.delay_ms / 1000
+
+
+__all__ = [
+    "AdapterLatencyTracker",
+    "HedgingPolicy",
+    "adapter_latency_tracker",
+]
@@ -2,10 +2,12 @@
 
 import logging
 
+from bs4 import BeautifulSoup
 from dealbrain_api.adapters.base import AdapterError, AdapterException, BaseAdapter
 from dealbrain_api.settings import get_settings
 from dealbrain_core.schemas.ingestion import NormalizedListingSchema
 
+from .document import ParsedDocument
 from .extractors import HtmlElementExtractor, MetaTagExtractor, StructuredDataExtractor
 from .normalizers import SchemaMapper
 from .parsers import ImageParser, PriceParser, SpecParser
@@ -151,10 +153,14 @@ class JsonLdAdapter(BaseAdapter):
 
         Workflow:
         1. Fetch HTML from URL
-        2. Extract structured data using extruct
-        3. Find Product schema (JSON-LD → Microdata → RDFa)
-        4. Map to NormalizedListingSchema
-        5. Parse specs from description
+        2. Find Product schema (JSON-LD → Microdata → RDFa), stopping at the
+           first syntax that has one
+        3. Map to NormalizedListingSchema
+        4. Parse specs from description
+
+        The page is parsed once into a ParsedDocument whose trees are shared
+        by every extractor; the BeautifulSoup tree used by the fallbacks is
+        only built if no Product schema is found.
 
         Args:
             url: URL to extract listing data from
@@ -170,16 +176,14 @@ class JsonLdAdapter(BaseAdapter):
         # Step 1: Fetch HTML (use wrapper for test compatibility)
         html = await self._fetch_html(url)
 
-        # Step 2: Extract structured data
-        structured_data = self._structured_data_extractor.extract_structured_data(html, url)
-
-        # Step 3: Find Product schema (use wrapper for test compatibility)
-        product_data = self._find_product_schema(structured_data)
+        # Step 2: Find Product schema on a single shared parse of the page
+        document = ParsedDocument(html, url)
+        product_data = self._structured_data_extractor.find_product(document)
 
         if not product_data:
             # Fallback 1: Try extracting from meta tags (OpenGraph, Twitter Card) (use wrapper for test compatibility)
             logger.info(f"📋 No Schema.org Product found, trying meta tag fallback for {url}")
-            result = self._extract_from_meta_tags(html, url)
+            result = self._extract_from_meta_tags(html, url, soup=document.soup)
 
             if result:
                 logger.info(f"✅ Successfully extracted listing from meta tags: {result.title}")
@@ -187,7 +191,7 @@ class JsonLdAdapter(BaseAdapter):
 
             # Fallback 2: Try extracting from HTML elements (Amazon-style) (use wrapper for test compatibility)
             logger.info(f"🔍 No meta tags found, trying HTML element fallback for {url}")
-            result = self._extract_from_html_elements(html, url)
+            result = self._extract_from_html_elements(html, url, soup=document.soup)
 
             if result:
                 logger.info(f"Successfully extracted listing from HTML elements: {result.title}")
@@ -201,7 +205,7 @@ class JsonLdAdapter(BaseAdapter):
                 metadata={"url": url},
             )
 
-        # Step 4: Map to normalized schema (use wrapper for test compatibility)
+        # Step 3: Map to normalized schema (use wrapper for test compatibility)
         normalized = self._map_to_schema(product_data, url)
 
         logger.info(f"Successfully extracted listing: {normalized.title}")
@@ -269,8 +273,6 @@ class JsonLdAdapter(BaseAdapter):
     def _extract_images(self, product_or_soup) -> list[str]:
         """Compatibility wrapper for _extract_images (delegates to parser based on input type)."""
         # Check if input is BeautifulSoup (HTML extraction) or dict (Product schema)
-        from bs4 import BeautifulSoup
-
         if isinstance(product_or_soup, BeautifulSoup):
             return ImageParser.extract_images_from_html(product_or_soup)
         else:
@@ -280,13 +282,13 @@ class JsonLdAdapter(BaseAdapter):
         """Compatibility wrapper for _extract_specs (delegates to parser)."""
         return SpecParser.extract_specs(text)
 
-    def _extract_from_meta_tags(self, html: str, url: str):
+    def _extract_from_meta_tags(self, html: str, url: str, soup: BeautifulSoup | None = None):
         """Compatibility wrapper for _extract_from_meta_tags (delegates to extractor)."""
-        return self._meta_tag_extractor.extract_from_meta_tags(html, url)
+        return self._meta_tag_extractor.extract_from_meta_tags(html, url, soup=soup)
 
-    def _extract_from_html_elements(self, html: str, url: str):
+    def _extract_from_html_elements(self, html: str, url: str, soup: BeautifulSoup | None = None):
         """Compatibility wrapper for _extract_from_html_elements (delegates to extractor)."""
-        return self._html_element_extractor.extract_from_html_elements(html, url)
+        return self._html_element_extractor.extract_from_html_elements(html, url, soup=soup)
 
     def _extract_brand(self, soup):
         """Compatibility wrapper for _extract_brand (delegates to parser)."""
@@ -0,0 +1,63 @@
+"""Parsed HTML document shared by all JSON-LD adapter extractors."""
+
+import logging
+from functools import cached_property
+
+from bs4 import BeautifulSoup
+from extruct.utils import parse_xmldom_html
+from lxml.html import HtmlElement
+
+logger = logging.getLogger(__name__)
+
+
+def parse_soup(html: str) -> BeautifulSoup:
+    """
+    Parse HTML into BeautifulSoup using the lxml tree builder.
+
+    lxml is several times faster than the pure-Python ``html.parser`` on
+    large retailer pages, and is already a dependency of extruct.
+
+    Args:
+        html: HTML content to parse
+
+    Returns:
+        BeautifulSoup document
+    """
+    return BeautifulSoup(html, "lxml")
+
+
+class ParsedDocument:
+    """
+    Fetched HTML page with lazily built, cached parse trees.
+
+    Every extractor in the JSON-LD pipeline works from the same instance, so
+    a page is parsed at most once per representation:
+
+    - ``tree``: lxml tree used by extruct for JSON-LD, Microdata and RDFa
+    - ``soup``: BeautifulSoup document used by the meta tag and HTML element
+      fallbacks
+
+    Neither tree is built until first use. When JSON-LD already yields a
+    Product, the soup is never built at all.
+
+    Args:
+        html: HTML content
+        url: URL the HTML was fetched from (base URL for relative links)
+    """
+
+    def __init__(self, html: str, url: str):
+        self.html = html
+        self.url = url
+
+    @cached_property
+    def tree(self) -> HtmlElement:
+        """lxml tree (XML-DOM compatible, as required by extruct's RDFa extractor)."""
+        return parse_xmldom_html(self.html, encoding="UTF-8")
+
+    @cached_property
+    def soup(self) -> BeautifulSoup:
+        """BeautifulSoup document for the fallback extractors."""
+        return parse_soup(self.html)
+
+
+__all__ = ["ParsedDocument", "parse_soup"]
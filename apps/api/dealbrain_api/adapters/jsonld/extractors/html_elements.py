@@ -8,6 +8,8 @@ from bs4 import BeautifulSoup
 from dealbrain_core.enums import Condition
 from dealbrain_core.schemas.ingestion import NormalizedListingSchema
 
+from ..document import parse_soup
+
 logger = logging.getLogger(__name__)
 
 
@@ -52,19 +54,23 @@ class HtmlElementExtractor:
         self._extract_list_price = list_price_parser
         self._extract_specs_from_table = table_spec_parser
 
-    def extract_from_html_elements(self, html: str, url: str) -> NormalizedListingSchema | None:
+    def extract_from_html_elements(
+        self, html: str, url: str, soup: BeautifulSoup | None = None
+    ) -> NormalizedListingSchema | None:
         """
         Extract product data from HTML elements as final fallback.
 
         Args:
             html: HTML content to parse
             url: Original URL (for error messages and logging)
+            soup: Already parsed document for ``html`` (parsed here if omitted)
 
         Returns:
             NormalizedListingSchema with extracted data, or None if insufficient data
         """
         try:
-            soup = BeautifulSoup(html, "html.parser")
+            if soup is None:
+                soup = parse_soup(html)
 
             # Diagnostic logging: HTML structure analysis
             logger.info(f"HTML element extraction diagnostics for {url}:")
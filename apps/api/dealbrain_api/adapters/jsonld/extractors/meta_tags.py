@@ -6,6 +6,8 @@ from bs4 import BeautifulSoup
 from dealbrain_core.enums import Condition
 from dealbrain_core.schemas.ingestion import NormalizedListingSchema
 
+from ..document import parse_soup
+
 logger = logging.getLogger(__name__)
 
 
@@ -36,7 +38,9 @@ class MetaTagExtractor:
         self._parse_price = price_parser
         self._extract_specs = spec_parser
 
-    def extract_from_meta_tags(self, html: str, url: str) -> NormalizedListingSchema | None:
+    def extract_from_meta_tags(
+        self, html: str, url: str, soup: BeautifulSoup | None = None
+    ) -> NormalizedListingSchema | None:
         """
         Extract product data from OpenGraph/Twitter Card meta tags as fallback.
 
@@ -52,12 +56,14 @@ class MetaTagExtractor:
         Args:
             html: HTML content to parse
             url: Original URL (for error messages and logging)
+            soup: Already parsed document for ``html`` (parsed here if omitted)
 
         Returns:
             NormalizedListingSchema with extracted data, or None if insufficient data
         """
         try:
-            soup = BeautifulSoup(html, "html.parser")
+            if soup is None:
+                soup = parse_soup(html)
             meta_tags = soup.find_all("meta")
 
             # Build meta data dictionary
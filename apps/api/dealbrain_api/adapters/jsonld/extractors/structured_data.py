@@ -6,9 +6,23 @@ from typing import Any
 import extruct
 import httpx
 from dealbrain_api.adapters.base import AdapterError, AdapterException
+from extruct.jsonld import JsonLdExtractor
+from extruct.rdfa import RDFaExtractor
+from extruct.w3cmicrodata import MicrodataExtractor
+
+from ..document import ParsedDocument
 
 logger = logging.getLogger(__name__)
 
+# Syntaxes that can carry a Schema.org Product, in lookup priority order
+PRODUCT_SYNTAXES = ["json-ld", "microdata", "rdfa"]
+
+_SYNTAX_EXTRACTORS = {
+    "json-ld": JsonLdExtractor,
+    "microdata": MicrodataExtractor,
+    "rdfa": RDFaExtractor,
+}
+
 
 class StructuredDataExtractor:
     """
@@ -114,18 +128,45 @@ class StructuredDataExtractor:
                 metadata={"url": url},
             ) from e
 
-    def extract_structured_data(self, html: str, url: str) -> dict[str, Any]:
+    def extract_structured_data(
+        self, html: str | ParsedDocument, url: str
+    ) -> dict[str, list[dict[str, Any]]]:
         """
-        Extract all structured data from HTML using extruct.
+        Extract all Product-capable structured data from HTML using extruct.
 
         Args:
-            html: HTML content to parse
+            html: HTML content, or an already parsed document
             url: Base URL for resolving relative URLs
 
         Returns:
             Dict containing json-ld, microdata, and rdfa data
         """
-        return extruct.extract(html, base_url=url)
+        if isinstance(html, ParsedDocument):
+            return extruct.extract(html.tree, base_url=url, syntaxes=PRODUCT_SYNTAXES)
+        return extruct.extract(html, base_url=url, syntaxes=PRODUCT_SYNTAXES)
+
+    def find_product(self, document: ParsedDocument) -> dict[str, Any] | None:
+        """
+        Find the Schema.org Product in a page, stopping at the first syntax that has one.
+
+        Uses the same priority as find_product_schema() (JSON-LD -> Microdata ->
+        RDFa), but extracts one syntax at a time from the document's shared lxml
+        tree. Most retailer pages carry a JSON-LD Product, so Microdata and RDFa
+        extraction (RDFa being by far the slowest) are usually skipped.
+
+        Args:
+            document: Parsed page
+
+        Returns:
+            Product schema dict or None if not found
+        """
+        for syntax in PRODUCT_SYNTAXES:
+            extractor = _SYNTAX_EXTRACTORS[syntax]()
+            items = list(extractor.extract_items(document.tree, base_url=document.url))
+            product = self.find_product_schema({syntax: items})
+            if product:
+                return product
+        return None
 
     def find_product_schema(self, data: dict[str, Any]) -> dict[str, Any] | None:
         """
@@ -199,4 +240,4 @@ class StructuredDataExtractor:
         return False
 
 
-__all__ = ["StructuredDataExtractor"]
+__all__ = ["PRODUCT_SYNTAXES", "StructuredDataExtractor"]
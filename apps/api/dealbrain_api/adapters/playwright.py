@@ -9,12 +9,12 @@ from decimal import Decimal, InvalidOperation
 from typing import Any
 
 from dealbrain_api.adapters.base import AdapterError, AdapterException, BaseAdapter
-from dealbrain_api.adapters.browser_pool import BrowserPool
+from dealbrain_api.adapters.browser_pool import SCRAPING_TENANT, BrowserPool
 from dealbrain_api.settings import get_settings
 from dealbrain_api.telemetry import get_logger
 from dealbrain_core.enums import Condition
 from dealbrain_core.schemas.ingestion import NormalizedListingSchema
-from playwright.async_api import Browser, Page, TimeoutError as PlaywrightTimeoutError
+from playwright.async_api import BrowserContext, Page, TimeoutError as PlaywrightTimeoutError
 from prometheus_client import Counter, Gauge, Histogram
 
 logger = get_logger("dealbrain.adapters.playwright")
@@ -35,7 +35,7 @@ playwright_extraction_total = Counter(
 
 playwright_browser_pool_size = Gauge(
     "playwright_browser_pool_size",
-    "Number of browsers in pool by state",
+    "Number of browser context slots in pool by state",
     ["state"],  # in_use, available, total
 )
 
@@ -78,7 +78,7 @@ class PlaywrightAdapter(BaseAdapter):
     ------------
     - Priority: 10 (lowest, fallback adapter)
     - Supported domains: ["*"] (wildcard - all domains)
-    - Browser pool: Reuses 2-3 Chromium instances for performance
+    - Browser pool: Multiplexes isolated contexts over 2-3 Chromium instances
     - Timeout: 8s default (configurable)
     - Extraction strategy: CSS selectors + JavaScript evaluation
 
@@ -104,6 +104,7 @@ class PlaywrightAdapter(BaseAdapter):
     Performance:
     -----------
     - Browser pool amortizes launch cost (~1-2s per browser)
+    - Images, fonts and ad hosts are blocked by the pool's request interception
     - Page load + extraction: ~3-8s per URL
     - Network idle wait: ~1-3s typical
     - Target latency: <10s per request
@@ -132,7 +133,8 @@ class PlaywrightAdapter(BaseAdapter):
             enabled=True,
             timeout_s=8,
             max_retries=2,
-            pool_size=3,
+            pool_size=2,
+            max_contexts_per_browser=10,
             headless=True,
         )
     )
@@ -181,21 +183,18 @@ class PlaywrightAdapter(BaseAdapter):
         Ensure browser pool is initialized.
 
         Lazy initialization of browser pool to avoid startup cost if adapter
-        is never used. Uses singleton pattern to share pool across all requests.
+        is never used. The pool is the process-wide shared pool, also used by
+        card rendering; this adapter acquires contexts as the scraping tenant.
 
         Returns:
             Initialized BrowserPool instance
         """
         if self._browser_pool is None:
             logger.info("Initializing browser pool for PlaywrightAdapter...")
-            self._browser_pool = BrowserPool.get_instance(
-                pool_size=self.pool_size,
-                headless=self.headless,
-                timeout_ms=self.timeout_s * 1000,
-            )
-            await self._browser_pool.initialize()
-            logger.info("Browser pool initialized successfully")
+            self._browser_pool = BrowserPool.shared()
 
+        # No-op when already initialized on this event loop
+        await self._browser_pool.initialize()
         return self._browser_pool
 
     async def extract(self, url: str) -> NormalizedListingSchema:
@@ -204,12 +203,12 @@ class PlaywrightAdapter(BaseAdapter):
 
         This is the main entry point that orchestrates the extraction workflow:
         1. Validate URL format
-        2. Acquire browser from pool
-        3. Create new page with anti-detection settings
+        2. Acquire an isolated browser context from pool
+        3. Create new page (context carries anti-detection settings)
         4. Load page and wait for network idle
         5. Extract data using CSS selectors and JavaScript
         6. Map to NormalizedListingSchema
-        7. Release browser back to pool
+        7. Release context back to pool
 
         Args:
             url: URL to extract listing data from
@@ -233,10 +232,12 @@ class PlaywrightAdapter(BaseAdapter):
         stats = pool.get_pool_stats()
         playwright_browser_pool_size.labels(state="in_use").set(stats["in_use"])
         playwright_browser_pool_size.labels(state="available").set(stats["available"])
-        playwright_browser_pool_size.labels(state="total").set(stats["pool_size"])
+        playwright_browser_pool_size.labels(state="total").set(
+            stats.get("capacity", stats["pool_size"])
+        )
 
-        # Acquire browser from pool
-        browser = await pool.acquire()
+        # Acquire browser context from pool
+        context = await pool.acquire(tenant=SCRAPING_TENANT)
 
         try:
             # Check rate limit before making request
@@ -244,8 +245,8 @@ class PlaywrightAdapter(BaseAdapter):
 
             # Execute extraction with retry logic
             normalized = await self.retry_config.execute_with_retry(
-                self._extract_with_browser,
-                browser,
+                self._extract_with_context,
+                context,
                 url,
             )
 
@@ -280,8 +281,8 @@ class PlaywrightAdapter(BaseAdapter):
             raise
 
         finally:
-            # Always release browser back to pool
-            await pool.release(browser)
+            # Always release context back to pool
+            await pool.release(context)
 
             # Record metrics
             duration_ms = (time.time() - start_time) * 1000
@@ -293,19 +294,20 @@ class PlaywrightAdapter(BaseAdapter):
             playwright_browser_pool_size.labels(state="in_use").set(stats["in_use"])
             playwright_browser_pool_size.labels(state="available").set(stats["available"])
 
-    async def _extract_with_browser(
+    async def _extract_with_context(
         self,
-        browser: Browser,
+        context: BrowserContext,
         url: str,
     ) -> NormalizedListingSchema:
         """
-        Extract data using provided browser instance.
+        Extract data using provided browser context.
 
-        This method creates a new page, configures anti-detection settings,
-        loads the URL, and extracts data using CSS selectors and JavaScript.
+        This method creates a new page in the pooled context (which already
+        carries anti-detection settings and request interception), loads the
+        URL, and extracts data using CSS selectors and JavaScript.
 
         Args:
-            browser: Browser instance from pool
+            context: BrowserContext from pool
             url: URL to extract data from
 
         Returns:
@@ -317,23 +319,8 @@ class PlaywrightAdapter(BaseAdapter):
         page: Page | None = None
 
         try:
-            # Create new page with anti-detection settings
-            page = await browser.new_page(
-                viewport={"width": 1920, "height": 1080},
-                user_agent=(
-                    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
-                    "(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
-                ),
-            )
-
-            # Override navigator.webdriver to avoid detection
-            await page.add_init_script(
-                """
-                Object.defineProperty(navigator, 'webdriver', {
-                    get: () => undefined
-                });
-                """
-            )
+            # Viewport, user agent and webdriver override are set on the context
+            page = await context.new_page()
 
             logger.debug(f"Loading page: {url}")
 
@@ -687,7 +674,8 @@ class PlaywrightAdapter(BaseAdapter):
 
         # Check refurb first (before new) to avoid "renewed" matching "new"
         if any(
-            keyword in condition_lower for keyword in ["refurb", "renewed", "refurbished", "recertified"]
+            keyword in condition_lower
+            for keyword in ["refurb", "renewed", "refurbished", "recertified"]
         ):
             return str(Condition.REFURB.value)
         elif "brand new" in condition_lower or "brand-new" in condition_lower:
@@ -771,7 +759,9 @@ class PlaywrightAdapter(BaseAdapter):
                     text = await element.text_content()
                     if text and len(text.strip()) > 10:
                         description = text.strip()
-                        logger.debug(f"Extracted description from selector '{selector}': {len(description)} chars")
+                        logger.debug(
+                            f"Extracted description from selector '{selector}': {len(description)} chars"
+                        )
                         return description
             except Exception as e:
                 logger.debug(f"Failed to extract description with selector '{selector}': {e}")
@@ -2,11 +2,22 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
+import time
 from urllib.parse import urlparse
 
 from dealbrain_api.adapters.base import AdapterError, AdapterException, BaseAdapter
+from dealbrain_api.adapters.circuit_breaker import (
+    CircuitBreakerRegistry,
+    get_circuit_breaker_registry,
+)
 from dealbrain_api.adapters.ebay import EbayAdapter
+from dealbrain_api.adapters.hedging import (
+    AdapterLatencyTracker,
+    HedgingPolicy,
+    adapter_latency_tracker,
+)
 from dealbrain_api.adapters.jsonld import JsonLdAdapter
 from dealbrain_api.adapters.playwright import PlaywrightAdapter
 from dealbrain_api.settings import get_settings
@@ -55,6 +66,21 @@ class AdapterRouter:
     - JsonLdAdapter: priority 5 (fallback)
     - If two adapters have same priority, first in registry wins
 
+    Hedged Fallback (optional):
+    --------------------------
+    With ``settings.ingestion.hedging.enabled``, extract() does not wait for a
+    slow adapter to fail before trying the next one. If the running adapter
+    has not answered within its hedge delay, the next adapter starts in
+    parallel; the first successful result wins and the rest are cancelled.
+    Hedge delays are derived from each adapter's recorded latency percentile.
+
+    Circuit Breakers (optional):
+    ---------------------------
+    With ``settings.ingestion.circuit_breaker.enabled``, each adapter has a
+    breaker per domain (shared across workers through Redis). Adapters whose
+    circuit is open are skipped, and degraded adapters (low recent success
+    rate or high latency) are tried after healthy ones.
+
     Example Usage:
     -------------
     ```python
@@ -79,14 +105,30 @@ class AdapterRouter:
     - PARSE_ERROR: Invalid URL format
     """
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        hedging: HedgingPolicy | None = None,
+        latency_tracker: AdapterLatencyTracker | None = None,
+        circuit_breakers: CircuitBreakerRegistry | None = None,
+    ) -> None:
         """
         Initialize adapter router.
 
         Loads available adapters from registry and prepares for routing.
+
+        Args:
+            hedging: Hedging policy (default: built from settings)
+            latency_tracker: Adapter latency tracker (default: process-wide tracker)
+            circuit_breakers: Circuit breaker registry (default: process-wide registry)
         """
         self.adapters = AVAILABLE_ADAPTERS
-        logger.info(f"Initialized AdapterRouter with {len(self.adapters)} adapters")
+        self.hedging = hedging if hedging is not None else HedgingPolicy.from_settings()
+        self.latency_tracker = latency_tracker or adapter_latency_tracker
+        self.circuit_breakers = circuit_breakers or get_circuit_breaker_registry()
+        logger.info(
+            f"Initialized AdapterRouter with {len(self.adapters)} adapters "
+            f"(hedging={'on' if self.hedging.enabled else 'off'})"
+        )
 
     def select_adapter(self, url: str) -> BaseAdapter:
         """
@@ -160,8 +202,9 @@ class AdapterRouter:
         """
         Extract data using fallback chain.
 
-        Tries adapters in priority order until one succeeds. This implements
-        the adapter fallback mechanism:
+        Tries adapters in priority order until one succeeds (or, with hedging
+        enabled, overlaps slow adapters with the next ones; see
+        _extract_hedged). This implements the adapter fallback mechanism:
         1. Get list of matching adapters sorted by priority
         2. Try each adapter in order
         3. Log each attempt
@@ -195,81 +238,274 @@ class AdapterRouter:
                 metadata={"url": url, "error": str(e)},
             ) from e
 
-        # Step 2: Get all matching adapters sorted by priority
+        # Step 2: Get all matching adapters sorted by priority (and health)
+        if self.circuit_breakers.enabled:
+            candidates = self._find_matching_adapters(url, domain)
+            await self.circuit_breakers.refresh(
+                domain, [self._get_adapter_name(a) for a in candidates]
+            )
         matching = self._get_matching_adapters_sorted(url, domain)
 
         if not matching:
+            open_circuits = [
+                self._get_adapter_name(a)
+                for a in self._find_matching_adapters(url, domain)
+                if self.circuit_breakers.enabled
+                and not self.circuit_breakers.is_available(self._get_adapter_name(a), domain)
+            ]
+            if open_circuits:
+                raise AdapterException(
+                    AdapterError.ALL_ADAPTERS_FAILED,
+                    f"All adapters for {domain} are unavailable (circuit open)",
+                    metadata={"url": url, "domain": domain, "open_circuits": open_circuits},
+                )
             raise AdapterException(
                 AdapterError.NO_ADAPTER_FOUND,
                 f"No adapter found for URL: {url}",
                 metadata={"url": url, "domain": domain},
             )
 
-        # Step 3: Try each adapter in priority order
+        # Step 3: Drop adapters disabled in settings
+        enabled: list[type[BaseAdapter]] = []
+        for adapter_class in matching:
+            if self._is_adapter_class_enabled(adapter_class):
+                enabled.append(adapter_class)
+            else:
+                adapter_name = self._get_adapter_name(adapter_class)
+                logger.info(f"Skipping {adapter_name} adapter (disabled in settings)")
+
+        if self.hedging.enabled and len(enabled) > 1:
+            return await self._extract_hedged(url, domain, enabled)
+
+        # Step 4: Try each adapter in priority order
         last_error = None
-        attempted_adapters = []
+        attempted_adapters: list[str] = []
 
-        for adapter_class in matching:
+        for adapter_class in enabled:
             adapter_name = self._get_adapter_name(adapter_class)
 
-            # Check if adapter is enabled before trying
-            if not self._is_adapter_class_enabled(adapter_class):
-                logger.info(f"Skipping {adapter_name} adapter (disabled in settings)")
-                continue  # Skip to next adapter silently
-
             try:
-                # Try to initialize adapter
-                logger.info(f"Trying adapter {adapter_name} for {url}")
-                adapter = adapter_class()  # type: ignore[call-arg]
-                attempted_adapters.append(adapter_name)
-
-                # Try to extract
-                result = await adapter.extract(url)
+                result = await self._run_adapter(adapter_class, url, domain, attempted_adapters)
 
                 logger.info(f"Success with {adapter_name} adapter")
                 return (result, adapter_name)
 
-            except AdapterException as e:
-                # Adapter-specific error (timeout, parse error, etc.)
-                last_error = e
-                logger.warning(f"{adapter_name} adapter failed: [{e.error_type.value}] {e.message}")
+            except Exception as e:
+                last_error = self._handle_adapter_failure(adapter_name, url, e)
 
                 # Don't retry if item not found (definitive failure)
-                if e.error_type == AdapterError.ITEM_NOT_FOUND:
-                    logger.info(f"Fast-fail for {e.error_type.value}, not trying other adapters")
+                if last_error.error_type == AdapterError.ITEM_NOT_FOUND:
+                    logger.info(
+                        f"Fast-fail for {last_error.error_type.value}, not trying other adapters"
+                    )
                     raise
 
                 # Try next adapter for retryable errors
                 continue
 
-            except ValueError as e:
-                # Initialization error (missing API key, etc.)
-                last_error = AdapterException(
-                    AdapterError.CONFIGURATION_ERROR,
-                    str(e),
-                    metadata={"adapter": adapter_name, "url": url},
+        raise self._all_failed_error(url, attempted_adapters, last_error)
+
+    async def _extract_hedged(
+        self,
+        url: str,
+        domain: str,
+        adapter_classes: list[type[BaseAdapter]],
+    ) -> tuple[NormalizedListingSchema, str]:
+        """
+        Extract with hedged fallback: overlap slow adapters with the next ones.
+
+        Adapters start in priority order. The next adapter is started when the
+        most recently started one fails, or when it has been running longer
+        than its hedge delay. The first successful result wins and all other
+        in-flight attempts are cancelled. ITEM_NOT_FOUND still fast-fails.
+
+        Args:
+            url: The URL to extract data from
+            domain: Normalized domain from URL
+            adapter_classes: Enabled adapters sorted by priority
+
+        Returns:
+            Tuple of (normalized listing data, adapter name used)
+
+        Raises:
+            AdapterException: If all adapters fail or item not found
+        """
+        loop = asyncio.get_running_loop()
+        pending: dict[asyncio.Task[NormalizedListingSchema], str] = {}
+        attempted_adapters: list[str] = []
+        last_error: AdapterException | None = None
+        next_index = 0
+        next_launch_at = 0.0
+
+        def launch_next() -> None:
+            nonlocal next_index, next_launch_at
+            adapter_class = adapter_classes[next_index]
+            adapter_name = self._get_adapter_name(adapter_class)
+            next_index += 1
+            task = asyncio.ensure_future(
+                self._run_adapter(adapter_class, url, domain, attempted_adapters)
+            )
+            pending[task] = adapter_name
+            next_launch_at = loop.time() + self.hedging.hedge_delay_s(
+                adapter_name, self.latency_tracker
+            )
+
+        async def cancel_pending() -> None:
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+            pending.clear()
+
+        try:
+            launch_next()
+            while pending:
+                timeout = None
+                if next_index < len(adapter_classes):
+                    timeout = max(0.0, next_launch_at - loop.time())
+
+                done, _ = await asyncio.wait(
+                    pending, timeout=timeout, return_when=asyncio.FIRST_COMPLETED
                 )
-                logger.warning(f"{adapter_name} adapter initialization failed: {e}")
-                continue
 
-            except Exception as e:
-                # Unexpected error
-                last_error = AdapterException(
-                    AdapterError.NETWORK_ERROR,
-                    f"Unexpected error in {adapter_name}: {e}",
-                    metadata={"adapter": adapter_name, "url": url},
+                if not done:
+                    hedged_name = self._get_adapter_name(adapter_classes[next_index])
+                    logger.info(f"Hedging: starting {hedged_name} adapter in parallel for {url}")
+                    launch_next()
+                    continue
+
+                for task in done:
+                    adapter_name = pending.pop(task)
+                    error = task.exception()
+                    if error is None:
+                        logger.info(f"Success with {adapter_name} adapter")
+                        await cancel_pending()
+                        return (task.result(), adapter_name)
+
+                    last_error = self._handle_adapter_failure(adapter_name, url, error)
+                    if last_error.error_type == AdapterError.ITEM_NOT_FOUND:
+                        logger.info(
+                            f"Fast-fail for {last_error.error_type.value}, "
+                            "not trying other adapters"
+                        )
+                        await cancel_pending()
+                        raise last_error
+
+                # A failure frees the lane: start the next adapter right away
+                if not pending and next_index < len(adapter_classes):
+                    launch_next()
+        finally:
+            if pending:
+                await cancel_pending()
+
+        raise self._all_failed_error(url, attempted_adapters, last_error)
+
+    async def _run_adapter(
+        self,
+        adapter_class: type[BaseAdapter],
+        url: str,
+        domain: str,
+        attempted_adapters: list[str],
+    ) -> NormalizedListingSchema:
+        """
+        Instantiate an adapter, run its extraction and record its latency and health.
+
+        Args:
+            adapter_class: Adapter class to run
+            url: The URL to extract data from
+            domain: Normalized domain from URL (circuit breaker key)
+            attempted_adapters: Attempt log, appended once the adapter initializes
+
+        Returns:
+            Normalized listing data from the adapter
+        """
+        adapter_name = self._get_adapter_name(adapter_class)
+
+        # Try to initialize adapter
+        logger.info(f"Trying adapter {adapter_name} for {url}")
+        adapter = adapter_class()  # type: ignore[call-arg]
+        attempted_adapters.append(adapter_name)
+
+        start = time.perf_counter()
+        outcome = "error"
+        try:
+            result = await adapter.extract(url)
+            outcome = "success"
+        except asyncio.CancelledError:
+            outcome = "cancelled"
+            raise
+        except AdapterException as e:
+            if self.circuit_breakers.enabled:
+                await self.circuit_breakers.record_failure(adapter_name, domain, e.error_type)
+            raise
+        except Exception:
+            if self.circuit_breakers.enabled:
+                await self.circuit_breakers.record_failure(
+                    adapter_name, domain, AdapterError.NETWORK_ERROR
                 )
-                logger.error(f"{adapter_name} adapter unexpected error: {e}", exc_info=True)
-                continue
+            raise
+        finally:
+            duration_s = time.perf_counter() - start
+            self.latency_tracker.record(adapter_name, duration_s, outcome)
+
+        if self.circuit_breakers.enabled:
+            await self.circuit_breakers.record_success(adapter_name, domain, duration_s)
+        return result
+
+    def _handle_adapter_failure(
+        self,
+        adapter_name: str,
+        url: str,
+        error: BaseException,
+    ) -> AdapterException:
+        """
+        Log an adapter failure and normalize it to an AdapterException.
+
+        Args:
+            adapter_name: Adapter that failed
+            url: URL being extracted
+            error: Exception raised by the adapter (or its constructor)
+
+        Returns:
+            AdapterException describing the failure
+        """
+        if isinstance(error, AdapterException):
+            # Adapter-specific error (timeout, parse error, etc.)
+            logger.warning(
+                f"{adapter_name} adapter failed: [{error.error_type.value}] {error.message}"
+            )
+            return error
+
+        if isinstance(error, ValueError):
+            # Initialization error (missing API key, etc.)
+            logger.warning(f"{adapter_name} adapter initialization failed: {error}")
+            return AdapterException(
+                AdapterError.CONFIGURATION_ERROR,
+                str(error),
+                metadata={"adapter": adapter_name, "url": url},
+            )
+
+        # Unexpected error
+        logger.error(f"{adapter_name} adapter unexpected error: {error}", exc_info=error)
+        return AdapterException(
+            AdapterError.NETWORK_ERROR,
+            f"Unexpected error in {adapter_name}: {error}",
+            metadata={"adapter": adapter_name, "url": url},
+        )
 
-        # All adapters failed
+    def _all_failed_error(
+        self,
+        url: str,
+        attempted_adapters: list[str],
+        last_error: AdapterException | None,
+    ) -> AdapterException:
+        """Build the ALL_ADAPTERS_FAILED exception for a URL."""
         error_details = {
             "attempted_adapters": attempted_adapters,
             "last_error_type": last_error.error_type.value if last_error else None,
             "last_error_message": str(last_error) if last_error else None,
         }
 
-        raise AdapterException(
+        return AdapterException(
             AdapterError.ALL_ADAPTERS_FAILED,
             f"All {len(attempted_adapters)} adapters failed for {url}",
             metadata=error_details,
@@ -352,6 +588,11 @@ class AdapterRouter:
         all adapters that support the URL and sorts them by priority
         (lower number = higher priority).
 
+        With circuit breakers enabled, adapters whose circuit is open for the
+        domain are skipped, and degraded adapters are moved behind healthy
+        ones (priority order is kept within each group). Breaker state must
+        have been loaded with ``circuit_breakers.refresh()`` beforehand.
+
         Args:
             url: Original URL (for logging)
             domain: Normalized domain from URL
@@ -362,6 +603,19 @@ class AdapterRouter:
         matching = self._find_matching_adapters(url, domain)
         matching.sort(key=lambda a: self._get_adapter_priority(a))
 
+        if self.circuit_breakers.enabled:
+            breakers = self.circuit_breakers
+            available: list[type[BaseAdapter]] = []
+            for adapter_class in matching:
+                adapter_name = self._get_adapter_name(adapter_class)
+                if breakers.is_available(adapter_name, domain):
+                    available.append(adapter_class)
+                else:
+                    logger.info(f"Skipping {adapter_name} adapter for {domain} (circuit open)")
+            # Stable sort: healthy adapters first, priority order within each group
+            available.sort(key=lambda a: breakers.is_degraded(self._get_adapter_name(a), domain))
+            matching = available
+
         if matching:
             adapter_names = [
                 f"{self._get_adapter_name(a)} (priority {self._get_adapter_priority(a)})"
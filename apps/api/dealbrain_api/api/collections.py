@@ -14,6 +14,7 @@ This module provides REST API endpoints for managing deal collections (FR-A4):
 - PATCH /collections/{id}/items/{item_id} - Update collection item
 - DELETE /collections/{id}/items/{item_id} - Remove item from collection
 - GET /collections/{id}/export - Export collection as CSV or JSON
+- GET /collections/import/{preview_id}/rows - Page through an import preview
 """
 
 from __future__ import annotations
@@ -1631,7 +1632,7 @@ async def import_collection(
             )
 
         # Initialize export service
-        from ..services.export_import import ExportImportService, _preview_cache
+        from ..services.export_import import ExportImportService, _preview_store
 
         export_service = ExportImportService(session)
 
@@ -1643,7 +1644,7 @@ async def import_collection(
             )
 
             # Retrieve preview to build response
-            preview = _preview_cache.get(preview_id)
+            preview = await _preview_store.get(preview_id)
 
             if not preview:
                 raise HTTPException(
@@ -1700,6 +1701,61 @@ async def import_collection(
             )
 
 
+# ==================== GET /collections/import/{preview_id}/rows ====================
+
+
+@router.get(
+    "/import/{preview_id}/rows",
+    status_code=status.HTTP_200_OK,
+    summary="Page through an import preview",
+    description=(
+        "Return a window of collection items from an import preview so large "
+        "previews can be scrolled without downloading them whole."
+    ),
+    responses={
+        200: {"description": "Preview rows returned"},
+        401: {"description": "Authentication required"},
+        404: {"description": "Preview not found or expired"},
+    },
+)
+async def get_import_preview_rows(
+    preview_id: str,
+    current_user: CurrentUserDep,
+    offset: int = Query(0, ge=0, description="Position of the first item"),
+    limit: int = Query(100, ge=1, le=1000, description="Maximum items to return"),
+) -> dict:
+    """Return a page of items from a collection import preview.
+
+    Only the stored pages covering the requested window are read, so any API
+    worker can serve any preview regardless of its size.
+
+    Example:
+        GET /api/v1/collections/import/{preview_id}/rows?offset=200&limit=100
+
+        Response (200):
+        {
+            "preview_id": "550e8400-e29b-41d4-a716-446655440000",
+            "offset": 200,
+            "total": 50000,
+            "items": [{ "listing": { ... }, "status": "undecided", ... }]
+        }
+    """
+    from ..services.export_import import _preview_store
+
+    page = await _preview_store.get_rows(preview_id, offset, limit)
+    if page is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Preview not found or expired"
+        )
+
+    return {
+        "preview_id": page.preview_id,
+        "offset": page.offset,
+        "total": page.total,
+        "items": page.rows,
+    }
+
+
 # ==================== Task 2c-api-4b: POST /collections/import/confirm ====================
 
 
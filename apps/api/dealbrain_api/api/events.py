@@ -2,108 +2,89 @@
 Server-Sent Events (SSE) endpoint for real-time updates.
 
 Provides SSE endpoint for streaming real-time events to connected clients.
-Clients connect via EventSource and receive events published to Redis pub/sub channel.
+Clients connect via EventSource and receive events appended to the Redis
+Stream, read once per process and fanned out by the shared ``EventHub``.
+Each event carries its stream ID; a reconnecting client sends the last one
+back (``Last-Event-ID``) and only the events it missed are replayed.
 """
 
 from __future__ import annotations
 
 import asyncio
 
-from fastapi import APIRouter, Request
+from fastapi import APIRouter, Header, Query
 from sse_starlette.sse import EventSourceResponse
 
-from ..cache import cache_manager
-from ..events import EVENTS_CHANNEL
+from ..events.hub import EventFilter, EventHub
 from ..telemetry import get_logger
 
 logger = get_logger("dealbrain.api.events")
 
 router = APIRouter(prefix="/v1/events", tags=["events"])
 
+# Seconds between keep-alive comments on idle streams
+HEARTBEAT_INTERVAL_SECONDS = 15
 
-async def event_stream(request: Request):
+
+async def event_stream(
+    event_filter: EventFilter,
+    hub: EventHub | None = None,
+    last_event_id: str | None = None,
+):
     """
     Stream events to client via SSE.
 
-    Subscribes to Redis pub/sub channel and streams events to connected client.
-    Handles client disconnection gracefully and cleans up subscriptions.
+    Registers a queue with the shared event hub and yields matching events
+    until the client disconnects (the response cancels this generator) or
+    is dropped for falling behind. Events published after ``last_event_id``
+    are replayed first.
 
     Yields:
-        dict: SSE event with 'event' and 'data' keys
+        dict: SSE event with 'id', 'event' and 'data' keys
 
     Example event:
         {
+            "id": "1732017600000-0",
             "event": "listing.created",
             "data": '{"listing_id": 123, "timestamp": "2025-11-19T12:00:00Z"}'
         }
     """
-    logger.info("sse.connection.opened")
-
-    redis = await cache_manager.get_redis()
-    pubsub = redis.pubsub()
+    hub = hub or EventHub.shared()
+    subscription = await hub.subscribe(event_filter, last_event_id)
+    logger.info("sse.connection.opened", clients=hub.subscriber_count, last_event_id=last_event_id)
 
     try:
-        await pubsub.subscribe(EVENTS_CHANNEL)
-        logger.debug("sse.subscribed", channel=EVENTS_CHANNEL)
-
-        # Send initial comment to establish connection
+        # Send initial event to establish connection
         yield {
             "event": "connected",
             "data": '{"status": "connected"}',
         }
 
-        # Stream events until client disconnects
-        while True:
-            # Check if client disconnected
-            if await request.is_disconnected():
-                logger.info("sse.connection.closed")
-                break
-
-            # Get message from Redis pub/sub (non-blocking)
-            message = await pubsub.get_message(ignore_subscribe_messages=True, timeout=0.1)
-
-            if message and message["type"] == "message":
-                try:
-                    # message["data"] is already the JSON string from publish_event
-                    event_data = message["data"]
-
-                    # Parse to extract event type
-                    import json
-
-                    parsed = json.loads(event_data)
-                    event_type = parsed.get("type", "unknown")
-
-                    # Stream to client
-                    yield {
-                        "event": event_type,
-                        "data": json.dumps(parsed.get("data", {})),
-                    }
-
-                    logger.debug("sse.event.sent", event_type=event_type)
-
-                except Exception as exc:
-                    logger.error("sse.event.parse_error", error=str(exc))
-                    continue
-
-            # Prevent busy loop
-            await asyncio.sleep(0.1)
+        async for event in subscription:
+            yield event
 
+        if subscription.dropped:
+            logger.info("sse.connection.dropped")
     except asyncio.CancelledError:
-        logger.info("sse.connection.cancelled")
-    except Exception as exc:
-        logger.error("sse.connection.error", error=str(exc))
+        logger.info("sse.connection.closed")
+        raise
     finally:
-        # Clean up subscription
-        try:
-            await pubsub.unsubscribe(EVENTS_CHANNEL)
-            await pubsub.close()
-            logger.debug("sse.unsubscribed", channel=EVENTS_CHANNEL)
-        except Exception as exc:
-            logger.warning("sse.cleanup_error", error=str(exc))
+        await hub.unsubscribe(subscription)
 
 
 @router.get("", response_class=EventSourceResponse)
-async def stream_events(request: Request):
+async def stream_events(
+    types: str | None = Query(
+        None, description="Comma-separated event types to receive (default: all)"
+    ),
+    job_id: str | None = Query(None, description="Only receive events for this import job"),
+    last_event_id_param: str | None = Query(
+        None,
+        alias="last_event_id",
+        description="Resume after this event ID (for clients that reconnect manually)",
+    ),
+    last_event_id: str | None = Header(None, alias="Last-Event-ID"),
+):
     """
     SSE endpoint for real-time event streaming.
 
@@ -122,10 +103,22 @@ async def stream_events(request: Request):
     - import.completed: Import job completed
     - import.progress: Real-time import progress updates
 
+    Clients interested in a single import job can narrow the stream:
+        new EventSource('/api/v1/events?types=import.progress&job_id=<uuid>')
+
+    Every event carries an ID. Browsers resend the last one as the
+    Last-Event-ID header when EventSource reconnects (clients that create a
+    new EventSource pass it as ?last_event_id=) and only the events missed
+    since then are replayed.
+
     Returns:
         EventSourceResponse: SSE stream with events
     """
-    return EventSourceResponse(event_stream(request))
+    event_filter = EventFilter.from_params(types.split(",") if types else None, job_id)
+    return EventSourceResponse(
+        event_stream(event_filter, last_event_id=last_event_id or last_event_id_param),
+        ping=HEARTBEAT_INTERVAL_SECONDS,
+    )
 
 
 __all__ = ["router"]
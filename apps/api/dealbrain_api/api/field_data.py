@@ -6,21 +6,14 @@ from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ..db import session_dependency
-from ..services.field_registry import FieldRegistry
+from ..services.field_registry import FieldRegistry, InvalidCursorError, get_field_registry
 
 router = APIRouter(prefix="/v1/fields-data", tags=["fields"])
 
-# Lazy initialization to avoid circular import during module loading
-# The FieldRegistry imports from api.listings.schema, which triggers api.listings.__init__
-_registry: FieldRegistry | None = None
-
 
 def get_registry() -> FieldRegistry:
-    """Get or create the singleton FieldRegistry instance."""
-    global _registry
-    if _registry is None:
-        _registry = FieldRegistry()
-    return _registry
+    """Get the shared FieldRegistry instance."""
+    return get_field_registry()
 
 
 @router.get("/entities")
@@ -54,11 +47,16 @@ async def list_entity_records(
     entity: str,
     limit: int = Query(default=50, ge=1, le=200),
     offset: int = Query(default=0, ge=0),
+    cursor: str | None = Query(default=None, description="next_cursor of the previous page"),
     db: AsyncSession = Depends(session_dependency),
 ) -> dict[str, object]:
     registry = get_registry()
     try:
-        return await registry.list_records(db, entity=entity, limit=limit, offset=offset)
+        return await registry.list_records(
+            db, entity=entity, limit=limit, offset=offset, cursor=cursor
+        )
+    except InvalidCursorError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
     except ValueError as exc:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(exc)) from exc
 
@@ -23,7 +23,8 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from ..db import session_dependency
 from ..models.core import ImportSession
-from ..tasks.ingestion import ingest_url_task
+from ..settings import get_settings
+from ..tasks.ingestion import ingest_url_batch_task, ingest_url_task
 
 logger = logging.getLogger(__name__)
 
@@ -142,7 +143,8 @@ async def create_bulk_url_import(
 
     This endpoint accepts a file upload (CSV or JSON format) containing up to 1000 URLs,
     creates a parent ImportSession and child sessions for each URL, and queues Celery tasks
-    for asynchronous processing.
+    for asynchronous processing. Children are queued in batches of
+    ``ingestion.bulk_batch_size`` so duplicates are resolved once per batch.
 
     File Formats:
 
@@ -328,8 +330,14 @@ async def create_bulk_url_import(
         await session.commit()
 
         # Now queue Celery tasks (safe - all ImportSession records are committed and visible)
-        for child_job_id, url in child_job_ids:
-            ingest_url_task.delay(job_id=child_job_id, url=url)
+        batch_size = get_settings().ingestion.bulk_batch_size
+        for start in range(0, len(child_job_ids), batch_size):
+            ingest_url_batch_task.delay(
+                jobs=[
+                    {"job_id": child_job_id, "url": url}
+                    for child_job_id, url in child_job_ids[start : start + batch_size]
+                ]
+            )
 
         logger.info(
             "Bulk URL import job created and queued",
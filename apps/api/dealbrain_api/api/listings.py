@@ -355,8 +355,8 @@ async def import_listing(
         )
 
         # Retrieve preview to build response
-        from ..services.export_import import _preview_cache
-        preview = _preview_cache.get(preview_id)
+        from ..services.export_import import _preview_store
+        preview = await _preview_store.get(preview_id)
 
         if not preview:
             raise HTTPException(
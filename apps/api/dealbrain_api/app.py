@@ -18,11 +18,32 @@ async def lifespan(app: FastAPI):
     FastAPI lifespan context manager for startup and shutdown events.
 
     Handles:
-    - Startup: No specific actions (browser pool lazy-initialized on first use)
-    - Shutdown: Close browser pool to release resources gracefully
+    - Startup: Sync custom field indexes with their definitions, and warm up
+      the shared browser pool if enabled (otherwise it is lazily initialized
+      on first use)
+    - Shutdown: Close browser pool and SSE event hub to release resources gracefully
     """
     # Startup
     logger.info("FastAPI application starting up...")
+    settings = get_settings()
+    try:
+        from .services.custom_field_indexes import reconcile_custom_field_indexes
+
+        synced = await reconcile_custom_field_indexes()
+        logger.info(
+            f"Custom field indexes synced: {len(synced.created)} created, "
+            f"{len(synced.dropped)} dropped"
+        )
+    except Exception as e:
+        logger.error(f"Custom field index sync failed: {e}", exc_info=True)
+    if settings.playwright.enabled and settings.playwright.warm_up_on_startup:
+        try:
+            from .adapters.browser_pool import BrowserPool
+
+            health = await BrowserPool.shared().warm_up()
+            logger.info(f"Browser pool warmed up: {health}")
+        except Exception as e:
+            logger.error(f"Browser pool warm-up failed: {e}", exc_info=True)
     yield
     # Shutdown
     logger.info("FastAPI application shutting down...")
@@ -39,6 +60,15 @@ async def lifespan(app: FastAPI):
             logger.info("No browser pool to close")
     except Exception as e:
         logger.error(f"Error during shutdown: {e}", exc_info=True)
+    try:
+        from .events.hub import EventHub
+
+        # End open SSE streams and release the shared Redis subscription
+        hub = EventHub._instance
+        if hub is not None:
+            await hub.close()
+    except Exception as e:
+        logger.error(f"Error closing event hub: {e}", exc_info=True)
 
 
 def create_app() -> FastAPI:
@@ -3,8 +3,9 @@
 from __future__ import annotations
 
 import logging
-from collections.abc import AsyncIterator, Callable
+from collections.abc import AsyncIterator, Callable, Hashable
 from contextlib import asynccontextmanager
+from typing import Any
 
 from sqlalchemy.ext.asyncio import (
     AsyncEngine,
@@ -73,6 +74,20 @@ async def dispose_engine() -> None:
         _session_factory = None
 
 
+def database_key(bind: Any) -> Hashable:
+    """Identify the database behind an engine for process-wide caches.
+
+    Celery tasks dispose and recreate the engine on every run, so caches keyed
+    by the engine object would be rebuilt for each task. Engines for the same
+    URL share a key; in-memory SQLite databases live only as long as their
+    engine and are keyed by the engine itself.
+    """
+    url = bind.url
+    if url.get_backend_name() == "sqlite" and url.database in (None, "", ":memory:"):
+        return bind
+    return url.render_as_string(hide_password=False)
+
+
 def get_session_factory() -> async_sessionmaker[AsyncSession]:
     """Return a configured session factory."""
     global _session_factory
@@ -116,6 +131,7 @@ __all__ = [
     "Base",
     "get_engine",
     "dispose_engine",
+    "database_key",
     "get_session_factory",
     "session_scope",
     "SessionDependency",
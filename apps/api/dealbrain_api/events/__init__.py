@@ -5,17 +5,19 @@ This module provides event types, schemas, and utilities for streaming real-time
 updates to connected clients via SSE.
 
 Architecture:
-- Event producers publish events to Redis pub/sub channel 'dealbrain:events'
-- SSE endpoint subscribes to channel and streams to connected clients
+- Event producers append events to the capped Redis Stream 'dealbrain:events'
+- Each API process tails the stream once and fans events out to SSE clients
 - Clients receive events and invalidate caches/update UI
 
 Event Flow:
 1. Service layer calls publish_event() after creating/updating/deleting entities
-2. Event published to Redis channel 'dealbrain:events'
-3. SSE endpoint receives event and streams to all connected clients
+2. Event appended to Redis Stream 'dealbrain:events' and assigned an ID
+3. SSE endpoint streams the event, with its ID, to matching connected clients
 4. Frontend EventSource listeners receive events and trigger handlers
 5. React Query invalidates caches, UI updates automatically
 
+A client reconnecting with ``Last-Event-ID`` is replayed the events it missed.
+
 Supported Events:
 - listing.created: New listing created
 - listing.updated: Listing fields updated
@@ -32,8 +34,8 @@ from typing import Any
 
 from pydantic import BaseModel, Field
 
-from ..cache import cache_manager
 from ..telemetry import get_logger
+from . import stream
 
 logger = get_logger("dealbrain.events")
 
@@ -104,15 +106,15 @@ class Event(BaseModel):
     data: dict[str, Any] = Field(..., description="Event payload data")
 
 
-# Redis pub/sub channel for events
-EVENTS_CHANNEL = "dealbrain:events"
+# Redis Stream holding published events
+EVENTS_CHANNEL = stream.EVENTS_STREAM_KEY
 
 
 async def publish_event(event_type: EventType, data: dict[str, Any]) -> None:
     """
-    Publish event to Redis pub/sub channel.
+    Publish event to the Redis event stream.
 
-    Events are published to 'dealbrain:events' channel and consumed by SSE endpoint.
+    Events are appended to the 'dealbrain:events' stream and consumed by the SSE endpoint.
 
     Args:
         event_type: Type of event to publish
@@ -125,16 +127,15 @@ async def publish_event(event_type: EventType, data: dict[str, Any]) -> None:
         )
     """
     try:
-        redis = await cache_manager.get_redis()
-
         event = Event(type=event_type, data=data)
         message = event.model_dump_json()
 
-        await redis.publish(EVENTS_CHANNEL, message)
+        event_id = await stream.event_log.append(message)
 
         logger.debug(
             "event.published",
             event_type=event_type.value,
+            event_id=event_id,
             data=data,
         )
     except Exception as exc:
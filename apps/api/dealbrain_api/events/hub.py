@@ -0,0 +1,302 @@
+"""
+Process-wide fan-out of published events to SSE clients.
+
+Each API process tails the event stream (``EVENTS_CHANNEL``) with a single
+reader. Incoming events are parsed once and pushed onto a bounded queue per
+connected client whose filter matches. A client whose queue fills up is
+dropped (its stream ends and EventSource reconnects, resuming from the last
+event ID it received) so one stalled tab cannot hold memory or slow delivery
+to everyone else.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import json
+from collections.abc import Iterable
+from dataclasses import dataclass
+from typing import Any
+
+from ..telemetry import get_logger
+from . import stream
+from .stream import EventLog, parse_event_id
+
+logger = get_logger("dealbrain.events.hub")
+
+# Events buffered per client before it is considered too slow and dropped
+CLIENT_QUEUE_SIZE = 256
+
+# Delay before reading again after the Redis connection fails
+RECONNECT_DELAY_SECONDS = 1.0
+
+
+@dataclass(frozen=True)
+class EventFilter:
+    """Per-client selection of events.
+
+    Attributes:
+        types: Event types to deliver; empty delivers every type
+        job_id: Only deliver events about this import job
+    """
+
+    types: frozenset[str] = frozenset()
+    job_id: str | None = None
+
+    @classmethod
+    def from_params(cls, types: Iterable[str] | None = None, job_id: str | None = None):
+        return cls(
+            types=frozenset(value.strip() for value in types or () if value.strip()),
+            job_id=job_id or None,
+        )
+
+    def matches(self, event_type: str, data: dict[str, Any]) -> bool:
+        if self.types and event_type not in self.types:
+            return False
+        if self.job_id is not None:
+            job = data.get("job_id", data.get("import_job_id"))
+            return job is not None and str(job) == self.job_id
+        return True
+
+
+@dataclass(frozen=True, slots=True)
+class _Envelope:
+    """A parsed event shared by every client it is queued for."""
+
+    event_id: str
+    event_type: str
+    data: dict[str, Any]
+    sse: dict[str, str]
+
+
+class Subscription:
+    """A connected client's queue of SSE-ready events.
+
+    Iterating yields ``{"id": ..., "event": ..., "data": ...}`` dicts until
+    the client unsubscribes or is dropped for falling behind.
+    """
+
+    def __init__(self, event_filter: EventFilter, maxsize: int):
+        self.filter = event_filter
+        self.queue: asyncio.Queue[_Envelope | None] = asyncio.Queue(maxsize)
+        self.dropped = False
+        # Live events held back while missed events are replayed
+        self._pending: list[_Envelope] | None = None
+
+    def __aiter__(self) -> Subscription:
+        return self
+
+    async def __anext__(self) -> dict[str, str]:
+        envelope = await self.queue.get()
+        if envelope is None:
+            raise StopAsyncIteration
+        return envelope.sse
+
+    def _end(self) -> None:
+        # Discard anything still queued so the end marker always fits
+        while not self.queue.empty():
+            self.queue.get_nowait()
+        self.queue.put_nowait(None)
+
+
+class EventHub:
+    """Single event stream reader fanning events out to per-client queues.
+
+    The reader task starts with the first client and stops when the last one
+    leaves, so idle processes do not poll Redis.
+    """
+
+    _instance: EventHub | None = None
+
+    def __init__(
+        self,
+        *,
+        log: EventLog | None = None,
+        queue_size: int = CLIENT_QUEUE_SIZE,
+    ):
+        self._log = log or stream.event_log
+        self._queue_size = queue_size
+        self._subscribers: set[Subscription] = set()
+        self._task: asyncio.Task[None] | None = None
+        self._ready = asyncio.Event()
+        # Sort key of the last event ID the stream reader has dispatched
+        self._position: tuple[int, int] | None = None
+
+    @classmethod
+    def shared(cls) -> EventHub:
+        """Return the process-wide hub."""
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    @property
+    def subscriber_count(self) -> int:
+        return len(self._subscribers)
+
+    async def subscribe(
+        self, event_filter: EventFilter | None = None, last_event_id: str | None = None
+    ) -> Subscription:
+        """Register a client and make sure the stream reader is running.
+
+        With ``last_event_id`` the client is first replayed the matching
+        events published after that ID. If more of them are missed than its
+        queue holds, the stream ends after the first queue's worth so the
+        client reconnects from the last event it received.
+        """
+        subscription = Subscription(event_filter or EventFilter(), self._queue_size)
+        replay_after = parse_event_id(last_event_id)
+        if replay_after is not None:
+            subscription._pending = []
+        self._subscribers.add(subscription)
+        if self._task is None or self._task.done():
+            self._ready.clear()
+            self._task = asyncio.create_task(self._run(), name="event-hub")
+        await self._ready.wait()
+        if replay_after is not None:
+            await self._replay(subscription, last_event_id)
+        return subscription
+
+    async def _replay(self, subscription: Subscription, last_event_id: str) -> None:
+        after = last_event_id
+        replayed: list[_Envelope] = []
+        truncated = False
+        try:
+            while not truncated:
+                page = await self._log.since(after, self._queue_size)
+                for event_id, message in page:
+                    envelope = self._envelope(event_id, message)
+                    if envelope is None or not subscription.filter.matches(
+                        envelope.event_type, envelope.data
+                    ):
+                        after = event_id
+                        continue
+                    # Leave room in the queue for the end-of-stream marker
+                    if len(replayed) == self._queue_size - 1:
+                        truncated = True
+                        break
+                    replayed.append(envelope)
+                    after = event_id
+                # Later events reach the client live through ``_pending``
+                if len(page) < self._queue_size or self._caught_up(after):
+                    break
+        except Exception as exc:
+            logger.error("sse.replay.error", error=str(exc))
+
+        # Live events that arrived meanwhile may overlap the replayed range
+        newest = parse_event_id(after)
+        pending, subscription._pending = subscription._pending or [], None
+        if subscription.dropped:
+            return
+        logger.info(
+            "sse.replay", last_event_id=last_event_id, replayed=len(replayed), truncated=truncated
+        )
+        if truncated:
+            # End the stream after what fits; the client resumes from the last ID it got
+            for envelope in replayed:
+                subscription.queue.put_nowait(envelope)
+            self._subscribers.discard(subscription)
+            subscription.dropped = True
+            subscription.queue.put_nowait(None)
+            return
+        live = [envelope for envelope in pending if parse_event_id(envelope.event_id) > newest]
+        for envelope in replayed + live:
+            if not self._offer(subscription, envelope):
+                break
+
+    def _caught_up(self, event_id: str) -> bool:
+        """Whether the stream reader has already dispatched past ``event_id``."""
+        return self._position is not None and parse_event_id(event_id) >= self._position
+
+    async def unsubscribe(self, subscription: Subscription) -> None:
+        """Remove a client; stops the subscriber when none are left."""
+        self._subscribers.discard(subscription)
+        if not self._subscribers:
+            await self._stop()
+
+    async def close(self) -> None:
+        """End every client stream and stop the subscriber."""
+        for subscription in self._subscribers:
+            subscription._end()
+        self._subscribers.clear()
+        await self._stop()
+
+    def dispatch(self, event_id: str, message: str | bytes) -> int:
+        """Deliver one published event to matching clients.
+
+        Returns:
+            Number of clients the event was queued for
+        """
+        envelope = self._envelope(event_id, message)
+        if envelope is None:
+            return 0
+
+        delivered = 0
+        for subscription in list(self._subscribers):
+            if not subscription.filter.matches(envelope.event_type, envelope.data):
+                continue
+            if subscription._pending is None:
+                delivered += self._offer(subscription, envelope)
+            elif len(subscription._pending) < self._queue_size:
+                subscription._pending.append(envelope)
+            else:
+                self._drop(subscription)
+        return delivered
+
+    @staticmethod
+    def _envelope(event_id: str, message: str | bytes) -> _Envelope | None:
+        try:
+            parsed = json.loads(message)
+            event_type = str(parsed.get("type", "unknown"))
+            data = parsed.get("data") or {}
+        except (ValueError, AttributeError) as exc:
+            logger.error("sse.event.parse_error", event_id=event_id, error=str(exc))
+            return None
+        sse = {"id": event_id, "event": event_type, "data": json.dumps(data)}
+        return _Envelope(event_id, event_type, data, sse)
+
+    def _offer(self, subscription: Subscription, envelope: _Envelope) -> bool:
+        try:
+            subscription.queue.put_nowait(envelope)
+            return True
+        except asyncio.QueueFull:
+            self._drop(subscription)
+            return False
+
+    def _drop(self, subscription: Subscription) -> None:
+        self._subscribers.discard(subscription)
+        subscription.dropped = True
+        subscription._end()
+        logger.warning("sse.client.dropped", queue_size=self._queue_size)
+
+    async def _stop(self) -> None:
+        task, self._task = self._task, None
+        self._position = None
+        if task is not None and not task.done():
+            task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+
+    async def _run(self) -> None:
+        last_id: str | None = None
+        while True:
+            try:
+                if last_id is None:
+                    # Start from the tip; earlier events are only sent on replay
+                    last_id = await self._log.last_id()
+                    self._position = parse_event_id(last_id)
+                    logger.debug("sse.stream.tailing", last_id=last_id)
+                    self._ready.set()
+                for event_id, message in await self._log.read(last_id):
+                    self.dispatch(event_id, message)
+                    last_id = event_id
+                    self._position = parse_event_id(event_id)
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:
+                logger.error("sse.stream.error", error=str(exc))
+                # Let clients connect while Redis is unavailable
+                self._ready.set()
+                await asyncio.sleep(RECONNECT_DELAY_SECONDS)
+
+
+__all__ = ["CLIENT_QUEUE_SIZE", "EventFilter", "EventHub", "Subscription"]
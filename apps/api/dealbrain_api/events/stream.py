@@ -0,0 +1,160 @@
+"""
+Bounded, replayable log backing ``EVENTS_CHANNEL``.
+
+Events are appended to a capped Redis Stream so every event gets a
+monotonically increasing ID (``<ms>-<seq>``). SSE responses send that ID
+with each event and a reconnecting client passes back the last one it saw,
+letting the server replay only what was missed instead of the client
+polling for status. ``MemoryEventLog`` keeps the same contract in process
+for tests.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from abc import ABC, abstractmethod
+from collections import deque
+from collections.abc import Awaitable, Callable
+
+from redis import asyncio as aioredis
+
+from ..cache import cache_manager
+
+# Stream key; shares the name of the former pub/sub channel
+EVENTS_STREAM_KEY = "dealbrain:events"
+
+# Events retained for replay (trimmed approximately by Redis)
+EVENTS_STREAM_MAXLEN = 10_000
+
+# How long a blocking read waits for new events before returning empty
+READ_BLOCK_MS = 5_000
+
+INITIAL_ID = "0-0"
+
+
+def parse_event_id(event_id: str | None) -> tuple[int, int] | None:
+    """Return a sortable key for a stream ID, or None if it is malformed."""
+    if not event_id:
+        return None
+    millis, _, sequence = event_id.strip().partition("-")
+    try:
+        return int(millis), int(sequence or 0)
+    except ValueError:
+        return None
+
+
+class EventLog(ABC):
+    """Append-only event log with ID-based reads."""
+
+    @abstractmethod
+    async def append(self, message: str) -> str:
+        """Store a serialized event and return its ID."""
+
+    @abstractmethod
+    async def last_id(self) -> str:
+        """ID of the newest event, or ``INITIAL_ID`` when empty."""
+
+    @abstractmethod
+    async def since(self, after_id: str, count: int) -> list[tuple[str, str]]:
+        """Up to ``count`` events newer than ``after_id``, oldest first."""
+
+    @abstractmethod
+    async def read(
+        self, after_id: str, *, count: int = 100, block_ms: int = READ_BLOCK_MS
+    ) -> list[tuple[str, str]]:
+        """Like ``since`` but waits up to ``block_ms`` for new events."""
+
+
+class RedisEventLog(EventLog):
+    """Event log stored in a capped Redis Stream."""
+
+    def __init__(
+        self,
+        *,
+        redis_factory: Callable[[], Awaitable[aioredis.Redis]] | None = None,
+        key: str = EVENTS_STREAM_KEY,
+        maxlen: int = EVENTS_STREAM_MAXLEN,
+    ):
+        self._redis_factory = redis_factory or cache_manager.get_redis
+        self.key = key
+        self.maxlen = maxlen
+
+    async def append(self, message: str) -> str:
+        redis = await self._redis_factory()
+        return await redis.xadd(self.key, {"event": message}, maxlen=self.maxlen, approximate=True)
+
+    async def last_id(self) -> str:
+        redis = await self._redis_factory()
+        newest = await redis.xrevrange(self.key, count=1)
+        return newest[0][0] if newest else INITIAL_ID
+
+    async def since(self, after_id: str, count: int) -> list[tuple[str, str]]:
+        redis = await self._redis_factory()
+        entries = await redis.xrange(self.key, min=f"({after_id}", count=count)
+        return [(event_id, fields["event"]) for event_id, fields in entries]
+
+    async def read(
+        self, after_id: str, *, count: int = 100, block_ms: int = READ_BLOCK_MS
+    ) -> list[tuple[str, str]]:
+        redis = await self._redis_factory()
+        response = await redis.xread({self.key: after_id}, count=count, block=block_ms)
+        return [
+            (event_id, fields["event"])
+            for _, entries in response or []
+            for event_id, fields in entries
+        ]
+
+
+class MemoryEventLog(EventLog):
+    """In-process ring buffer with the same contract as ``RedisEventLog``."""
+
+    def __init__(self, maxlen: int = EVENTS_STREAM_MAXLEN):
+        self._entries: deque[tuple[int, str]] = deque(maxlen=maxlen)
+        self._sequence = 0
+        self._appended = asyncio.Condition()
+
+    async def append(self, message: str) -> str:
+        async with self._appended:
+            self._sequence += 1
+            self._entries.append((self._sequence, message))
+            self._appended.notify_all()
+        return f"0-{self._sequence}"
+
+    async def last_id(self) -> str:
+        return f"0-{self._sequence}"
+
+    async def since(self, after_id: str, count: int) -> list[tuple[str, str]]:
+        after = parse_event_id(after_id) or (0, 0)
+        return [
+            (f"0-{sequence}", message)
+            for sequence, message in self._entries
+            if (0, sequence) > after
+        ][:count]
+
+    async def read(
+        self, after_id: str, *, count: int = 100, block_ms: int = READ_BLOCK_MS
+    ) -> list[tuple[str, str]]:
+        after = parse_event_id(after_id) or (0, 0)
+        async with self._appended:
+            try:
+                await asyncio.wait_for(
+                    self._appended.wait_for(lambda: (0, self._sequence) > after),
+                    timeout=block_ms / 1000,
+                )
+            except TimeoutError:
+                return []
+        return await self.since(after_id, count)
+
+
+event_log: EventLog = RedisEventLog()
+
+
+__all__ = [
+    "EVENTS_STREAM_KEY",
+    "EVENTS_STREAM_MAXLEN",
+    "EventLog",
+    "MemoryEventLog",
+    "RedisEventLog",
+    "event_log",
+    "parse_event_id",
+]
@@ -0,0 +1,330 @@
+"""High-throughput entity import built on the universal importer.
+
+Records are validated per row (in a process pool for large files), rows that
+fail validation or persistence are collected into a report instead of
+aborting the import, and valid rows are written in chunks in dependency order
+so listings can reference the CPUs and GPUs imported alongside them.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+import billiard
+from dealbrain_core.schemas import PortsProfileCreate
+from pydantic import ValidationError
+from sqlalchemy import delete, insert, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..db import session_scope
+from ..models.core import Cpu, Gpu, Port, PortsProfile, Profile
+from ..services.component_catalog import get_or_create_ram_spec, get_or_create_storage_profile
+from ..services.imports.chunk_writer import ChunkWriter
+from .universal import (
+    SUPPORTED_ENTITIES,
+    ImporterError,
+    _ensure_object,
+    _normalize_payload,
+    _read_records,
+)
+
+logger = logging.getLogger(__name__)
+
+# Pseudo-entity for JSON dumps keyed by entity (``{"cpu": [...], "listing": [...]}``)
+CATALOG_ENTITY = "catalog"
+
+# Referenced entities are written before the entities that point at them
+IMPORT_ORDER = ("ram_spec", "storage_profile", "cpu", "gpu", "ports_profile", "profile", "listing")
+
+BULK_CHUNK_SIZE = 500
+
+# Below this many records the process pool costs more than it saves
+PARALLEL_THRESHOLD = 2000
+VALIDATION_BATCH_SIZE = 1000
+
+# Row errors returned in task results; the full count is always reported
+MAX_REPORTED_ERRORS = 500
+
+
+@dataclass(frozen=True)
+class RowError:
+    """A record that could not be validated or written."""
+
+    entity: str
+    row: int
+    message: str
+
+    def to_dict(self) -> dict[str, Any]:
+        return {"entity": self.entity, "row": self.row, "message": self.message}
+
+
+@dataclass
+class BulkImportReport:
+    """Outcome of a bulk entity import."""
+
+    records: dict[str, int] = field(default_factory=dict)
+    imported: dict[str, int] = field(default_factory=dict)
+    errors: list[RowError] = field(default_factory=list)
+
+    @property
+    def total_records(self) -> int:
+        return sum(self.records.values())
+
+    @property
+    def total_imported(self) -> int:
+        return sum(self.imported.values())
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "records": self.total_records,
+            "imported": self.total_imported,
+            "failed": len(self.errors),
+            "entities": {
+                entity: {"records": count, "imported": self.imported.get(entity, 0)}
+                for entity, count in self.records.items()
+            },
+            "errors": [error.to_dict() for error in self.errors[:MAX_REPORTED_ERRORS]],
+        }
+
+
+def load_entity_records(path: Path, entity: str) -> dict[str, list[dict[str, Any]]]:
+    """Read raw records from *path* grouped by entity key.
+
+    ``entity`` is one of ``SUPPORTED_ENTITIES`` or ``"catalog"`` for a JSON
+    object holding several entity arrays, keyed by entity (``cpu``) or seed
+    field (``cpus``).
+    """
+
+    normalized = entity.lower().strip()
+    if normalized != CATALOG_ENTITY:
+        if normalized not in SUPPORTED_ENTITIES:
+            options = ", ".join(sorted([*SUPPORTED_ENTITIES, CATALOG_ENTITY]))
+            raise ImporterError(f"Unsupported entity '{entity}'. Choose one of: {options}.")
+        return {normalized: _read_records(path, normalized)}
+
+    if not path.exists():
+        raise ImporterError(f"File not found: {path}")
+    if path.suffix.lower() != ".json":
+        raise ImporterError("Catalog imports require a JSON file keyed by entity.")
+    try:
+        payload = json.loads(path.read_text())
+    except json.JSONDecodeError as exc:
+        raise ImporterError(f"Invalid JSON in {path}: {exc}") from exc
+    if not isinstance(payload, dict):
+        raise ImporterError("Catalog payload must be an object keyed by entity.")
+
+    aliases = {config.field_name: key for key, config in SUPPORTED_ENTITIES.items()}
+    grouped: dict[str, list[dict[str, Any]]] = {}
+    for key, value in payload.items():
+        entity_key = aliases.get(key, key)
+        if entity_key not in SUPPORTED_ENTITIES:
+            raise ImporterError(f"Unsupported entity '{key}' in catalog payload.")
+        if not isinstance(value, list):
+            raise ImporterError(
+                f"Expected array for key '{key}' in {path}, received {type(value).__name__}."
+            )
+        grouped.setdefault(entity_key, []).extend(
+            _ensure_object(item, index) for index, item in enumerate(value, start=1)
+        )
+    return grouped
+
+
+def validate_records(
+    entity: str,
+    records: Sequence[dict[str, Any]],
+    *,
+    workers: int | None = None,
+) -> tuple[list[tuple[int, Any]], list[RowError]]:
+    """Validate *records* row by row.
+
+    Large inputs are split into batches validated in a process pool; results
+    keep file order either way. The pool comes from billiard (Celery's
+    multiprocessing fork), which unlike ``multiprocessing`` may start workers
+    from the daemonic processes of a prefork Celery worker.
+
+    Returns
+    -------
+    tuple[list[tuple[int, Any]], list[RowError]]
+        ``(row, schema)`` pairs for valid records (rows are 1-based) and the
+        errors of the rest.
+    """
+
+    batches = [
+        (entity, start, list(records[start : start + VALIDATION_BATCH_SIZE]))
+        for start in range(0, len(records), VALIDATION_BATCH_SIZE)
+    ]
+    workers = workers if workers is not None else os.cpu_count() or 1
+    if len(records) < PARALLEL_THRESHOLD or workers <= 1 or len(batches) <= 1:
+        results = [_validate_batch(*batch) for batch in batches]
+    else:
+        with billiard.Pool(processes=min(workers, len(batches))) as pool:
+            results = pool.starmap(_validate_batch, batches)
+
+    validated: list[tuple[int, Any]] = []
+    errors: list[RowError] = []
+    for batch_valid, batch_errors in results:
+        validated.extend(batch_valid)
+        errors.extend(batch_errors)
+    return validated, errors
+
+
+def _validate_batch(
+    entity: str, start: int, records: list[dict[str, Any]]
+) -> tuple[list[tuple[int, Any]], list[RowError]]:
+    # Module-level so it can be pickled into pool workers; entity configs hold
+    # lambdas and are looked up here rather than passed in
+    config = SUPPORTED_ENTITIES[entity]
+    validated: list[tuple[int, Any]] = []
+    errors: list[RowError] = []
+    for row, record in enumerate(records, start=start + 1):
+        try:
+            processed = _normalize_payload(record, config.json_fields)
+            validated.append((row, config.factory(processed)))
+        except (ValidationError, ImporterError) as exc:
+            errors.append(RowError(entity, row, str(exc)))
+    return validated, errors
+
+
+async def import_entities_bulk(
+    path: Path,
+    entity: str,
+    *,
+    dry_run: bool = False,
+    chunk_size: int = BULK_CHUNK_SIZE,
+    workers: int | None = None,
+) -> BulkImportReport:
+    """Validate and persist every record in *path*, reporting failed rows.
+
+    Raises ``ImporterError`` only for problems with the file itself
+    (unsupported entity or file type, unreadable payload, no records).
+    """
+
+    grouped = load_entity_records(path, entity)
+    if not any(grouped.values()):
+        raise ImporterError(f"No records found in {path} for entity '{entity}'.")
+
+    report = BulkImportReport()
+    validated: dict[str, list[tuple[int, Any]]] = {}
+    for entity_key, records in grouped.items():
+        report.records[entity_key] = len(records)
+        validated[entity_key], errors = validate_records(entity_key, records, workers=workers)
+        report.errors.extend(errors)
+
+    if dry_run:
+        report.imported = {key: len(items) for key, items in validated.items()}
+        return report
+
+    for entity_key in IMPORT_ORDER:
+        items = validated.get(entity_key)
+        if not items:
+            continue
+        imported = 0
+        for start in range(0, len(items), chunk_size):
+            chunk = items[start : start + chunk_size]
+            imported += await _persist_rows(entity_key, chunk, report.errors)
+        report.imported[entity_key] = imported
+        logger.info(f"Imported {imported}/{len(items)} valid {entity_key} records from {path.name}")
+
+    report.errors.sort(key=lambda error: (IMPORT_ORDER.index(error.entity), error.row))
+    return report
+
+
+async def _persist_rows(entity: str, rows: list[tuple[int, Any]], errors: list[RowError]) -> int:
+    """Write a chunk in one transaction, isolating failing rows on error."""
+
+    try:
+        await _write(entity, [item for _, item in rows])
+        return len(rows)
+    except Exception as exc:
+        if len(rows) == 1:
+            errors.append(RowError(entity, rows[0][0], _error_message(exc)))
+            return 0
+        logger.warning(f"{entity} chunk of {len(rows)} rows failed, retrying row by row: {exc}")
+
+    written = 0
+    for row in rows:
+        written += await _persist_rows(entity, [row], errors)
+    return written
+
+
+async def _write(entity: str, items: list[Any]) -> None:
+    async with session_scope() as session:
+        if entity == "cpu":
+            await ChunkWriter.upsert_catalog(session, Cpu, items)
+        elif entity == "gpu":
+            await ChunkWriter.upsert_catalog(session, Gpu, items)
+        elif entity == "listing":
+            await ChunkWriter.write_listings(session, items)
+        elif entity == "profile":
+            await ChunkWriter.upsert_catalog(session, Profile, items)
+        elif entity == "ports_profile":
+            await _write_ports_profiles(session, items)
+        elif entity == "ram_spec":
+            for item in items:
+                await get_or_create_ram_spec(session, item.model_dump(exclude_none=True))
+        else:
+            for item in items:
+                await get_or_create_storage_profile(session, item.model_dump(exclude_none=True))
+
+
+async def _write_ports_profiles(session: AsyncSession, items: list[PortsProfileCreate]) -> None:
+    """Upsert ports profiles by name and replace their ports, later rows winning."""
+
+    rows: dict[str, dict[str, Any]] = {}
+    ports: dict[str, list[dict[str, Any]]] = {}
+    for item in items:
+        data = item.model_dump(exclude={"ports"}, exclude_none=True)
+        data["attributes_json"] = data.pop("attributes", {})
+        rows.setdefault(data["name"], {}).update(data)
+        ports[data["name"]] = [port.model_dump(exclude_none=True) for port in item.ports or []]
+
+    result = await session.execute(
+        select(PortsProfile.id, PortsProfile.name).where(PortsProfile.name.in_(list(rows)))
+    )
+    existing = {name: profile_id for profile_id, name in result.all()}
+    updates = [{"id": existing[name], **data} for name, data in rows.items() if name in existing]
+    inserts = [data for name, data in rows.items() if name not in existing]
+    if updates:
+        await session.execute(update(PortsProfile), updates)
+    if inserts:
+        await session.execute(insert(PortsProfile), inserts)
+        # Core inserts do not return ids on every backend; look the new rows up
+        result = await session.execute(
+            select(PortsProfile.id, PortsProfile.name).where(
+                PortsProfile.name.in_([data["name"] for data in inserts])
+            )
+        )
+        existing.update({name: profile_id for profile_id, name in result.all()})
+
+    profile_ids = [existing[name] for name in rows]
+    await session.execute(delete(Port).where(Port.ports_profile_id.in_(profile_ids)))
+    port_rows = [
+        {"ports_profile_id": existing[name], **port}
+        for name, profile_ports in ports.items()
+        for port in profile_ports
+    ]
+    if port_rows:
+        await session.execute(insert(Port), port_rows)
+
+
+def _error_message(exc: Exception) -> str:
+    # Database errors carry the statement and parameters after the first line
+    message = str(getattr(exc, "orig", None) or exc).strip()
+    return message.splitlines()[0] if message else type(exc).__name__
+
+
+__all__ = [
+    "BulkImportReport",
+    "CATALOG_ENTITY",
+    "IMPORT_ORDER",
+    "RowError",
+    "import_entities_bulk",
+    "load_entity_records",
+    "validate_records",
+]
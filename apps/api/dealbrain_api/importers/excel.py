@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterator
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
@@ -21,6 +22,8 @@ from dealbrain_core.schemas import (
     ValuationRuleCreate,
 )
 
+from ..services.imports.workbook_parser import DEFAULT_CHUNK_SIZE, WorkbookParser
+
 
 @dataclass
 class ImportSummary:
@@ -75,7 +78,51 @@ class SpreadsheetImporter:
 
         return seed, summary
 
-    def _find_sheet(self, workbook: dict[str, pd.DataFrame], candidates: set[str]) -> str | None:
+    def default_seed(self) -> SpreadsheetSeed:
+        """Profiles and ports profiles that ``load()`` adds to every import."""
+        return SpreadsheetSeed(
+            profiles=self._default_profiles(),
+            ports_profiles=self._default_ports_profiles(),
+        )
+
+    def iter_chunks(self, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[SpreadsheetSeed]:
+        """
+        Parse the workbook in chunks of at most ``chunk_size`` sheet rows.
+
+        Sheets are streamed instead of loaded whole, so memory stays flat for
+        large workbooks. Each yielded seed holds the CPUs, GPUs, valuation
+        rules or listings of one chunk; the default profiles are not included
+        (see ``default_seed()``).
+        """
+        if not self.path.exists():
+            raise FileNotFoundError(self.path)
+
+        sheets = dict.fromkeys(WorkbookParser.sheet_names(self.path))
+
+        def chunks(sheet: str) -> Iterator[pd.DataFrame]:
+            for _, chunk in WorkbookParser.iter_sheet_chunks(
+                self.path, sheet, chunk_size=chunk_size
+            ):
+                yield chunk
+
+        if cpu_sheet := self._find_sheet(sheets, {"cpu", "cpus"}):
+            for chunk in chunks(cpu_sheet):
+                yield SpreadsheetSeed(cpus=self._parse_cpus(chunk))
+
+        if ref_sheet := self._find_sheet(sheets, {"reference", "valuation", "rules"}):
+            for chunk in chunks(ref_sheet):
+                rules, gpus = self._parse_reference(chunk)
+                yield SpreadsheetSeed(valuation_rules=rules, gpus=gpus)
+
+        if sff_sheet := self._find_sheet(sheets, {"sff pcs", "listings", "devices"}):
+            for chunk in chunks(sff_sheet):
+                yield SpreadsheetSeed(listings=self._parse_listings(chunk))
+
+        if mac_sheet := self._find_sheet(sheets, {"macs", "macs 725"}):
+            for chunk in chunks(mac_sheet):
+                yield SpreadsheetSeed(listings=self._parse_listings(chunk, is_apple=True))
+
+    def _find_sheet(self, workbook: dict[str, Any], candidates: set[str]) -> str | None:
         lowered = {name.lower(): name for name in workbook.keys()}
         for candidate in candidates:
             if candidate in lowered:
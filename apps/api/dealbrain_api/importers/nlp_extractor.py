@@ -2,12 +2,20 @@
 
 This module provides pattern-based extraction of hardware components
 (CPU, RAM, Storage, GPU) from unstructured text using regex patterns.
+
+Patterns are loaded and compiled once per patterns file and shared by all
+extractor instances. Each pattern may declare ``anchors``: lowercase
+substrings at least one of which must appear in any text the pattern can
+match. The text is lowercased once per extraction and patterns whose anchors
+are all absent are skipped without running the regex.
 """
 
 from __future__ import annotations
 
 import logging
 import re
+from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Literal
 
@@ -18,6 +26,70 @@ logger = logging.getLogger(__name__)
 # Confidence level type
 ConfidenceLevel = Literal["high", "medium", "low"]
 
+DEFAULT_PATTERNS_FILE = Path(__file__).parent / "extraction_patterns.yaml"
+
+
+@dataclass(frozen=True)
+class CompiledPattern:
+    """Extraction pattern compiled at load time.
+
+    Attributes
+    ----------
+    regex : re.Pattern[str]
+        Compiled, case-insensitive pattern
+    pattern : str
+        Source pattern string from the YAML file
+    confidence : ConfidenceLevel
+        Confidence assigned to matches
+    anchors : tuple[str, ...]
+        Lowercase substrings, one of which must occur in matching text
+        (empty means the pattern always runs)
+    """
+
+    regex: re.Pattern[str]
+    pattern: str
+    confidence: ConfidenceLevel
+    anchors: tuple[str, ...] = ()
+
+    def may_match(self, lowered_text: str) -> bool:
+        """Cheap pre-check: False only if the pattern cannot match."""
+        return not self.anchors or any(anchor in lowered_text for anchor in self.anchors)
+
+
+@lru_cache(maxsize=8)
+def load_patterns(
+    patterns_file: Path,
+) -> tuple[dict[str, Any], dict[str, tuple[CompiledPattern, ...]]]:
+    """Load and compile extraction patterns (cached per file).
+
+    Parameters
+    ----------
+    patterns_file : Path
+        Path to YAML file containing extraction patterns
+
+    Returns
+    -------
+    tuple[dict[str, Any], dict[str, tuple[CompiledPattern, ...]]]
+        Raw YAML definitions and compiled patterns keyed by pattern group
+    """
+    with open(patterns_file) as f:
+        definitions = yaml.safe_load(f)
+
+    compiled: dict[str, tuple[CompiledPattern, ...]] = {}
+    for key, value in definitions.items():
+        if not key.endswith("_patterns"):
+            continue
+        compiled[key] = tuple(
+            CompiledPattern(
+                regex=re.compile(pattern_def["pattern"], re.IGNORECASE),
+                pattern=pattern_def["pattern"],
+                confidence=pattern_def["confidence"],
+                anchors=tuple(anchor.lower() for anchor in pattern_def.get("anchors") or ()),
+            )
+            for pattern_def in value
+        )
+    return definitions, compiled
+
 
 class ExtractionResult:
     """Result of a component extraction attempt.
@@ -73,33 +145,36 @@ class NLPExtractor:
     def __init__(self, patterns_file: Path | None = None):
         if patterns_file is None:
             # Default to patterns file in same directory
-            patterns_file = Path(__file__).parent / "extraction_patterns.yaml"
+            patterns_file = DEFAULT_PATTERNS_FILE
 
-        with open(patterns_file) as f:
-            self.patterns = yaml.safe_load(f)
+        self.patterns, self._compiled = load_patterns(Path(patterns_file).resolve())
 
-    def extract_cpu(self, text: str) -> ExtractionResult | None:
+    def extract_cpu(self, text: str, lowered: str | None = None) -> ExtractionResult | None:
         """Extract CPU information from text.
 
         Parameters
         ----------
         text : str
             Product title or description text
+        lowered : str | None
+            ``text.lower()``, if the caller already computed it
 
         Returns
         -------
         ExtractionResult | None
             Extraction result with CPU name and confidence, or None if no match
         """
-        return self._extract_component(text, "cpu_patterns")
+        return self._extract_component(text, "cpu_patterns", lowered)
 
-    def extract_ram(self, text: str) -> dict[str, Any] | None:
+    def extract_ram(self, text: str, lowered: str | None = None) -> dict[str, Any] | None:
         """Extract RAM information from text.
 
         Parameters
         ----------
         text : str
             Product title or description text
+        lowered : str | None
+            ``text.lower()``, if the caller already computed it
 
         Returns
         -------
@@ -111,7 +186,7 @@ class NLPExtractor:
             - confidence: ConfidenceLevel
             Or None if no match
         """
-        result = self._extract_component(text, "ram_patterns")
+        result = self._extract_component(text, "ram_patterns", lowered)
         if not result:
             return None
 
@@ -141,13 +216,15 @@ class NLPExtractor:
             "confidence": result.confidence,
         }
 
-    def extract_storage(self, text: str) -> dict[str, Any] | None:
+    def extract_storage(self, text: str, lowered: str | None = None) -> dict[str, Any] | None:
         """Extract storage information from text.
 
         Parameters
         ----------
         text : str
             Product title or description text
+        lowered : str | None
+            ``text.lower()``, if the caller already computed it
 
         Returns
         -------
@@ -159,7 +236,7 @@ class NLPExtractor:
             - confidence: ConfidenceLevel
             Or None if no match
         """
-        result = self._extract_component(text, "storage_patterns")
+        result = self._extract_component(text, "storage_patterns", lowered)
         if not result:
             return None
 
@@ -198,39 +275,48 @@ class NLPExtractor:
             "confidence": result.confidence,
         }
 
-    def extract_gpu(self, text: str) -> ExtractionResult | None:
+    def extract_gpu(self, text: str, lowered: str | None = None) -> ExtractionResult | None:
         """Extract GPU information from text.
 
         Parameters
         ----------
         text : str
             Product title or description text
+        lowered : str | None
+            ``text.lower()``, if the caller already computed it
 
         Returns
         -------
         ExtractionResult | None
             Extraction result with GPU name and confidence, or None if no match
         """
-        return self._extract_component(text, "gpu_patterns")
+        return self._extract_component(text, "gpu_patterns", lowered)
 
-    def extract_form_factor(self, text: str) -> ExtractionResult | None:
+    def extract_form_factor(
+        self, text: str, lowered: str | None = None
+    ) -> ExtractionResult | None:
         """Extract form factor information from text.
 
         Parameters
         ----------
         text : str
             Product title or description text
+        lowered : str | None
+            ``text.lower()``, if the caller already computed it
 
         Returns
         -------
         ExtractionResult | None
             Extraction result with form factor and confidence, or None if no match
         """
-        return self._extract_component(text, "form_factor_patterns")
+        return self._extract_component(text, "form_factor_patterns", lowered)
 
     def extract_all(self, text: str) -> dict[str, Any]:
         """Extract all component information from text.
 
+        The text is lowercased once and shared by all component extractors
+        for the anchor pre-checks.
+
         Parameters
         ----------
         text : str
@@ -246,16 +332,17 @@ class NLPExtractor:
             - gpu: ExtractionResult | None
             - form_factor: ExtractionResult | None
         """
+        lowered = text.lower()
         return {
-            "cpu": self.extract_cpu(text),
-            "ram": self.extract_ram(text),
-            "storage": self.extract_storage(text),
-            "gpu": self.extract_gpu(text),
-            "form_factor": self.extract_form_factor(text),
+            "cpu": self.extract_cpu(text, lowered),
+            "ram": self.extract_ram(text, lowered),
+            "storage": self.extract_storage(text, lowered),
+            "gpu": self.extract_gpu(text, lowered),
+            "form_factor": self.extract_form_factor(text, lowered),
         }
 
     def _extract_component(
-        self, text: str, pattern_key: str
+        self, text: str, pattern_key: str, lowered: str | None = None
     ) -> ExtractionResult | None:
         """Extract a component using patterns from a specific pattern group.
 
@@ -265,20 +352,23 @@ class NLPExtractor:
             Text to extract from
         pattern_key : str
             Key in patterns dictionary (e.g., 'cpu_patterns')
+        lowered : str | None
+            ``text.lower()``, if the caller already computed it
 
         Returns
         -------
         ExtractionResult | None
             First matching extraction result, or None if no match
         """
-        patterns = self.patterns.get(pattern_key, [])
+        if lowered is None:
+            lowered = text.lower()
 
-        for pattern_def in patterns:
-            pattern = pattern_def["pattern"]
-            confidence = pattern_def["confidence"]
+        for compiled in self._compiled.get(pattern_key, ()):
+            # Skip the regex when none of the pattern's anchors occur
+            if not compiled.may_match(lowered):
+                continue
 
-            # Try to find a match
-            match = re.search(pattern, text, re.IGNORECASE)
+            match = compiled.regex.search(text)
             if match:
                 # Extract the full matched text
                 matched_text = match.group(0)
@@ -288,8 +378,8 @@ class NLPExtractor:
 
                 return ExtractionResult(
                     value=matched_text,
-                    confidence=confidence,
-                    pattern=pattern,
+                    confidence=compiled.confidence,
+                    pattern=compiled.pattern,
                     match_groups=match_groups,
                 )
 
@@ -5,7 +5,7 @@ from __future__ import annotations
 from datetime import datetime
 from typing import TYPE_CHECKING, Any
 
-from sqlalchemy import JSON, Enum as SAEnum, Integer, String, Text, UniqueConstraint
+from sqlalchemy import JSON, Enum as SAEnum, Index, Integer, String, Text, UniqueConstraint, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from dealbrain_core.enums import RamGeneration, StorageMedium
@@ -21,6 +21,10 @@ class Cpu(Base, TimestampMixin):
     """CPU catalog with benchmarks and pricing analytics."""
 
     __tablename__ = "cpu"
+    __table_args__ = (
+        # Case-insensitive name lookups (import auto-creation)
+        Index("ix_cpu_name_lower", text("lower(name)")),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
     name: Mapped[str] = mapped_column(String(255), unique=True, nullable=False)
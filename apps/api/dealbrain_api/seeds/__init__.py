@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import asyncio
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 from sqlalchemy import select
 
@@ -22,6 +23,9 @@ from ..services.listings import (
 from ..services.component_catalog import get_or_create_ram_spec, get_or_create_storage_profile
 from ..settings import get_settings
 
+if TYPE_CHECKING:
+    from ..importers import ImportSummary, SpreadsheetImporter
+
 
 async def apply_seed(seed: SpreadsheetSeed) -> None:
     async with session_scope() as session:
@@ -117,13 +121,16 @@ async def apply_seed(seed: SpreadsheetSeed) -> None:
                 await session.refresh(created)
 
 
-async def seed_from_workbook(path: Path) -> None:
+async def seed_from_workbook(path: Path, *, chunk_size: int | None = None) -> None:
     # Import lazily so CLI scripts without spreadsheet dependencies can rely on apply_seed.
     from ..importers import SpreadsheetImporter
 
     importer = SpreadsheetImporter(path)
-    seed, summary = importer.load()
-    await apply_seed(seed)
+    if chunk_size:
+        summary = await _stream_workbook(importer, chunk_size)
+    else:
+        seed, summary = importer.load()
+        await apply_seed(seed)
     print(
         "Seed import complete:"
         f" {summary.cpus} CPUs, {summary.gpus} GPUs, {summary.valuation_rules} rules,"
@@ -131,6 +138,27 @@ async def seed_from_workbook(path: Path) -> None:
     )
 
 
+async def _stream_workbook(importer: SpreadsheetImporter, chunk_size: int) -> ImportSummary:
+    """Apply a workbook chunk by chunk, one transaction per chunk."""
+    from ..importers import ImportSummary
+    from ..services.imports import ChunkWriter
+
+    defaults = importer.default_seed()
+    await apply_seed(defaults)
+    summary = ImportSummary(
+        profiles=len(defaults.profiles), ports_profiles=len(defaults.ports_profiles)
+    )
+
+    for seed in importer.iter_chunks(chunk_size):
+        async with session_scope() as session:
+            await ChunkWriter.write(session, seed)
+        summary.cpus += len(seed.cpus)
+        summary.gpus += len(seed.gpus)
+        summary.valuation_rules += len(seed.valuation_rules)
+        summary.listings += len(seed.listings)
+    return summary
+
+
 async def run() -> None:
     settings = get_settings()
     engine = get_engine()
@@ -0,0 +1,158 @@
+"""In-process tier of the card image cache.
+
+Rendered cards are cached in two tiers: a per-process LRU (this module) in
+front of S3 (``ImageGenerationService``). Both tiers are keyed by a
+``content_hash`` of everything that goes into a card, i.e. the template
+context and the template source, so a price or spec change yields a new
+hash and a stale image is never served, even before ``invalidate_cache``
+runs on every process.
+
+Lookups are counted per tier in ``card_image_cache_requests_total`` and in
+``card_cache_stats()`` for hit ratios.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from collections import OrderedDict
+from dataclasses import dataclass
+from functools import cache
+from pathlib import Path
+from typing import Any
+
+from prometheus_client import Counter
+
+from ..settings import get_settings
+
+
+def _lookup_counter(**kwargs: Any) -> Counter:
+    return Counter(
+        "card_image_cache_requests_total",
+        "Card image cache lookups by tier and result",
+        ["tier", "result"],  # tier: local, s3; result: hit, miss, stale, error
+        **kwargs,
+    )
+
+
+# Prometheus metrics
+try:
+    card_image_cache_requests = _lookup_counter()
+except ValueError:
+    # Already registered by a second copy of the package imported as
+    # ``apps.api.dealbrain_api`` (some tests do); count into an unregistered one
+    card_image_cache_requests = _lookup_counter(registry=None)
+
+_stats: dict[tuple[str, str], int] = {}
+
+
+def record_lookup(tier: str, result: str) -> None:
+    """Count one cache lookup for ``tier`` with ``result``."""
+    card_image_cache_requests.labels(tier=tier, result=result).inc()
+    _stats[(tier, result)] = _stats.get((tier, result), 0) + 1
+
+
+def card_cache_stats() -> dict[str, dict[str, float]]:
+    """Per-tier lookup counts and hit ratio for this process."""
+    stats: dict[str, dict[str, float]] = {}
+    for (tier, result), count in _stats.items():
+        stats.setdefault(tier, {})[result] = count
+    for counts in stats.values():
+        lookups = sum(counts.values())
+        counts["hit_ratio"] = counts.get("hit", 0) / lookups if lookups else 0.0
+    return stats
+
+
+@cache
+def _file_digest(path: Path) -> str:
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+def card_content_hash(context: dict[str, Any], template_path: Path) -> str:
+    """Hash a card's template context together with its template source."""
+    payload = json.dumps(context, sort_keys=True, default=str)
+    digest = hashlib.sha256(_file_digest(template_path).encode())
+    digest.update(payload.encode())
+    return digest.hexdigest()[:32]
+
+
+@dataclass(frozen=True, slots=True)
+class CardCacheKey:
+    listing_id: int
+    style: str
+    size: str
+    format: str
+    content_hash: str
+
+
+class LocalCardCache:
+    """Least-recently-used card images, bounded by total bytes.
+
+    Args:
+        max_bytes: Capacity; 0 disables the tier
+    """
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self.size_bytes = 0
+        self._entries: OrderedDict[CardCacheKey, bytes] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: object) -> bool:
+        # A peek: does not refresh the entry's recency
+        return key in self._entries
+
+    def get(self, key: CardCacheKey) -> bytes | None:
+        image_bytes = self._entries.get(key)
+        if image_bytes is not None:
+            self._entries.move_to_end(key)
+        return image_bytes
+
+    def put(self, key: CardCacheKey, image_bytes: bytes) -> None:
+        if len(image_bytes) > self.max_bytes:
+            return
+        self._remove(key)
+        self._entries[key] = image_bytes
+        self.size_bytes += len(image_bytes)
+        while self.size_bytes > self.max_bytes:
+            self._remove(next(iter(self._entries)))
+
+    def discard_listing(self, listing_id: int) -> int:
+        """Drop every cached variant of a listing; returns the number removed."""
+        keys = [key for key in self._entries if key.listing_id == listing_id]
+        for key in keys:
+            self._remove(key)
+        return len(keys)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self.size_bytes = 0
+
+    def _remove(self, key: CardCacheKey) -> None:
+        image_bytes = self._entries.pop(key, None)
+        if image_bytes is not None:
+            self.size_bytes -= len(image_bytes)
+
+
+_local_cache: LocalCardCache | None = None
+
+
+def get_local_card_cache() -> LocalCardCache:
+    """Return the process-wide local tier, sized from ``s3.local_cache_max_bytes``."""
+    global _local_cache
+    if _local_cache is None:
+        _local_cache = LocalCardCache(get_settings().s3.local_cache_max_bytes)
+    return _local_cache
+
+
+__all__ = [
+    "CardCacheKey",
+    "LocalCardCache",
+    "card_cache_stats",
+    "card_content_hash",
+    "card_image_cache_requests",
+    "get_local_card_cache",
+    "record_lookup",
+]
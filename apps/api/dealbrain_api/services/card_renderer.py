@@ -0,0 +1,345 @@
+"""Browser-free card rendering with Pillow.
+
+Draws the layout of ``templates/card_template.html`` (header with logo and
+valuation badge, title, prices, specs grid, footer) directly onto an image
+from the same template context ``ImageGenerationService`` renders HTML
+from. A card takes a few milliseconds instead of a Chromium page load and
+screenshot, so workers without a browser can produce cards too.
+
+Which size presets use this renderer is configured with
+``settings.cards.pillow_sizes``. Fonts and theme backgrounds are loaded
+once per process; text metrics follow the CSS box model (line-height,
+padding, margins) closely enough that cards match the browser output up to
+font rasterization.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from functools import cache
+from io import BytesIO
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+from PIL import Image, ImageColor, ImageDraw, ImageFont
+
+# Regular/bold font files tried in order (Chromium's fallback for the
+# template's sans-serif stack on Linux)
+FONT_CANDIDATES = (
+    ("DejaVuSans.ttf", "DejaVuSans-Bold.ttf"),
+    ("LiberationSans-Regular.ttf", "LiberationSans-Bold.ttf"),
+    ("Arial.ttf", "Arial Bold.ttf"),
+)
+FONT_SEARCH_DIRS = (
+    Path("/usr/share/fonts"),
+    Path("/usr/local/share/fonts"),
+    Path("/Library/Fonts"),
+    Path("C:/Windows/Fonts"),
+)
+
+PADDING = 50
+JPEG_QUALITY = 90
+
+
+@dataclass(frozen=True)
+class CardTheme:
+    """Colors of one ``body.<theme>`` block in the card template."""
+
+    background: tuple[str, str]
+    text: str
+    logo: str
+    price: str
+    branding: str
+    score: str
+    title: str = "#ffffff"
+    spec_value: str = "#ffffff"
+
+
+THEMES = {
+    "light": CardTheme(
+        background=("#667eea", "#764ba2"),
+        text="#1a1a1a",
+        logo="#ffffff",
+        price="#ffffff",
+        branding="#ffffff",
+        score="#ffffff",
+    ),
+    "dark": CardTheme(
+        background=("#1a1a2e", "#16213e"),
+        text="#ffffff",
+        logo="#4F46E5",
+        price="#4ade80",
+        branding="#94a3b8",
+        score="#4ade80",
+    ),
+}
+
+VALUATION_COLORS = {
+    "great": "#10b981",
+    "good": "#3b82f6",
+    "fair": "#f59e0b",
+    "premium": "#ef4444",
+}
+
+
+def _rgba(color: str, opacity: float = 1.0) -> tuple[int, int, int, int]:
+    red, green, blue = ImageColor.getrgb(color)[:3]
+    return red, green, blue, round(255 * opacity)
+
+
+@cache
+def _gradient(start: str, end: str, width: int, height: int) -> Image.Image:
+    """``linear-gradient(135deg, start, end)`` over a width × height box."""
+    # At 135deg the gradient position of (x, y) is (x + y) / (width + height)
+    position = (np.arange(width)[None, :] + np.arange(height)[:, None]) / (width + height)
+    first = np.array(ImageColor.getrgb(start), dtype=np.float32)
+    last = np.array(ImageColor.getrgb(end), dtype=np.float32)
+    pixels = first + (last - first) * position[..., None]
+    return Image.fromarray(np.rint(pixels).astype(np.uint8), "RGB")
+
+
+@cache
+def _font_files(font_dir: Path | None) -> tuple[str | None, str | None]:
+    dirs = ((font_dir,) if font_dir else ()) + FONT_SEARCH_DIRS
+    for regular, bold in FONT_CANDIDATES:
+        for directory in dirs:
+            if not directory.is_dir():
+                continue
+            regular_path = next(directory.rglob(regular), None)
+            bold_path = next(directory.rglob(bold), None)
+            if regular_path and bold_path:
+                return str(regular_path), str(bold_path)
+    return None, None
+
+
+class PillowCardRenderer:
+    """Draw listing cards from the card template context.
+
+    Args:
+        font_dir: Extra directory searched first for the TrueType fonts
+    """
+
+    def __init__(self, font_dir: Path | None = None):
+        self._regular, self._bold = _font_files(font_dir)
+
+    @cache  # noqa: B019 - renderers are long-lived per font_dir
+    def font(self, size: int, bold: bool = False) -> ImageFont.FreeTypeFont:
+        path = self._bold if bold else self._regular
+        if path is None:
+            return ImageFont.load_default(size)
+        return ImageFont.truetype(path, size)
+
+    def render(self, context: dict[str, Any], format: str) -> bytes:
+        """Render a card as PNG or JPEG bytes.
+
+        Args:
+            context: Template context from ``ImageGenerationService._card_context``
+            format: Image format ("png" or "jpeg")
+        """
+        image = self.draw(context)
+        buffer = BytesIO()
+        if format == "jpeg":
+            image.save(buffer, format="JPEG", quality=JPEG_QUALITY)
+        else:
+            image.save(buffer, format="PNG", compress_level=1)
+        return buffer.getvalue()
+
+    def draw(self, context: dict[str, Any]) -> Image.Image:
+        """Draw a card onto a new RGB image."""
+        width, height = context["width"], context["height"]
+        theme = THEMES[context["theme"]]
+        image = _gradient(*theme.background, width, height).copy()
+        draw = ImageDraw.Draw(image, "RGBA")
+        inner_width = width - 2 * PADDING
+
+        header_height = self._draw_header(draw, context, theme, width)
+        footer_top = self._draw_footer(draw, context, theme, width, height)
+
+        # .main-content: vertically centered between header and footer, 20px padding
+        area_top = PADDING + header_height + 20
+        area_height = footer_top - 20 - area_top
+        title_lines = self._wrap(context["title"], self.font(42, bold=True), inner_width)
+        specs = self._spec_rows(context, (inner_width - 20) / 2)
+        content_height = (
+            len(title_lines) * 42 * 1.2
+            + 30
+            + 64 * 1.4
+            + 30
+            + sum(row_height for _, row_height in specs)
+            + 20 * max(len(specs) - 1, 0)
+            + 30
+        )
+        top = area_top + max((area_height - content_height) / 2, 0)
+
+        for line in title_lines:
+            self._text(draw, (PADDING, top), line, self.font(42, bold=True), 1.2, theme.title)
+            top += 42 * 1.2
+        top += 30
+
+        top = self._draw_prices(draw, context, theme, top) + 30
+        self._draw_specs(draw, specs, theme, top, (inner_width - 20) / 2)
+        return image
+
+    def _draw_header(
+        self, draw: ImageDraw.ImageDraw, context: dict[str, Any], theme: CardTheme, width: int
+    ) -> float:
+        self._text(
+            draw, (PADDING, PADDING), "Deal Brain", self.font(32, bold=True), 1.4, theme.logo
+        )
+        header_height = 32 * 1.4
+
+        tier = context.get("valuation_tier")
+        if tier:
+            font = self.font(18, bold=True)
+            label = tier.upper()
+            badge_width = draw.textlength(label, font=font) + 48
+            badge_height = 18 * 1.4 + 24
+            left = width - PADDING - badge_width
+            draw.rounded_rectangle(
+                (left, PADDING, left + badge_width, PADDING + badge_height),
+                radius=8,
+                fill=VALUATION_COLORS.get(tier, VALUATION_COLORS["fair"]),
+            )
+            self._text(draw, (left + 24, PADDING + 12), label, font, 1.4, "#ffffff")
+            header_height = max(header_height, badge_height)
+        return header_height
+
+    def _draw_footer(
+        self,
+        draw: ImageDraw.ImageDraw,
+        context: dict[str, Any],
+        theme: CardTheme,
+        width: int,
+        height: int,
+    ) -> float:
+        # .footer: 2px top border, 30px padding-top, one 18px branding line
+        footer_top = height - PADDING - (2 + 30 + 18 * 1.4)
+        draw.rectangle(
+            (PADDING, footer_top, width - PADDING - 1, footer_top + 1),
+            fill=_rgba("#ffffff", 0.2),
+        )
+        manufacturer = context.get("manufacturer")
+        branding = (
+            " ".join(part for part in (manufacturer, context.get("series")) if part)
+            if manufacturer
+            else "Curated PC Deals"
+        )
+        self._text(
+            draw,
+            (PADDING, footer_top + 32),
+            branding,
+            self.font(18, bold=True),
+            1.4,
+            _rgba(theme.branding, 0.9),
+        )
+        return footer_top
+
+    def _draw_prices(
+        self, draw: ImageDraw.ImageDraw, context: dict[str, Any], theme: CardTheme, top: float
+    ) -> float:
+        price_font = self.font(64, bold=True)
+        baseline = self._text(
+            draw, (PADDING, top), f"${context['price']}", price_font, 1.4, theme.price
+        )
+        adjusted = context.get("adjusted_price")
+        if adjusted and adjusted != context["price"]:
+            left = PADDING + draw.textlength(f"${context['price']}", font=price_font) + 20
+            draw.text(
+                (left, baseline),
+                f"Adj: ${adjusted}",
+                font=self.font(32, bold=True),
+                fill=_rgba(theme.text, 0.8),
+                anchor="ls",
+            )
+        return top + 64 * 1.4
+
+    def _spec_rows(
+        self, context: dict[str, Any], column_width: float
+    ) -> list[tuple[list[tuple[str, list[str] | str]], float]]:
+        items: list[tuple[str, list[str] | str]] = [
+            (label, self._wrap(context[key], self.font(24, bold=True), column_width))
+            for label, key in (("CPU", "cpu"), ("RAM", "ram"), ("Storage", "storage"))
+            if context.get(key)
+        ]
+        if context.get("score"):
+            items.append(("Score", f"{context['score']}/10"))
+
+        rows = []
+        for start in range(0, len(items), 2):
+            row = items[start : start + 2]
+            row_height = max(
+                14 * 1.4 + 6 + (len(value) * 24 * 1.4 if isinstance(value, list) else 18 * 1.4 + 16)
+                for _, value in row
+            )
+            rows.append((row, row_height))
+        return rows
+
+    def _draw_specs(
+        self,
+        draw: ImageDraw.ImageDraw,
+        rows: list[tuple[list[tuple[str, list[str] | str]], float]],
+        theme: CardTheme,
+        top: float,
+        column_width: float,
+    ) -> None:
+        label_font = self.font(14, bold=True)
+        value_font = self.font(24, bold=True)
+        for row, row_height in rows:
+            for column, (label, value) in enumerate(row):
+                left = PADDING + column * (column_width + 20)
+                self._text(
+                    draw, (left, top), label.upper(), label_font, 1.4, _rgba(theme.text, 0.7)
+                )
+                value_top = top + 14 * 1.4 + 6
+                if isinstance(value, list):
+                    for line in value:
+                        self._text(draw, (left, value_top), line, value_font, 1.4, theme.spec_value)
+                        value_top += 24 * 1.4
+                    continue
+                # .score-badge: 8px/16px padding on a translucent rounded box
+                badge_font = self.font(18, bold=True)
+                badge_width = draw.textlength(value, font=badge_font) + 32
+                draw.rounded_rectangle(
+                    (left, value_top, left + badge_width, value_top + 18 * 1.4 + 16),
+                    radius=6,
+                    fill=_rgba("#ffffff", 0.2),
+                )
+                self._text(draw, (left + 16, value_top + 8), value, badge_font, 1.4, theme.score)
+            top += row_height + 20
+
+    def _text(
+        self,
+        draw: ImageDraw.ImageDraw,
+        position: tuple[float, float],
+        text: str,
+        font: ImageFont.FreeTypeFont,
+        line_height: float,
+        fill: str | tuple[int, int, int, int],
+    ) -> float:
+        """Draw one line inside a CSS line box at ``position``; returns its baseline."""
+        ascent, descent = font.getmetrics()
+        left, top = position
+        baseline = top + (font.size * line_height - (ascent + descent)) / 2 + ascent
+        draw.text((left, baseline), text, font=font, fill=fill, anchor="ls")
+        return baseline
+
+    @staticmethod
+    def _wrap(text: str, font: ImageFont.FreeTypeFont, max_width: float) -> list[str]:
+        lines: list[str] = []
+        for word in text.split():
+            candidate = f"{lines[-1]} {word}" if lines else word
+            if lines and font.getlength(candidate) <= max_width:
+                lines[-1] = candidate
+            else:
+                lines.append(word)
+        return lines or [""]
+
+
+@cache
+def get_pillow_renderer(font_dir: Path | None = None) -> PillowCardRenderer:
+    """Return the process-wide renderer for ``font_dir``."""
+    return PillowCardRenderer(font_dir)
+
+
+__all__ = ["CardTheme", "PillowCardRenderer", "THEMES", "get_pillow_renderer"]
@@ -0,0 +1,289 @@
+"""In-memory CPU/GPU catalog index shared by all component matching paths.
+
+Ingestion (`IngestionService._find_cpu_by_model`), spreadsheet imports
+(`services/imports/cpu_matcher.py`) and extracted-component matching
+(`CatalogMatcher`) all resolve free-text component names against the CPU and
+GPU catalogs. Instead of each path querying or rebuilding its own lookup, the
+catalog is loaded once per process into a `CatalogIndex` holding:
+
+- normalized name/alias -> id maps for exact lookups
+- a model-number token index (e.g. "12900h" -> {cpu ids}) for token lookups
+- pre-built choice lists for rapidfuzz fuzzy lookups
+
+The index is cached per database (see ``db.database_key``, so it survives the
+engine being recreated for each Celery task) and rebuilt when the catalog
+version (row count, max id and last update of the cpu/gpu tables) changes.
+"""
+
+from __future__ import annotations
+
+import logging
+import re
+from collections.abc import Hashable, Iterable
+from dataclasses import dataclass, field
+from typing import Any, Generic, TypeVar
+
+from rapidfuzz import fuzz, process
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..db import database_key
+from ..models.catalog import Cpu, Gpu
+from .imports.utils import normalize_text
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Model-number tokens contain at least one digit and are 3+ characters long
+# ("12900h", "5600x", "3060", "n100"); shorter tokens such as "i7" or "m2"
+# are too ambiguous to index on their own.
+MODEL_TOKEN_PATTERN = re.compile(r"^(?=.*\d)[a-z0-9]{3,}$")
+
+
+def model_tokens(text: str) -> set[str]:
+    """Extract model-number tokens from a component name."""
+    return {token for token in normalize_text(text).split() if MODEL_TOKEN_PATTERN.match(token)}
+
+
+@dataclass(frozen=True)
+class CatalogEntry:
+    """Lightweight catalog row held by the process-wide index."""
+
+    id: int
+    name: str
+    manufacturer: str | None = None
+
+
+@dataclass(frozen=True)
+class IndexMatch(Generic[T]):
+    """Result of an index lookup."""
+
+    item: T
+    score: int
+    match_type: str  # exact, substring, token, keyword, fuzzy
+
+
+class ComponentIndex(Generic[T]):
+    """
+    Lookup structures for one component catalog (CPUs or GPUs).
+
+    Args:
+        entries: Iterable of (id, name, aliases, item) tuples. ``item`` is what
+            lookups return (an ORM model or a CatalogEntry).
+    """
+
+    def __init__(self, entries: Iterable[tuple[int, str, Iterable[str], T]]):
+        self.items: dict[int, T] = {}
+        self.names: list[str] = []
+        self.name_lookup: dict[str, int] = {}
+        self._normalized_names: list[tuple[str, int]] = []
+        self._exact: dict[str, int] = {}
+        self._normalized: dict[str, int] = {}
+        self._tokens: dict[str, set[int]] = {}
+
+        for item_id, name, aliases, item in entries:
+            if not name:
+                continue
+            self.items[item_id] = item
+            self.names.append(name)
+            normalized_name = normalize_text(name)
+            self.name_lookup[normalized_name] = item_id
+            self._normalized_names.append((normalized_name, item_id))
+
+            for label in [name, *aliases]:
+                if not isinstance(label, str) or not label:
+                    continue
+                self._exact[label] = item_id
+                self._normalized.setdefault(normalize_text(label), item_id)
+                for token in model_tokens(label):
+                    self._tokens.setdefault(token, set()).add(item_id)
+
+        # Fuzzy choices in insertion order; a label shared by two entries maps
+        # to the later one, as with the per-call dicts the matchers used to build
+        self._choices: list[str] = list(self._exact)
+        self._choice_ids: list[int] = list(self._exact.values())
+
+    @classmethod
+    def from_models(cls, models: Iterable[Any]) -> ComponentIndex[Any]:
+        """Build an index over ORM models (``id``, ``name``, ``attributes_json``)."""
+        return cls(
+            (model.id, model.name, _aliases(model.attributes_json), model) for model in models
+        )
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def exact(self, name: str) -> IndexMatch[T] | None:
+        """Case- and punctuation-insensitive exact lookup on names and aliases."""
+        item_id = self._exact.get(name)
+        if item_id is None:
+            item_id = self._normalized.get(normalize_text(name))
+        if item_id is None:
+            return None
+        return IndexMatch(self.items[item_id], 100, "exact")
+
+    def by_model_token(self, text: str) -> IndexMatch[T] | None:
+        """
+        Lookup by model-number tokens ("12900H", "5600X", "3060").
+
+        Entries sharing every model token of the query are candidates; the
+        one whose name is closest to the query wins.
+        """
+        candidates: set[int] | None = None
+        for token in model_tokens(text):
+            ids = self._tokens.get(token)
+            if not ids:
+                continue
+            candidates = set(ids) if candidates is None else candidates & ids
+        if not candidates:
+            return None
+
+        query = normalize_text(text)
+        best_id = max(
+            sorted(candidates),
+            key=lambda item_id: fuzz.ratio(query, normalize_text(self._name(item_id))),
+        )
+        score = int(fuzz.ratio(query, normalize_text(self._name(best_id))))
+        return IndexMatch(self.items[best_id], score, "token")
+
+    def fuzzy(
+        self,
+        name: str,
+        *,
+        scorer: Any = fuzz.ratio,
+        score_cutoff: float = 0,
+    ) -> IndexMatch[T] | None:
+        """Best fuzzy match over names and aliases (same semantics as rapidfuzz extractOne)."""
+        if name in self._exact:
+            return IndexMatch(self.items[self._exact[name]], 100, "exact")
+        result = process.extractOne(name, self._choices, scorer=scorer, score_cutoff=score_cutoff)
+        if result is None:
+            return None
+        _, score, position = result
+        return IndexMatch(self.items[self._choice_ids[position]], int(score), "fuzzy")
+
+    def search(self, query: str) -> IndexMatch[T] | None:
+        """
+        Resolve a free-text model string the way ingestion does.
+
+        Tries, in order: exact name/alias, the query as a substring of a
+        name, model-number tokens, and finally any query keyword (3+ chars)
+        as a substring of a name.
+        """
+        if not query or not query.strip():
+            return None
+
+        match = self.exact(query)
+        if match:
+            return match
+
+        normalized = normalize_text(query)
+        if not normalized:
+            return None
+        for normalized_name, item_id in self._normalized_names:
+            if normalized in normalized_name:
+                return IndexMatch(self.items[item_id], 90, "substring")
+
+        match = self.by_model_token(query)
+        if match:
+            return match
+
+        for keyword in (part for part in normalized.split() if len(part) > 2):
+            for normalized_name, item_id in self._normalized_names:
+                if keyword in normalized_name:
+                    return IndexMatch(self.items[item_id], 50, "keyword")
+        return None
+
+    def _name(self, item_id: int) -> str:
+        item = self.items[item_id]
+        return getattr(item, "name", "")
+
+
+def _aliases(attributes: dict[str, Any] | None) -> list[str]:
+    if not attributes:
+        return []
+    aliases = attributes.get("aliases")
+    if not isinstance(aliases, list):
+        return []
+    return [alias for alias in aliases if isinstance(alias, str)]
+
+
+@dataclass
+class CatalogIndex:
+    """CPU and GPU indexes for one catalog version."""
+
+    version: tuple[Any, ...]
+    cpus: ComponentIndex[CatalogEntry] = field(repr=False)
+    gpus: ComponentIndex[CatalogEntry] = field(repr=False)
+
+
+_indexes: dict[Hashable, CatalogIndex] = {}
+
+
+async def _catalog_version(session: AsyncSession) -> tuple[Any, ...]:
+    """Cheap fingerprint of the cpu and gpu tables."""
+    version: list[Any] = []
+    for model in (Cpu, Gpu):
+        result = await session.execute(
+            select(func.count(model.id), func.max(model.id), func.max(model.updated_at))
+        )
+        version.extend(result.one())
+    return tuple(version)
+
+
+async def _load_component_index(session: AsyncSession, model: Any) -> ComponentIndex[CatalogEntry]:
+    result = await session.execute(
+        select(model.id, model.name, model.manufacturer, model.attributes_json).order_by(model.id)
+    )
+    return ComponentIndex(
+        (item_id, name, _aliases(attributes), CatalogEntry(item_id, name, manufacturer))
+        for item_id, name, manufacturer, attributes in result.all()
+    )
+
+
+async def get_catalog_index(session: AsyncSession) -> CatalogIndex:
+    """
+    Return the process-wide catalog index, rebuilding it if the catalog changed.
+
+    Costs one small aggregate query per table when the cached index is current.
+
+    Args:
+        session: Database session
+
+    Returns:
+        CatalogIndex for the session's database
+    """
+    key = database_key(session.get_bind())
+    version = await _catalog_version(session)
+    cached = _indexes.get(key)
+    if cached is not None and cached.version == version:
+        return cached
+
+    index = CatalogIndex(
+        version=version,
+        cpus=await _load_component_index(session, Cpu),
+        gpus=await _load_component_index(session, Gpu),
+    )
+    _indexes[key] = index
+    logger.info(
+        f"Built catalog index: {len(index.cpus)} CPUs, {len(index.gpus)} GPUs "
+        f"(version {version})"
+    )
+    return index
+
+
+def invalidate_catalog_index() -> None:
+    """Drop all cached indexes (e.g. after bulk catalog writes)."""
+    _indexes.clear()
+
+
+__all__ = [
+    "CatalogEntry",
+    "CatalogIndex",
+    "ComponentIndex",
+    "IndexMatch",
+    "get_catalog_index",
+    "invalidate_catalog_index",
+    "model_tokens",
+]
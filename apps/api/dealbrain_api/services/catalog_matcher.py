@@ -10,7 +10,9 @@ from __future__ import annotations
 import logging
 from typing import TYPE_CHECKING, Any
 
-from rapidfuzz import fuzz, process
+from rapidfuzz import fuzz
+
+from .catalog_index import ComponentIndex
 
 if TYPE_CHECKING:
     from ..models.catalog import Cpu, Gpu
@@ -25,6 +27,10 @@ class CatalogMatcher:
     between extracted component names and catalog entries, handling common
     variations in naming conventions.
 
+    Catalogs can be passed as lists of ORM entries or as a pre-built
+    ``ComponentIndex`` (e.g. from ``get_catalog_index``). Lists are indexed
+    once and the index is reused while the same list is passed again.
+
     Parameters
     ----------
     similarity_threshold : int
@@ -43,9 +49,23 @@ class CatalogMatcher:
         if not 0 <= similarity_threshold <= 100:
             raise ValueError("similarity_threshold must be between 0 and 100")
         self.similarity_threshold = similarity_threshold
+        self._indexes: dict[str, tuple[Any, ComponentIndex[Any]]] = {}
+
+    def _get_index(
+        self, kind: str, catalog: list[Any] | ComponentIndex[Any]
+    ) -> ComponentIndex[Any]:
+        """Return an index for ``catalog``, reusing the last one built for the same list."""
+        if isinstance(catalog, ComponentIndex):
+            return catalog
+        cached = self._indexes.get(kind)
+        if cached is not None and cached[0] is catalog and len(cached[1]) == len(catalog):
+            return cached[1]
+        index = ComponentIndex.from_models(catalog)
+        self._indexes[kind] = (catalog, index)
+        return index
 
     def match_cpu(
-        self, extracted_name: str, cpus: list[Cpu]
+        self, extracted_name: str, cpus: list[Cpu] | ComponentIndex[Any]
     ) -> tuple[Cpu | None, int]:
         """Match extracted CPU name to catalog entry.
 
@@ -53,8 +73,8 @@ class CatalogMatcher:
         ----------
         extracted_name : str
             Extracted CPU name from product description
-        cpus : list[Cpu]
-            List of CPU catalog entries to match against
+        cpus : list[Cpu] | ComponentIndex
+            CPU catalog entries (or a pre-built index) to match against
 
         Returns
         -------
@@ -68,28 +88,12 @@ class CatalogMatcher:
         >>> cpu, score = matcher.match_cpu("i7 12700K", cpu_list)
         >>> print(f"Matched: {cpu.name} (score: {score})")
         """
-        if not extracted_name or not cpus:
+        if not extracted_name or not len(cpus):
             return None, 0
 
-        # Build list of CPU names and aliases for matching
-        choices: dict[str, Cpu] = {}
-
-        for cpu in cpus:
-            # Add main CPU name
-            choices[cpu.name] = cpu
-
-            # Add aliases from attributes_json if available
-            if cpu.attributes_json and "aliases" in cpu.attributes_json:
-                aliases = cpu.attributes_json["aliases"]
-                if isinstance(aliases, list):
-                    for alias in aliases:
-                        if isinstance(alias, str):
-                            choices[alias] = cpu
-
-        # Perform fuzzy matching
-        result = process.extractOne(
+        # Fuzzy match against the indexed names and aliases
+        result = self._get_index("cpu", cpus).fuzzy(
             extracted_name,
-            choices.keys(),
             scorer=fuzz.ratio,
             score_cutoff=self.similarity_threshold,
         )
@@ -101,8 +105,7 @@ class CatalogMatcher:
             )
             return None, 0
 
-        matched_name, score, _ = result
-        matched_cpu = choices[matched_name]
+        matched_cpu, score = result.item, result.score
 
         logger.info(
             f"Matched CPU '{extracted_name}' to '{matched_cpu.name}' "
@@ -112,7 +115,7 @@ class CatalogMatcher:
         return matched_cpu, int(score)
 
     def match_gpu(
-        self, extracted_name: str, gpus: list[Gpu]
+        self, extracted_name: str, gpus: list[Gpu] | ComponentIndex[Any]
     ) -> tuple[Gpu | None, int]:
         """Match extracted GPU name to catalog entry.
 
@@ -120,8 +123,8 @@ class CatalogMatcher:
         ----------
         extracted_name : str
             Extracted GPU name from product description
-        gpus : list[Gpu]
-            List of GPU catalog entries to match against
+        gpus : list[Gpu] | ComponentIndex
+            GPU catalog entries (or a pre-built index) to match against
 
         Returns
         -------
@@ -135,28 +138,12 @@ class CatalogMatcher:
         >>> gpu, score = matcher.match_gpu("RTX 3060", gpu_list)
         >>> print(f"Matched: {gpu.name} (score: {score})")
         """
-        if not extracted_name or not gpus:
+        if not extracted_name or not len(gpus):
             return None, 0
 
-        # Build list of GPU names and aliases for matching
-        choices: dict[str, Gpu] = {}
-
-        for gpu in gpus:
-            # Add main GPU name
-            choices[gpu.name] = gpu
-
-            # Add aliases from attributes_json if available
-            if gpu.attributes_json and "aliases" in gpu.attributes_json:
-                aliases = gpu.attributes_json["aliases"]
-                if isinstance(aliases, list):
-                    for alias in aliases:
-                        if isinstance(alias, str):
-                            choices[alias] = gpu
-
-        # Perform fuzzy matching
-        result = process.extractOne(
+        # Fuzzy match against the indexed names and aliases
+        result = self._get_index("gpu", gpus).fuzzy(
             extracted_name,
-            choices.keys(),
             scorer=fuzz.ratio,
             score_cutoff=self.similarity_threshold,
         )
@@ -168,8 +155,7 @@ class CatalogMatcher:
             )
             return None, 0
 
-        matched_name, score, _ = result
-        matched_gpu = choices[matched_name]
+        matched_gpu, score = result.item, result.score
 
         logger.info(
             f"Matched GPU '{extracted_name}' to '{matched_gpu.name}' "
@@ -0,0 +1,295 @@
+"""Expression indexes over custom field values stored in ``attributes_json``.
+
+Every defined (not deleted) custom field gets a B-tree index on
+``attributes_json ->> '<key>'`` of its entity's table, which serves usage
+counts (``IS NOT NULL``), equality filters and ordered distinct-value
+lookups. On PostgreSQL with the ``pg_trgm`` extension a trigram GIN index
+on ``lower(attributes_json ->> '<key>')`` additionally serves the
+substring search used by value autocomplete.
+
+``CustomFieldService`` creates the indexes with a definition and drops
+them when it is deleted; ``sync_custom_field_indexes`` reconciles the
+database with the definitions (e.g. after a restore) and runs at API and
+worker startup through ``reconcile_custom_field_indexes``. Queries must build
+the value expression with ``attribute_value`` so the planner can match
+it against the index.
+
+A plain CREATE/DROP INDEX locks the whole table until the transaction
+ends, so on PostgreSQL the statements are queued on the session and run
+``CONCURRENTLY`` on an autocommit connection once it commits (the commit
+hook is registered only on sessions that queued DDL). SQLite runs them in
+the session's transaction.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import hashlib
+import logging
+import re
+from dataclasses import dataclass, field
+
+from sqlalchemy import Text, bindparam, event, literal_column, select, text
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+from sqlalchemy.orm import Session
+from sqlalchemy.sql.elements import ColumnElement
+
+from ..db import session_scope
+from ..models.core import Cpu, CustomFieldDefinition, Gpu, Listing, PortsProfile
+
+logger = logging.getLogger(__name__)
+
+INDEX_PREFIX = "ix_cf_"
+
+# Entities whose custom fields live in <table>.attributes_json
+INDEXED_ENTITY_MODELS = {
+    "listing": Listing,
+    "cpu": Cpu,
+    "gpu": Gpu,
+    "ports_profile": PortsProfile,
+}
+
+# Dialects supporting ``->>`` expression indexes
+SUPPORTED_DIALECTS = frozenset({"postgresql", "sqlite"})
+
+_MAX_IDENTIFIER_LENGTH = 63
+
+_PENDING_DDL_KEY = "custom_field_index_ddl"
+
+# Keeps scheduled index builds referenced until they finish
+_background_tasks: set[asyncio.Task[None]] = set()
+
+
+@dataclass
+class IndexSyncResult:
+    created: list[str] = field(default_factory=list)
+    dropped: list[str] = field(default_factory=list)
+
+
+def _quote_key(key: str) -> str:
+    return "'" + key.replace("'", "''") + "'"
+
+
+def attribute_value(model, key: str) -> ColumnElement[str]:
+    """``<table>.attributes_json ->> '<key>'``, the indexed custom field value.
+
+    The key is inlined (not a bound parameter) and the result is not cast,
+    so the expression is identical to the one the index was built on.
+    """
+    column = model.__table__.c.attributes_json
+    return column.op("->>", return_type=Text)(literal_column(_quote_key(key)))
+
+
+def index_name(table: str, key: str, suffix: str = "") -> str:
+    """Index name for a custom field, unique per key and at most 63 characters.
+
+    The sanitized key keeps the name readable; a hash of the raw key keeps
+    keys that sanitize alike ("ram-type" and "ram_type") apart.
+    """
+    safe_key = re.sub(r"[^a-z0-9_]+", "_", key.lower())
+    digest = hashlib.sha256(key.encode()).hexdigest()[:8]
+    prefix = f"{INDEX_PREFIX}{table}_"
+    safe_key = safe_key[: _MAX_IDENTIFIER_LENGTH - len(prefix) - len(suffix) - 9]
+    return f"{prefix}{safe_key}_{digest}{suffix}"
+
+
+def index_statements(
+    table: str, key: str, *, trigram: bool = False, concurrently: bool = False
+) -> dict[str, str]:
+    """CREATE INDEX statements for one custom field, keyed by index name."""
+    value = f"(attributes_json ->> {_quote_key(key)})"
+    create = "CREATE INDEX CONCURRENTLY" if concurrently else "CREATE INDEX"
+    statements = {
+        index_name(table, key): f"{create} IF NOT EXISTS {index_name(table, key)} "
+        f"ON {table} ({value})"
+    }
+    if trigram:
+        name = index_name(table, key, "_trgm")
+        statements[name] = (
+            f"{create} IF NOT EXISTS {name} ON {table} USING gin (lower{value} gin_trgm_ops)"
+        )
+    return statements
+
+
+def _drop_statement(name: str, *, concurrently: bool = False) -> str:
+    return f"DROP INDEX {'CONCURRENTLY ' if concurrently else ''}IF EXISTS {name}"
+
+
+def _dialect(db: AsyncSession) -> str:
+    return db.get_bind().dialect.name
+
+
+async def _has_trigram(db: AsyncSession, dialect: str) -> bool:
+    if dialect != "postgresql":
+        return False
+    found = await db.scalar(text("SELECT 1 FROM pg_extension WHERE extname = 'pg_trgm'"))
+    return found is not None
+
+
+async def _existing_indexes(db: AsyncSession, dialect: str) -> dict[str, str]:
+    """Custom field index name -> table for the indexed tables."""
+    tables = [model.__table__.name for model in INDEXED_ENTITY_MODELS.values()]
+    if dialect == "postgresql":
+        query = text(
+            "SELECT indexname, tablename FROM pg_indexes "
+            "WHERE schemaname = current_schema() AND tablename IN :tables"
+        )
+    else:
+        query = text(
+            "SELECT name, tbl_name FROM sqlite_master WHERE type = 'index' AND tbl_name IN :tables"
+        )
+    query = query.bindparams(bindparam("tables", tables, expanding=True))
+    rows = (await db.execute(query)).all()
+    return {name: table for name, table in rows if name.startswith(INDEX_PREFIX)}
+
+
+async def _execute_ddl(db: AsyncSession, dialect: str, statements: dict[str, str]) -> None:
+    """Run index DDL now (SQLite) or once ``db`` commits (PostgreSQL)."""
+    if dialect != "postgresql":
+        for statement in statements.values():
+            await db.execute(text(statement))
+        return
+    session = db.sync_session
+    if not event.contains(session, "after_commit", _schedule_pending_ddl):
+        event.listen(session, "after_commit", _schedule_pending_ddl)
+        event.listen(session, "after_rollback", _discard_pending_ddl)
+    session.info.setdefault(_PENDING_DDL_KEY, []).append((db.bind, statements))
+
+
+async def ensure_field_indexes(db: AsyncSession, definition: CustomFieldDefinition) -> list[str]:
+    """Create the indexes for a custom field; returns the index names."""
+    model = INDEXED_ENTITY_MODELS.get(definition.entity)
+    dialect = _dialect(db)
+    if model is None or dialect not in SUPPORTED_DIALECTS:
+        return []
+    statements = index_statements(
+        model.__table__.name,
+        definition.key,
+        trigram=await _has_trigram(db, dialect),
+        concurrently=dialect == "postgresql",
+    )
+    await _execute_ddl(db, dialect, statements)
+    logger.info(f"Ensured custom field indexes for {definition.entity}.{definition.key}")
+    return list(statements)
+
+
+async def drop_field_indexes(db: AsyncSession, definition: CustomFieldDefinition) -> list[str]:
+    """Drop the indexes of a custom field; returns the index names."""
+    model = INDEXED_ENTITY_MODELS.get(definition.entity)
+    dialect = _dialect(db)
+    if model is None or dialect not in SUPPORTED_DIALECTS:
+        return []
+    table = model.__table__.name
+    names = [index_name(table, definition.key), index_name(table, definition.key, "_trgm")]
+    concurrently = dialect == "postgresql"
+    await _execute_ddl(
+        db, dialect, {name: _drop_statement(name, concurrently=concurrently) for name in names}
+    )
+    logger.info(f"Dropped custom field indexes for {definition.entity}.{definition.key}")
+    return names
+
+
+async def sync_custom_field_indexes(db: AsyncSession) -> IndexSyncResult:
+    """Create missing and drop orphaned custom field indexes.
+
+    On PostgreSQL the reported indexes are built or dropped after ``db``
+    commits.
+    """
+    result = IndexSyncResult()
+    dialect = _dialect(db)
+    if dialect not in SUPPORTED_DIALECTS:
+        return result
+
+    trigram = await _has_trigram(db, dialect)
+    concurrently = dialect == "postgresql"
+    fields = await db.execute(
+        select(CustomFieldDefinition.entity, CustomFieldDefinition.key).where(
+            CustomFieldDefinition.deleted_at.is_(None),
+            CustomFieldDefinition.entity.in_(INDEXED_ENTITY_MODELS),
+        )
+    )
+    desired: dict[str, str] = {}
+    for entity, key in fields:
+        table = INDEXED_ENTITY_MODELS[entity].__table__.name
+        desired.update(index_statements(table, key, trigram=trigram, concurrently=concurrently))
+
+    existing = await _existing_indexes(db, dialect)
+    result.dropped = sorted(existing.keys() - desired.keys())
+    result.created = sorted(desired.keys() - existing.keys())
+    statements = {name: _drop_statement(name, concurrently=concurrently) for name in result.dropped}
+    statements.update({name: desired[name] for name in result.created})
+    await _execute_ddl(db, dialect, statements)
+
+    if result.created or result.dropped:
+        logger.info(
+            f"Synced custom field indexes: {len(result.created)} created, "
+            f"{len(result.dropped)} dropped"
+        )
+    return result
+
+
+async def _run_concurrent_ddl(engine: AsyncEngine, statements: dict[str, str]) -> None:
+    # CONCURRENTLY cannot run inside a transaction block
+    async with engine.connect() as conn:
+        conn = await conn.execution_options(isolation_level="AUTOCOMMIT")
+        for name, statement in statements.items():
+            try:
+                await conn.execute(text(statement))
+            except Exception as exc:
+                logger.warning(f"Custom field index DDL failed for {name}: {exc}")
+                if statement.startswith("CREATE"):
+                    # A failed concurrent build leaves an INVALID index behind
+                    with contextlib.suppress(Exception):
+                        await conn.execute(text(_drop_statement(name, concurrently=True)))
+
+
+def _schedule_pending_ddl(session: Session) -> None:
+    pending = session.info.pop(_PENDING_DDL_KEY, [])
+    if not pending:
+        return
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        logger.warning("No running event loop; custom field indexes left to the startup sync")
+        return
+    for engine, statements in pending:
+        task = loop.create_task(_run_concurrent_ddl(engine, statements))
+        _background_tasks.add(task)
+        task.add_done_callback(_background_tasks.discard)
+
+
+def _discard_pending_ddl(session: Session) -> None:
+    session.info.pop(_PENDING_DDL_KEY, None)
+
+
+async def wait_for_index_ddl() -> None:
+    """Wait for index builds scheduled by committed sessions to finish."""
+    while _background_tasks:
+        await asyncio.gather(*_background_tasks, return_exceptions=True)
+
+
+async def reconcile_custom_field_indexes() -> IndexSyncResult:
+    """Sync the custom field indexes and wait for the DDL to finish.
+
+    Run at API and worker startup, so index builds lost with an event loop
+    that ended right after its commit are picked up again.
+    """
+    async with session_scope() as db:
+        result = await sync_custom_field_indexes(db)
+    await wait_for_index_ddl()
+    return result
+
+
+__all__ = [
+    "INDEXED_ENTITY_MODELS",
+    "IndexSyncResult",
+    "attribute_value",
+    "drop_field_indexes",
+    "ensure_field_indexes",
+    "index_name",
+    "index_statements",
+    "reconcile_custom_field_indexes",
+    "sync_custom_field_indexes",
+    "wait_for_index_ddl",
+]
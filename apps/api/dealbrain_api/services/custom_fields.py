@@ -8,8 +8,9 @@ from dataclasses import dataclass
 from datetime import datetime
 from typing import Any, Callable, Iterable, Sequence
 
-from sqlalchemy import func, select
+from sqlalchemy import event, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
 
 from ..models.core import (
     Cpu,
@@ -21,6 +22,8 @@ from ..models.core import (
     PortsProfile,
 )
 from ..settings import get_settings
+from .custom_field_indexes import attribute_value, drop_field_indexes, ensure_field_indexes
+from .field_value_dictionary import field_value_dictionaries
 
 logger = logging.getLogger(__name__)
 analytics_logger = logging.getLogger("dealbrain.analytics")
@@ -71,6 +74,41 @@ class FieldDependencyError(RuntimeError):
         self.usage = usage
 
 
+_CHANGED_ENTITIES_KEY = "custom_field_definitions_changed"
+
+
+class DefinitionVersions:
+    """Per-entity version counters for custom field definitions.
+
+    Caches derived from the definitions (such as the field registry schemas)
+    remember the version they were built at and rebuild once it moves.
+    ``CustomFieldService`` bumps an entity when it changes one of its
+    definitions and again when that session commits or rolls back, so nothing
+    read mid-transaction outlives the transaction.
+    """
+
+    def __init__(self) -> None:
+        self._versions: dict[str, int] = {}
+
+    def get(self, entity: str) -> int:
+        return self._versions.get(entity, 0)
+
+    def bump(self, entity: str) -> None:
+        self._versions[entity] = self.get(entity) + 1
+
+    def touch(self, db: AsyncSession, entity: str) -> None:
+        """Bump ``entity`` now and once more when ``db``'s transaction ends."""
+        self.bump(entity)
+        db.sync_session.info.setdefault(_CHANGED_ENTITIES_KEY, set()).add(entity)
+
+    @staticmethod
+    def has_uncommitted_changes(db: AsyncSession) -> bool:
+        return bool(db.sync_session.info.get(_CHANGED_ENTITIES_KEY))
+
+
+definition_versions = DefinitionVersions()
+
+
 class CustomFieldService:
     """CRUD helpers for custom fields."""
 
@@ -162,6 +200,8 @@ class CustomFieldService:
         db.add(record)
         await db.flush()
         await db.refresh(record)
+        await ensure_field_indexes(db, record)
+        definition_versions.touch(db, record.entity)
 
         snapshot = self._snapshot(record)
         self._write_audit_event(
@@ -253,6 +293,7 @@ class CustomFieldService:
 
         await db.flush()
         await db.refresh(record)
+        definition_versions.touch(db, record.entity)
 
         current_options = list(record.options or []) if record.options else []
         removed_options: set[str] = set()
@@ -348,6 +389,7 @@ class CustomFieldService:
 
         await db.flush()
         await db.refresh(record)
+        definition_versions.touch(db, record.entity)
 
         # Audit logging
         self._write_audit_event(
@@ -411,6 +453,9 @@ class CustomFieldService:
             )
 
         await db.flush()
+        await drop_field_indexes(db, record)
+        field_value_dictionaries.invalidate(f"{record.entity}.{record.key}")
+        definition_versions.touch(db, record.entity)
         self._emit_event(
             "field_definition.deleted",
             {
@@ -435,9 +480,12 @@ class CustomFieldService:
                 field_id=field.id, entity=field.entity, key=field.key, counts=counts
             )
 
-        column = getattr(model, "attributes_json", None)
-        if column is not None:
-            stmt = select(func.count()).select_from(model).where(column[field.key].isnot(None))
+        if getattr(model, "attributes_json", None) is not None:
+            stmt = (
+                select(func.count())
+                .select_from(model)
+                .where(attribute_value(model, field.key).isnot(None))
+            )
             result = await db.scalar(stmt)
             counts[field.entity] = int(result or 0)
         return FieldUsageSummary(
@@ -493,11 +541,12 @@ class CustomFieldService:
         model = ENTITY_MODEL_MAP.get(field.entity)
         if model is None:
             return
-        column = getattr(model, "attributes_json", None)
-        if column is None:
+        if getattr(model, "attributes_json", None) is None:
             return
 
-        result = await db.execute(select(model).where(column[field.key].isnot(None)))
+        result = await db.execute(
+            select(model).where(attribute_value(model, field.key).isnot(None))
+        )
         records = result.scalars().all()
         for record_instance in records:
             attributes = dict(getattr(record_instance, "attributes_json", {}) or {})
@@ -637,8 +686,19 @@ class CustomFieldService:
             analytics_logger.info("event=%s payload=%s", name, payload)
 
 
+def _bump_changed_entities(session: Session) -> None:
+    for entity in session.info.pop(_CHANGED_ENTITIES_KEY, ()):
+        definition_versions.bump(entity)
+
+
+event.listen(Session, "after_commit", _bump_changed_entities)
+event.listen(Session, "after_rollback", _bump_changed_entities)
+
+
 __all__ = [
     "CustomFieldService",
+    "DefinitionVersions",
+    "definition_versions",
     "ALLOWED_FIELD_TYPES",
     "UNSET",
     "FieldDependencyError",
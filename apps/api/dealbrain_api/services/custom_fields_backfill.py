@@ -2,15 +2,24 @@
 
 from __future__ import annotations
 
+import json
 from collections import defaultdict
 from typing import Any, Iterable
 
-from sqlalchemy import select
+from sqlalchemy import JSON, String, select, text
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ..models.core import CustomFieldDefinition
 from .custom_fields import CustomFieldService, ENTITY_MODEL_MAP
 
+# Distinct values per attribute key, aggregated in the database
+_PG_DISTINCT_ATTRIBUTE_VALUES = """
+SELECT attrs.key AS key, json_agg(DISTINCT attrs.value) AS samples
+FROM {table}, jsonb_each({table}.attributes_json::jsonb) AS attrs
+WHERE attrs.key <> ''
+GROUP BY attrs.key
+"""
+
 
 async def inventory_attribute_values(
     db: AsyncSession,
@@ -23,15 +32,24 @@ async def inventory_attribute_values(
     if column is None:
         return {}
 
+    if db.get_bind().dialect.name == "postgresql":
+        # Ship one row per key instead of every record's attributes
+        stmt = text(_PG_DISTINCT_ATTRIBUTE_VALUES.format(table=model.__table__.name)).columns(
+            key=String, samples=JSON
+        )
+        result = await db.execute(stmt)
+        return dict(result.tuples())
+
+    # Same DISTINCT as the PostgreSQL aggregate; values may be unhashable JSON
     result = await db.execute(select(column))
-    values: dict[str, list[Any]] = defaultdict(list)
+    values: dict[str, dict[str, Any]] = defaultdict(dict)
     for row in result.scalars():
         if not row:
             continue
         for key, value in row.items():
             if key:
-                values[key].append(value)
-    return values
+                values[key].setdefault(json.dumps(value, sort_keys=True), value)
+    return {key: list(samples.values()) for key, samples in values.items()}
 
 
 def infer_field_shape(values: Iterable[Any]) -> tuple[str, dict[str, Any] | None, list[str] | None]:
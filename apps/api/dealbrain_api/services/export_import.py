@@ -17,12 +17,13 @@ from __future__ import annotations
 import hashlib
 import logging
 import uuid
-from dataclasses import dataclass
+from collections.abc import Sequence
+from dataclasses import asdict, dataclass
 from datetime import datetime, timedelta
 from typing import Any, Literal
 
 from pydantic import ValidationError
-from sqlalchemy import select
+from sqlalchemy import delete, insert, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import joinedload, selectinload
 
@@ -52,6 +53,15 @@ from ..schemas.export_import import (
     StorageExport,
     ValuationExport,
 )
+from ..settings import get_settings
+from .import_previews import (
+    DuplicateMatch,
+    ImportPreview,
+    PreviewCache,
+    PreviewRows,
+    PreviewStore,
+)
+from .near_duplicates import get_near_duplicate_index, record_listing, record_listing_values
 from dealbrain_core.enums import (
     Condition,
     ListingStatus,
@@ -66,103 +76,48 @@ logger = logging.getLogger(__name__)
 # ==================== Preview Storage ====================
 
 
-@dataclass
-class ImportPreview:
-    """Preview of an import operation before confirmation.
-
-    Attributes:
-        preview_id: Unique ID for this preview
-        type: Type of import (deal or collection)
-        data: Validated export data
-        duplicates: List of potential duplicate entities
-        created_at: When preview was created
-        expires_at: When preview expires (30 minutes)
-    """
-
-    preview_id: str
-    type: Literal["deal", "collection"]
-    data: PortableDealExport | PortableCollectionExport
-    duplicates: list[DuplicateMatch]
-    created_at: datetime
-    expires_at: datetime
-
-
-@dataclass
-class DuplicateMatch:
-    """Potential duplicate entity match.
-
-    Attributes:
-        entity_id: ID of existing entity
-        entity_type: Type of entity (listing or collection)
-        match_score: Confidence score (0.0-1.0)
-        match_reason: Human-readable explanation
-        entity_data: Partial data for display
-    """
-
-    entity_id: int
-    entity_type: Literal["listing", "collection"]
-    match_score: float
-    match_reason: str
-    entity_data: dict[str, Any]
+# Global preview store instance
+_preview_store = PreviewStore()
 
 
-class PreviewCache:
-    """In-memory cache for import previews with TTL."""
+# ==================== Component Matching ====================
 
-    def __init__(self, ttl_minutes: int = 30):
-        """Initialize preview cache.
-
-        Args:
-            ttl_minutes: Time-to-live for previews in minutes
-        """
-        self._cache: dict[str, ImportPreview] = {}
-        self._ttl_minutes = ttl_minutes
-
-    def store(self, preview: ImportPreview) -> str:
-        """Store preview and return preview ID.
-
-        Args:
-            preview: Import preview to store
-
-        Returns:
-            Preview ID
-        """
-        self._cache[preview.preview_id] = preview
-        self._cleanup_expired()
-        return preview.preview_id
 
-    def get(self, preview_id: str) -> ImportPreview | None:
-        """Retrieve preview by ID.
+@dataclass
+class _ComponentIds:
+    """Catalog components resolved for one imported deal."""
 
-        Args:
-            preview_id: Preview ID
+    cpu_id: int | None = None
+    gpu_id: int | None = None
+    ram_spec_id: int | None = None
+    primary_storage_profile_id: int | None = None
+    secondary_storage_profile_id: int | None = None
+    ports_profile_id: int | None = None
 
-        Returns:
-            ImportPreview if found and not expired, None otherwise
-        """
-        preview = self._cache.get(preview_id)
-        if preview and preview.expires_at > datetime.utcnow():
-            return preview
-        return None
 
-    def remove(self, preview_id: str) -> None:
-        """Remove preview from cache.
+def _enum_value(value: Any) -> Any:
+    return getattr(value, "value", value)
 
-        Args:
-            preview_id: Preview ID
-        """
-        self._cache.pop(preview_id, None)
 
-    def _cleanup_expired(self) -> None:
-        """Remove expired previews from cache."""
-        now = datetime.utcnow()
-        expired = [pid for pid, p in self._cache.items() if p.expires_at <= now]
-        for pid in expired:
-            self._cache.pop(pid)
+def _ram_key(ram_data: RAMExport) -> tuple[Any, ...]:
+    """Dimensions an imported RAM spec is matched on."""
+    return (
+        ram_data.total_gb,
+        _enum_value(ram_data.ddr_generation),
+        ram_data.speed_mhz,
+        ram_data.module_count,
+        ram_data.capacity_per_module_gb,
+    )
 
 
-# Global preview cache instance
-_preview_cache = PreviewCache()
+def _storage_key(storage_data: StorageExport) -> tuple[Any, ...]:
+    """Dimensions an imported storage profile is matched on."""
+    return (
+        storage_data.capacity_gb,
+        _enum_value(storage_data.medium),
+        storage_data.interface,
+        storage_data.form_factor,
+    )
 
 
 # ==================== Export/Import Service ====================
@@ -473,11 +428,12 @@ class ExportImportService:
             data=portable_export,
             duplicates=duplicates,
             created_at=datetime.utcnow(),
-            expires_at=datetime.utcnow() + timedelta(minutes=30),
+            expires_at=datetime.utcnow()
+            + timedelta(minutes=get_settings().import_preview.ttl_minutes),
         )
 
         # 5. Store preview
-        preview_id = _preview_cache.store(preview)
+        preview_id = await _preview_store.store(preview)
 
         logger.info(
             f"Created import preview {preview_id} for listing '{portable_export.data.listing.title}' "
@@ -514,8 +470,14 @@ class ExportImportService:
             ...     merge_strategy="create_new"
             ... )
         """
-        # 1. Retrieve preview
-        preview = _preview_cache.get(preview_id)
+        # 1. Retrieve preview (a repeated confirm returns the listing already imported)
+        imported_id = await _preview_store.completed_entity(preview_id)
+        if imported_id is not None:
+            imported = await self.session.get(Listing, imported_id)
+            if imported is not None:
+                return imported
+
+        preview = await _preview_store.get(preview_id)
         if not preview:
             raise ValueError("Preview not found or expired")
 
@@ -524,12 +486,31 @@ class ExportImportService:
 
         # 2. Validate merge strategy
         if merge_strategy == "skip":
-            _preview_cache.remove(preview_id)
+            await _preview_store.remove(preview_id)
             raise ValueError("Import skipped by user")
 
         if merge_strategy == "update_existing" and not target_listing_id:
             raise ValueError("target_listing_id required for update_existing strategy")
 
+        if not await _preview_store.claim(preview_id):
+            raise ValueError("Import is already being confirmed")
+        try:
+            listing = await self._apply_listing_import(preview, merge_strategy, target_listing_id)
+        except Exception:
+            await _preview_store.release(preview_id)
+            raise
+
+        # 7. Record the result and clean up preview
+        await _preview_store.complete(preview_id, listing.id)
+
+        return listing
+
+    async def _apply_listing_import(
+        self,
+        preview: ImportPreview,
+        merge_strategy: Literal["create_new", "update_existing"],
+        target_listing_id: int | None,
+    ) -> Listing:
         # 3. Execute import
         portable_export: PortableDealExport = preview.data
         listing_data = portable_export.data.listing
@@ -563,22 +544,7 @@ class ExportImportService:
 
         else:  # create_new
             # Create new listing
-            listing = Listing(
-                title=listing_data.title,
-                listing_url=listing_data.listing_url,
-                seller=listing_data.seller,
-                price_usd=listing_data.price_usd,
-                price_date=listing_data.price_date,
-                condition=listing_data.condition.value,
-                status=listing_data.status.value,
-                device_model=listing_data.device_model,
-                notes=listing_data.notes,
-                attributes_json=listing_data.custom_fields,
-                other_urls=[
-                    {"url": link.url, "label": link.label}
-                    for link in listing_data.other_urls
-                ],
-            )
+            listing = Listing(**self._listing_values(listing_data))
 
             self.session.add(listing)
             await self.session.flush()
@@ -593,9 +559,7 @@ class ExportImportService:
 
         # 6. Refresh to get updated relationships
         await self.session.refresh(listing)
-
-        # 7. Clean up preview
-        _preview_cache.remove(preview_id)
+        record_listing(self.session, listing)
 
         return listing
 
@@ -608,264 +572,390 @@ class ExportImportService:
             listing: Listing entity to update
             deal_data: Deal data from export
         """
-        # Import CPU
-        if deal_data.performance and deal_data.performance.cpu:
-            cpu_data = deal_data.performance.cpu
-            cpu = await self._get_or_create_cpu(cpu_data)
-            listing.cpu_id = cpu.id
-
-        # Import GPU
-        if deal_data.performance and deal_data.performance.gpu:
-            gpu_data = deal_data.performance.gpu
-            gpu = await self._get_or_create_gpu(gpu_data)
-            listing.gpu_id = gpu.id
-
-        # Import RAM
-        if deal_data.performance and deal_data.performance.ram:
-            ram_data = deal_data.performance.ram
-            ram_spec = await self._get_or_create_ram_spec(ram_data)
-            listing.ram_spec_id = ram_spec.id
-            listing.ram_notes = ram_data.notes
-
-        # Import Storage
-        if deal_data.performance and deal_data.performance.storage_primary:
-            storage_data = deal_data.performance.storage_primary
-            storage_profile = await self._get_or_create_storage_profile(storage_data)
-            listing.primary_storage_profile_id = storage_profile.id
-
-        if deal_data.performance and deal_data.performance.storage_secondary:
-            storage_data = deal_data.performance.storage_secondary
-            storage_profile = await self._get_or_create_storage_profile(storage_data)
-            listing.secondary_storage_profile_id = storage_profile.id
-
-        # Import Ports
-        if deal_data.performance and deal_data.performance.ports:
-            ports_data = deal_data.performance.ports
-            ports_profile = await self._get_or_create_ports_profile(ports_data)
-            listing.ports_profile_id = ports_profile.id
+        # Import CPU, GPU, RAM, Storage and Ports, plus metadata, valuation and metrics
+        [component_ids] = await self._resolve_components([deal_data])
+        for field_name, value in self._deal_values(deal_data, component_ids).items():
+            setattr(listing, field_name, value)
 
         # Import Components (delete existing and recreate)
         if deal_data.performance and deal_data.performance.components:
-            # Delete existing components
             await self.session.execute(
-                select(ListingComponent)
-                .where(ListingComponent.listing_id == listing.id)
+                delete(ListingComponent).where(ListingComponent.listing_id == listing.id)
             )
-            # Create new components
-            for comp_data in deal_data.performance.components:
-                component = ListingComponent(
-                    listing_id=listing.id,
-                    component_type=comp_data.component_type.value,
-                    name=comp_data.name,
-                    quantity=comp_data.quantity,
-                    metadata_json=comp_data.metadata,
-                    adjustment_value_usd=comp_data.adjustment_value_usd,
-                )
-                self.session.add(component)
-
-        # Import Metadata
-        if deal_data.metadata:
-            listing.manufacturer = deal_data.metadata.manufacturer
-            listing.series = deal_data.metadata.series
-            listing.model_number = deal_data.metadata.model_number
-            listing.form_factor = deal_data.metadata.form_factor
-
-        # Import Valuation
-        if deal_data.valuation:
-            listing.adjusted_price_usd = deal_data.valuation.adjusted_price_usd
-            listing.valuation_breakdown = deal_data.valuation.valuation_breakdown
-
-        # Import Performance Metrics
-        if deal_data.performance and deal_data.performance.metrics:
-            metrics = deal_data.performance.metrics
-            listing.dollar_per_cpu_mark_single = metrics.dollar_per_cpu_mark_single
-            listing.dollar_per_cpu_mark_single_adjusted = (
-                metrics.dollar_per_cpu_mark_single_adjusted
+            self.session.add_all(
+                ListingComponent(**values)
+                for values in self._component_values(listing.id, deal_data)
             )
-            listing.dollar_per_cpu_mark_multi = metrics.dollar_per_cpu_mark_multi
-            listing.dollar_per_cpu_mark_multi_adjusted = (
-                metrics.dollar_per_cpu_mark_multi_adjusted
-            )
-            listing.score_cpu_multi = metrics.score_cpu_multi
-            listing.score_cpu_single = metrics.score_cpu_single
-            listing.score_gpu = metrics.score_gpu
-            listing.score_composite = metrics.score_composite
-            listing.perf_per_watt = metrics.perf_per_watt
 
         await self.session.flush()
 
-    async def _get_or_create_cpu(self, cpu_data: CPUExport) -> Cpu:
-        """Get existing CPU or create new one.
+    async def _bulk_import_collection_items(
+        self, collection: Collection, items: list[CollectionItemExport]
+    ) -> list[tuple[int, dict[str, Any]]]:
+        """Create listings and collection items for every exported item at once.
+
+        Components referenced anywhere in the payload are resolved with one
+        lookup per component type and missing ones are created in a single
+        flush; listings, their components and the collection items are then
+        written with one multi-row INSERT each.
 
         Args:
-            cpu_data: CPU export data
+            collection: Collection receiving the items
+            items: Exported collection items
 
         Returns:
-            CPU entity
+            (listing ID, inserted column values) pairs, in item order
         """
-        # Try to find existing CPU by name
-        stmt = select(Cpu).where(Cpu.name == cpu_data.name)
-        result = await self.session.execute(stmt)
-        cpu = result.scalar_one_or_none()
-
-        if not cpu:
-            # Create new CPU
-            cpu = Cpu(
-                name=cpu_data.name,
-                manufacturer=cpu_data.manufacturer,
-                cores=cpu_data.cores,
-                threads=cpu_data.threads,
-                tdp_w=cpu_data.tdp_w,
-                igpu_model=cpu_data.igpu_model,
-                cpu_mark_multi=cpu_data.cpu_mark_multi,
-                cpu_mark_single=cpu_data.cpu_mark_single,
-                igpu_mark=cpu_data.igpu_mark,
-                release_year=cpu_data.release_year,
+        if not items:
+            return []
+
+        deals = [item.listing for item in items]
+        component_ids = await self._resolve_components(deals)
+        rows = [
+            {**self._listing_values(deal_data.listing), **self._deal_values(deal_data, ids)}
+            for deal_data, ids in zip(deals, component_ids, strict=True)
+        ]
+        listing_ids = (
+            await self.session.scalars(
+                insert(Listing).returning(Listing.id, sort_by_parameter_order=True), rows
             )
-            self.session.add(cpu)
-            await self.session.flush()
-            logger.info(f"Created CPU '{cpu_data.name}'")
-
-        return cpu
+        ).all()
 
-    async def _get_or_create_gpu(self, gpu_data: GPUExport) -> Gpu:
-        """Get existing GPU or create new one.
+        components = [
+            component
+            for listing_id, deal_data in zip(listing_ids, deals, strict=True)
+            for component in self._component_values(listing_id, deal_data)
+        ]
+        if components:
+            await self.session.execute(insert(ListingComponent), components)
+        await self.session.execute(
+            insert(CollectionItem),
+            [
+                {
+                    "collection_id": collection.id,
+                    "listing_id": listing_id,
+                    "status": item_data.status.value,
+                    "notes": item_data.notes,
+                    "position": item_data.position,
+                    "added_at": item_data.added_at,
+                }
+                for listing_id, item_data in zip(listing_ids, items, strict=True)
+            ],
+        )
 
-        Args:
-            gpu_data: GPU export data
+        logger.info(f"Imported {len(listing_ids)} listings into collection {collection.id}")
+        return list(zip(listing_ids, rows, strict=True))
 
-        Returns:
-            GPU entity
-        """
-        # Try to find existing GPU by name
-        stmt = select(Gpu).where(Gpu.name == gpu_data.name)
-        result = await self.session.execute(stmt)
-        gpu = result.scalar_one_or_none()
-
-        if not gpu:
-            # Create new GPU
-            gpu = Gpu(
-                name=gpu_data.name,
-                manufacturer=gpu_data.manufacturer,
-                gpu_mark=gpu_data.gpu_mark,
-                metal_score=gpu_data.metal_score,
-            )
-            self.session.add(gpu)
-            await self.session.flush()
-            logger.info(f"Created GPU '{gpu_data.name}'")
+    @staticmethod
+    def _listing_values(listing_data: ListingExport) -> dict[str, Any]:
+        """Column values for a new listing from exported listing fields."""
+        return {
+            "title": listing_data.title,
+            "listing_url": listing_data.listing_url,
+            "seller": listing_data.seller,
+            "price_usd": listing_data.price_usd,
+            "price_date": listing_data.price_date,
+            "condition": listing_data.condition.value,
+            "status": listing_data.status.value,
+            "device_model": listing_data.device_model,
+            "notes": listing_data.notes,
+            "attributes_json": listing_data.custom_fields,
+            "other_urls": [
+                {"url": link.url, "label": link.label} for link in listing_data.other_urls
+            ],
+        }
 
-        return gpu
+    @staticmethod
+    def _deal_values(deal_data: DealDataExport, component_ids: _ComponentIds) -> dict[str, Any]:
+        """Column values from resolved components, metadata, valuation and metrics."""
+        values = {
+            field_name: value
+            for field_name, value in asdict(component_ids).items()
+            if value is not None
+        }
+        performance = deal_data.performance
+
+        if performance and performance.ram:
+            values["ram_notes"] = performance.ram.notes
 
-    async def _get_or_create_ram_spec(self, ram_data: RAMExport) -> RamSpec:
-        """Get existing RAM spec or create new one.
+        # Import Metadata
+        if deal_data.metadata:
+            values["manufacturer"] = deal_data.metadata.manufacturer
+            values["series"] = deal_data.metadata.series
+            values["model_number"] = deal_data.metadata.model_number
+            values["form_factor"] = deal_data.metadata.form_factor
 
-        Args:
-            ram_data: RAM export data
+        # Import Valuation
+        if deal_data.valuation:
+            values["adjusted_price_usd"] = deal_data.valuation.adjusted_price_usd
+            values["valuation_breakdown"] = deal_data.valuation.valuation_breakdown
 
-        Returns:
-            RamSpec entity
-        """
-        # Try to find existing RAM spec by dimensions
-        stmt = select(RamSpec).where(
-            RamSpec.total_capacity_gb == ram_data.total_gb,
-            RamSpec.ddr_generation == (ram_data.ddr_generation.value if ram_data.ddr_generation else None),
-            RamSpec.speed_mhz == ram_data.speed_mhz,
-            RamSpec.module_count == ram_data.module_count,
-            RamSpec.capacity_per_module_gb == ram_data.capacity_per_module_gb,
-        )
-        result = await self.session.execute(stmt)
-        ram_spec = result.scalar_one_or_none()
-
-        if not ram_spec:
-            # Create new RAM spec
-            ram_spec = RamSpec(
-                total_capacity_gb=ram_data.total_gb,
-                ddr_generation=ram_data.ddr_generation.value if ram_data.ddr_generation else None,
-                speed_mhz=ram_data.speed_mhz,
-                module_count=ram_data.module_count,
-                capacity_per_module_gb=ram_data.capacity_per_module_gb,
+        # Import Performance Metrics
+        if performance and performance.metrics:
+            values.update(
+                performance.metrics.model_dump(
+                    include={
+                        "dollar_per_cpu_mark_single",
+                        "dollar_per_cpu_mark_single_adjusted",
+                        "dollar_per_cpu_mark_multi",
+                        "dollar_per_cpu_mark_multi_adjusted",
+                        "score_cpu_multi",
+                        "score_cpu_single",
+                        "score_gpu",
+                        "score_composite",
+                        "perf_per_watt",
+                    }
+                )
             )
-            self.session.add(ram_spec)
-            await self.session.flush()
-            logger.info(f"Created RAM spec {ram_data.total_gb}GB")
+        return values
 
-        return ram_spec
+    @staticmethod
+    def _component_values(listing_id: int, deal_data: DealDataExport) -> list[dict[str, Any]]:
+        """Column values for the listing's exported components."""
+        if not (deal_data.performance and deal_data.performance.components):
+            return []
+        return [
+            {
+                "listing_id": listing_id,
+                "component_type": comp_data.component_type.value,
+                "name": comp_data.name,
+                "quantity": comp_data.quantity,
+                "metadata_json": comp_data.metadata,
+                "adjustment_value_usd": comp_data.adjustment_value_usd,
+            }
+            for comp_data in deal_data.performance.components
+        ]
+
+    # ==================== Component Resolution ====================
+
+    async def _resolve_components(self, deals: Sequence[DealDataExport]) -> list[_ComponentIds]:
+        """Find or create the catalog components referenced by a set of deals.
 
-    async def _get_or_create_storage_profile(
-        self, storage_data: StorageExport
-    ) -> StorageProfile:
-        """Get existing storage profile or create new one.
+        Each component type is looked up with one query for the whole set;
+        missing components are added together and created with a single flush.
 
         Args:
-            storage_data: Storage export data
+            deals: Exported deals
 
         Returns:
-            StorageProfile entity
+            Component IDs for each deal, in input order
         """
-        # Try to find existing storage profile by dimensions
-        stmt = select(StorageProfile).where(
-            StorageProfile.capacity_gb == storage_data.capacity_gb,
-            StorageProfile.medium == (storage_data.medium.value if storage_data.medium else None),
-            StorageProfile.interface == storage_data.interface,
-            StorageProfile.form_factor == storage_data.form_factor,
-        )
-        result = await self.session.execute(stmt)
-        storage_profile = result.scalar_one_or_none()
-
-        if not storage_profile:
-            # Create new storage profile
-            storage_profile = StorageProfile(
-                capacity_gb=storage_data.capacity_gb,
-                medium=storage_data.medium.value if storage_data.medium else None,
-                interface=storage_data.interface,
-                form_factor=storage_data.form_factor,
-                performance_tier=storage_data.performance_tier,
-            )
-            self.session.add(storage_profile)
+        performances = [deal.performance for deal in deals]
+
+        cpu_exports = {p.cpu.name: p.cpu for p in performances if p and p.cpu}
+        gpu_exports = {p.gpu.name: p.gpu for p in performances if p and p.gpu}
+        ram_exports = {_ram_key(p.ram): p.ram for p in performances if p and p.ram}
+        storage_exports = {
+            _storage_key(storage): storage
+            for p in performances
+            if p
+            for storage in (p.storage_primary, p.storage_secondary)
+            if storage
+        }
+        ports_exports = {
+            p.ports.profile_name: p.ports
+            for p in performances
+            if p and p.ports and p.ports.profile_name
+        }
+
+        cpus = await self._find_by_name(Cpu, cpu_exports)
+        gpus = await self._find_by_name(Gpu, gpu_exports)
+        ports_profiles = await self._find_by_name(PortsProfile, ports_exports)
+        ram_specs = await self._find_ram_specs(ram_exports)
+        storage_profiles = await self._find_storage_profiles(storage_exports)
+
+        created: dict[str, dict[Any, Any]] = {
+            "cpu": {
+                name: self._new_cpu(data) for name, data in cpu_exports.items() if name not in cpus
+            },
+            "gpu": {
+                name: self._new_gpu(data) for name, data in gpu_exports.items() if name not in gpus
+            },
+            "ram": {
+                key: self._new_ram_spec(data)
+                for key, data in ram_exports.items()
+                if key not in ram_specs
+            },
+            "storage": {
+                key: self._new_storage_profile(data)
+                for key, data in storage_exports.items()
+                if key not in storage_profiles
+            },
+            "ports": {
+                name: self._new_ports_profile(name, data)
+                for name, data in ports_exports.items()
+                if name not in ports_profiles
+            },
+        }
+        # Unnamed port layouts always get a fresh profile of their own
+        unnamed_ports = {
+            index: self._new_ports_profile(f"Imported_{uuid.uuid4().hex[:8]}", p.ports)
+            for index, p in enumerate(performances)
+            if p and p.ports and not p.ports.profile_name
+        }
+
+        new_entities = [entity for group in created.values() for entity in group.values()]
+        new_entities.extend(unnamed_ports.values())
+        if new_entities:
+            self.session.add_all(new_entities)
             await self.session.flush()
-            logger.info(f"Created storage profile {storage_data.capacity_gb}GB")
-
-        return storage_profile
-
-    async def _get_or_create_ports_profile(
-        self, ports_data: PortsExport
-    ) -> PortsProfile:
-        """Get existing ports profile or create new one.
+            for kind, group in created.items():
+                for key, entity in group.items():
+                    logger.info(f"Created {kind} '{getattr(entity, 'name', key)}' from import")
+
+        cpus.update({name: cpu.id for name, cpu in created["cpu"].items()})
+        gpus.update({name: gpu.id for name, gpu in created["gpu"].items()})
+        ram_specs.update({key: spec.id for key, spec in created["ram"].items()})
+        storage_profiles.update({key: profile.id for key, profile in created["storage"].items()})
+        ports_profiles.update({name: profile.id for name, profile in created["ports"].items()})
+
+        resolved = []
+        for index, performance in enumerate(performances):
+            ids = _ComponentIds()
+            if performance:
+                if performance.cpu:
+                    ids.cpu_id = cpus[performance.cpu.name]
+                if performance.gpu:
+                    ids.gpu_id = gpus[performance.gpu.name]
+                if performance.ram:
+                    ids.ram_spec_id = ram_specs[_ram_key(performance.ram)]
+                if performance.storage_primary:
+                    ids.primary_storage_profile_id = storage_profiles[
+                        _storage_key(performance.storage_primary)
+                    ]
+                if performance.storage_secondary:
+                    ids.secondary_storage_profile_id = storage_profiles[
+                        _storage_key(performance.storage_secondary)
+                    ]
+                if performance.ports:
+                    ids.ports_profile_id = (
+                        unnamed_ports[index].id
+                        if index in unnamed_ports
+                        else ports_profiles[performance.ports.profile_name]
+                    )
+            resolved.append(ids)
+        return resolved
+
+    async def _find_by_name(
+        self, model: type[Cpu] | type[Gpu] | type[PortsProfile], exports: dict[str, Any]
+    ) -> dict[str, int]:
+        """Map names to IDs of existing rows (oldest row wins on duplicates)."""
+        if not exports:
+            return {}
+        stmt = select(model.id, model.name).where(model.name.in_(list(exports))).order_by(model.id)
+        found: dict[str, int] = {}
+        for row_id, name in (await self.session.execute(stmt)).all():
+            found.setdefault(name, row_id)
+        return found
+
+    async def _find_ram_specs(
+        self, exports: dict[tuple[Any, ...], RAMExport]
+    ) -> dict[tuple[Any, ...], int]:
+        """Map RAM dimension keys to IDs of existing specs."""
+        if not exports:
+            return {}
+        totals = {key[0] for key in exports}
+        stmt = select(
+            RamSpec.id,
+            RamSpec.total_capacity_gb,
+            RamSpec.ddr_generation,
+            RamSpec.speed_mhz,
+            RamSpec.module_count,
+            RamSpec.capacity_per_module_gb,
+        ).order_by(RamSpec.id)
+        if None not in totals:
+            stmt = stmt.where(RamSpec.total_capacity_gb.in_(totals))
+        found: dict[tuple[Any, ...], int] = {}
+        for row_id, total, generation, speed, modules, per_module in (
+            await self.session.execute(stmt)
+        ).all():
+            key = (total, _enum_value(generation), speed, modules, per_module)
+            if key in exports:
+                found.setdefault(key, row_id)
+        return found
+
+    async def _find_storage_profiles(
+        self, exports: dict[tuple[Any, ...], StorageExport]
+    ) -> dict[tuple[Any, ...], int]:
+        """Map storage dimension keys to IDs of existing profiles."""
+        if not exports:
+            return {}
+        capacities = {key[0] for key in exports}
+        stmt = select(
+            StorageProfile.id,
+            StorageProfile.capacity_gb,
+            StorageProfile.medium,
+            StorageProfile.interface,
+            StorageProfile.form_factor,
+        ).order_by(StorageProfile.id)
+        if None not in capacities:
+            stmt = stmt.where(StorageProfile.capacity_gb.in_(capacities))
+        found: dict[tuple[Any, ...], int] = {}
+        for row_id, capacity, medium, interface, form_factor in (
+            await self.session.execute(stmt)
+        ).all():
+            key = (capacity, _enum_value(medium), interface, form_factor)
+            if key in exports:
+                found.setdefault(key, row_id)
+        return found
 
-        Args:
-            ports_data: Ports export data
+    @staticmethod
+    def _new_cpu(cpu_data: CPUExport) -> Cpu:
+        return Cpu(
+            name=cpu_data.name,
+            manufacturer=cpu_data.manufacturer,
+            cores=cpu_data.cores,
+            threads=cpu_data.threads,
+            tdp_w=cpu_data.tdp_w,
+            igpu_model=cpu_data.igpu_model,
+            cpu_mark_multi=cpu_data.cpu_mark_multi,
+            cpu_mark_single=cpu_data.cpu_mark_single,
+            igpu_mark=cpu_data.igpu_mark,
+            release_year=cpu_data.release_year,
+        )
 
-        Returns:
-            PortsProfile entity
-        """
-        # For ports, we'll create a new profile with a unique name if profile_name exists
-        profile_name = ports_data.profile_name or f"Imported_{uuid.uuid4().hex[:8]}"
+    @staticmethod
+    def _new_gpu(gpu_data: GPUExport) -> Gpu:
+        return Gpu(
+            name=gpu_data.name,
+            manufacturer=gpu_data.manufacturer,
+            gpu_mark=gpu_data.gpu_mark,
+            metal_score=gpu_data.metal_score,
+        )
 
-        # Try to find existing ports profile by name
-        stmt = select(PortsProfile).where(PortsProfile.name == profile_name)
-        result = await self.session.execute(stmt)
-        ports_profile = result.scalar_one_or_none()
+    @staticmethod
+    def _new_ram_spec(ram_data: RAMExport) -> RamSpec:
+        return RamSpec(
+            total_capacity_gb=ram_data.total_gb,
+            ddr_generation=ram_data.ddr_generation.value if ram_data.ddr_generation else None,
+            speed_mhz=ram_data.speed_mhz,
+            module_count=ram_data.module_count,
+            capacity_per_module_gb=ram_data.capacity_per_module_gb,
+        )
 
-        if not ports_profile:
-            # Create new ports profile
-            ports_profile = PortsProfile(name=profile_name)
-            self.session.add(ports_profile)
-            await self.session.flush()
+    @staticmethod
+    def _new_storage_profile(storage_data: StorageExport) -> StorageProfile:
+        return StorageProfile(
+            capacity_gb=storage_data.capacity_gb,
+            medium=storage_data.medium.value if storage_data.medium else None,
+            interface=storage_data.interface,
+            form_factor=storage_data.form_factor,
+            performance_tier=storage_data.performance_tier,
+        )
 
-            # Create ports
-            for port_data in ports_data.ports:
-                port = Port(
-                    ports_profile_id=ports_profile.id,
+    @staticmethod
+    def _new_ports_profile(name: str, ports_data: PortsExport) -> PortsProfile:
+        return PortsProfile(
+            name=name,
+            ports=[
+                Port(
                     type=port_data.type.value,
                     count=port_data.count,
                     spec_notes=port_data.spec_notes,
                 )
-                self.session.add(port)
-
-            await self.session.flush()
-            logger.info(f"Created ports profile '{profile_name}'")
-
-        return ports_profile
+                for port_data in ports_data.ports
+            ],
+        )
 
     # ==================== Collection Export ====================
 
@@ -1006,11 +1096,12 @@ class ExportImportService:
             data=portable_export,
             duplicates=duplicates,
             created_at=datetime.utcnow(),
-            expires_at=datetime.utcnow() + timedelta(minutes=30),
+            expires_at=datetime.utcnow()
+            + timedelta(minutes=get_settings().import_preview.ttl_minutes),
         )
 
         # 5. Store preview
-        preview_id = _preview_cache.store(preview)
+        preview_id = await _preview_store.store(preview)
 
         logger.info(
             f"Created import preview {preview_id} for collection '{portable_export.data.collection.name}' "
@@ -1050,8 +1141,14 @@ class ExportImportService:
             ...     user_id=1
             ... )
         """
-        # 1. Retrieve preview
-        preview = _preview_cache.get(preview_id)
+        # 1. Retrieve preview (a repeated confirm returns the collection already imported)
+        imported_id = await _preview_store.completed_entity(preview_id)
+        if imported_id is not None:
+            imported = await self.session.get(Collection, imported_id)
+            if imported is not None:
+                return imported
+
+        preview = await _preview_store.get(preview_id)
         if not preview:
             raise ValueError("Preview not found or expired")
 
@@ -1060,7 +1157,7 @@ class ExportImportService:
 
         # 2. Validate merge strategy
         if merge_strategy == "skip":
-            _preview_cache.remove(preview_id)
+            await _preview_store.remove(preview_id)
             raise ValueError("Import skipped by user")
 
         if merge_strategy == "merge_items" and not target_collection_id:
@@ -1071,6 +1168,28 @@ class ExportImportService:
         if merge_strategy == "create_new" and not user_id:
             raise ValueError("user_id required for create_new strategy")
 
+        if not await _preview_store.claim(preview_id):
+            raise ValueError("Import is already being confirmed")
+        try:
+            collection = await self._apply_collection_import(
+                preview, merge_strategy, target_collection_id, user_id
+            )
+        except Exception:
+            await _preview_store.release(preview_id)
+            raise
+
+        # 7. Record the result and clean up preview
+        await _preview_store.complete(preview_id, collection.id)
+
+        return collection
+
+    async def _apply_collection_import(
+        self,
+        preview: ImportPreview,
+        merge_strategy: Literal["create_new", "merge_items"],
+        target_collection_id: int | None,
+        user_id: int | None,
+    ) -> Collection:
         # 3. Execute import
         portable_export: PortableCollectionExport = preview.data
         collection_data = portable_export.data.collection
@@ -1106,44 +1225,18 @@ class ExportImportService:
                 f"Created new collection {collection.id} '{collection_data.name}'"
             )
 
-        # 4. Import collection items
-        for item_data in portable_export.data.items:
-            # Import the listing first
-            listing_preview_id = await self.import_listing_from_json(
-                {
-                    "deal_brain_export": {
-                        "version": "1.0.0",
-                        "exported_at": datetime.utcnow().isoformat(),
-                        "type": "deal",
-                    },
-                    "data": item_data.listing.model_dump(),
-                }
-            )
-
-            # Confirm import with create_new strategy
-            listing = await self.confirm_import_listing(
-                listing_preview_id, merge_strategy="create_new"
-            )
-
-            # Create collection item
-            collection_item = CollectionItem(
-                collection_id=collection.id,
-                listing_id=listing.id,
-                status=item_data.status.value,
-                notes=item_data.notes,
-                position=item_data.position,
-                added_at=item_data.added_at,
-            )
-            self.session.add(collection_item)
+        # 4. Import collection items (listings, components and items in bulk)
+        imported = await self._bulk_import_collection_items(collection, portable_export.data.items)
 
         # 5. Commit transaction
         await self.session.commit()
 
         # 6. Refresh to get updated relationships
         await self.session.refresh(collection)
-
-        # 7. Clean up preview
-        _preview_cache.remove(preview_id)
+        for listing_id, row in imported:
+            record_listing_values(
+                self.session, listing_id, row["title"], row["price_usd"], row.get("cpu_id")
+            )
 
         return collection
 
@@ -1234,8 +1327,10 @@ class ExportImportService:
 
         Matches on:
         1. Exact title + seller match (score: 1.0)
-        2. Title similarity + price similarity (score: 0.8-0.95)
-        3. URL match (score: 1.0)
+        2. URL match (score: 1.0)
+        3. Title similarity + price similarity (score > 0.7), using the
+           near-duplicate index so all listings are considered, not just
+           recent ones
 
         Args:
             listing_data: Listing export data
@@ -1296,44 +1391,37 @@ class ExportImportService:
                     )
                 )
 
-        # 3. Fuzzy title + price similarity
-        # Normalize title for comparison
-        normalized_title = self._normalize_text(listing_data.title)
-
-        # Get all listings for fuzzy comparison (limit to recent 100 for performance)
-        stmt = select(Listing).order_by(Listing.created_at.desc()).limit(100)
-        result = await self.session.execute(stmt)
-        all_listings = result.scalars().all()
-
-        for listing in all_listings:
-            # Skip if already matched
-            if any(d.entity_id == listing.id for d in duplicates):
-                continue
+        # 3. Fuzzy title + price similarity over the near-duplicate index
+        index = await get_near_duplicate_index(self.session)
+        near_duplicates = index.query(
+            listing_data.title,
+            listing_data.price_usd,
+            exclude=[d.entity_id for d in duplicates],
+        )
 
-            # Calculate title similarity
-            normalized_existing = self._normalize_text(listing.title)
-            title_similarity = self._text_similarity(
-                normalized_title, normalized_existing
+        if near_duplicates:
+            stmt = select(Listing).where(
+                Listing.id.in_([match.listing_id for match in near_duplicates])
             )
+            result = await self.session.execute(stmt)
+            listings_by_id = {listing.id: listing for listing in result.scalars().all()}
 
-            # Calculate price similarity (if both have prices)
-            price_similarity = 0.0
-            if listing_data.price_usd and listing.price_usd:
-                price_diff = abs(listing_data.price_usd - listing.price_usd)
-                max_price = max(listing_data.price_usd, listing.price_usd)
-                price_similarity = 1.0 - (price_diff / max_price)
-
-            # Combined score (weighted: 70% title, 30% price)
-            combined_score = (title_similarity * 0.7) + (price_similarity * 0.3)
+            for match in near_duplicates:
+                listing = listings_by_id.get(match.listing_id)
+                if listing is None:
+                    # Deleted since it was indexed
+                    index.remove(match.listing_id)
+                    continue
 
-            # Only consider if score > 0.7
-            if combined_score > 0.7:
                 duplicates.append(
                     DuplicateMatch(
                         entity_id=listing.id,
                         entity_type="listing",
-                        match_score=combined_score,
-                        match_reason=f"Similar title ({title_similarity:.0%}) and price ({price_similarity:.0%})",
+                        match_score=match.score,
+                        match_reason=(
+                            f"Similar title ({match.title_similarity:.0%}) "
+                            f"and price ({match.price_similarity:.0%})"
+                        ),
                         entity_data={
                             "id": listing.id,
                             "title": listing.title,
@@ -1463,4 +1551,6 @@ __all__ = [
     "ImportPreview",
     "DuplicateMatch",
     "PreviewCache",
+    "PreviewRows",
+    "PreviewStore",
 ]
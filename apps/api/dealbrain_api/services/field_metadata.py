@@ -7,7 +7,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from dealbrain_core.enums import RamGeneration, StorageMedium
 
-from .field_registry import FieldRegistry
+from .field_registry import FieldRegistry, get_field_registry
 
 
 @dataclass
@@ -60,7 +60,7 @@ class FieldMetadataService:
     ]
 
     def __init__(self, field_registry: FieldRegistry | None = None):
-        self.field_registry = field_registry or FieldRegistry()
+        self.field_registry = field_registry or get_field_registry()
 
     async def get_entities_metadata(self, db: AsyncSession) -> list[EntityMetadata]:
         """Fetch all entities with their fields."""
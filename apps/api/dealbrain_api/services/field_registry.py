@@ -2,27 +2,30 @@
 
 from __future__ import annotations
 
+import time
+import weakref
 from dataclasses import asdict, dataclass, field
+from datetime import datetime, timedelta
+from functools import cache
+from operator import attrgetter
 from typing import Any, Mapping, Sequence
 
-from dealbrain_core.schemas import (
-    CpuRead,
-    GpuRead,
-    ListingRead,
-    PortsProfileRead,
-    ProfileRead,
-    RamSpecRead,
-    StorageProfileRead,
-)
-from sqlalchemy import func, select
+from sqlalchemy import and_, func, or_, select
 from sqlalchemy import inspect as sa_inspect
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import joinedload
+from sqlalchemy.orm import joinedload, raiseload
 from sqlalchemy.sql import sqltypes
 
+from ..cache import cache_manager
 from ..models import Cpu, Gpu, Listing, PortsProfile, Profile, RamSpec, StorageProfile
-from .custom_fields import CustomFieldService
+from .custom_fields import CustomFieldService, definition_versions
 from .listings import apply_listing_metrics, create_listing, partial_update_listing
+from .listings.pagination import decode_cursor, encode_cursor
+
+# Cached record totals per entity; reset when records are created here
+RECORD_COUNT_TTL = timedelta(minutes=5)
+# Upper bound on how long a schema can miss custom field changes made by other processes
+SCHEMA_CACHE_TTL = timedelta(minutes=1)
 
 
 @dataclass(slots=True)
@@ -53,89 +56,329 @@ class RecordPayload:
     attributes: dict[str, Any]
 
 
-class FieldRegistry:
-    """Central registry for catalog entities and their field metadata."""
+class InvalidCursorError(ValueError):
+    """Raised when a records cursor cannot be decoded."""
 
-    def __init__(self, *, custom_field_service: CustomFieldService | None = None) -> None:
-        self.custom_fields = custom_field_service or CustomFieldService()
-        self.entities: dict[str, EntityMeta] = {
-            "listing": EntityMeta(
-                entity="listing",
-                label="Listings",
-                core_fields=self._listing_core_fields(),
-            ),
-            "cpu": EntityMeta(
-                entity="cpu",
-                label="CPUs",
-                supports_custom_fields=True,
-                core_fields=self._cpu_core_fields(),
-            ),
-            "gpu": EntityMeta(
-                entity="gpu",
-                label="GPUs",
-                supports_custom_fields=True,
-                core_fields=self._gpu_core_fields(),
+
+@dataclass(frozen=True, slots=True)
+class RecordSource:
+    """How one entity's records are queried and ordered for the data grid.
+
+    Records are ordered by ``sort_key`` then ``id`` (both in the same
+    direction), which makes (sort value, id) a unique keyset cursor.
+    """
+
+    model: Any
+    sort_key: str
+    descending: bool = False
+    # Relationships the serializer reads; everything else is never loaded
+    relationships: tuple[str, ...] = ()
+
+    def statement(self) -> Any:
+        options = [
+            joinedload(getattr(self.model, name)).raiseload("*") for name in self.relationships
+        ]
+        columns = (getattr(self.model, self.sort_key), self.model.id)
+        if self.sort_key == "id":
+            columns = columns[1:]
+        order_by = [column.desc() if self.descending else column.asc() for column in columns]
+        return select(self.model).options(*options, raiseload("*")).order_by(*order_by)
+
+    def after(self, cursor: str) -> Any:
+        """WHERE clause selecting the records after ``cursor``."""
+        try:
+            record_id, raw_value = decode_cursor(cursor)
+            record_id = int(record_id)
+        except (TypeError, ValueError) as exc:
+            raise InvalidCursorError(f"Invalid cursor: {cursor}") from exc
+
+        id_column = self.model.id
+        if self.sort_key == "id" or raw_value is None:
+            return id_column < record_id if self.descending else id_column > record_id
+
+        sort_column = getattr(self.model, self.sort_key)
+        python_type = sort_column.type.python_type
+        try:
+            value = (
+                datetime.fromisoformat(raw_value)
+                if python_type is datetime
+                else python_type(raw_value)
+            )
+        except ValueError as exc:
+            raise InvalidCursorError(f"Invalid cursor: {cursor}") from exc
+        if self.descending:
+            return or_(sort_column < value, and_(sort_column == value, id_column < record_id))
+        return or_(sort_column > value, and_(sort_column == value, id_column > record_id))
+
+    def cursor_for(self, record: Any) -> str:
+        value = getattr(record, self.sort_key)
+        if isinstance(value, datetime):
+            value = value.isoformat()
+        return encode_cursor(record.id, value)
+
+
+RECORD_SOURCES: dict[str, RecordSource] = {
+    "listing": RecordSource(Listing, "created_at", descending=True, relationships=("ram_spec",)),
+    "cpu": RecordSource(Cpu, "name"),
+    "gpu": RecordSource(Gpu, "name"),
+    "ram_spec": RecordSource(RamSpec, "id", descending=True),
+    "storage_profile": RecordSource(StorageProfile, "id", descending=True),
+    "ports_profile": RecordSource(PortsProfile, "name"),
+    "profile": RecordSource(Profile, "name"),
+}
+
+
+class RecordSerializer:
+    """Serialize records of one entity into the grid's ``{id, fields, attributes}`` shape.
+
+    Reads the core field keys straight off the model; the keys are fixed when
+    the registry is built, so no per-row schema validation or introspection.
+    """
+
+    def __init__(self, keys: Sequence[str], *, attributes_key: str | None = "attributes_json"):
+        self.keys = tuple(keys)
+        self.attributes_key = attributes_key
+        self._values = attrgetter(*self.keys) if len(self.keys) > 1 else None
+
+    def __call__(self, record: Any) -> dict[str, Any]:
+        if self._values is not None:
+            fields = dict(zip(self.keys, self._values(record), strict=True))
+        else:
+            fields = {key: getattr(record, key) for key in self.keys}
+        attributes = getattr(record, self.attributes_key) if self.attributes_key else None
+        return {"id": record.id, "fields": fields, "attributes": dict(attributes or {})}
+
+
+_NUMERIC_TYPES = (
+    sqltypes.Integer,
+    sqltypes.Numeric,
+    sqltypes.Float,
+    sqltypes.BigInteger,
+    sqltypes.SmallInteger,
+)
+_TEXT_TYPES = (sqltypes.Text, sqltypes.UnicodeText)
+_SKIP_COLUMNS = frozenset({"id", "created_at", "updated_at", "attributes_json"})
+
+
+def _infer_type(column_type: sqltypes.TypeEngine) -> str:
+    if isinstance(column_type, _NUMERIC_TYPES):
+        return "number"
+    if isinstance(column_type, sqltypes.Boolean):
+        return "boolean"
+    if isinstance(column_type, _TEXT_TYPES):
+        return "text"
+    if isinstance(column_type, sqltypes.JSON):
+        return "json"
+    return "string"
+
+
+def _column_fields(
+    model: Any,
+    label_overrides: Mapping[str, str] | None = None,
+    *,
+    acronyms: Sequence[str] = (),
+) -> list[FieldMeta]:
+    """Core fields for every mapped column of ``model`` except ids, timestamps and attributes."""
+    overrides = label_overrides or {}
+    fields: list[FieldMeta] = []
+    for column in sa_inspect(model).columns:
+        key = column.key
+        if key in _SKIP_COLUMNS:
+            continue
+        label = overrides.get(key)
+        if label is None:
+            label = key.replace("_", " ").title()
+            for acronym in acronyms:
+                label = label.replace(acronym.title(), acronym)
+        fields.append(
+            FieldMeta(
+                key=key,
+                label=label,
+                data_type=_infer_type(column.type),
+                required=not column.nullable,
+                origin="core",
+                locked=True,
+            )
+        )
+    return fields
+
+
+def _listing_core_fields() -> list[FieldMeta]:
+    from ..api.listings.schema import CORE_LISTING_FIELDS
+
+    return [
+        FieldMeta(
+            key=field_schema.key,
+            label=field_schema.label,
+            data_type=field_schema.data_type,
+            required=getattr(field_schema, "required", False),
+            description=field_schema.description,
+            origin="core",
+            editable=getattr(field_schema, "editable", True),
+            locked=True,
+            options=field_schema.options,
+        )
+        for field_schema in CORE_LISTING_FIELDS
+    ]
+
+
+@cache
+def _core_entities() -> dict[str, EntityMeta]:
+    """Entity metadata built from the models; done once per process.
+
+    Built lazily rather than at import: the listing fields live in
+    ``api.listings.schema``, whose package imports back into the services.
+    """
+    return {
+        "listing": EntityMeta(
+            entity="listing",
+            label="Listings",
+            core_fields=_listing_core_fields(),
+        ),
+        "cpu": EntityMeta(
+            entity="cpu",
+            label="CPUs",
+            supports_custom_fields=True,
+            core_fields=_column_fields(
+                Cpu,
+                {
+                    "igpu_model": "iGPU Model",
+                    "igpu_mark": "iGPU Mark",
+                    "cpu_mark_multi": "CPU Mark (Multi)",
+                    "cpu_mark_single": "CPU Mark (Single)",
+                    "tdp_w": "TDP (W)",
+                    "passmark_slug": "PassMark Slug",
+                    "passmark_category": "PassMark Category",
+                    "passmark_id": "PassMark ID",
+                },
+                acronyms=("CPU",),
             ),
-            "ram_spec": EntityMeta(
-                entity="ram_spec",
-                label="RAM Specs",
-                supports_custom_fields=True,
-                core_fields=self._ram_spec_core_fields(),
+        ),
+        "gpu": EntityMeta(
+            entity="gpu",
+            label="GPUs",
+            supports_custom_fields=True,
+            core_fields=_column_fields(
+                Gpu,
+                {"gpu_mark": "GPU Mark", "metal_score": "Metal Score"},
+                acronyms=("GPU",),
             ),
-            "storage_profile": EntityMeta(
-                entity="storage_profile",
-                label="Storage Profiles",
-                supports_custom_fields=True,
-                core_fields=self._storage_profile_core_fields(),
+        ),
+        "ram_spec": EntityMeta(
+            entity="ram_spec",
+            label="RAM Specs",
+            supports_custom_fields=True,
+            core_fields=_column_fields(
+                RamSpec,
+                {
+                    "ddr_generation": "DDR Generation",
+                    "speed_mhz": "Speed (MHz)",
+                    "module_count": "Module Count",
+                    "capacity_per_module_gb": "Capacity per Module (GB)",
+                    "total_capacity_gb": "Total Capacity (GB)",
+                },
             ),
-            "ports_profile": EntityMeta(
-                entity="ports_profile",
-                label="Ports Profiles",
-                supports_custom_fields=True,
-                core_fields=self._ports_profile_core_fields(),
+        ),
+        "storage_profile": EntityMeta(
+            entity="storage_profile",
+            label="Storage Profiles",
+            supports_custom_fields=True,
+            core_fields=_column_fields(
+                StorageProfile,
+                {
+                    "capacity_gb": "Capacity (GB)",
+                    "performance_tier": "Performance Tier",
+                    "form_factor": "Form Factor",
+                },
             ),
-            "profile": EntityMeta(
-                entity="profile",
-                label="Scoring Profiles",
-                supports_custom_fields=False,
-                core_fields=self._profile_core_fields(),
+        ),
+        "ports_profile": EntityMeta(
+            entity="ports_profile",
+            label="Ports Profiles",
+            supports_custom_fields=True,
+            core_fields=_column_fields(PortsProfile),
+        ),
+        "profile": EntityMeta(
+            entity="profile",
+            label="Scoring Profiles",
+            supports_custom_fields=False,
+            core_fields=_column_fields(
+                Profile,
+                {
+                    "weights_json": "Metric Weights",
+                    "rule_group_weights": "Rule Group Weights",
+                    "is_default": "Default Profile",
+                },
             ),
+        ),
+    }
+
+
+@dataclass(slots=True)
+class _SchemaEntry:
+    version: int
+    loaded_at: float
+    schema: dict[str, Any]
+
+
+class FieldRegistry:
+    """Central registry for catalog entities and their field metadata."""
+
+    def __init__(self, *, custom_field_service: CustomFieldService | None = None) -> None:
+        self.custom_fields = custom_field_service or CustomFieldService()
+        self.entities: dict[str, EntityMeta] = _core_entities()
+        # Schema dicts are shared between callers and must be treated as read-only
+        self._core_schemas: dict[str, dict[str, Any]] = {
+            entity: {
+                "entity": entity,
+                "label": meta.label,
+                "primary_key": meta.primary_key,
+                "fields": [asdict(field) for field in meta.core_fields],
+            }
+            for entity, meta in self.entities.items()
+        }
+        self._schemas: weakref.WeakKeyDictionary[Any, dict[str, _SchemaEntry]] = (
+            weakref.WeakKeyDictionary()
+        )
+        self._serializers: dict[str, RecordSerializer] = {
+            entity: RecordSerializer(
+                [field.key for field in meta.core_fields],
+                attributes_key="attributes_json" if meta.supports_custom_fields else None,
+            )
+            for entity, meta in self.entities.items()
         }
 
     def get_entities(self) -> list[EntityMeta]:
         return list(self.entities.values())
 
     async def schema_for(self, db: AsyncSession, entity: str) -> dict[str, Any]:
+        """Core and custom field schema for ``entity``.
+
+        Core fields are fixed per process. The merged schema is cached per
+        database until ``CustomFieldService`` changes the entity's definitions
+        (tracked by ``definition_versions``) or ``SCHEMA_CACHE_TTL`` passes,
+        which bounds staleness from changes made by other processes.
+        """
         meta = self._require_entity(entity)
-        custom: list[dict[str, Any]] = []
-        if meta.supports_custom_fields:
-            records = await self.custom_fields.list_fields(
-                db, entity=entity, include_inactive=True, include_deleted=False
-            )
-            core_keys = {f.key for f in meta.core_fields}
-            custom = [
-                {
-                    "id": record.id,
-                    "key": record.key,
-                    "label": record.label,
-                    "data_type": record.data_type,
-                    "required": record.required,
-                    "locked": record.is_locked,
-                    "editable": not record.is_locked,
-                    "origin": "custom",
-                    "description": record.description,
-                    "options": record.options,
-                    "is_active": record.is_active,
-                }
-                for record in records
-                if record.key not in core_keys  # avoid duplicate keys colliding with core fields
-            ]
-        return {
-            "entity": entity,
-            "label": meta.label,
-            "primary_key": meta.primary_key,
-            "fields": [asdict(field) for field in meta.core_fields] + custom,
-        }
+        if not meta.supports_custom_fields:
+            return self._core_schemas[entity]
+
+        bind = db.get_bind()
+        version = definition_versions.get(entity)
+        entry = self._schemas.get(bind, {}).get(entity)
+        now = time.monotonic()
+        if (
+            entry is not None
+            and entry.version == version
+            and now - entry.loaded_at < SCHEMA_CACHE_TTL.total_seconds()
+        ):
+            return entry.schema
+
+        schema = await self._load_schema(db, meta)
+        # Definitions changed in a still-open transaction are not cached for other sessions
+        if not definition_versions.has_uncommitted_changes(db):
+            self._schemas.setdefault(bind, {})[entity] = _SchemaEntry(version, now, schema)
+        return schema
 
     async def list_records(
         self,
@@ -144,67 +387,46 @@ class FieldRegistry:
         entity: str,
         limit: int = 50,
         offset: int = 0,
+        cursor: str | None = None,
     ) -> dict[str, Any]:
+        """List one page of records.
+
+        Pass the previous page's ``next_cursor`` as ``cursor`` to page by keyset,
+        which costs the same at any depth; ``offset`` is kept for compatibility
+        and ignored when a cursor is given.
+
+        Raises:
+            ValueError: If the entity is unknown
+            InvalidCursorError: If the cursor cannot be decoded
+        """
         meta = self._require_entity(entity)
-        if entity == "listing":
-            result = await db.execute(
-                select(Listing)
-                .options(joinedload(Listing.cpu), joinedload(Listing.gpu))
-                .order_by(Listing.created_at.desc())
-                .offset(offset)
-                .limit(limit)
-            )
-            rows = result.scalars().all()
-            total = await self._count(db, Listing)
-            serialized = [self._serialize_listing(row) for row in rows]
-        elif entity == "cpu":
-            result = await db.execute(select(Cpu).order_by(Cpu.name).offset(offset).limit(limit))
-            rows = result.scalars().all()
-            total = await self._count(db, Cpu)
-            serialized = [self._serialize_cpu(row) for row in rows]
-        elif entity == "gpu":
-            result = await db.execute(select(Gpu).order_by(Gpu.name).offset(offset).limit(limit))
-            rows = result.scalars().all()
-            total = await self._count(db, Gpu)
-            serialized = [self._serialize_gpu(row) for row in rows]
-        elif entity == "ram_spec":
-            result = await db.execute(
-                select(RamSpec).order_by(RamSpec.id.desc()).offset(offset).limit(limit)
-            )
-            rows = result.scalars().all()
-            total = await self._count(db, RamSpec)
-            serialized = [self._serialize_ram_spec(row) for row in rows]
-        elif entity == "storage_profile":
-            result = await db.execute(
-                select(StorageProfile)
-                .order_by(StorageProfile.id.desc())
-                .offset(offset)
-                .limit(limit)
-            )
-            rows = result.scalars().all()
-            total = await self._count(db, StorageProfile)
-            serialized = [self._serialize_storage_profile(row) for row in rows]
-        elif entity == "ports_profile":
-            result = await db.execute(
-                select(PortsProfile).order_by(PortsProfile.name).offset(offset).limit(limit)
-            )
-            rows = result.scalars().all()
-            total = await self._count(db, PortsProfile)
-            serialized = [self._serialize_ports_profile(row) for row in rows]
-        elif entity == "profile":
-            result = await db.execute(
-                select(Profile).order_by(Profile.name).offset(offset).limit(limit)
-            )
-            rows = result.scalars().all()
-            total = await self._count(db, Profile)
-            serialized = [self._serialize_profile(row) for row in rows]
-        else:
+        source = RECORD_SOURCES.get(entity)
+        if source is None:
             raise ValueError(f"Unsupported entity '{entity}'")
+
+        stmt = source.statement()
+        if cursor:
+            stmt = stmt.where(source.after(cursor))
+        elif offset:
+            stmt = stmt.offset(offset)
+        # One extra row tells whether another page exists
+        result = await db.execute(stmt.limit(limit + 1))
+        rows = result.scalars().unique().all()
+        has_next = len(rows) > limit
+        rows = rows[:limit]
+
+        serialize = self._serializers[entity]
         return {
             "entity": entity,
             "label": meta.label,
-            "records": serialized,
-            "pagination": {"limit": limit, "offset": offset, "total": total},
+            "records": [serialize(row) for row in rows],
+            "pagination": {
+                "limit": limit,
+                "offset": 0 if cursor else offset,
+                "total": await self._count(db, entity),
+                "next_cursor": source.cursor_for(rows[-1]) if has_next else None,
+                "has_next": has_next,
+            },
         }
 
     async def create_record(
@@ -212,6 +434,7 @@ class FieldRegistry:
     ) -> dict[str, Any]:
         self._require_entity(entity)
         record_payload = self._normalize_payload(entity, payload)
+        await cache_manager.delete(self._count_cache_key(entity))
         if entity == "listing":
             listing_payload = dict(record_payload.fields)
             if record_payload.attributes:
@@ -421,9 +644,19 @@ class FieldRegistry:
         # Profile does not have attributes_json, no special handling needed
         return RecordPayload(fields=fields, attributes=attributes)
 
-    async def _count(self, db: AsyncSession, model) -> int:
-        result = await db.execute(select(func.count()).select_from(model))
-        return result.scalar_one()
+    @staticmethod
+    def _count_cache_key(entity: str) -> str:
+        return f"fields_data:{entity}:total_count"
+
+    async def _count(self, db: AsyncSession, entity: str) -> int:
+        cache_key = self._count_cache_key(entity)
+        cached = await cache_manager.get(cache_key)
+        if cached is not None:
+            return int(cached)
+        result = await db.execute(select(func.count()).select_from(RECORD_SOURCES[entity].model))
+        total = result.scalar_one()
+        await cache_manager.set(cache_key, str(total), ttl=RECORD_COUNT_TTL)
+        return total
 
     def _require_entity(self, entity: str) -> EntityMeta:
         try:
@@ -431,402 +664,65 @@ class FieldRegistry:
         except KeyError as exc:
             raise ValueError(f"Unknown entity '{entity}'") from exc
 
-    def _listing_core_fields(self) -> list[FieldMeta]:
-        from ..api.listings.schema import CORE_LISTING_FIELDS
-
-        fields: list[FieldMeta] = []
-        for field_schema in CORE_LISTING_FIELDS:
-            fields.append(
-                FieldMeta(
-                    key=field_schema.key,
-                    label=field_schema.label,
-                    data_type=field_schema.data_type,
-                    required=getattr(field_schema, "required", False),
-                    description=field_schema.description,
-                    origin="core",
-                    editable=getattr(field_schema, "editable", True),
-                    locked=True,
-                    options=field_schema.options,
-                )
-            )
-        return fields
-
-    def _cpu_core_fields(self) -> list[FieldMeta]:
-        mapper = sa_inspect(Cpu)
-        skip_keys = {"id", "created_at", "updated_at", "attributes_json"}
-        label_overrides = {
-            "igpu_model": "iGPU Model",
-            "igpu_mark": "iGPU Mark",
-            "cpu_mark_multi": "CPU Mark (Multi)",
-            "cpu_mark_single": "CPU Mark (Single)",
-            "tdp_w": "TDP (W)",
-            "passmark_slug": "PassMark Slug",
-            "passmark_category": "PassMark Category",
-            "passmark_id": "PassMark ID",
-        }
-
-        def format_label(key: str) -> str:
-            return label_overrides.get(key, key.replace("_", " ").title().replace("Cpu", "CPU"))
-
-        numeric_types = (
-            sqltypes.Integer,
-            sqltypes.Numeric,
-            sqltypes.Float,
-            sqltypes.BigInteger,
-            sqltypes.SmallInteger,
-        )
-        text_types = (sqltypes.Text, sqltypes.UnicodeText)
-
-        def infer_type(column_type: sqltypes.TypeEngine) -> str:
-            if isinstance(column_type, numeric_types):
-                return "number"
-            if isinstance(column_type, sqltypes.Boolean):
-                return "boolean"
-            if isinstance(column_type, text_types):
-                return "text"
-            if isinstance(column_type, sqltypes.JSON):
-                return "json"
-            return "string"
-
-        fields: list[FieldMeta] = []
-        for column in mapper.columns:
-            key = column.key
-            if key in skip_keys:
-                continue
-            fields.append(
-                FieldMeta(
-                    key=key,
-                    label=format_label(key),
-                    data_type=infer_type(column.type),
-                    required=not column.nullable,
-                    origin="core",
-                    locked=True,
-                )
-            )
-        return fields
-
-    def _gpu_core_fields(self) -> list[FieldMeta]:
-        mapper = sa_inspect(Gpu)
-        skip_keys = {"id", "created_at", "updated_at", "attributes_json"}
-        label_overrides = {
-            "gpu_mark": "GPU Mark",
-            "metal_score": "Metal Score",
-        }
-
-        def format_label(key: str) -> str:
-            return label_overrides.get(key, key.replace("_", " ").title().replace("Gpu", "GPU"))
-
-        numeric_types = (
-            sqltypes.Integer,
-            sqltypes.Numeric,
-            sqltypes.Float,
-            sqltypes.BigInteger,
-            sqltypes.SmallInteger,
-        )
-        text_types = (sqltypes.Text, sqltypes.UnicodeText)
-
-        def infer_type(column_type: sqltypes.TypeEngine) -> str:
-            if isinstance(column_type, numeric_types):
-                return "number"
-            if isinstance(column_type, sqltypes.Boolean):
-                return "boolean"
-            if isinstance(column_type, text_types):
-                return "text"
-            if isinstance(column_type, sqltypes.JSON):
-                return "json"
-            return "string"
-
-        fields: list[FieldMeta] = []
-        for column in mapper.columns:
-            key = column.key
-            if key in skip_keys:
-                continue
-            fields.append(
-                FieldMeta(
-                    key=key,
-                    label=format_label(key),
-                    data_type=infer_type(column.type),
-                    required=not column.nullable,
-                    origin="core",
-                    locked=True,
-                )
-            )
-        return fields
-
-    def _ram_spec_core_fields(self) -> list[FieldMeta]:
-        mapper = sa_inspect(RamSpec)
-        skip_keys = {"id", "created_at", "updated_at", "attributes_json"}
-        label_overrides = {
-            "ddr_generation": "DDR Generation",
-            "speed_mhz": "Speed (MHz)",
-            "module_count": "Module Count",
-            "capacity_per_module_gb": "Capacity per Module (GB)",
-            "total_capacity_gb": "Total Capacity (GB)",
-        }
-
-        def format_label(key: str) -> str:
-            return label_overrides.get(key, key.replace("_", " ").title())
-
-        numeric_types = (
-            sqltypes.Integer,
-            sqltypes.Numeric,
-            sqltypes.Float,
-            sqltypes.BigInteger,
-            sqltypes.SmallInteger,
-        )
-        text_types = (sqltypes.Text, sqltypes.UnicodeText)
-
-        def infer_type(column_type: sqltypes.TypeEngine) -> str:
-            if isinstance(column_type, numeric_types):
-                return "number"
-            if isinstance(column_type, sqltypes.Boolean):
-                return "boolean"
-            if isinstance(column_type, text_types):
-                return "text"
-            if isinstance(column_type, sqltypes.JSON):
-                return "json"
-            if isinstance(column_type, sqltypes.Enum):
-                return "string"
-            return "string"
-
-        fields: list[FieldMeta] = []
-        for column in mapper.columns:
-            key = column.key
-            if key in skip_keys:
-                continue
-            fields.append(
-                FieldMeta(
-                    key=key,
-                    label=format_label(key),
-                    data_type=infer_type(column.type),
-                    required=not column.nullable,
-                    origin="core",
-                    locked=True,
-                )
-            )
-        return fields
-
-    def _storage_profile_core_fields(self) -> list[FieldMeta]:
-        mapper = sa_inspect(StorageProfile)
-        skip_keys = {"id", "created_at", "updated_at", "attributes_json"}
-        label_overrides = {
-            "capacity_gb": "Capacity (GB)",
-            "performance_tier": "Performance Tier",
-            "form_factor": "Form Factor",
-        }
-
-        def format_label(key: str) -> str:
-            return label_overrides.get(key, key.replace("_", " ").title())
-
-        numeric_types = (
-            sqltypes.Integer,
-            sqltypes.Numeric,
-            sqltypes.Float,
-            sqltypes.BigInteger,
-            sqltypes.SmallInteger,
+    async def _load_schema(self, db: AsyncSession, meta: EntityMeta) -> dict[str, Any]:
+        records = await self.custom_fields.list_fields(
+            db, entity=meta.entity, include_inactive=True, include_deleted=False
         )
-        text_types = (sqltypes.Text, sqltypes.UnicodeText)
-
-        def infer_type(column_type: sqltypes.TypeEngine) -> str:
-            if isinstance(column_type, numeric_types):
-                return "number"
-            if isinstance(column_type, sqltypes.Boolean):
-                return "boolean"
-            if isinstance(column_type, text_types):
-                return "text"
-            if isinstance(column_type, sqltypes.JSON):
-                return "json"
-            if isinstance(column_type, sqltypes.Enum):
-                return "string"
-            return "string"
-
-        fields: list[FieldMeta] = []
-        for column in mapper.columns:
-            key = column.key
-            if key in skip_keys:
-                continue
-            fields.append(
-                FieldMeta(
-                    key=key,
-                    label=format_label(key),
-                    data_type=infer_type(column.type),
-                    required=not column.nullable,
-                    origin="core",
-                    locked=True,
-                )
-            )
-        return fields
-
-    def _ports_profile_core_fields(self) -> list[FieldMeta]:
-        mapper = sa_inspect(PortsProfile)
-        skip_keys = {"id", "created_at", "updated_at", "attributes_json"}
-        label_overrides: dict[str, str] = {}
-
-        def format_label(key: str) -> str:
-            return label_overrides.get(key, key.replace("_", " ").title())
-
-        numeric_types = (
-            sqltypes.Integer,
-            sqltypes.Numeric,
-            sqltypes.Float,
-            sqltypes.BigInteger,
-            sqltypes.SmallInteger,
-        )
-        text_types = (sqltypes.Text, sqltypes.UnicodeText)
-
-        def infer_type(column_type: sqltypes.TypeEngine) -> str:
-            if isinstance(column_type, numeric_types):
-                return "number"
-            if isinstance(column_type, sqltypes.Boolean):
-                return "boolean"
-            if isinstance(column_type, text_types):
-                return "text"
-            if isinstance(column_type, sqltypes.JSON):
-                return "json"
-            return "string"
-
-        fields: list[FieldMeta] = []
-        for column in mapper.columns:
-            key = column.key
-            if key in skip_keys:
-                continue
-            fields.append(
-                FieldMeta(
-                    key=key,
-                    label=format_label(key),
-                    data_type=infer_type(column.type),
-                    required=not column.nullable,
-                    origin="core",
-                    locked=True,
-                )
-            )
-        return fields
-
-    def _profile_core_fields(self) -> list[FieldMeta]:
-        mapper = sa_inspect(Profile)
-        skip_keys = {"id", "created_at", "updated_at"}
-        label_overrides = {
-            "weights_json": "Metric Weights",
-            "rule_group_weights": "Rule Group Weights",
-            "is_default": "Default Profile",
-        }
-
-        def format_label(key: str) -> str:
-            return label_overrides.get(key, key.replace("_", " ").title())
-
-        numeric_types = (
-            sqltypes.Integer,
-            sqltypes.Numeric,
-            sqltypes.Float,
-            sqltypes.BigInteger,
-            sqltypes.SmallInteger,
-        )
-        text_types = (sqltypes.Text, sqltypes.UnicodeText)
-
-        def infer_type(column_type: sqltypes.TypeEngine) -> str:
-            if isinstance(column_type, numeric_types):
-                return "number"
-            if isinstance(column_type, sqltypes.Boolean):
-                return "boolean"
-            if isinstance(column_type, text_types):
-                return "text"
-            if isinstance(column_type, sqltypes.JSON):
-                return "json"
-            return "string"
-
-        fields: list[FieldMeta] = []
-        for column in mapper.columns:
-            key = column.key
-            if key in skip_keys:
-                continue
-            fields.append(
-                FieldMeta(
-                    key=key,
-                    label=format_label(key),
-                    data_type=infer_type(column.type),
-                    required=not column.nullable,
-                    origin="core",
-                    locked=True,
-                )
-            )
-        return fields
+        core_keys = {f.key for f in meta.core_fields}
+        custom = [
+            {
+                "id": record.id,
+                "key": record.key,
+                "label": record.label,
+                "data_type": record.data_type,
+                "required": record.required,
+                "locked": record.is_locked,
+                "editable": not record.is_locked,
+                "origin": "custom",
+                "description": record.description,
+                "options": record.options,
+                "is_active": record.is_active,
+            }
+            for record in records
+            if record.key not in core_keys  # avoid duplicate keys colliding with core fields
+        ]
+        core = self._core_schemas[meta.entity]
+        return {**core, "fields": core["fields"] + custom}
 
     def _serialize_listing(self, listing: Listing) -> dict[str, Any]:
-        data = ListingRead.model_validate(listing).model_dump()
-        return {
-            "id": data["id"],
-            "fields": {k: data.get(k) for k in self._listing_field_keys()},
-            "attributes": data.get("attributes", {}) or {},
-        }
+        return self._serializers["listing"](listing)
 
     def _serialize_cpu(self, cpu: Cpu) -> dict[str, Any]:
-        data = CpuRead.model_validate(cpu).model_dump()
-        return {
-            "id": data["id"],
-            "fields": {key: data.get(key) for key in self._cpu_field_keys()},
-            "attributes": dict(getattr(cpu, "attributes_json", {}) or {}),
-        }
+        return self._serializers["cpu"](cpu)
 
     def _serialize_gpu(self, gpu: Gpu) -> dict[str, Any]:
-        data = GpuRead.model_validate(gpu).model_dump()
-        return {
-            "id": data["id"],
-            "fields": {key: data.get(key) for key in self._gpu_field_keys()},
-            "attributes": dict(getattr(gpu, "attributes_json", {}) or {}),
-        }
+        return self._serializers["gpu"](gpu)
 
     def _serialize_ram_spec(self, ram_spec: RamSpec) -> dict[str, Any]:
-        data = RamSpecRead.model_validate(ram_spec).model_dump()
-        return {
-            "id": data["id"],
-            "fields": {key: data.get(key) for key in self._ram_spec_field_keys()},
-            "attributes": dict(getattr(ram_spec, "attributes_json", {}) or {}),
-        }
+        return self._serializers["ram_spec"](ram_spec)
 
     def _serialize_storage_profile(self, storage_profile: StorageProfile) -> dict[str, Any]:
-        data = StorageProfileRead.model_validate(storage_profile).model_dump()
-        return {
-            "id": data["id"],
-            "fields": {key: data.get(key) for key in self._storage_profile_field_keys()},
-            "attributes": dict(getattr(storage_profile, "attributes_json", {}) or {}),
-        }
+        return self._serializers["storage_profile"](storage_profile)
 
     def _serialize_ports_profile(self, ports_profile: PortsProfile) -> dict[str, Any]:
-        data = PortsProfileRead.model_validate(ports_profile).model_dump()
-        return {
-            "id": data["id"],
-            "fields": {key: data.get(key) for key in self._ports_profile_field_keys()},
-            "attributes": dict(getattr(ports_profile, "attributes_json", {}) or {}),
-        }
+        return self._serializers["ports_profile"](ports_profile)
 
     def _serialize_profile(self, profile: Profile) -> dict[str, Any]:
-        data = ProfileRead.model_validate(profile).model_dump()
-        return {
-            "id": data["id"],
-            "fields": {key: data.get(key) for key in self._profile_field_keys()},
-            "attributes": {},  # Profile does not support custom fields
-        }
-
-    def _listing_field_keys(self) -> list[str]:
-        return [field.key for field in self.entities["listing"].core_fields]
-
-    def _cpu_field_keys(self) -> list[str]:
-        return [field.key for field in self.entities["cpu"].core_fields]
-
-    def _gpu_field_keys(self) -> list[str]:
-        return [field.key for field in self.entities["gpu"].core_fields]
-
-    def _ram_spec_field_keys(self) -> list[str]:
-        return [field.key for field in self.entities["ram_spec"].core_fields]
-
-    def _storage_profile_field_keys(self) -> list[str]:
-        return [field.key for field in self.entities["storage_profile"].core_fields]
+        return self._serializers["profile"](profile)
 
-    def _ports_profile_field_keys(self) -> list[str]:
-        return [field.key for field in self.entities["ports_profile"].core_fields]
 
-    def _profile_field_keys(self) -> list[str]:
-        return [field.key for field in self.entities["profile"].core_fields]
+@cache
+def get_field_registry() -> FieldRegistry:
+    """Process-wide registry, so every endpoint shares its schema cache."""
+    return FieldRegistry()
 
 
-__all__ = ["FieldRegistry", "EntityMeta", "FieldMeta"]
+__all__ = [
+    "FieldRegistry",
+    "EntityMeta",
+    "FieldMeta",
+    "InvalidCursorError",
+    "RecordSerializer",
+    "RecordSource",
+    "get_field_registry",
+]
@@ -0,0 +1,417 @@
+"""In-memory value dictionaries behind field value autocomplete.
+
+The rule builder calls ``get_field_distinct_values`` on every keystroke.
+Instead of running ``SELECT DISTINCT ... LIKE`` each time, the distinct
+values of a field (core column or custom field) are loaded once per process
+and database into a ``FieldValueDictionary`` holding:
+
+- value -> frequency counts, so deletes know when a value disappears
+- the values in sort order (numbers numerically, ahead of text) for
+  unfiltered lookups
+- sorted (lower-cased value, value) pairs for prefix lookups by bisection
+- a trigram -> values index for substring lookups
+
+Committed ORM writes to listings, CPUs, GPUs and ports profiles update the
+loaded dictionaries in place (see ``_collect_flush_deltas``). Writes the
+session cannot see (other processes, Core bulk statements) are picked up
+when a dictionary expires after ``field_values.dictionary_ttl_s``. Fields
+with more than ``field_values.dictionary_max_values`` distinct values are
+not held in memory and callers query the database instead.
+"""
+
+from __future__ import annotations
+
+import heapq
+import json
+import logging
+import math
+import threading
+import time
+import weakref
+from bisect import bisect_left, insort
+from collections import defaultdict
+from collections.abc import Awaitable, Callable, Iterable, Mapping
+from dataclasses import dataclass
+from enum import Enum
+from functools import cache
+from typing import Any
+
+from sqlalchemy import event, func, inspect, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from ..models.core import Cpu, Gpu, Listing, PortsProfile
+from ..settings import get_settings
+
+logger = logging.getLogger(__name__)
+
+# Models whose writes update loaded dictionaries, by entity name
+TRACKED_MODELS: dict[type, str] = {
+    Listing: "listing",
+    Cpu: "cpu",
+    Gpu: "gpu",
+    PortsProfile: "ports_profile",
+}
+
+_DELTAS_KEY = "field_value_deltas"
+
+
+def _trigrams(text: str) -> set[str]:
+    return {text[index : index + 3] for index in range(len(text) - 2)}
+
+
+def _sort_key(value: str) -> tuple[int, float, str]:
+    """Order numeric values by magnitude ahead of text, so "4" < "16" < "128"."""
+    try:
+        number = float(value)
+    except ValueError:
+        return 1, 0.0, value
+    if not math.isfinite(number):
+        return 1, 0.0, value
+    return 0, number, value
+
+
+def value_text(value: Any) -> str:
+    """Text form of a core column value, as returned by autocomplete."""
+    if isinstance(value, Enum):
+        return str(value.value)
+    return str(value)
+
+
+def attribute_text(value: Any) -> str:
+    """Text form of a custom field value (``attributes_json ->> key``)."""
+    if isinstance(value, str):
+        return value
+    return json.dumps(value)
+
+
+class FieldValueDictionary:
+    """Distinct values of one field with their frequencies.
+
+    Args:
+        counts: Initial value -> frequency counts
+    """
+
+    def __init__(self, counts: Mapping[str, int] | None = None):
+        self._counts = {value: count for value, count in (counts or {}).items() if count > 0}
+        self._sorted = sorted(map(_sort_key, self._counts))
+        self._lowered = sorted((value.lower(), value) for value in self._counts)
+        self._trigrams: dict[str, set[str]] = defaultdict(set)
+        for lowered, value in self._lowered:
+            for trigram in _trigrams(lowered):
+                self._trigrams[trigram].add(value)
+
+    def __len__(self) -> int:
+        return len(self._counts)
+
+    def __contains__(self, value: object) -> bool:
+        return value in self._counts
+
+    def frequency(self, value: str) -> int:
+        """Number of records holding ``value``."""
+        return self._counts.get(value, 0)
+
+    def add(self, value: str, count: int = 1) -> None:
+        current = self._counts.get(value, 0)
+        self._counts[value] = current + count
+        if current:
+            return
+        insort(self._sorted, _sort_key(value))
+        lowered = value.lower()
+        insort(self._lowered, (lowered, value))
+        for trigram in _trigrams(lowered):
+            self._trigrams[trigram].add(value)
+
+    def remove(self, value: str, count: int = 1) -> None:
+        current = self._counts.get(value)
+        if current is None:
+            return
+        if current > count:
+            self._counts[value] = current - count
+            return
+        del self._counts[value]
+        del self._sorted[bisect_left(self._sorted, _sort_key(value))]
+        lowered = value.lower()
+        del self._lowered[bisect_left(self._lowered, (lowered, value))]
+        for trigram in _trigrams(lowered):
+            postings = self._trigrams[trigram]
+            postings.discard(value)
+            if not postings:
+                del self._trigrams[trigram]
+
+    def search(
+        self, query: str | None = None, *, limit: int = 100, prefix: bool = False
+    ) -> list[str]:
+        """Values matching ``query`` case-insensitively, in sort order.
+
+        Args:
+            query: Substring (or prefix) to match; None or empty returns all values
+            limit: Maximum number of values to return
+            prefix: Match only values starting with ``query``
+        """
+        if not query:
+            return [key[2] for key in self._sorted[:limit]]
+        needle = query.lower()
+        if prefix:
+            matches = []
+            for index in range(bisect_left(self._lowered, (needle,)), len(self._lowered)):
+                lowered, value = self._lowered[index]
+                if not lowered.startswith(needle):
+                    break
+                matches.append(value)
+        elif len(needle) >= 3:
+            postings = sorted(
+                (self._trigrams.get(trigram, set()) for trigram in _trigrams(needle)), key=len
+            )
+            candidates = postings[0].intersection(*postings[1:])
+            matches = [value for value in candidates if needle in value.lower()]
+        else:
+            matches = [value for lowered, value in self._lowered if needle in lowered]
+        return heapq.nsmallest(limit, matches, key=_sort_key)
+
+
+@dataclass
+class _Entry:
+    # None when the field has too many distinct values to hold in memory
+    dictionary: FieldValueDictionary | None
+    loaded_at: float
+
+
+class FieldValueDictionaries:
+    """Process-wide dictionaries per database and ``entity.field`` name.
+
+    Args:
+        ttl_s: Seconds before a dictionary is reloaded
+            (defaults to ``field_values.dictionary_ttl_s``)
+        max_values: Largest number of distinct values held in memory
+            (defaults to ``field_values.dictionary_max_values``)
+        clock: Monotonic clock (injectable for tests)
+    """
+
+    def __init__(
+        self,
+        *,
+        ttl_s: float | None = None,
+        max_values: int | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self._ttl_s = ttl_s
+        self._max_values = max_values
+        self._clock = clock
+        self._entries: weakref.WeakKeyDictionary[Any, dict[str, _Entry]] = (
+            weakref.WeakKeyDictionary()
+        )
+        self._lock = threading.Lock()
+
+    @property
+    def ttl_s(self) -> float:
+        if self._ttl_s is None:
+            return get_settings().field_values.dictionary_ttl_s
+        return self._ttl_s
+
+    @property
+    def max_values(self) -> int:
+        if self._max_values is None:
+            return get_settings().field_values.dictionary_max_values
+        return self._max_values
+
+    async def get(
+        self,
+        session: AsyncSession,
+        field_name: str,
+        resolve_column: Callable[[], Awaitable[Any]],
+    ) -> FieldValueDictionary | None:
+        """Return the dictionary for ``field_name``, loading it if missing or expired.
+
+        Args:
+            session: Database session
+            field_name: Field name in "entity.field" format
+            resolve_column: Returns the column or expression holding the field's
+                values; only called when the dictionary is (re)loaded
+
+        Returns:
+            The dictionary, or None if the field has too many distinct values
+        """
+        fields = self._entries.setdefault(session.get_bind(), {})
+        entry = fields.get(field_name)
+        if entry is None or self._clock() - entry.loaded_at >= self.ttl_s:
+            entry = await self._load(session, field_name, await resolve_column())
+            fields[field_name] = entry
+        return entry.dictionary
+
+    async def _load(self, session: AsyncSession, field_name: str, column: Any) -> _Entry:
+        loaded_at = self._clock()
+        max_values = self.max_values
+        result = await session.execute(
+            select(column, func.count())
+            .where(column.is_not(None))
+            .group_by(column)
+            .limit(max_values + 1)
+        )
+        rows = result.all()
+        if len(rows) > max_values:
+            logger.info(f"Field {field_name} has over {max_values} distinct values; not cached")
+            return _Entry(None, loaded_at)
+
+        counts: dict[str, int] = defaultdict(int)
+        for value, count in rows:
+            counts[value_text(value)] += count
+        logger.info(f"Loaded {len(counts)} values for field {field_name}")
+        return _Entry(FieldValueDictionary(counts), loaded_at)
+
+    def loaded_fields(self, bind: Any) -> set[str]:
+        """Names of the fields with an in-memory dictionary for ``bind``."""
+        return {
+            name
+            for name, entry in self._entries.get(bind, {}).items()
+            if entry.dictionary is not None
+        }
+
+    def apply(self, bind: Any, deltas: Iterable[tuple[str, str | None, int]]) -> None:
+        """Apply (field_name, value, change) deltas; a None value drops the dictionary."""
+        fields = self._entries.get(bind)
+        if not fields:
+            return
+        with self._lock:
+            for field_name, value, change in deltas:
+                entry = fields.get(field_name)
+                if entry is None or entry.dictionary is None:
+                    continue
+                if value is None:
+                    del fields[field_name]
+                elif change > 0:
+                    entry.dictionary.add(value, change)
+                else:
+                    entry.dictionary.remove(value, -change)
+
+    def invalidate(self, field_name: str | None = None) -> None:
+        """Drop the dictionaries for ``field_name`` (or all) so they reload on next use."""
+        with self._lock:
+            if field_name is None:
+                self._entries.clear()
+                return
+            for fields in self._entries.values():
+                fields.pop(field_name, None)
+
+
+field_value_dictionaries = FieldValueDictionaries()
+
+
+_UNKNOWN = object()
+
+
+def _field_attribute(state: Any, field_name: str) -> tuple[str, str]:
+    """(mapped attribute, key) holding a field: a column, or a key in ``attributes_json``."""
+    key = field_name.partition(".")[2]
+    if key != "attributes_json" and key in state.mapper.column_attrs:
+        return key, key
+    return "attributes_json", key
+
+
+def _field_text(state: Any, field_name: str, values: Mapping[str, Any]) -> Any:
+    """Text value of a field in ``values``; None if unset, ``_UNKNOWN`` if not loaded."""
+    attribute, key = _field_attribute(state, field_name)
+    if attribute not in values:
+        return _UNKNOWN
+    value = values[attribute]
+    if attribute == "attributes_json":
+        value = (value or {}).get(key)
+        return None if value is None else attribute_text(value)
+    return None if value is None else value_text(value)
+
+
+@cache
+def _insert_nulls(mapper: Any) -> dict[str, None]:
+    return {
+        prop.key: None
+        for prop in mapper.column_attrs
+        if prop.columns[0].server_default is None and prop.columns[0].default is None
+    }
+
+
+def _row_deltas(state: Any, fields: set[str], sign: int) -> list[tuple[str, str | None, int]]:
+    values: Mapping[str, Any] = state.dict
+    if sign > 0:
+        # Columns left unset on a new row without a default were inserted as
+        # NULL; scalar defaults are already in state.dict
+        values = _insert_nulls(state.mapper) | values
+    deltas: list[tuple[str, str | None, int]] = []
+    for field_name in fields:
+        text = _field_text(state, field_name, values)
+        if text is _UNKNOWN:
+            deltas.append((field_name, None, 0))
+        elif text is not None:
+            deltas.append((field_name, text, sign))
+    return deltas
+
+
+def _changed_deltas(state: Any, fields: set[str]) -> list[tuple[str, str | None, int]]:
+    deltas: list[tuple[str, str | None, int]] = []
+    for field_name in fields:
+        attribute, _ = _field_attribute(state, field_name)
+        history = state.attrs[attribute].history
+        if not history.has_changes():
+            continue
+        if not history.deleted:
+            # Assigned without the previous value loaded
+            deltas.append((field_name, None, 0))
+            continue
+        old = _field_text(state, field_name, {attribute: history.deleted[0]})
+        new = _field_text(
+            state, field_name, {attribute: history.added[0] if history.added else None}
+        )
+        if old == new:
+            continue
+        if old is not None:
+            deltas.append((field_name, old, -1))
+        if new is not None:
+            deltas.append((field_name, new, 1))
+    return deltas
+
+
+def _collect_flush_deltas(session: Session, flush_context: Any) -> None:
+    """Record value changes of tracked rows; applied when the session commits."""
+    bind = session.get_bind()
+    loaded = field_value_dictionaries.loaded_fields(bind)
+    if not loaded:
+        return
+    by_entity: dict[str, set[str]] = defaultdict(set)
+    for field_name in loaded:
+        by_entity[field_name.partition(".")[0]].add(field_name)
+
+    deltas: list[tuple[str, str | None, int]] = []
+    for objects, sign in ((session.new, 1), (session.deleted, -1), (session.dirty, 0)):
+        for obj in objects:
+            entity = TRACKED_MODELS.get(type(obj))
+            if entity is None or entity not in by_entity:
+                continue
+            state = inspect(obj)
+            if sign:
+                deltas.extend(_row_deltas(state, by_entity[entity], sign))
+            else:
+                deltas.extend(_changed_deltas(state, by_entity[entity]))
+    if deltas:
+        session.info.setdefault(_DELTAS_KEY, []).append((bind, deltas))
+
+
+def _apply_committed_deltas(session: Session) -> None:
+    for bind, deltas in session.info.pop(_DELTAS_KEY, []):
+        field_value_dictionaries.apply(bind, deltas)
+
+
+def _discard_deltas(session: Session) -> None:
+    session.info.pop(_DELTAS_KEY, None)
+
+
+event.listen(Session, "after_flush", _collect_flush_deltas)
+event.listen(Session, "after_commit", _apply_committed_deltas)
+event.listen(Session, "after_rollback", _discard_deltas)
+
+
+__all__ = [
+    "FieldValueDictionaries",
+    "FieldValueDictionary",
+    "attribute_text",
+    "field_value_dictionaries",
+    "value_text",
+]
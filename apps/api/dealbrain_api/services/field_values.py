@@ -9,7 +9,9 @@ from sqlalchemy import distinct, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import InstrumentedAttribute
 
-from ..models.core import Cpu, Gpu, Listing
+from ..models.core import Cpu, CustomFieldDefinition, Gpu, Listing
+from .custom_field_indexes import INDEXED_ENTITY_MODELS, attribute_value
+from .field_value_dictionary import field_value_dictionaries, value_text
 
 logger = logging.getLogger(__name__)
 
@@ -54,9 +56,24 @@ async def get_field_distinct_values(
             raise ValueError(f"Unknown entity: {entity_name}")
 
         model, column = entity_map[entity_name]
+        custom = column is None
 
-        if column is None:
-            raise ValueError(f"Unknown field: {field_key} for entity: {entity_name}")
+        async def resolve_column() -> Any:
+            if not custom:
+                return column
+            resolved = await get_custom_field_column(session, entity_name, field_key)
+            if resolved is None:
+                raise ValueError(f"Unknown field: {field_key} for entity: {entity_name}")
+            return resolved
+
+        # Answer from the in-memory dictionary unless the field has too many values
+        dictionary = await field_value_dictionaries.get(session, field_name, resolve_column)
+        if dictionary is not None:
+            values = dictionary.search(search, limit=limit)
+            logger.debug(f"Retrieved {len(values)} cached values for field {field_name}")
+            return values
+
+        column = await resolve_column()
 
         # Build query for distinct values
         query = select(distinct(column)).where(column.is_not(None))
@@ -66,14 +83,16 @@ async def get_field_distinct_values(
             # Cast column to string type for search
             from sqlalchemy import String, cast
 
-            query = query.where(func.lower(cast(column, String)).contains(search.lower()))
+            # Custom field values are already text; matching the trigram index needs no cast
+            searchable = column if custom else cast(column, String)
+            query = query.where(func.lower(searchable).contains(search.lower()))
 
         # Order and limit
         query = query.order_by(column).limit(limit)
 
         # Execute query
         result = await session.execute(query)
-        values = [str(row[0]) for row in result.fetchall()]
+        values = [value_text(row[0]) for row in result.fetchall()]
 
         logger.info(f"Retrieved {len(values)} values for field {field_name}")
         return values
@@ -83,6 +102,25 @@ async def get_field_distinct_values(
         raise
 
 
+async def get_custom_field_column(
+    session: AsyncSession, entity_name: str, field_key: str
+) -> Any | None:
+    """Map a custom field key to its indexed ``attributes_json`` expression."""
+    model = INDEXED_ENTITY_MODELS.get(entity_name)
+    if model is None:
+        return None
+    field_id = await session.scalar(
+        select(CustomFieldDefinition.id).where(
+            CustomFieldDefinition.entity == entity_name,
+            CustomFieldDefinition.key == field_key,
+            CustomFieldDefinition.deleted_at.is_(None),
+        )
+    )
+    if field_id is None:
+        return None
+    return attribute_value(model, field_key)
+
+
 def get_listing_column(field_key: str) -> InstrumentedAttribute[Any] | None:
     """Map field key to Listing model column."""
     field_map = {
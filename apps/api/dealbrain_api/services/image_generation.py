@@ -2,9 +2,12 @@
 
 This module provides the service layer for card image generation including:
 - HTML template rendering with Jinja2
-- Playwright-based headless browser rendering
-- Browser pool management for performance
-- S3 caching with automatic invalidation
+- Playwright-based headless browser rendering, or direct Pillow drawing
+  for the size presets in ``settings.cards.pillow_sizes``
+- Rendering through the shared browser pool (rendering tenant)
+- Batch pre-rendering of every card variant across a bounded set of pages
+- Tiered caching (in-process LRU, then S3) keyed by a content hash, so
+  cards are invalidated automatically when the rendered data changes
 - Graceful fallback on errors
 """
 
@@ -13,23 +16,39 @@ from __future__ import annotations
 import asyncio
 import hashlib
 import logging
+from collections.abc import Sequence
+from dataclasses import dataclass
 from datetime import datetime, timedelta
+from functools import partial
 from io import BytesIO
 from pathlib import Path
-from typing import Literal, Optional
+from typing import Any, Literal
 
 import boto3
 from botocore.exceptions import BotoCoreError, ClientError
-from jinja2 import Environment, FileSystemLoader, select_autoescape
-from playwright.async_api import Browser, Error as PlaywrightError, async_playwright
+from jinja2 import Environment, FileSystemLoader, Template, select_autoescape
+from playwright.async_api import Error as PlaywrightError
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from ..adapters.browser_pool import RENDERING_TENANT, BrowserPool
 from ..models.listings import Listing
 from ..settings import get_settings
+from .card_cache import (
+    CardCacheKey,
+    LocalCardCache,
+    card_content_hash,
+    get_local_card_cache,
+    record_lookup,
+)
+from .card_renderer import get_pillow_renderer
 
 logger = logging.getLogger(__name__)
 
+TEMPLATE_DIR = Path(__file__).parent.parent / "templates"
+CARD_TEMPLATE = "card_template.html"
+PILLOW_RENDERER_SOURCE = Path(__file__).parent / "card_renderer.py"
+
 # Template dimensions for different card sizes
 CARD_DIMENSIONS = {
     "social": {"width": 1200, "height": 630},  # Twitter/Facebook
@@ -37,6 +56,12 @@ CARD_DIMENSIONS = {
     "story": {"width": 1080, "height": 1920},  # Instagram story
 }
 
+CARD_STYLES = ("light", "dark")
+CARD_FORMATS = ("png", "jpeg")
+
+# Delay after the page settles so fonts and layout finish painting
+RENDER_SETTLE_SECONDS = 0.5
+
 # Valuation tier thresholds (should match frontend settings)
 VALUATION_TIERS = {
     "great": 0.15,  # 15% or more below market
@@ -46,86 +71,16 @@ VALUATION_TIERS = {
 }
 
 
-class BrowserPool:
-    """Pool manager for Playwright browser instances.
-
-    Manages a pool of headless browser instances to improve performance
-    and prevent resource exhaustion. Implements semaphore-based limiting
-    to prevent OOM issues.
+@dataclass
+class BatchRenderResult:
+    """Outcome of ``ImageGenerationService.render_cards_batch``.
 
-    Args:
-        max_size: Maximum number of concurrent browser instances (default: 2)
-        timeout_ms: Browser operation timeout in milliseconds (default: 30000)
+    Counts are per image (one listing × style × size × format).
     """
 
-    def __init__(self, max_size: int = 2, timeout_ms: int = 30000):
-        """Initialize browser pool.
-
-        Args:
-            max_size: Maximum concurrent browsers
-            timeout_ms: Browser operation timeout
-        """
-        self._semaphore = asyncio.Semaphore(max_size)
-        self._timeout_ms = timeout_ms
-        self._playwright = None
-        self._browser: Optional[Browser] = None
-        self._lock = asyncio.Lock()
-
-    async def acquire(self) -> Browser:
-        """Acquire a browser instance from the pool.
-
-        Returns:
-            Playwright Browser instance
-
-        Raises:
-            PlaywrightError: If browser initialization fails
-        """
-        await self._semaphore.acquire()
-
-        async with self._lock:
-            if self._browser is None:
-                try:
-                    self._playwright = await async_playwright().start()
-                    self._browser = await self._playwright.chromium.launch(
-                        headless=True,
-                        args=[
-                            "--disable-dev-shm-usage",
-                            "--no-sandbox",
-                            "--disable-setuid-sandbox",
-                            "--disable-gpu",
-                        ]
-                    )
-                    logger.info("Initialized Playwright browser instance")
-                except PlaywrightError as e:
-                    logger.error(f"Failed to initialize browser: {e}")
-                    self._semaphore.release()
-                    raise
-
-        return self._browser
-
-    def release(self):
-        """Release browser instance back to pool."""
-        self._semaphore.release()
-
-    async def close(self):
-        """Close all browser instances and cleanup."""
-        async with self._lock:
-            if self._browser:
-                try:
-                    await self._browser.close()
-                    logger.info("Closed browser instance")
-                except Exception as e:
-                    logger.warning(f"Error closing browser: {e}")
-                finally:
-                    self._browser = None
-
-            if self._playwright:
-                try:
-                    await self._playwright.stop()
-                except Exception as e:
-                    logger.warning(f"Error stopping playwright: {e}")
-                finally:
-                    self._playwright = None
+    rendered: int = 0
+    skipped: int = 0
+    failed: int = 0
 
 
 class ImageGenerationService:
@@ -134,31 +89,31 @@ class ImageGenerationService:
     Provides high-level operations for:
     - Rendering listing data as HTML cards
     - Converting HTML to PNG/JPEG images using Playwright
-    - Caching images in S3 with TTL
+    - Caching images in a local LRU and in S3 with TTL
     - Cache invalidation on listing updates
     - Graceful error handling and fallbacks
 
+    S3 calls are blocking boto3 calls and run in a worker thread.
+
     Args:
         session: Async SQLAlchemy session for database operations
+        local_cache: In-process cache tier (defaults to the shared one)
     """
 
-    # Shared browser pool across all service instances
-    _browser_pool: Optional[BrowserPool] = None
-    _pool_lock = asyncio.Lock()
-
-    def __init__(self, session: AsyncSession):
+    def __init__(self, session: AsyncSession, local_cache: LocalCardCache | None = None):
         """Initialize service with database session.
 
         Args:
             session: Async SQLAlchemy session
+            local_cache: In-process cache tier (defaults to the shared one)
         """
         self.session = session
         self.settings = get_settings()
+        self.local_cache = local_cache if local_cache is not None else get_local_card_cache()
 
         # Initialize Jinja2 environment
-        template_dir = Path(__file__).parent.parent / "templates"
         self.jinja_env = Environment(
-            loader=FileSystemLoader(template_dir),
+            loader=FileSystemLoader(TEMPLATE_DIR),
             autoescape=select_autoescape(["html", "xml"]),
             enable_async=True,
         )
@@ -183,27 +138,25 @@ class ImageGenerationService:
 
     @classmethod
     async def get_browser_pool(cls) -> BrowserPool:
-        """Get or create the shared browser pool.
+        """Get the process-wide browser pool, initialized on the current loop.
+
+        Card rendering shares browsers with URL scraping and acquires
+        contexts as the rendering tenant, limited to
+        ``settings.playwright.max_concurrent_browsers`` concurrent renders.
 
         Returns:
             Shared BrowserPool instance
         """
-        async with cls._pool_lock:
-            if cls._browser_pool is None:
-                settings = get_settings()
-                cls._browser_pool = BrowserPool(
-                    max_size=settings.playwright.max_concurrent_browsers,
-                    timeout_ms=settings.playwright.browser_timeout_ms,
-                )
-            return cls._browser_pool
+        pool = BrowserPool.shared()
+        await pool.initialize()
+        return pool
 
     @classmethod
     async def close_browser_pool(cls):
         """Close the shared browser pool."""
-        async with cls._pool_lock:
-            if cls._browser_pool is not None:
-                await cls._browser_pool.close()
-                cls._browser_pool = None
+        pool = BrowserPool._instance
+        if pool is not None:
+            await pool.close_all()
 
     async def render_card(
         self,
@@ -215,7 +168,8 @@ class ImageGenerationService:
         """Render listing as card image.
 
         Loads listing data, renders HTML template, and converts to image
-        using Playwright. Implements caching with S3 if enabled.
+        using Playwright. Rendered images are cached under a hash of the
+        card's content, in the local tier and in S3 if enabled.
 
         Args:
             listing_id: Listing ID to render
@@ -239,23 +193,34 @@ class ImageGenerationService:
                 size="social"
             )
         """
-        # Check cache first
-        cached_image = await self.get_cached_image(listing_id, style, format, size)
-        if cached_image:
-            logger.info(f"Cache hit for listing {listing_id} ({style}/{size}.{format})")
-            return cached_image
-
         # Load listing data
         listing = await self._load_listing(listing_id)
         if not listing:
             raise ValueError(f"Listing {listing_id} not found")
 
-        # Render HTML
-        html = await self._render_html(listing, style, size)
+        # Check cache first; the key changes whenever the rendered data does
+        card_context = self._card_context(listing, style, size)
+        content_hash = self._content_hash(card_context, size)
+        cached_image = await self.get_cached_image(
+            listing_id, style, format, size, content_hash=content_hash
+        )
+        if cached_image:
+            logger.info(f"Cache hit for listing {listing_id} ({style}/{size}.{format})")
+            return cached_image
+
+        if self._uses_pillow(size):
+            # Draw directly; CPU-bound, so off the event loop
+            render = partial(
+                asyncio.to_thread, self._pillow_renderer().render, card_context, format
+            )
+        else:
+            # Render HTML to screenshot in the browser
+            html = await self._render_html(listing, style, size)
+            render = partial(self._html_to_image, html, format, size)
 
         # Convert to image
         try:
-            image_bytes = await self._html_to_image(html, format, size)
+            image_bytes = await render()
             logger.info(
                 f"Generated {format.upper()} card for listing {listing_id} "
                 f"({style}/{size}): {len(image_bytes)} bytes"
@@ -267,11 +232,13 @@ class ImageGenerationService:
 
         # Cache the image
         if image_bytes:
-            await self.cache_image(listing_id, style, format, size, image_bytes)
+            await self.cache_image(
+                listing_id, style, format, size, image_bytes, content_hash=content_hash
+            )
 
         return image_bytes
 
-    async def _load_listing(self, listing_id: int) -> Optional[Listing]:
+    async def _load_listing(self, listing_id: int) -> Listing | None:
         """Load listing with related data.
 
         Args:
@@ -300,13 +267,38 @@ class ImageGenerationService:
         Returns:
             Rendered HTML string
         """
+        template = self.jinja_env.get_template(CARD_TEMPLATE)
+        return await template.render_async(**self._card_context(listing, style, size))
+
+    def _uses_pillow(self, size: str) -> bool:
+        """Whether cards of this size preset are drawn with Pillow."""
+        return size in self.settings.cards.pillow_sizes
+
+    def _pillow_renderer(self):
+        return get_pillow_renderer(self.settings.cards.font_dir)
+
+    def _content_hash(self, card_context: dict[str, Any], size: str) -> str:
+        """Cache hash of a card: its context plus the renderer that draws it."""
+        source = PILLOW_RENDERER_SOURCE if self._uses_pillow(size) else TEMPLATE_DIR / CARD_TEMPLATE
+        return card_content_hash(card_context, source)
+
+    def _card_context(self, listing: Listing, style: str, size: str) -> dict[str, Any]:
+        """Build the card template context (also the input to the content hash).
+
+        Args:
+            listing: Listing instance
+            style: Card theme
+            size: Card size preset
+
+        Returns:
+            Template context dict
+        """
         dimensions = CARD_DIMENSIONS[size]
 
         # Determine valuation tier
         valuation_tier = self._get_valuation_tier(listing)
 
-        # Prepare template context
-        context = {
+        return {
             "title": listing.title[:60],  # Truncate for readability
             "price": f"{listing.price_usd:.0f}" if listing.price_usd else "N/A",
             "adjusted_price": (
@@ -314,7 +306,7 @@ class ImageGenerationService:
                 if listing.adjusted_price_usd and listing.adjusted_price_usd != listing.price_usd
                 else None
             ),
-            "cpu": listing.cpu.model if listing.cpu else None,
+            "cpu": listing.cpu.name if listing.cpu else None,
             "ram": f"{listing.ram_gb}GB" if listing.ram_gb else None,
             "storage": (
                 f"{listing.primary_storage_gb}GB {listing.primary_storage_type or 'SSD'}"
@@ -335,10 +327,7 @@ class ImageGenerationService:
             "qr_code_url": None,  # TODO: Generate QR code in future phase
         }
 
-        template = self.jinja_env.get_template("card_template.html")
-        return await template.render_async(**context)
-
-    def _get_valuation_tier(self, listing: Listing) -> Optional[str]:
+    def _get_valuation_tier(self, listing: Listing) -> str | None:
         """Determine valuation tier based on price difference.
 
         Args:
@@ -386,22 +375,23 @@ class ImageGenerationService:
 
         dimensions = CARD_DIMENSIONS[size]
         browser_pool = await self.get_browser_pool()
-        browser = None
+        context = None
 
         try:
-            browser = await browser_pool.acquire()
-            page = await browser.new_page(
+            context = await browser_pool.acquire(
+                tenant=RENDERING_TENANT,
                 viewport={
                     "width": dimensions["width"],
                     "height": dimensions["height"],
-                }
+                },
             )
+            page = await context.new_page()
 
             # Set content and wait for fonts/images to load
             await page.set_content(html, wait_until="networkidle")
 
             # Small delay to ensure rendering completes
-            await asyncio.sleep(0.5)
+            await asyncio.sleep(RENDER_SETTLE_SECONDS)
 
             # Capture screenshot
             screenshot_bytes = await page.screenshot(
@@ -419,8 +409,188 @@ class ImageGenerationService:
             logger.error("Playwright rendering timeout")
             raise PlaywrightError("Rendering timeout")
         finally:
-            if browser:
-                browser_pool.release()
+            if context:
+                await browser_pool.release(context)
+
+    async def render_cards_batch(
+        self,
+        listings: Sequence[Listing],
+        *,
+        styles: Sequence[str] = CARD_STYLES,
+        sizes: Sequence[str] = tuple(CARD_DIMENSIONS),
+        formats: Sequence[str] = CARD_FORMATS,
+        concurrency: int | None = None,
+        force: bool = False,
+    ) -> BatchRenderResult:
+        """Pre-render and cache every card variant of the given listings.
+
+        The card template is compiled once for the whole batch. Variants
+        whose cached image was rendered from the same content are skipped
+        unless ``force`` is set: the S3 object (if not expired), or the
+        local tier entry when S3 is disabled. Cards of Pillow size presets
+        are drawn in worker threads; the remaining
+        (listing, style, size) cards are spread over ``concurrency`` pages,
+        each held for the whole batch, and every format of a card is
+        captured from the same page load.
+
+        Args:
+            listings: Listings to render (with ``cpu`` loaded)
+            styles: Card themes to render
+            sizes: Card size presets to render
+            formats: Image formats to capture
+            concurrency: Pages rendering at once (defaults to
+                ``settings.playwright.max_concurrent_browsers``)
+            force: Re-render variants whose content is unchanged
+
+        Returns:
+            Per-image rendered/skipped/failed counts
+        """
+        result = BatchRenderResult()
+        cards: list[tuple[Listing, str, str, dict[str, Any], str]] = []
+        for listing in listings:
+            for style in styles:
+                for size in sizes:
+                    try:
+                        context = self._card_context(listing, style, size)
+                        content_hash = self._content_hash(context, size)
+                    except Exception as e:
+                        logger.error(
+                            f"Failed to build card for listing {listing.id} ({style}/{size}): {e}"
+                        )
+                        result.failed += len(formats)
+                        continue
+                    cards.append((listing, style, size, context, content_hash))
+
+        # Look up what is already cached, one blocking HEAD per image in threads
+        stored: Sequence[Sequence[str | None]] = [[None] * len(formats) for _ in cards]
+        if not force and self.s3_client and self.settings.s3.enabled:
+            stored = await asyncio.gather(
+                *(
+                    asyncio.gather(
+                        *(
+                            asyncio.to_thread(
+                                self._s3_cached_hash,
+                                self._get_s3_key(listing.id, style, size, format),
+                            )
+                            for format in formats
+                        )
+                    )
+                    for listing, style, size, _, _ in cards
+                )
+            )
+        elif not force:
+            # Without S3 the local tier is the only record of what is current
+            stored = [
+                [
+                    (
+                        content_hash
+                        if CardCacheKey(listing.id, style, size, format, content_hash)
+                        in self.local_cache
+                        else None
+                    )
+                    for format in formats
+                ]
+                for listing, style, size, _, content_hash in cards
+            ]
+
+        queue: asyncio.Queue[tuple[Listing, str, str, dict[str, Any], str, list[str]]]
+        queue = asyncio.Queue()
+        drawn = []
+        for card, cached_hashes in zip(cards, stored, strict=True):
+            listing, style, size, context, content_hash = card
+            stale = [
+                format
+                for format, cached_hash in zip(formats, cached_hashes, strict=True)
+                if cached_hash != content_hash
+            ]
+            result.skipped += len(formats) - len(stale)
+            if stale and self._uses_pillow(size):
+                drawn.extend(self._draw_and_cache(*card, format, result) for format in stale)
+            elif stale:
+                queue.put_nowait((*card, stale))
+
+        await asyncio.gather(*drawn)
+        if not queue.empty():
+            template = self.jinja_env.get_template(CARD_TEMPLATE)
+            workers = min(
+                concurrency or self.settings.playwright.max_concurrent_browsers, queue.qsize()
+            )
+            browser_pool = await self.get_browser_pool()
+            await asyncio.gather(
+                *(self._batch_worker(browser_pool, template, queue, result) for _ in range(workers))
+            )
+
+        logger.info(
+            f"Batch rendered {result.rendered} card images "
+            f"({result.skipped} unchanged, {result.failed} failed)"
+        )
+        return result
+
+    async def _draw_and_cache(
+        self,
+        listing: Listing,
+        style: str,
+        size: str,
+        card_context: dict[str, Any],
+        content_hash: str,
+        format: str,
+        result: BatchRenderResult,
+    ) -> None:
+        """Draw one image with Pillow in a worker thread and cache it."""
+        try:
+            image_bytes = await asyncio.to_thread(
+                self._pillow_renderer().render, card_context, format
+            )
+            await self.cache_image(
+                listing.id, style, format, size, image_bytes, content_hash=content_hash
+            )
+            result.rendered += 1
+        except Exception as e:
+            logger.error(f"Failed to draw card for listing {listing.id} ({style}/{size}): {e}")
+            result.failed += 1
+
+    async def _batch_worker(
+        self,
+        browser_pool: BrowserPool,
+        template: Template,
+        queue: asyncio.Queue,
+        result: BatchRenderResult,
+    ) -> None:
+        """Render queued cards on one page until the queue is drained."""
+        context = await browser_pool.acquire(tenant=RENDERING_TENANT)
+        page = None
+        try:
+            while not queue.empty():
+                listing, style, size, card_context, content_hash, formats = queue.get_nowait()
+                try:
+                    if page is None:
+                        page = await context.new_page()
+                    await page.set_viewport_size(CARD_DIMENSIONS[size])
+                    html = await template.render_async(**card_context)
+                    await page.set_content(html, wait_until="networkidle")
+                    await asyncio.sleep(RENDER_SETTLE_SECONDS)
+                    for format in formats:
+                        image_bytes = await page.screenshot(type=format, full_page=False)
+                        await self.cache_image(
+                            listing.id,
+                            style,
+                            format,
+                            size,
+                            image_bytes,
+                            content_hash=content_hash,
+                        )
+                        result.rendered += 1
+                except Exception as e:
+                    logger.error(
+                        f"Failed to pre-render card for listing {listing.id} ({style}/{size}): {e}"
+                    )
+                    result.failed += len(formats)
+                    # Start the next card on a fresh page
+                    if page is not None:
+                        await asyncio.gather(page.close(), return_exceptions=True)
+                        page = None
+        finally:
+            await browser_pool.release(context)
 
     async def _generate_placeholder(
         self,
@@ -478,52 +648,88 @@ class ImageGenerationService:
         style: str,
         format: str,
         size: str,
-    ) -> Optional[bytes]:
-        """Retrieve cached image from S3.
+        content_hash: str | None = None,
+    ) -> bytes | None:
+        """Retrieve cached image from the local tier, then S3.
 
         Args:
             listing_id: Listing ID
             style: Card theme
             format: Image format
             size: Card size preset
+            content_hash: Hash of the card content; a cached image rendered
+                from different content is treated as a miss
 
         Returns:
-            Image bytes if cached and not expired, None otherwise
+            Image bytes if cached, current and not expired, None otherwise
         """
+        key = CardCacheKey(listing_id, style, size, format, content_hash) if content_hash else None
+        if key is not None and self.local_cache.max_bytes:
+            image_bytes = self.local_cache.get(key)
+            record_lookup("local", "hit" if image_bytes is not None else "miss")
+            if image_bytes is not None:
+                return image_bytes
+
         if not self.s3_client or not self.settings.s3.enabled:
             return None
 
         s3_key = self._get_s3_key(listing_id, style, size, format)
+        image_bytes, result = await asyncio.to_thread(self._s3_get, s3_key, content_hash)
+        record_lookup("s3", result)
+        if image_bytes is not None and key is not None and self.local_cache.max_bytes:
+            self.local_cache.put(key, image_bytes)
+        return image_bytes
 
+    def _s3_get(self, s3_key: str, content_hash: str | None) -> tuple[bytes | None, str]:
+        """Blocking S3 read; returns the image (or None) and the lookup result."""
         try:
             response = self.s3_client.get_object(
                 Bucket=self.settings.s3.bucket_name,
                 Key=s3_key,
             )
 
-            # Check if cache is expired
+            # Check if cache is expired or was rendered from other content
             metadata = response.get("Metadata", {})
             if "expires_at" in metadata:
                 expires_at = datetime.fromisoformat(metadata["expires_at"])
                 if datetime.utcnow() > expires_at:
                     logger.info(f"Cache expired for {s3_key}")
-                    return None
+                    return None, "stale"
+            if content_hash and metadata.get("content_hash") != content_hash:
+                logger.debug(f"Cached content changed for {s3_key}")
+                return None, "stale"
 
             image_bytes = response["Body"].read()
             logger.debug(f"Retrieved cached image from S3: {s3_key}")
-            return image_bytes
+            return image_bytes, "hit"
 
         except ClientError as e:
             error_code = e.response.get("Error", {}).get("Code")
             if error_code == "NoSuchKey":
                 logger.debug(f"Cache miss for {s3_key}")
-            else:
-                logger.warning(f"S3 get error for {s3_key}: {e}")
-            return None
+                return None, "miss"
+            logger.warning(f"S3 get error for {s3_key}: {e}")
+            return None, "error"
         except Exception as e:
             logger.error(f"Unexpected error retrieving from S3: {e}")
+            return None, "error"
+
+    def _s3_cached_hash(self, s3_key: str) -> str | None:
+        """Blocking S3 HEAD; the content hash of a current cached object, if any."""
+        try:
+            response = self.s3_client.head_object(
+                Bucket=self.settings.s3.bucket_name,
+                Key=s3_key,
+            )
+        except (ClientError, BotoCoreError):
             return None
 
+        metadata = response.get("Metadata", {})
+        expires_at = metadata.get("expires_at")
+        if expires_at and datetime.utcnow() > datetime.fromisoformat(expires_at):
+            return None
+        return metadata.get("content_hash")
+
     async def cache_image(
         self,
         listing_id: int,
@@ -531,8 +737,9 @@ class ImageGenerationService:
         format: str,
         size: str,
         image_bytes: bytes,
-    ) -> Optional[str]:
-        """Cache image in S3.
+        content_hash: str | None = None,
+    ) -> str | None:
+        """Cache image in the local tier and in S3.
 
         Args:
             listing_id: Listing ID
@@ -540,10 +747,16 @@ class ImageGenerationService:
             format: Image format
             size: Card size preset
             image_bytes: Image data
+            content_hash: Hash of the card content the image was rendered from
 
         Returns:
             S3 URL if successful, None otherwise
         """
+        if content_hash and self.local_cache.max_bytes:
+            self.local_cache.put(
+                CardCacheKey(listing_id, style, size, format, content_hash), image_bytes
+            )
+
         if not self.s3_client or not self.settings.s3.enabled:
             return None
 
@@ -553,21 +766,25 @@ class ImageGenerationService:
         expires_at = datetime.utcnow() + timedelta(
             seconds=self.settings.s3.cache_ttl_seconds
         )
+        metadata = {
+            "listing_id": str(listing_id),
+            "style": style,
+            "size": size,
+            "format": format,
+            "expires_at": expires_at.isoformat(),
+        }
+        if content_hash:
+            metadata["content_hash"] = content_hash
 
         try:
             # Upload to S3
-            self.s3_client.put_object(
+            await asyncio.to_thread(
+                self.s3_client.put_object,
                 Bucket=self.settings.s3.bucket_name,
                 Key=s3_key,
                 Body=image_bytes,
                 ContentType=f"image/{format}",
-                Metadata={
-                    "listing_id": str(listing_id),
-                    "style": style,
-                    "size": size,
-                    "format": format,
-                    "expires_at": expires_at.isoformat(),
-                },
+                Metadata=metadata,
                 CacheControl=f"max-age={self.settings.s3.cache_ttl_seconds}",
             )
 
@@ -585,7 +802,8 @@ class ImageGenerationService:
         """Invalidate all cached images for a listing.
 
         Deletes all cached variants (styles, sizes, formats) for the
-        given listing. Called when listing is updated.
+        given listing. Called when listing is updated. Other processes'
+        local tiers miss on their own, since the content hash changes.
 
         Args:
             listing_id: Listing ID
@@ -593,9 +811,17 @@ class ImageGenerationService:
         Returns:
             Number of cached images deleted
         """
-        if not self.s3_client or not self.settings.s3.enabled:
-            return 0
+        deleted_count = self.local_cache.discard_listing(listing_id)
+        if self.s3_client and self.settings.s3.enabled:
+            deleted_count += await asyncio.to_thread(self._s3_delete_variants, listing_id)
+
+        if deleted_count > 0:
+            logger.info(f"Invalidated {deleted_count} cached images for listing {listing_id}")
+
+        return deleted_count
 
+    def _s3_delete_variants(self, listing_id: int) -> int:
+        """Blocking S3 delete of every cached variant of a listing."""
         deleted_count = 0
 
         # Generate all possible cache keys
@@ -610,15 +836,7 @@ class ImageGenerationService:
                         )
                         deleted_count += 1
                     except Exception as e:
-                        logger.debug(
-                            f"Failed to delete {s3_key} (may not exist): {e}"
-                        )
-
-        if deleted_count > 0:
-            logger.info(
-                f"Invalidated {deleted_count} cached images for listing {listing_id}"
-            )
-
+                        logger.debug(f"Failed to delete {s3_key} (may not exist): {e}")
         return deleted_count
 
     def _get_s3_key(
@@ -649,7 +867,9 @@ class ImageGenerationService:
 
 __all__ = [
     "ImageGenerationService",
-    "BrowserPool",
+    "BatchRenderResult",
     "CARD_DIMENSIONS",
+    "CARD_FORMATS",
+    "CARD_STYLES",
     "VALUATION_TIERS",
 ]
@@ -0,0 +1,520 @@
+"""Storage for import previews awaiting confirmation.
+
+Previews are written to Redis so any API worker can page through or confirm
+a preview created by another one. Each preview is split into a small header
+(metadata, duplicates and the export minus its rows) and fixed-size pages of
+rows, both zlib-compressed JSON, so a page of a 50k-row collection preview can
+be read without loading the rest. Total size and entry count are capped with
+least-recently-used eviction.
+
+When Redis is unreachable the store degrades to a per-process ``PreviewCache``.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import time
+import zlib
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from typing import Any, Literal
+
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+from ..schemas.export_import import PortableCollectionExport, PortableDealExport
+from ..settings import ImportPreviewSettings, get_settings
+
+logger = logging.getLogger(__name__)
+
+KEY_PREFIX = "import_preview"
+
+# Seconds a worker may hold a confirmation claim before another may retry
+CLAIM_TTL_SECONDS = 600
+
+# Seconds to wait before retrying Redis after a connection failure
+REDIS_RETRY_SECONDS = 30
+
+
+@dataclass
+class ImportPreview:
+    """Preview of an import operation before confirmation.
+
+    Attributes:
+        preview_id: Unique ID for this preview
+        type: Type of import (deal or collection)
+        data: Validated export data
+        duplicates: List of potential duplicate entities
+        created_at: When preview was created
+        expires_at: When preview expires (30 minutes)
+    """
+
+    preview_id: str
+    type: Literal["deal", "collection"]
+    data: PortableDealExport | PortableCollectionExport
+    duplicates: list[DuplicateMatch]
+    created_at: datetime
+    expires_at: datetime
+
+
+@dataclass
+class DuplicateMatch:
+    """Potential duplicate entity match.
+
+    Attributes:
+        entity_id: ID of existing entity
+        entity_type: Type of entity (listing or collection)
+        match_score: Confidence score (0.0-1.0)
+        match_reason: Human-readable explanation
+        entity_data: Partial data for display
+    """
+
+    entity_id: int
+    entity_type: Literal["listing", "collection"]
+    match_score: float
+    match_reason: str
+    entity_data: dict[str, Any]
+
+
+@dataclass
+class PreviewRows:
+    """A page of preview rows (collection items, or the single listing of a deal).
+
+    Attributes:
+        preview_id: Preview the rows belong to
+        offset: Position of the first returned row
+        total: Number of rows in the preview
+        rows: Serialized rows
+    """
+
+    preview_id: str
+    offset: int
+    total: int
+    rows: list[dict[str, Any]]
+
+
+class PreviewCache:
+    """In-memory cache for import previews with TTL and LRU eviction."""
+
+    def __init__(self, ttl_minutes: int = 30, max_entries: int = 200):
+        """Initialize preview cache.
+
+        Args:
+            ttl_minutes: Time-to-live for previews in minutes
+            max_entries: Previews kept before the least recently used is evicted
+        """
+        self._cache: OrderedDict[str, ImportPreview] = OrderedDict()
+        self._ttl_minutes = ttl_minutes
+        self._max_entries = max_entries
+        self._claims: set[str] = set()
+        self._results: dict[str, tuple[int, float]] = {}
+
+    def store(self, preview: ImportPreview) -> str:
+        """Store preview and return preview ID.
+
+        Args:
+            preview: Import preview to store
+
+        Returns:
+            Preview ID
+        """
+        self._cache[preview.preview_id] = preview
+        self._cache.move_to_end(preview.preview_id)
+        self._cleanup_expired()
+        while len(self._cache) > self._max_entries:
+            self._cache.popitem(last=False)
+        return preview.preview_id
+
+    def get(self, preview_id: str) -> ImportPreview | None:
+        """Retrieve preview by ID.
+
+        Args:
+            preview_id: Preview ID
+
+        Returns:
+            ImportPreview if found and not expired, None otherwise
+        """
+        preview = self._cache.get(preview_id)
+        if preview and preview.expires_at > datetime.utcnow():
+            self._cache.move_to_end(preview_id)
+            return preview
+        return None
+
+    def get_rows(self, preview_id: str, offset: int, limit: int) -> PreviewRows | None:
+        """Return ``limit`` rows starting at ``offset``, or None if the preview is gone."""
+        preview = self.get(preview_id)
+        if preview is None:
+            return None
+        _, rows = split_rows(preview)
+        return PreviewRows(preview_id, offset, len(rows), rows[offset : offset + limit])
+
+    def remove(self, preview_id: str) -> None:
+        """Remove preview from cache.
+
+        Args:
+            preview_id: Preview ID
+        """
+        self._cache.pop(preview_id, None)
+
+    def claim(self, preview_id: str) -> bool:
+        """Reserve a preview for confirmation; False if already claimed."""
+        if preview_id in self._claims:
+            return False
+        self._claims.add(preview_id)
+        return True
+
+    def release(self, preview_id: str) -> None:
+        """Drop a confirmation claim after a failed confirmation."""
+        self._claims.discard(preview_id)
+
+    def complete(self, preview_id: str, entity_id: int) -> None:
+        """Record the entity created by a confirmation and drop the preview."""
+        expires = time.monotonic() + self._ttl_minutes * 60
+        self._results[preview_id] = (entity_id, expires)
+        self._claims.discard(preview_id)
+        self.remove(preview_id)
+
+    def completed_entity(self, preview_id: str) -> int | None:
+        """ID of the entity a confirmed preview produced, if any."""
+        result = self._results.get(preview_id)
+        if result is None or result[1] <= time.monotonic():
+            return None
+        return result[0]
+
+    def _cleanup_expired(self) -> None:
+        """Remove expired previews and confirmation results from cache."""
+        now = datetime.utcnow()
+        expired = [pid for pid, p in self._cache.items() if p.expires_at <= now]
+        for pid in expired:
+            self._cache.pop(pid)
+        clock = time.monotonic()
+        for pid in [pid for pid, (_, expires) in self._results.items() if expires <= clock]:
+            self._results.pop(pid)
+
+
+class PreviewStore:
+    """Import previews shared across API workers through Redis.
+
+    Args:
+        redis_client: Optional Redis client (created from settings if omitted)
+        settings: Optional preview settings (loaded from app settings if omitted)
+        fallback: In-process cache used while Redis is unavailable
+    """
+
+    def __init__(
+        self,
+        redis_client: Redis | None = None,
+        settings: ImportPreviewSettings | None = None,
+        fallback: PreviewCache | None = None,
+    ):
+        self._redis_client = redis_client
+        self._settings = settings
+        self._fallback = fallback
+        self._retry_at = 0.0
+
+    @property
+    def settings(self) -> ImportPreviewSettings:
+        if self._settings is None:
+            self._settings = get_settings().import_preview
+        return self._settings
+
+    @property
+    def fallback(self) -> PreviewCache:
+        if self._fallback is None:
+            self._fallback = PreviewCache(
+                ttl_minutes=self.settings.ttl_minutes, max_entries=self.settings.max_entries
+            )
+        return self._fallback
+
+    async def store(self, preview: ImportPreview) -> str:
+        """Store preview and return preview ID.
+
+        Raises:
+            ValueError: If the serialized preview exceeds ``max_preview_bytes``
+        """
+        header, rows = split_rows(preview)
+        page_size = self.settings.page_size
+        meta = _pack(
+            {
+                "preview_id": preview.preview_id,
+                "type": preview.type,
+                "header": header,
+                "duplicates": [asdict(duplicate) for duplicate in preview.duplicates],
+                "created_at": preview.created_at.isoformat(),
+                "expires_at": preview.expires_at.isoformat(),
+                "row_count": len(rows),
+                "page_size": page_size,
+            }
+        )
+        pages = {
+            str(number): _pack(rows[start : start + page_size])
+            for number, start in enumerate(range(0, len(rows), page_size))
+        }
+        size = len(meta) + sum(len(page) for page in pages.values())
+        if size > self.settings.max_preview_bytes:
+            raise ValueError(
+                f"Import preview is too large ({size} bytes compressed, "
+                f"limit {self.settings.max_preview_bytes})"
+            )
+
+        client = await self._client()
+        if client is None:
+            return self.fallback.store(preview)
+
+        ttl = max(1, int((preview.expires_at - datetime.utcnow()).total_seconds()))
+        preview_id = preview.preview_id
+        try:
+            async with client.pipeline(transaction=True) as pipe:
+                pipe.set(self._key(preview_id, "meta"), meta, ex=ttl)
+                pipe.delete(self._key(preview_id, "pages"))
+                if pages:
+                    pipe.hset(self._key(preview_id, "pages"), mapping=pages)
+                    pipe.expire(self._key(preview_id, "pages"), ttl)
+                pipe.zadd(self._key("lru"), {preview_id: time.time()})
+                pipe.hset(self._key("sizes"), preview_id, size)
+                await pipe.execute()
+            await self._evict(client)
+        except RedisError as exc:
+            self._mark_unavailable(exc)
+            return self.fallback.store(preview)
+        return preview_id
+
+    async def get(self, preview_id: str) -> ImportPreview | None:
+        """Retrieve the full preview, or None if missing or expired."""
+        client = await self._client()
+        if client is None:
+            return self.fallback.get(preview_id)
+        try:
+            meta = await self._meta(client, preview_id)
+            if meta is None:
+                return None
+            page_count = -(-meta["row_count"] // meta["page_size"])
+            rows = await self._read_pages(client, preview_id, range(page_count))
+        except RedisError as exc:
+            self._mark_unavailable(exc)
+            return self.fallback.get(preview_id)
+        if rows is None:
+            return None
+
+        expires_at = datetime.fromisoformat(meta["expires_at"])
+        if expires_at <= datetime.utcnow():
+            return None
+        return ImportPreview(
+            preview_id=meta["preview_id"],
+            type=meta["type"],
+            data=join_rows(meta["type"], meta["header"], rows),
+            duplicates=[DuplicateMatch(**duplicate) for duplicate in meta["duplicates"]],
+            created_at=datetime.fromisoformat(meta["created_at"]),
+            expires_at=expires_at,
+        )
+
+    async def get_rows(self, preview_id: str, offset: int, limit: int) -> PreviewRows | None:
+        """Read ``limit`` rows starting at ``offset`` without loading the whole preview."""
+        client = await self._client()
+        if client is None:
+            return self.fallback.get_rows(preview_id, offset, limit)
+        try:
+            meta = await self._meta(client, preview_id)
+            if meta is None:
+                return None
+            total, page_size = meta["row_count"], meta["page_size"]
+            end = min(offset + limit, total)
+            if offset >= end:
+                return PreviewRows(preview_id, offset, total, [])
+            first_page = offset // page_size
+            rows = await self._read_pages(
+                client, preview_id, range(first_page, (end - 1) // page_size + 1)
+            )
+        except RedisError as exc:
+            self._mark_unavailable(exc)
+            return self.fallback.get_rows(preview_id, offset, limit)
+        if rows is None:
+            return None
+        start = offset - first_page * page_size
+        return PreviewRows(preview_id, offset, total, rows[start : start + end - offset])
+
+    async def remove(self, preview_id: str) -> None:
+        """Remove a preview."""
+        client = await self._client()
+        if client is None:
+            self.fallback.remove(preview_id)
+            return
+        try:
+            await self._delete(client, [preview_id])
+        except RedisError as exc:
+            self._mark_unavailable(exc)
+            self.fallback.remove(preview_id)
+
+    async def claim(self, preview_id: str) -> bool:
+        """Reserve a preview for confirmation; False if another request holds it."""
+        client = await self._client()
+        if client is None:
+            return self.fallback.claim(preview_id)
+        try:
+            return bool(
+                await client.set(self._key(preview_id, "claim"), 1, nx=True, ex=CLAIM_TTL_SECONDS)
+            )
+        except RedisError as exc:
+            self._mark_unavailable(exc)
+            return self.fallback.claim(preview_id)
+
+    async def release(self, preview_id: str) -> None:
+        """Drop a confirmation claim so the preview can be confirmed again."""
+        client = await self._client()
+        if client is None:
+            self.fallback.release(preview_id)
+            return
+        try:
+            await client.delete(self._key(preview_id, "claim"))
+        except RedisError as exc:
+            self._mark_unavailable(exc)
+            self.fallback.release(preview_id)
+
+    async def complete(self, preview_id: str, entity_id: int) -> None:
+        """Record the entity a confirmation produced and drop the preview data.
+
+        Repeated confirmations of the same preview return this entity instead
+        of importing twice.
+        """
+        client = await self._client()
+        if client is None:
+            self.fallback.complete(preview_id, entity_id)
+            return
+        try:
+            await client.set(
+                self._key(preview_id, "result"), entity_id, ex=self.settings.ttl_minutes * 60
+            )
+            await self._delete(client, [preview_id])
+        except RedisError as exc:
+            self._mark_unavailable(exc)
+            self.fallback.complete(preview_id, entity_id)
+
+    async def completed_entity(self, preview_id: str) -> int | None:
+        """ID of the entity a confirmed preview produced, if any."""
+        client = await self._client()
+        if client is None:
+            return self.fallback.completed_entity(preview_id)
+        try:
+            value = await client.get(self._key(preview_id, "result"))
+        except RedisError as exc:
+            self._mark_unavailable(exc)
+            return self.fallback.completed_entity(preview_id)
+        return int(value) if value is not None else None
+
+    async def _client(self) -> Redis | None:
+        if self._redis_client is None:
+            if time.monotonic() < self._retry_at:
+                return None
+            try:
+                client = Redis.from_url(get_settings().redis_url)
+                await client.ping()
+            except (RedisError, OSError) as exc:
+                self._mark_unavailable(exc)
+                return None
+            self._redis_client = client
+        return self._redis_client
+
+    def _mark_unavailable(self, exc: Exception) -> None:
+        logger.warning(f"Import preview store falling back to process memory: {exc}")
+        self._redis_client = None
+        self._retry_at = time.monotonic() + REDIS_RETRY_SECONDS
+
+    async def _meta(self, client: Redis, preview_id: str) -> dict[str, Any] | None:
+        raw = await client.get(self._key(preview_id, "meta"))
+        if raw is None:
+            return None
+        await client.zadd(self._key("lru"), {preview_id: time.time()}, xx=True)
+        return _unpack(raw)
+
+    async def _read_pages(
+        self, client: Redis, preview_id: str, numbers: range
+    ) -> list[dict[str, Any]] | None:
+        if not numbers:
+            return []
+        pages = await client.hmget(self._key(preview_id, "pages"), [str(n) for n in numbers])
+        if any(page is None for page in pages):
+            return None
+        return [row for page in pages for row in _unpack(page)]
+
+    async def _evict(self, client: Redis) -> None:
+        """Drop expired entries, then least recently used ones until under the caps."""
+        ids = [_text(value) for value in await client.zrange(self._key("lru"), 0, -1)]
+        if not ids:
+            return
+        sizes = {
+            _text(key): int(value)
+            for key, value in (await client.hgetall(self._key("sizes"))).items()
+        }
+        async with client.pipeline(transaction=False) as pipe:
+            for preview_id in ids:
+                pipe.exists(self._key(preview_id, "meta"))
+            alive = await pipe.execute()
+
+        evict = [preview_id for preview_id, exists in zip(ids, alive, strict=True) if not exists]
+        live = [preview_id for preview_id, exists in zip(ids, alive, strict=True) if exists]
+        total = sum(sizes.get(preview_id, 0) for preview_id in live)
+        while live and (
+            len(live) > self.settings.max_entries or total > self.settings.max_total_bytes
+        ):
+            oldest = live.pop(0)
+            total -= sizes.get(oldest, 0)
+            evict.append(oldest)
+        if evict:
+            logger.debug(f"Evicting {len(evict)} import previews")
+            await self._delete(client, evict)
+
+    async def _delete(self, client: Redis, preview_ids: list[str]) -> None:
+        async with client.pipeline(transaction=True) as pipe:
+            for preview_id in preview_ids:
+                pipe.delete(self._key(preview_id, "meta"), self._key(preview_id, "pages"))
+            pipe.zrem(self._key("lru"), *preview_ids)
+            pipe.hdel(self._key("sizes"), *preview_ids)
+            await pipe.execute()
+
+    @staticmethod
+    def _key(*parts: str) -> str:
+        return ":".join((KEY_PREFIX, *parts))
+
+
+def split_rows(preview: ImportPreview) -> tuple[dict[str, Any], list[dict[str, Any]]]:
+    """Split a preview's export into its header and its rows."""
+    header = preview.data.model_dump(mode="json")
+    if preview.type == "collection":
+        rows = header["data"].pop("items")
+    else:
+        rows = [header["data"].pop("listing")]
+    return header, rows
+
+
+def join_rows(
+    preview_type: str, header: dict[str, Any], rows: list[dict[str, Any]]
+) -> PortableDealExport | PortableCollectionExport:
+    """Inverse of ``split_rows``."""
+    if preview_type == "collection":
+        header["data"]["items"] = rows
+        return PortableCollectionExport.model_validate(header)
+    header["data"]["listing"] = rows[0]
+    return PortableDealExport.model_validate(header)
+
+
+def _pack(value: Any) -> bytes:
+    return zlib.compress(json.dumps(value, separators=(",", ":")).encode("utf-8"))
+
+
+def _unpack(value: bytes) -> Any:
+    return json.loads(zlib.decompress(value))
+
+
+def _text(value: bytes | str) -> str:
+    return value.decode("utf-8") if isinstance(value, bytes) else value
+
+
+__all__ = [
+    "DuplicateMatch",
+    "ImportPreview",
+    "PreviewCache",
+    "PreviewRows",
+    "PreviewStore",
+]
@@ -10,6 +10,7 @@ from .cpu_matcher import CpuMatcher
 from .validators import ImportValidator
 from .builders import SeedBuilder, ValueExtractor, ValueParser
 from .preview_builder import PreviewBuilder
+from .chunk_writer import ChunkWriter
 
 __all__ = [
     # Main service
@@ -24,4 +25,5 @@ __all__ = [
     "ValueExtractor",
     "ValueParser",
     "PreviewBuilder",
+    "ChunkWriter",
 ]
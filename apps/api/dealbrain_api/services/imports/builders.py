@@ -328,6 +328,7 @@ class SeedBuilder:
         component_overrides: Mapping[int, dict[str, Any]],
         cpu_lookup: Mapping[str, int],
         gpu_lookup: Mapping[str, int],
+        row_offset: int = 0,
     ) -> list[ListingCreate]:
         """
         Build listing schema objects from a DataFrame.
@@ -338,6 +339,7 @@ class SeedBuilder:
             component_overrides: Component assignment overrides
             cpu_lookup: CPU name -> ID lookup
             gpu_lookup: GPU name -> ID lookup
+            row_offset: Sheet position of the DataFrame's first row (for chunks)
 
         Returns:
             List of ListingCreate schemas
@@ -370,7 +372,7 @@ class SeedBuilder:
                 ValueExtractor.extract_value(row, field_mappings, "condition")
             )
 
-            override = component_overrides.get(index, {})
+            override = component_overrides.get(row_offset + index, {})
             match_data = match_lookup.get(index)
             cpu_assignment = CpuMatcher.resolve_cpu_assignment(override, match_data)
             cpu_id = cpu_lookup.get(normalize_text(cpu_assignment)) if cpu_assignment else None
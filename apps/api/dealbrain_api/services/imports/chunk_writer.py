@@ -0,0 +1,150 @@
+"""Set-based persistence for streamed import chunks."""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from typing import Any
+
+from dealbrain_core.schemas import ListingCreate, SpreadsheetSeed
+from pydantic import BaseModel
+from sqlalchemy import insert, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ...models.core import Cpu, Gpu, Listing, Profile
+from ..listings import (
+    apply_listing_metrics,
+    create_listings,
+    sync_listings_components,
+    update_listings,
+)
+
+
+class ChunkWriter:
+    """
+    Persists seed chunks with one lookup query per entity instead of one per row.
+
+    Mirrors ``apply_seed`` for CPUs, GPUs and listings: records are matched by
+    name (title for listings), fields left empty in the sheet never overwrite
+    stored values, and later rows win over earlier ones.
+    """
+
+    @staticmethod
+    async def write(session: AsyncSession, seed: SpreadsheetSeed) -> None:
+        """
+        Persist the CPUs, GPUs and listings of a seed chunk.
+
+        Args:
+            session: Database session (one per chunk keeps the identity map small)
+            seed: Seed built from one chunk of sheet rows
+        """
+        await ChunkWriter.upsert_catalog(session, Cpu, seed.cpus)
+        await ChunkWriter.upsert_catalog(session, Gpu, seed.gpus)
+        await ChunkWriter.write_listings(session, seed.listings)
+
+    @staticmethod
+    async def upsert_catalog(
+        session: AsyncSession,
+        model: type[Cpu] | type[Gpu] | type[Profile],
+        items: Sequence[BaseModel],
+    ) -> int:
+        """
+        Insert or update catalog rows keyed by name.
+
+        Args:
+            session: Database session
+            model: Cpu, Gpu or Profile
+            items: CpuCreate/GpuCreate/ProfileCreate schemas
+
+        Returns:
+            Number of distinct catalog entries written
+        """
+        rows: dict[str, dict[str, Any]] = {}
+        for item in items:
+            data = item.model_dump(exclude_none=True)
+            # Map 'attributes' to 'attributes_json' for SQLAlchemy model
+            if "attributes" in data:
+                data["attributes_json"] = data.pop("attributes")
+            rows.setdefault(data["name"], {}).update(data)
+        if not rows:
+            return 0
+
+        result = await session.execute(
+            select(model.id, model.name).where(model.name.in_(list(rows)))
+        )
+        existing = {name: item_id for item_id, name in result.all()}
+
+        updates = [
+            {"id": existing[name], **data} for name, data in rows.items() if name in existing
+        ]
+        inserts = [data for name, data in rows.items() if name not in existing]
+        if updates:
+            await session.execute(update(model), updates)
+        if inserts:
+            await session.execute(insert(model), inserts)
+        return len(rows)
+
+    @staticmethod
+    async def write_listings(session: AsyncSession, listings: Sequence[ListingCreate]) -> int:
+        """
+        Create or update listings matched by title.
+
+        Existing listings are loaded with a single ``IN`` query, rows sharing a
+        title are merged (later rows win), and the chunk is written with one
+        insert flush, one update flush and one component sync. Payloads,
+        components and events are handled as for single-listing writes;
+        valuation (``apply_listing_metrics``) still runs per listing.
+
+        Args:
+            session: Database session
+            listings: Listing schemas
+
+        Returns:
+            Number of listings written
+        """
+        if not listings:
+            return 0
+
+        rows: dict[str, tuple[dict[str, Any], list[dict[str, Any]]]] = {}
+        for listing in listings:
+            payload = listing.model_dump(exclude={"components"}, exclude_none=True)
+            components_payload = [
+                component.model_dump(exclude_none=True) for component in (listing.components or [])
+            ]
+            if listing.title in rows:
+                payload = {**rows[listing.title][0], **payload}
+            rows[listing.title] = (payload, components_payload)
+
+        result = await session.execute(
+            select(Listing).where(Listing.title.in_(list(rows))).order_by(Listing.id)
+        )
+        existing: dict[str, Listing] = {}
+        for row in result.scalars():
+            existing.setdefault(row.title, row)
+
+        targets = await update_listings(
+            session,
+            [
+                (existing[title], payload)
+                for title, (payload, _) in rows.items()
+                if title in existing
+            ],
+        )
+        targets += await create_listings(
+            session, [payload for title, (payload, _) in rows.items() if title not in existing]
+        )
+        by_title = {target.title: target for target in targets}
+        await sync_listings_components(
+            session,
+            {
+                by_title[title].id: components_payload
+                for title, (_, components_payload) in rows.items()
+            },
+        )
+        for target in targets:
+            await apply_listing_metrics(session, target)
+
+        await session.flush()
+        return len(listings)
+
+
+__all__ = ["ChunkWriter"]
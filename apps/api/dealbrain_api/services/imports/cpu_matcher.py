@@ -6,10 +6,10 @@ from typing import Any, Mapping
 
 from pandas import DataFrame
 from rapidfuzz import fuzz, process
-from sqlalchemy import select
+from sqlalchemy import func, insert, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from ...models.core import Cpu, Gpu, ImportSession
+from ...models.core import Cpu, ImportSession
 from .utils import normalize_text
 
 
@@ -21,19 +21,19 @@ class CpuMatcher:
         """
         Load all CPUs into a normalized name -> ID lookup.
 
+        Served from the shared catalog index, so repeated imports do not
+        reload the CPU table unless the catalog changed.
+
         Args:
             db: Database session
 
         Returns:
             Dictionary mapping normalized CPU names to CPU IDs
         """
-        result = await db.execute(select(Cpu.id, Cpu.name))
-        lookup: dict[str, int] = {}
-        for cpu_id, name in result.all():
-            if not name:
-                continue
-            lookup[normalize_text(str(name))] = cpu_id
-        return lookup
+        from ..catalog_index import get_catalog_index
+
+        index = await get_catalog_index(db)
+        return dict(index.cpus.name_lookup)
 
     @staticmethod
     async def load_gpu_lookup(db: AsyncSession) -> dict[str, int]:
@@ -46,13 +46,10 @@ class CpuMatcher:
         Returns:
             Dictionary mapping normalized GPU names to GPU IDs
         """
-        result = await db.execute(select(Gpu.id, Gpu.name))
-        lookup: dict[str, int] = {}
-        for gpu_id, name in result.all():
-            if not name:
-                continue
-            lookup[normalize_text(str(name))] = gpu_id
-        return lookup
+        from ..catalog_index import get_catalog_index
+
+        index = await get_catalog_index(db)
+        return dict(index.gpus.name_lookup)
 
     @staticmethod
     async def load_cpu_names(db: AsyncSession) -> list[str]:
@@ -65,8 +62,10 @@ class CpuMatcher:
         Returns:
             List of CPU names
         """
-        result = await db.execute(select(Cpu.name))
-        return [row[0] for row in result.all() if row[0]]
+        from ..catalog_index import get_catalog_index
+
+        index = await get_catalog_index(db)
+        return list(index.cpus.names)
 
     @staticmethod
     def match_components(
@@ -94,6 +93,8 @@ class CpuMatcher:
         values = dataframe[column].fillna("").astype(str).tolist()
         matches: list[dict[str, Any]] = []
         iterable = values if limit is None else values[:limit]
+        # Spreadsheets repeat the same CPU on many rows; score each distinct value once
+        suggestion_cache: dict[str, list[tuple[str, float, int]]] = {}
 
         for idx, value in enumerate(iterable):
             normalized = value.strip()
@@ -108,7 +109,10 @@ class CpuMatcher:
                 )
                 continue
 
-            suggestions = process.extract(normalized, cpu_names, scorer=fuzz.WRatio, limit=3)
+            suggestions = suggestion_cache.get(normalized)
+            if suggestions is None:
+                suggestions = process.extract(normalized, cpu_names, scorer=fuzz.WRatio, limit=3)
+                suggestion_cache[normalized] = suggestions
             structured = [
                 {"match": suggestion[0], "confidence": round(suggestion[1] / 100, 4)}
                 for suggestion in suggestions
@@ -141,6 +145,7 @@ class CpuMatcher:
         *,
         component_overrides: Mapping[int, dict[str, Any]],
         cpu_lookup: Mapping[str, int],
+        row_offset: int = 0,
     ) -> list[dict[str, Any]]:
         """
         Identify CPUs that need to be auto-created.
@@ -150,6 +155,7 @@ class CpuMatcher:
             field_mappings: Field mapping configuration
             component_overrides: User overrides for component assignments
             cpu_lookup: Existing CPU name -> ID lookup
+            row_offset: Sheet position of the DataFrame's first row (for chunks)
 
         Returns:
             List of missing CPU entries to create
@@ -168,7 +174,7 @@ class CpuMatcher:
         records = dataframe.fillna("").to_dict(orient="records")
 
         for index, row in enumerate(records):
-            override = component_overrides.get(index)
+            override = component_overrides.get(row_offset + index)
             match_data = match_lookup.get(index)
             candidate = None
 
@@ -200,7 +206,7 @@ class CpuMatcher:
 
             missing[normalized] = {
                 "name": candidate,
-                "row_index": index,
+                "row_index": row_offset + index,
                 "manufacturer": CpuMatcher._guess_cpu_manufacturer(candidate),
             }
 
@@ -253,41 +259,50 @@ class CpuMatcher:
         """
         Auto-create CPU records for missing components.
 
+        Names already in the catalog are matched case-insensitively in one
+        query (served by the ``lower(name)`` index) and the remaining CPUs are
+        inserted in a single statement.
+
         Args:
             db: Database session
             entries: List of missing CPU entries to create
             import_session: Import session for audit trail
 
         Returns:
-            List of created CPU records
+            List of created CPU records, in entry order
         """
-        created: list[Cpu] = []
+        pending: dict[str, dict[str, Any]] = {}
         for entry in entries:
             name = entry.get("name")
-            if not name:
-                continue
+            if name:
+                pending.setdefault(name.lower(), entry)
+        if not pending:
+            return []
 
-            existing = await db.scalar(select(Cpu).where(Cpu.name.ilike(name)))
-            if existing:
-                continue
+        lowered_name = func.lower(Cpu.name)
+        existing = await db.scalars(select(lowered_name).where(lowered_name.in_(list(pending))))
+        for name in existing:
+            pending.pop(name, None)
+        if not pending:
+            return []
 
-            cpu = Cpu(
-                name=name,
-                manufacturer=entry.get("manufacturer") or "Unknown",
-                attributes_json={
+        rows = [
+            {
+                "name": entry["name"],
+                "manufacturer": entry.get("manufacturer") or "Unknown",
+                "attributes_json": {
                     "auto_created_from_import": str(import_session.id),
                     "source_row_index": entry.get("row_index"),
                 },
-            )
-            db.add(cpu)
-            await db.flush()
-            await db.refresh(cpu)
-            created.append(cpu)
-
-        if created:
-            await db.commit()
-
-        return created
+            }
+            for entry in pending.values()
+        ]
+        # RETURNING order is not guaranteed for multi-row inserts; restore it by name
+        inserted = {
+            cpu.name.lower(): cpu for cpu in await db.scalars(insert(Cpu).returning(Cpu), rows)
+        }
+        await db.commit()
+        return [inserted[name] for name in pending]
 
     @staticmethod
     def resolve_cpu_assignment(
@@ -2,24 +2,32 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterator
 from copy import deepcopy
 from pathlib import Path
 from typing import Any, Mapping
 from uuid import uuid4
 
+from dealbrain_core.schemas import SpreadsheetSeed
 from fastapi import UploadFile
+from pandas import DataFrame
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from ...db import session_scope
 from ...models.core import CustomFieldDefinition, ImportSession, ImportSessionAudit
 from ...seeds import apply_seed
 from ...settings import Settings, get_settings
 from .builders import SeedBuilder
+from .chunk_writer import ChunkWriter
 from .cpu_matcher import CpuMatcher
 from .preview_builder import PreviewBuilder
 from .schema_mapper import SchemaMapper
-from .utils import checksum_bytes, ensure_directory
+from .utils import checksum_bytes, ensure_directory, normalize_text
 from .validators import ImportValidator
-from .workbook_parser import WorkbookParser
+from .workbook_parser import DEFAULT_CHUNK_SIZE, WorkbookParser
+
+# Sheets with at least this many rows are committed in streaming mode
+STREAMING_ROW_THRESHOLD = 10_000
 
 
 class ImportSessionService:
@@ -33,6 +41,7 @@ class ImportSessionService:
     - CpuMatcher: Component matching and auto-creation
     - ImportValidator: Conflict detection and validation
     - SeedBuilder: Entity seed construction
+    - ChunkWriter: Set-based persistence for streamed chunks
     """
 
     def __init__(self, settings: Settings | None = None) -> None:
@@ -216,6 +225,8 @@ class ImportSessionService:
         *,
         conflict_resolutions: Mapping[str, str],
         component_overrides: Mapping[int, dict[str, Any]],
+        streaming: bool | None = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
     ) -> tuple[dict[str, int], list[str]]:
         """
         Commit the import session and apply data to the database.
@@ -225,6 +236,9 @@ class ImportSessionService:
             import_session: Import session to commit
             conflict_resolutions: User resolutions for detected conflicts
             component_overrides: Component assignment overrides by row index
+            streaming: Read and persist mapped sheets in row chunks; by default
+                enabled when a mapped sheet has ``STREAMING_ROW_THRESHOLD`` rows
+            chunk_size: Rows per chunk in streaming mode
 
         Returns:
             Tuple of (entity counts, auto-created CPU names)
@@ -232,6 +246,17 @@ class ImportSessionService:
         Raises:
             ValueError: If conflicts are unresolved or data is invalid
         """
+        if streaming is None:
+            streaming = self._should_stream(import_session)
+        if streaming:
+            return await self._commit_streaming(
+                db,
+                import_session,
+                conflict_resolutions=conflict_resolutions,
+                component_overrides=component_overrides,
+                chunk_size=chunk_size,
+            )
+
         workbook = WorkbookParser.load_workbook(Path(import_session.upload_path))
         ImportValidator.validate_conflicts(import_session.conflicts_json, conflict_resolutions)
 
@@ -261,7 +286,9 @@ class ImportSessionService:
                     )
                     if created_cpus:
                         auto_created_cpus = [cpu.name for cpu in created_cpus]
-                        cpu_lookup = await CpuMatcher.load_cpu_lookup(db)
+                        cpu_lookup.update(
+                            (normalize_text(cpu.name), cpu.id) for cpu in created_cpus
+                        )
                         self._record_audit(
                             db,
                             import_session,
@@ -301,6 +328,171 @@ class ImportSessionService:
 
         return counts, auto_created_cpus
 
+    async def _commit_streaming(
+        self,
+        db: AsyncSession,
+        import_session: ImportSession,
+        *,
+        conflict_resolutions: Mapping[str, str],
+        component_overrides: Mapping[int, dict[str, Any]],
+        chunk_size: int,
+    ) -> tuple[dict[str, int], list[str]]:
+        """
+        Commit an import session chunk by chunk with constant memory.
+
+        Mapped sheets are read ``chunk_size`` rows at a time; each chunk is
+        mapped to seed schemas and persisted by ``ChunkWriter`` in its own
+        transaction, so memory does not grow with the sheet size.
+
+        Args:
+            db: Database session
+            import_session: Import session to commit
+            conflict_resolutions: User resolutions for detected conflicts
+            component_overrides: Component assignment overrides by row index
+            chunk_size: Rows per chunk
+
+        Returns:
+            Tuple of (entity counts, auto-created CPU names)
+
+        Raises:
+            ValueError: If conflicts are unresolved or data is invalid
+        """
+        path = Path(import_session.upload_path)
+        mappings = import_session.mappings_json or {}
+        ImportValidator.validate_conflicts(import_session.conflicts_json, conflict_resolutions)
+
+        cpu_lookup = await CpuMatcher.load_cpu_lookup(db)
+        gpu_lookup = await CpuMatcher.load_gpu_lookup(db)
+
+        # Auto-create missing CPUs in one pass over the listing sheet
+        auto_created_cpus: list[str] = []
+        listing_mapping = mappings.get("listing")
+        listing_fields = listing_mapping.get("fields", {}) if listing_mapping else {}
+        missing_cpu_entries: dict[str, dict[str, Any]] = {}
+        for row_offset, chunk in self._iter_mapped_chunks(path, listing_mapping, chunk_size):
+            for entry in CpuMatcher.collect_missing_cpus(
+                chunk,
+                listing_fields,
+                component_overrides=component_overrides,
+                cpu_lookup=cpu_lookup,
+                row_offset=row_offset,
+            ):
+                missing_cpu_entries.setdefault(normalize_text(entry["name"]), entry)
+        if missing_cpu_entries:
+            created_cpus = await CpuMatcher.auto_create_cpus(
+                db,
+                entries=list(missing_cpu_entries.values()),
+                import_session=import_session,
+            )
+            if created_cpus:
+                auto_created_cpus = [cpu.name for cpu in created_cpus]
+                cpu_lookup.update((normalize_text(cpu.name), cpu.id) for cpu in created_cpus)
+                self._record_audit(
+                    db,
+                    import_session,
+                    event="cpu_auto_created",
+                    payload={"cpus": auto_created_cpus},
+                )
+
+        counts = {
+            "cpus": 0,
+            "gpus": 0,
+            "valuation_rules": 0,
+            "ports_profiles": 0,
+            "listings": 0,
+        }
+
+        # Small reference data (profiles, ports profiles) goes through apply_seed
+        ports_profiles = []
+        for _, chunk in self._iter_mapped_chunks(path, mappings.get("ports_profile"), chunk_size):
+            ports_profiles.extend(
+                SeedBuilder.build_ports_profiles(chunk, mappings["ports_profile"].get("fields", {}))
+            )
+        reference_seed = SpreadsheetSeed(
+            profiles=SeedBuilder.default_profiles(),
+            ports_profiles=ports_profiles or SeedBuilder.default_ports_profiles(),
+        )
+        await apply_seed(reference_seed)
+        counts["ports_profiles"] = len(reference_seed.ports_profiles)
+
+        cpu_mapping = mappings.get("cpu")
+        for _, chunk in self._iter_mapped_chunks(path, cpu_mapping, chunk_size):
+            seed = SpreadsheetSeed(
+                cpus=SeedBuilder.build_cpus(
+                    chunk, cpu_mapping.get("fields", {}), conflict_resolutions
+                )
+            )
+            async with session_scope() as session:
+                await ChunkWriter.write(session, seed)
+            counts["cpus"] += len(seed.cpus)
+
+        gpu_mapping = mappings.get("gpu")
+        for _, chunk in self._iter_mapped_chunks(path, gpu_mapping, chunk_size):
+            seed = SpreadsheetSeed(
+                gpus=SeedBuilder.build_gpus(chunk, gpu_mapping.get("fields", {}))
+            )
+            async with session_scope() as session:
+                await ChunkWriter.write(session, seed)
+            counts["gpus"] += len(seed.gpus)
+
+        # Valuation rules are counted but not persisted, as in apply_seed
+        rules_mapping = mappings.get("valuation_rule")
+        for _, chunk in self._iter_mapped_chunks(path, rules_mapping, chunk_size):
+            counts["valuation_rules"] += len(
+                SeedBuilder.build_rules(chunk, rules_mapping.get("fields", {}))
+            )
+
+        for row_offset, chunk in self._iter_mapped_chunks(path, listing_mapping, chunk_size):
+            seed = SpreadsheetSeed(
+                listings=SeedBuilder.build_listings(
+                    chunk,
+                    listing_fields,
+                    component_overrides=component_overrides,
+                    cpu_lookup=cpu_lookup,
+                    gpu_lookup=gpu_lookup,
+                    row_offset=row_offset,
+                )
+            )
+            async with session_scope() as session:
+                await ChunkWriter.write(session, seed)
+            counts["listings"] += len(seed.listings)
+
+        import_session.status = "completed"
+        import_session.conflicts_json = {}
+        self._record_audit(
+            db,
+            import_session,
+            event="commit_success",
+            payload={**counts, "auto_created_cpus": auto_created_cpus, "streaming": True},
+        )
+        await db.flush()
+
+        return counts, auto_created_cpus
+
+    @staticmethod
+    def _should_stream(import_session: ImportSession) -> bool:
+        """Whether any mapped sheet is large enough for a streaming commit."""
+        mapped_sheets = {
+            config.get("sheet") for config in (import_session.mappings_json or {}).values()
+        }
+        return any(
+            meta.get("sheet_name") in mapped_sheets
+            and (meta.get("row_count") or 0) >= STREAMING_ROW_THRESHOLD
+            for meta in import_session.sheet_meta_json or []
+        )
+
+    @staticmethod
+    def _iter_mapped_chunks(
+        path: Path,
+        mapping: Mapping[str, Any] | None,
+        chunk_size: int,
+    ) -> Iterator[tuple[int, DataFrame]]:
+        """Chunks of the sheet an entity is mapped to (nothing if unmapped or missing)."""
+        sheet = mapping.get("sheet") if mapping else None
+        if not sheet or sheet not in WorkbookParser.sheet_names(path):
+            return iter(())
+        return WorkbookParser.iter_sheet_chunks(path, sheet, chunk_size=chunk_size)
+
     async def attach_custom_field(
         self,
         db: AsyncSession,
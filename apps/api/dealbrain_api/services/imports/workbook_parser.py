@@ -2,11 +2,20 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterator
 from pathlib import Path
+from typing import Any
 
+import numpy as np
 import pandas as pd
 from pandas import DataFrame
 
+EXCEL_SUFFIXES = {".xlsx", ".xlsm", ".xls"}
+TEXT_SUFFIXES = {".csv", ".tsv"}
+
+# Rows per DataFrame yielded by the streaming readers
+DEFAULT_CHUNK_SIZE = 2000
+
 
 class WorkbookParser:
     """Handles parsing of Excel and CSV files into normalized DataFrames."""
@@ -26,9 +35,9 @@ class WorkbookParser:
             ValueError: If file type is not supported
         """
         suffix = path.suffix.lower()
-        if suffix in {".xlsx", ".xlsm", ".xls"}:
+        if suffix in EXCEL_SUFFIXES:
             sheets = pd.read_excel(path, sheet_name=None, dtype=object)
-        elif suffix in {".csv", ".tsv"}:
+        elif suffix in TEXT_SUFFIXES:
             sep = "," if suffix == ".csv" else "\t"
             sheets = {path.stem: pd.read_csv(path, sep=sep, dtype=object)}
         else:
@@ -43,5 +52,146 @@ class WorkbookParser:
 
         return normalized
 
+    @staticmethod
+    def sheet_names(path: Path) -> list[str]:
+        """
+        List sheet names without loading sheet data.
+
+        Args:
+            path: Path to the workbook file
+
+        Returns:
+            Sheet names in workbook order (the file stem for CSV/TSV)
+
+        Raises:
+            ValueError: If file type is not supported
+        """
+        suffix = path.suffix.lower()
+        if suffix in TEXT_SUFFIXES:
+            return [path.stem]
+        if suffix == ".xls":
+            return [str(name) for name in pd.ExcelFile(path).sheet_names]
+        if suffix in EXCEL_SUFFIXES:
+            from openpyxl import load_workbook
+
+            workbook = load_workbook(path, read_only=True)
+            try:
+                return list(workbook.sheetnames)
+            finally:
+                workbook.close()
+        raise ValueError(f"Unsupported file type: {suffix}")
+
+    @staticmethod
+    def iter_sheet_chunks(
+        path: Path,
+        sheet_name: str,
+        *,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> Iterator[tuple[int, DataFrame]]:
+        """
+        Stream one sheet as DataFrames of at most ``chunk_size`` rows.
+
+        Chunks have the same columns, values and row positions as the sheet
+        returned by ``load_workbook``, so row-indexed data (e.g. component
+        overrides) can be applied per chunk. ``.xlsx``/``.xlsm`` sheets are
+        read with openpyxl in read-only mode and CSV/TSV with pandas chunked
+        reads; legacy ``.xls`` files cannot be streamed and are loaded whole.
+
+        Args:
+            path: Path to the workbook file
+            sheet_name: Sheet to read (the file stem for CSV/TSV)
+            chunk_size: Maximum rows per chunk
+
+        Yields:
+            Tuples of (position of the chunk's first row in the sheet, DataFrame)
+
+        Raises:
+            ValueError: If file type is not supported
+            KeyError: If the sheet does not exist
+        """
+        suffix = path.suffix.lower()
+        if suffix in TEXT_SUFFIXES:
+            if sheet_name != path.stem:
+                raise KeyError(sheet_name)
+            sep = "," if suffix == ".csv" else "\t"
+            offset = 0
+            with pd.read_csv(path, sep=sep, dtype=object, chunksize=chunk_size) as reader:
+                for chunk in reader:
+                    chunk.columns = [str(column) for column in chunk.columns]
+                    yield offset, chunk
+                    offset += len(chunk)
+        elif suffix == ".xls":
+            dataframe = pd.read_excel(path, sheet_name=sheet_name, dtype=object)
+            dataframe.columns = [str(column) for column in dataframe.columns]
+            for offset in range(0, len(dataframe), chunk_size):
+                yield offset, dataframe.iloc[offset : offset + chunk_size]
+        elif suffix in EXCEL_SUFFIXES:
+            yield from WorkbookParser._iter_openpyxl_chunks(path, sheet_name, chunk_size)
+        else:
+            raise ValueError(f"Unsupported file type: {suffix}")
+
+    @staticmethod
+    def _iter_openpyxl_chunks(
+        path: Path, sheet_name: str, chunk_size: int
+    ) -> Iterator[tuple[int, DataFrame]]:
+        from openpyxl import load_workbook
+
+        workbook = load_workbook(path, read_only=True, data_only=True)
+        try:
+            rows = workbook[sheet_name].iter_rows(values_only=True)
+            header = next(rows, None)
+            if header is None:
+                return
+            columns = WorkbookParser._header_columns(header)
+            width = len(columns)
+
+            blank = (np.nan,) * width
+            offset = 0
+            buffer: list[tuple[Any, ...]] = []
+            # Blank rows are kept between data rows but dropped at the end of
+            # the sheet, matching pandas.read_excel
+            pending_blank = 0
+            for values in rows:
+                if all(value is None for value in values[:width]):
+                    pending_blank += 1
+                    continue
+                row = tuple(np.nan if value is None else value for value in values[:width])
+                row += blank[len(row) :]
+                buffer.extend([blank] * pending_blank)
+                pending_blank = 0
+                buffer.append(row)
+                while len(buffer) >= chunk_size:
+                    yield offset, WorkbookParser._frame(buffer[:chunk_size], columns, offset)
+                    offset += chunk_size
+                    del buffer[:chunk_size]
+            if buffer:
+                yield offset, WorkbookParser._frame(buffer, columns, offset)
+        finally:
+            workbook.close()
+
+    @staticmethod
+    def _header_columns(header: tuple[Any, ...]) -> list[str]:
+        """Column names as pandas derives them (``Unnamed: N``, ``name.1`` for repeats)."""
+        columns: list[str] = []
+        seen: dict[str, int] = {}
+        for position, value in enumerate(header):
+            name = f"Unnamed: {position}" if value is None else str(value)
+            if name in seen:
+                seen[name] += 1
+                name = f"{name}.{seen[name]}"
+            else:
+                seen[name] = 0
+            columns.append(name)
+        return columns
+
+    @staticmethod
+    def _frame(rows: list[tuple[Any, ...]], columns: list[str], offset: int) -> DataFrame:
+        return DataFrame(
+            rows,
+            columns=columns,
+            index=pd.RangeIndex(offset, offset + len(rows)),
+            dtype=object,
+        )
+
 
-__all__ = ["WorkbookParser"]
+__all__ = ["DEFAULT_CHUNK_SIZE", "WorkbookParser"]
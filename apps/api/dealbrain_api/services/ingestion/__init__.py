@@ -15,7 +15,9 @@ The ingestion service has been refactored into focused modules:
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+import asyncio
+from collections.abc import Sequence
+from dataclasses import dataclass, field, replace
 from datetime import datetime
 from decimal import Decimal
 
@@ -23,11 +25,12 @@ from dealbrain_api.adapters import AdapterRouter
 from dealbrain_api.models.core import Listing, RawPayload
 from dealbrain_core.enums import Condition
 from dealbrain_core.schemas.ingestion import NormalizedListingSchema
-from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm.attributes import flag_modified
 
 from ...telemetry import get_logger
+from ..catalog_index import get_catalog_index
+from ..near_duplicates import NearDuplicate, record_listing
 
 # Import all components for public API
 from .converters import (
@@ -73,6 +76,8 @@ class IngestionResult:
         price: Listing price in USD (optional)
         vendor_item_id: Marketplace-specific item ID (optional)
         marketplace: Marketplace identifier (ebay|amazon|other)
+        near_duplicates: Similar existing listings flagged for review when a
+            new listing was created (never merged automatically)
     """
 
     # Required fields
@@ -90,6 +95,7 @@ class IngestionResult:
     price: Decimal | None = None
     vendor_item_id: str | None = None
     marketplace: str = "other"
+    near_duplicates: list[NearDuplicate] = field(default_factory=list)
 
 
 class IngestionService:
@@ -143,94 +149,176 @@ class IngestionService:
             ... else:
             ...     print(f"Failed: {result.error}")
         """
-        logger.info("ingestion.url.start", url=url)
-        try:
-            # Step 1: Extract raw data via adapter with fallback chain
-            raw_data, adapter_name = await self.router.extract(url)
+        results = await self.ingest_urls([url])
+        return results[url]
 
-            # Step 2: Normalize and enrich
-            normalized = await self.normalizer.normalize(raw_data)
-
-            # Step 3: Check for duplicates
-            dedup_result = await self.dedup_service.find_existing_listing(normalized)
-
-            # Step 4: Upsert listing
-            if dedup_result.exists and dedup_result.existing_listing:
-                listing = await self._update_listing(dedup_result.existing_listing, normalized)
-                status = "updated"
-            else:
-                listing = await self._create_listing(normalized)
-                status = "created"
-
-            # Step 4.5: Calculate performance metrics
-            if listing.cpu_id:
-                from ..listings import apply_listing_metrics
-
-                await apply_listing_metrics(self.session, listing)
-                await self.session.refresh(listing)
-                logger.info(
-                    "ingestion.listing.metrics_applied",
-                    listing_id=listing.id,
-                    has_adjusted_price=listing.adjusted_price_usd is not None,
-                    has_single_thread_metric=listing.dollar_per_cpu_mark_single is not None,
-                    has_multi_thread_metric=listing.dollar_per_cpu_mark_multi is not None,
-                )
+    async def ingest_urls(self, urls: Sequence[str]) -> dict[str, IngestionResult]:
+        """Ingest a batch of URLs, resolving duplicates for the whole batch at once.
+
+        Extraction runs concurrently for all URLs and each result is
+        normalized in turn. Duplicates are then resolved with a single
+        ``find_existing_listings()`` call instead of one lookup per URL, and
+        listings are written in input order. A URL that repeats a listing
+        created earlier in the same batch updates that listing rather than
+        creating a second one. New listings are also checked against the
+        near-duplicate index and the matches are reported on the result.
+
+        Args:
+            urls: URLs to ingest (repeats are ingested once)
+
+        Returns:
+            IngestionResult per URL, keyed by URL in input order
+        """
+        urls = list(dict.fromkeys(urls))
+        results: dict[str, IngestionResult] = {}
+        normalized_by_url: dict[str, NormalizedListingSchema] = {}
+        adapters: dict[str, str] = {}
 
-            # Step 5: Emit events
-            quality = self.normalizer.assess_quality(normalized)
-            if status == "created":
-                self.event_service.emit_listing_created(
-                    listing, provenance=adapter_name, quality=quality
+        for url in urls:
+            logger.info("ingestion.url.start", url=url)
+
+        # Step 1: Extract raw data via adapter with fallback chain
+        extracted = await asyncio.gather(
+            *(self.router.extract(url) for url in urls), return_exceptions=True
+        )
+        for url, outcome in zip(urls, extracted, strict=True):
+            if isinstance(outcome, BaseException):
+                results[url] = self._failed(url, outcome)
+                continue
+            raw_data, adapters[url] = outcome
+            # Step 2: Normalize and enrich
+            try:
+                normalized_by_url[url] = await self.normalizer.normalize(raw_data)
+            except Exception as e:
+                results[url] = self._failed(url, e)
+
+        # Step 3: Check for duplicates, one set-based lookup for the batch
+        dedup_results: dict[str, DeduplicationResult] = {}
+        if normalized_by_url:
+            try:
+                dedup_results = await self.dedup_service.find_existing_listings(
+                    normalized_by_url, near_duplicates=True
                 )
-            elif status == "updated" and dedup_result.existing_listing:
-                # Check if price changed significantly
-                old_price = Decimal(str(dedup_result.existing_listing.price_usd))
-                new_price = normalized.price
-                self.event_service.check_and_emit_price_change(listing, old_price, new_price)
-
-            # Step 6: Store raw payload
-            await self._store_raw_payload(listing, adapter_name, normalized)
-
-            # Step 7: Return result
-            result = IngestionResult(
-                success=True,
-                listing_id=listing.id,
-                status=status,
-                provenance=adapter_name,
-                quality=quality,
-                dedup_result=dedup_result,
-                url=url,
-                title=listing.title,
-                price=Decimal(str(listing.price_usd)),
-                vendor_item_id=listing.vendor_item_id,
-                marketplace=listing.marketplace,
-            )
-            logger.info(
-                "ingestion.url.completed",
-                url=url,
-                listing_id=listing.id,
-                status=status,
-                provenance=adapter_name,
-                quality=quality,
-                dedup_exists=dedup_result.exists,
-                dedup_exact=dedup_result.is_exact_match,
-            )
-            return result
+            except Exception as e:
+                for url in normalized_by_url:
+                    results[url] = self._failed(url, e)
+                normalized_by_url = {}
+
+        written: dict[str, Listing] = {}
+        for url, normalized in normalized_by_url.items():
+            dedup_result = dedup_results[url]
+            earlier = written.get(dedup_result.batch_duplicate_of)
+            if earlier is not None and not dedup_result.exists:
+                dedup_result = replace(dedup_result, exists=True, existing_listing=earlier)
+            results[url] = await self._write_listing(url, adapters[url], normalized, dedup_result)
+            if results[url].success:
+                # Already in the identity map, so this does not query
+                written[url] = await self.session.get(Listing, results[url].listing_id)
+
+        return {url: results[url] for url in urls}
+
+    async def _write_listing(
+        self,
+        url: str,
+        adapter_name: str,
+        normalized: NormalizedListingSchema,
+        dedup_result: DeduplicationResult,
+    ) -> IngestionResult:
+        """Upsert one normalized listing and record its events and raw payload.
+
+        The writes run in a savepoint, so a URL that fails rolls back only its
+        own changes and the rest of the batch can still commit.
+        """
+        try:
+            async with self.session.begin_nested():
+                # Step 4: Upsert listing
+                if dedup_result.exists and dedup_result.existing_listing:
+                    listing = await self._update_listing(dedup_result.existing_listing, normalized)
+                    status = "updated"
+                else:
+                    listing = await self._create_listing(normalized)
+                    status = "created"
+
+                # Step 4.5: Calculate performance metrics
+                if listing.cpu_id:
+                    from ..listings import apply_listing_metrics
+
+                    await apply_listing_metrics(self.session, listing)
+                    await self.session.refresh(listing)
+                    logger.info(
+                        "ingestion.listing.metrics_applied",
+                        listing_id=listing.id,
+                        has_adjusted_price=listing.adjusted_price_usd is not None,
+                        has_single_thread_metric=listing.dollar_per_cpu_mark_single is not None,
+                        has_multi_thread_metric=listing.dollar_per_cpu_mark_multi is not None,
+                    )
 
+                # Step 5: Store raw payload
+                await self._store_raw_payload(listing, adapter_name, normalized)
         except Exception as e:
-            logger.exception("ingestion.url.failed", url=url)
-            return IngestionResult(
-                success=False,
-                listing_id=None,
-                status="failed",
-                provenance="unknown",
-                quality="partial",
-                error=str(e),
-                url=url,
+            return self._failed(url, e)
+
+        record_listing(self.session, listing)
+
+        # Step 6: Emit events
+        quality = self.normalizer.assess_quality(normalized)
+        if status == "created":
+            self.event_service.emit_listing_created(
+                listing, provenance=adapter_name, quality=quality
             )
+        elif status == "updated" and dedup_result.existing_listing:
+            # Check if price changed significantly
+            old_price = Decimal(str(dedup_result.existing_listing.price_usd))
+            new_price = normalized.price
+            self.event_service.check_and_emit_price_change(listing, old_price, new_price)
+
+        # Step 7: Return result
+        result = IngestionResult(
+            success=True,
+            listing_id=listing.id,
+            status=status,
+            provenance=adapter_name,
+            quality=quality,
+            dedup_result=dedup_result,
+            url=url,
+            title=listing.title,
+            price=Decimal(str(listing.price_usd)),
+            vendor_item_id=listing.vendor_item_id,
+            marketplace=listing.marketplace,
+            near_duplicates=dedup_result.near_duplicates,
+        )
+        logger.info(
+            "ingestion.url.completed",
+            url=url,
+            listing_id=listing.id,
+            status=status,
+            provenance=adapter_name,
+            quality=quality,
+            dedup_exists=dedup_result.exists,
+            dedup_exact=dedup_result.is_exact_match,
+            near_duplicate_ids=[match.listing_id for match in dedup_result.near_duplicates],
+        )
+        return result
+
+    @staticmethod
+    def _failed(url: str, error: BaseException) -> IngestionResult:
+        logger.error("ingestion.url.failed", url=url, error=str(error), exc_info=error)
+        return IngestionResult(
+            success=False,
+            listing_id=None,
+            status="failed",
+            provenance="unknown",
+            quality="partial",
+            error=str(error),
+            url=url,
+        )
 
     async def _find_cpu_by_model(self, cpu_model: str) -> int | None:
-        """Find CPU by model string using fuzzy matching.
+        """Find CPU by model string using the shared catalog index.
+
+        Tries an exact name/alias match, then the model string as a substring
+        of a CPU name, then model-number tokens (e.g. "12900H"), then any
+        keyword of the model string.
 
         Args:
             cpu_model: CPU model string to search for
@@ -238,47 +326,21 @@ class IngestionService:
         Returns:
             CPU ID if found, None otherwise
         """
-        from dealbrain_api.models.core import Cpu
-
         if not cpu_model:
             return None
 
-        # Normalize the cpu_model string (lowercase, strip whitespace)
-        normalized = cpu_model.lower().strip()
-
-        # Query CPU catalog for exact match first
-        stmt = select(Cpu).where(func.lower(Cpu.name).contains(normalized))
-        result = await self.session.execute(stmt)
-        cpu = result.scalars().first()
+        index = await get_catalog_index(self.session)
+        match = index.cpus.search(cpu_model)
 
-        if cpu:
+        if match:
             logger.info(
                 "ingestion.cpu.match",
-                match_type="model",
-                cpu_id=cpu.id,
-                cpu_name=cpu.name,
+                match_type=match.match_type,
+                cpu_id=match.item.id,
+                cpu_name=match.item.name,
                 query=cpu_model,
             )
-            return cpu.id
-
-        # Try partial match (e.g., "i9-12900H" matches "Intel Core i9-12900H")
-        # Extract key parts (e.g., "12900H" from "Intel Core i9-12900H")
-        cpu_keywords = [part for part in normalized.split() if len(part) > 2]
-        if cpu_keywords:
-            for keyword in cpu_keywords:
-                stmt = select(Cpu).where(func.lower(Cpu.name).contains(keyword))
-                result = await self.session.execute(stmt)
-                cpu = result.scalars().first()
-                if cpu:
-                    logger.info(
-                        "ingestion.cpu.match",
-                        match_type="keyword",
-                        cpu_id=cpu.id,
-                        cpu_name=cpu.name,
-                        keyword=keyword,
-                        query=cpu_model,
-                    )
-                    return cpu.id
+            return match.item.id
 
         logger.warning("ingestion.cpu.not_found", query=cpu_model)
         return None
@@ -5,14 +5,20 @@ when importing from URLs. It uses a hybrid approach:
 
 1. Primary: (marketplace, vendor_item_id) for API sources (eBay, Amazon)
 2. Secondary: Hash-based for JSON-LD sources without vendor IDs
+
+Callers that surface near-duplicates for review can ask for listings without
+an exact match to be checked against the near-duplicate index (see
+services/near_duplicates.py). Near-duplicates are never merged automatically.
 """
 
 from __future__ import annotations
 
 import hashlib
 import re
-from dataclasses import dataclass
+from collections.abc import Hashable, Iterator, Mapping
+from dataclasses import dataclass, field
 from decimal import Decimal
+from typing import TypeVar
 
 from dealbrain_api.models.core import Listing
 from dealbrain_core.schemas.ingestion import NormalizedListingSchema
@@ -20,9 +26,25 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ...telemetry import get_logger
+from ..near_duplicates import (
+    NearDuplicate,
+    NearDuplicateIndex,
+    existing_listing_ids,
+    get_near_duplicate_index,
+)
 
 logger = get_logger("dealbrain.ingestion.deduplication")
 
+# Keeps IN (...) lists well below database bind-parameter limits
+LOOKUP_CHUNK_SIZE = 500
+
+K = TypeVar("K", bound=Hashable)
+
+
+def _chunks(values: list[str]) -> Iterator[list[str]]:
+    for start in range(0, len(values), LOOKUP_CHUNK_SIZE):
+        yield values[start : start + LOOKUP_CHUNK_SIZE]
+
 
 @dataclass
 class DeduplicationResult:
@@ -34,6 +56,10 @@ class DeduplicationResult:
         is_exact_match: True if vendor ID match, False if hash match
         confidence: Match confidence (1.0 for vendor ID, 0.95 for hash)
         dedup_hash: SHA-256 hash used for deduplication (if applicable)
+        near_duplicates: Similar existing listings when no exact match was found
+            (only when requested)
+        batch_duplicate_of: Key of an earlier listing in the same batch with the
+            same vendor ID or hash (batch lookups only)
     """
 
     exists: bool
@@ -41,6 +67,8 @@ class DeduplicationResult:
     is_exact_match: bool
     confidence: float
     dedup_hash: str | None = None
+    near_duplicates: list[NearDuplicate] = field(default_factory=list)
+    batch_duplicate_of: Hashable | None = None
 
 
 class DeduplicationService:
@@ -52,6 +80,9 @@ class DeduplicationService:
 
     Hash formula: SHA-256(normalize(title) + normalize(seller) + normalize(price))
 
+    Bulk callers should use ``find_existing_listings()``, which resolves a whole
+    batch with set-based queries.
+
     Example:
         >>> async with session_scope() as session:
         ...     service = DeduplicationService(session)
@@ -71,6 +102,8 @@ class DeduplicationService:
     async def find_existing_listing(
         self,
         normalized_data: NormalizedListingSchema,
+        *,
+        near_duplicates: bool = False,
     ) -> DeduplicationResult:
         """Find existing listing using vendor ID or hash-based deduplication.
 
@@ -80,6 +113,7 @@ class DeduplicationService:
 
         Args:
             normalized_data: Normalized listing data from adapter
+            near_duplicates: Also look up near-duplicates when there is no exact match
 
         Returns:
             DeduplicationResult with exists flag and existing listing if found
@@ -95,106 +129,260 @@ class DeduplicationService:
             >>> result = await service.find_existing_listing(normalized)
             >>> print(f"Exists: {result.exists}, Confidence: {result.confidence}")
         """
-        # 1. Try vendor_item_id match first (if available)
-        if normalized_data.vendor_item_id and normalized_data.marketplace:
-            result = await self._check_vendor_id(
-                normalized_data.vendor_item_id,
-                normalized_data.marketplace,
+        results = await self.find_existing_listings(
+            {0: normalized_data}, near_duplicates=near_duplicates
+        )
+        return results[0]
+
+    async def find_existing_listings(
+        self,
+        batch: Mapping[K, NormalizedListingSchema],
+        *,
+        near_duplicates: bool = False,
+    ) -> dict[K, DeduplicationResult]:
+        """Resolve duplicates for a batch of listings with set-based lookups.
+
+        Computes every dedup hash up front, then resolves existing listings
+        with one ``vendor_item_id IN (...)`` and one ``dedup_hash IN (...)``
+        query (chunked for very large batches) instead of one or two queries
+        per listing. Listings repeated within the batch (same vendor key or
+        hash as an earlier entry) are detected in memory and flagged with
+        ``batch_duplicate_of``, the key of that earlier entry.
+
+        Args:
+            batch: Normalized listings keyed by their input, e.g. source URL or
+                row number; iteration order decides which repeat comes first
+            near_duplicates: Also query the near-duplicate index for listings
+                without an exact or in-batch match. Off by default: loading the
+                index costs a scan of all listings on first use
+
+        Returns:
+            One DeduplicationResult per input listing, under the same key
+
+        Example:
+            >>> results = await service.find_existing_listings(normalized_by_url)
+            >>> new_urls = [
+            ...     url for url, result in results.items()
+            ...     if not result.exists and result.batch_duplicate_of is None
+            ... ]
+        """
+        if not batch:
+            return {}
+
+        hashes = {key: self._generate_hash(data) for key, data in batch.items()}
+        vendor_keys = {
+            key: (
+                (data.vendor_item_id, data.marketplace)
+                if data.vendor_item_id and data.marketplace
+                else None
+            )
+            for key, data in batch.items()
+        }
+
+        # 1. Vendor ID matches (highest priority)
+        by_vendor = await self._load_by_vendor_keys({key for key in vendor_keys.values() if key})
+
+        # 2. Hash matches, only for listings without a vendor match
+        by_hash = await self._load_by_hashes(
+            {dedup_hash for key, dedup_hash in hashes.items() if vendor_keys[key] not in by_vendor}
+        )
+
+        results: dict[K, DeduplicationResult] = {}
+        first_seen: dict[tuple[str, ...], K] = {}
+        near_duplicate_index = None
+        new_keys: list[K] = []
+
+        for key, data in batch.items():
+            dedup_hash = hashes[key]
+            vendor_key = vendor_keys[key]
+            # 3. Intra-batch duplicates (same vendor key or same hash as an earlier row)
+            batch_keys = [("hash", dedup_hash)]
+            if vendor_key:
+                batch_keys.insert(0, ("vendor", *vendor_key))
+            batch_duplicate_of = next(
+                (first_seen[batch_key] for batch_key in batch_keys if batch_key in first_seen),
+                None,
             )
-            if result:
+            for batch_key in batch_keys:
+                first_seen.setdefault(batch_key, key)
+
+            vendor_match = by_vendor.get(vendor_key) if vendor_key else None
+            if vendor_match:
                 logger.info(
                     "ingestion.dedup.match",
                     strategy="vendor_id",
-                    vendor_item_id=normalized_data.vendor_item_id,
-                    marketplace=normalized_data.marketplace,
-                    listing_id=result.id,
-                    title=result.title,
+                    vendor_item_id=data.vendor_item_id,
+                    marketplace=data.marketplace,
+                    listing_id=vendor_match.id,
+                    title=vendor_match.title,
                     exists=True,
                 )
-                return DeduplicationResult(
+                results[key] = DeduplicationResult(
                     exists=True,
-                    existing_listing=result,
+                    existing_listing=vendor_match,
                     is_exact_match=True,
                     confidence=1.0,
+                    batch_duplicate_of=batch_duplicate_of,
                 )
+                continue
 
-        # 2. Fallback to hash-based dedup
-        dedup_hash = self._generate_hash(normalized_data)
-        result = await self._check_hash(dedup_hash)
+            hash_match = by_hash.get(dedup_hash)
+            if hash_match:
+                logger.info(
+                    "ingestion.dedup.match",
+                    strategy="hash",
+                    dedup_hash=f"{dedup_hash[:16]}...",
+                    listing_id=hash_match.id,
+                    title=hash_match.title,
+                    exists=True,
+                )
+                results[key] = DeduplicationResult(
+                    exists=True,
+                    existing_listing=hash_match,
+                    is_exact_match=False,
+                    confidence=0.95,
+                    dedup_hash=dedup_hash,
+                    batch_duplicate_of=batch_duplicate_of,
+                )
+                continue
+
+            # 4. Not found - optionally report near-duplicates for review
+            similar: list[NearDuplicate] = []
+            if near_duplicates and batch_duplicate_of is None:
+                if near_duplicate_index is None:
+                    near_duplicate_index = await get_near_duplicate_index(self.session)
+                similar = self._query_near_duplicates(near_duplicate_index, data)
+            new_keys.append(key)
+            results[key] = DeduplicationResult(
+                exists=False,
+                existing_listing=None,
+                is_exact_match=False,
+                confidence=0.0,
+                dedup_hash=dedup_hash,
+                near_duplicates=similar,
+                batch_duplicate_of=batch_duplicate_of,
+            )
 
-        if result:
+        if near_duplicate_index is not None:
+            # One lookup drops matches deleted since they were indexed
+            await self._drop_deleted_near_duplicates(
+                near_duplicate_index, [results[key] for key in new_keys]
+            )
+        for key in new_keys:
+            result = results[key]
             logger.info(
-                "ingestion.dedup.match",
-                strategy="hash",
-                dedup_hash=f"{dedup_hash[:16]}...",
-                listing_id=result.id,
-                title=result.title,
-                exists=True,
+                "ingestion.dedup.new_listing",
+                strategy="none",
+                dedup_hash=f"{hashes[key][:16]}...",
+                title=batch[key].title,
+                exists=False,
+                batch_duplicate_of=result.batch_duplicate_of,
+                near_duplicate_ids=[match.listing_id for match in result.near_duplicates],
             )
-            return DeduplicationResult(
-                exists=True,
-                existing_listing=result,
-                is_exact_match=False,
-                confidence=0.95,
-                dedup_hash=dedup_hash,
+
+        if len(batch) > 1:
+            logger.info(
+                "ingestion.dedup.batch",
+                size=len(batch),
+                existing=sum(result.exists for result in results.values()),
+                batch_duplicates=sum(
+                    result.batch_duplicate_of is not None for result in results.values()
+                ),
             )
+        return results
 
-        # 3. Not found
-        logger.info(
-            "ingestion.dedup.new_listing",
-            strategy="none",
-            dedup_hash=f"{dedup_hash[:16]}...",
-            title=normalized_data.title,
-            exists=False,
+    async def find_near_duplicates(
+        self,
+        normalized_data: NormalizedListingSchema,
+        limit: int = 5,
+    ) -> list[NearDuplicate]:
+        """Find similar existing listings via the near-duplicate index.
+
+        Args:
+            normalized_data: Normalized listing data from adapter
+            limit: Maximum number of matches to return
+
+        Returns:
+            Near-duplicate matches sorted by score, highest first
+        """
+        index = await get_near_duplicate_index(self.session)
+        matches = self._query_near_duplicates(index, normalized_data, limit)
+        existing = await existing_listing_ids(
+            self.session, index, [match.listing_id for match in matches]
         )
-        return DeduplicationResult(
-            exists=False,
-            existing_listing=None,
-            is_exact_match=False,
-            confidence=0.0,
-            dedup_hash=dedup_hash,
+        return [match for match in matches if match.listing_id in existing]
+
+    async def _drop_deleted_near_duplicates(
+        self, index: NearDuplicateIndex, results: list[DeduplicationResult]
+    ) -> None:
+        """Filter out near-duplicate matches whose listing no longer exists."""
+        existing = await existing_listing_ids(
+            self.session,
+            index,
+            [match.listing_id for result in results for match in result.near_duplicates],
         )
+        for result in results:
+            result.near_duplicates = [
+                match for match in result.near_duplicates if match.listing_id in existing
+            ]
+
+    @staticmethod
+    def _query_near_duplicates(
+        index: NearDuplicateIndex,
+        normalized_data: NormalizedListingSchema,
+        limit: int = 5,
+    ) -> list[NearDuplicate]:
+        price = float(normalized_data.price) if normalized_data.price is not None else None
+        return index.query(normalized_data.title, price, limit=limit)
 
-    async def _check_vendor_id(
+    async def _load_by_vendor_keys(
         self,
-        vendor_item_id: str,
-        marketplace: str,
-    ) -> Listing | None:
-        """Check for existing listing by vendor_item_id + marketplace.
+        vendor_keys: set[tuple[str, str]],
+    ) -> dict[tuple[str, str], Listing]:
+        """Load existing listings by (vendor_item_id, marketplace).
 
         Uses the unique constraint on (vendor_item_id, marketplace) from Phase 1.
+        Filters on ``vendor_item_id IN (...)`` and matches the marketplace in
+        memory, which keeps the query portable across databases.
 
         Args:
-            vendor_item_id: Marketplace-specific item ID
-            marketplace: Marketplace identifier (ebay|amazon|other)
+            vendor_keys: (vendor_item_id, marketplace) pairs
 
         Returns:
-            Existing Listing if found, None otherwise
+            Mapping of (vendor_item_id, marketplace) to existing Listing
         """
-        stmt = select(Listing).where(
-            Listing.vendor_item_id == vendor_item_id,
-            Listing.marketplace == marketplace,
-        )
-        result = await self.session.execute(stmt)
-        return result.scalar_one_or_none()
-
-    async def _check_hash(self, dedup_hash: str) -> Listing | None:
-        """Check for existing listing by dedup hash.
+        vendor_ids = sorted({vendor_item_id for vendor_item_id, _ in vendor_keys})
+        found: dict[tuple[str, str], Listing] = {}
+        for chunk in _chunks(vendor_ids):
+            stmt = select(Listing).where(Listing.vendor_item_id.in_(chunk))
+            result = await self.session.execute(stmt)
+            for listing in result.scalars():
+                key = (listing.vendor_item_id, listing.marketplace)
+                if key in vendor_keys:
+                    found[key] = listing
+        return found
+
+    async def _load_by_hashes(self, hashes: set[str]) -> dict[str, Listing]:
+        """Load existing listings by dedup hash.
 
         Uses indexed dedup_hash column for efficient lookups.
 
         Note: dedup_hash is not unique, so multiple listings may share
-        the same hash. This method returns the first match found.
+        the same hash. The oldest listing (lowest id) is returned per hash.
 
         Args:
-            dedup_hash: SHA-256 hash of normalized listing data
+            hashes: SHA-256 hashes of normalized listing data
 
         Returns:
-            Existing Listing if found (first match if multiple), None otherwise
+            Mapping of dedup hash to existing Listing
         """
-        stmt = select(Listing).where(Listing.dedup_hash == dedup_hash)
-        result = await self.session.execute(stmt)
-        return result.scalars().first()
+        found: dict[str, Listing] = {}
+        for chunk in _chunks(sorted(hashes)):
+            stmt = select(Listing).where(Listing.dedup_hash.in_(chunk)).order_by(Listing.id)
+            result = await self.session.execute(stmt)
+            for listing in result.scalars():
+                found.setdefault(listing.dedup_hash, listing)
+        return found
 
     def _generate_hash(self, data: NormalizedListingSchema) -> str:
         """Generate SHA-256 hash for deduplication.
@@ -0,0 +1,194 @@
+"""Coalesced progress reporting for bulk URL ingestion.
+
+Single-URL jobs publish an ``import.progress`` event and flush
+``progress_pct`` at every milestone. Doing the same for each child of a
+bulk job turns a 5k-URL import into ~20k flushes and ~20k events, so bulk
+children keep ``progress_pct`` on their own ImportSession (committed with
+the task) and report milestones to a ``BulkProgressAggregator``. It
+buffers the latest milestone per child in memory and, at most once per
+interval and bulk job, publishes one rolled-up ``import.progress`` event.
+Tasks flush their bulk jobs after committing, so the last milestones are
+always published and the roll-up that sees every child finished carries
+the bulk job's terminal status.
+
+Workers are separate processes, so the roll-up is computed from the
+database: all children of the bulk job are aggregated in one query, and the
+milestones this worker has buffered replace the committed values of its own
+children. The aggregator never writes child rows; they stay locked by the
+sessions of the tasks that own them.
+"""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from datetime import datetime
+from uuid import UUID
+
+from sqlalchemy import case, func, select
+
+from ...db import session_scope
+from ...events import EventType, publish_event
+from ...models.core import ImportSession
+from ...settings import get_settings
+from ...telemetry import get_logger
+
+logger = get_logger("dealbrain.ingestion.progress")
+
+# Child statuses that still count as unfinished in the roll-up
+_IN_FLIGHT_STATUSES = ("queued", "running")
+
+
+@dataclass
+class _ChildProgress:
+    progress_pct: int
+    status: str
+
+
+@dataclass
+class _BulkJobProgress:
+    """Buffered state for one bulk job."""
+
+    children: dict[str, _ChildProgress] = field(default_factory=dict)
+    last_emit: float = 0.0
+
+
+class BulkProgressAggregator:
+    """Buffer bulk-ingestion progress and emit it once per interval per job.
+
+    Args:
+        interval_s: Minimum seconds between rolled-up events for one bulk job
+            (defaults to ``ingestion.bulk_progress_interval_s``)
+        clock: Monotonic clock (injectable for tests)
+    """
+
+    def __init__(
+        self,
+        *,
+        interval_s: float | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if interval_s is None:
+            interval_s = get_settings().ingestion.bulk_progress_interval_s
+        self.interval_s = interval_s
+        self._clock = clock
+        self._jobs: dict[str, _BulkJobProgress] = {}
+
+    async def report(
+        self,
+        *,
+        bulk_job_id: str,
+        job_id: str,
+        progress_pct: int,
+        status: str = "running",
+    ) -> bool:
+        """Record a child milestone; flushes the bulk job if its interval elapsed.
+
+        Returns:
+            True if this call emitted a rolled-up event
+        """
+        job = self._jobs.setdefault(bulk_job_id, _BulkJobProgress())
+        job.children[job_id] = _ChildProgress(progress_pct, status)
+
+        if self._clock() - job.last_emit < self.interval_s:
+            return False
+        await self.flush(bulk_job_id)
+        return True
+
+    async def flush(self, bulk_job_id: str) -> None:
+        """Publish the rolled-up event for *bulk_job_id* now.
+
+        Tasks call this after committing their children, so the last
+        milestones of an interval are not lost. Once every child has
+        finished the event carries the bulk job's terminal status.
+        """
+        job = self._jobs.pop(bulk_job_id, None) or _BulkJobProgress()
+        job.last_emit = self._clock()
+
+        children = job.children
+        total = len(children)
+        finished = sum(child.status not in _IN_FLIGHT_STATUSES for child in children.values())
+        failed = sum(child.status == "failed" for child in children.values())
+        progress_sum = sum(child.progress_pct for child in children.values())
+        try:
+            committed = await self._committed_totals(bulk_job_id, exclude=list(children))
+        except Exception as exc:
+            # Fall back to this worker's children rather than skip the event
+            logger.warning(
+                "ingestion.progress.rollup_failed", bulk_job_id=bulk_job_id, error=str(exc)
+            )
+        else:
+            total += committed[0]
+            finished += committed[1]
+            failed += committed[2]
+            progress_sum += committed[3]
+        if not total:
+            return
+
+        status = "running"
+        progress_pct = round(progress_sum / total)
+        if finished == total:
+            # Same rules as the bulk status endpoint
+            if failed == total:
+                status = "failed"
+            elif failed:
+                status = "partial"
+            else:
+                status = "complete"
+            progress_pct = 100
+
+        await publish_event(
+            EventType.IMPORT_PROGRESS,
+            {
+                "job_id": bulk_job_id,
+                "progress_pct": progress_pct,
+                "status": status,
+                "message": f"{finished} of {total} URLs finished",
+                "children": {
+                    child_id: {"progress_pct": child.progress_pct, "status": child.status}
+                    for child_id, child in children.items()
+                },
+                "timestamp": datetime.utcnow().isoformat(),
+            },
+        )
+
+        # Finished children were reported once; later roll-ups read their committed rows
+        job.children = {
+            child_id: child
+            for child_id, child in children.items()
+            if child.status in _IN_FLIGHT_STATUSES
+        }
+        if job.children:
+            self._jobs[bulk_job_id] = job
+
+    async def flush_all(self) -> None:
+        for bulk_job_id in list(self._jobs):
+            await self.flush(bulk_job_id)
+
+    @staticmethod
+    async def _committed_totals(
+        bulk_job_id: str, *, exclude: list[str]
+    ) -> tuple[int, int, int, int]:
+        """Children, finished, failed and progress sum of the other children."""
+        parent_job_id = ImportSession.conflicts_json["parent_job_id"].as_string()
+        stmt = select(
+            func.count(),
+            func.coalesce(
+                func.sum(case((ImportSession.status.in_(_IN_FLIGHT_STATUSES), 0), else_=1)), 0
+            ),
+            func.coalesce(func.sum(case((ImportSession.status == "failed", 1), else_=0)), 0),
+            func.coalesce(func.sum(func.coalesce(ImportSession.progress_pct, 0)), 0),
+        ).where(
+            parent_job_id == bulk_job_id,
+            ImportSession.id.not_in([UUID(child_id) for child_id in exclude]),
+        )
+        async with session_scope() as session:
+            total, finished, failed, progress_sum = (await session.execute(stmt)).one()
+        return int(total), int(finished), int(failed), int(progress_sum)
+
+
+bulk_progress = BulkProgressAggregator()
+
+
+__all__ = ["BulkProgressAggregator", "bulk_progress"]
@@ -18,10 +18,12 @@ from .crud import (
     MUTABLE_LISTING_FIELDS,
     bulk_update_listings,
     create_listing,
+    create_listings,
     delete_listing,
     get_default_profile,
     partial_update_listing,
     update_listing,
+    update_listings,
 )
 
 # Component management
@@ -30,6 +32,7 @@ from .components import (
     complete_partial_import,
     create_from_ingestion,
     sync_listing_components,
+    sync_listings_components,
     upsert_from_url,
 )
 
@@ -61,13 +64,16 @@ __all__ = [
     "VALUATION_DISABLED_RULESETS_KEY",
     # CRUD
     "create_listing",
+    "create_listings",
     "update_listing",
+    "update_listings",
     "delete_listing",
     "partial_update_listing",
     "bulk_update_listings",
     "get_default_profile",
     # Components
     "sync_listing_components",
+    "sync_listings_components",
     "build_component_inputs",
     "complete_partial_import",
     "create_from_ingestion",
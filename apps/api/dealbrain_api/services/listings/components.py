@@ -6,6 +6,7 @@ and component relationship preparation for listings.
 
 from __future__ import annotations
 
+from collections.abc import Mapping
 from datetime import datetime
 from typing import TYPE_CHECKING, Any, Iterable
 
@@ -39,35 +40,57 @@ async def sync_listing_components(
     components_payload: list[dict] | None,
 ) -> None:
     """Replace listing components using explicit SQL to avoid lazy relationship access."""
-    if components_payload is None:
+    await sync_listings_components(session, {listing.id: components_payload})
+
+
+async def sync_listings_components(
+    session: AsyncSession,
+    components_by_listing: Mapping[int, list[dict] | None],
+) -> None:
+    """Replace the components of several listings with one DELETE and one flush.
+
+    Args:
+        session: Database session
+        components_by_listing: Component payloads keyed by listing ID; listings
+            mapped to None keep their components
+    """
+    components_by_listing = {
+        listing_id: components_payload
+        for listing_id, components_payload in components_by_listing.items()
+        if components_payload is not None
+    }
+    if not components_by_listing:
         return
 
-    await session.execute(delete(ListingComponent).where(ListingComponent.listing_id == listing.id))
-    await session.flush()
+    await session.execute(
+        delete(ListingComponent).where(ListingComponent.listing_id.in_(list(components_by_listing)))
+    )
 
-    for component in components_payload:
-        payload = dict(component)
-        component_type = payload.get("component_type")
-        if not component_type:
-            fallback = getattr(ComponentType, "OTHER", None)
-            component_type = fallback.value if fallback else "misc"
-        session.add(
-            ListingComponent(
-                listing_id=listing.id,
-                rule_id=payload.get("rule_id"),
-                component_type=component_type,
-                name=payload.get("name"),
-                quantity=payload.get("quantity", 1),
-                metadata_json=payload.get("metadata_json"),
-                adjustment_value_usd=payload.get("adjustment_value_usd"),
-            ),
-        )
+    for listing_id, components_payload in components_by_listing.items():
+        for component in components_payload:
+            payload = dict(component)
+            component_type = payload.get("component_type")
+            if not component_type:
+                fallback = getattr(ComponentType, "OTHER", None)
+                component_type = fallback.value if fallback else "misc"
+            session.add(
+                ListingComponent(
+                    listing_id=listing_id,
+                    rule_id=payload.get("rule_id"),
+                    component_type=component_type,
+                    name=payload.get("name"),
+                    quantity=payload.get("quantity", 1),
+                    metadata_json=payload.get("metadata_json"),
+                    adjustment_value_usd=payload.get("adjustment_value_usd"),
+                ),
+            )
     await session.flush()
-    logger.info(
-        "listing.components.synced",
-        listing_id=listing.id,
-        component_count=len(components_payload),
-    )
+    for listing_id, components_payload in components_by_listing.items():
+        logger.info(
+            "listing.components.synced",
+            listing_id=listing_id,
+            component_count=len(components_payload),
+        )
 
 
 def build_component_inputs(listing: Listing) -> Iterable[ComponentValuationInput]:
@@ -6,6 +6,7 @@ along with payload normalization and validation utilities.
 
 from __future__ import annotations
 
+from collections.abc import Sequence
 from datetime import datetime
 from typing import Any
 from urllib.parse import urlparse
@@ -16,6 +17,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from ...events import EventType, publish_event
 from ...models import Listing, Profile
 from ...telemetry import get_logger
+from ..near_duplicates import forget_listing
 
 logger = get_logger("dealbrain.listings.crud")
 
@@ -152,34 +154,58 @@ async def create_listing(session: AsyncSession, payload: dict) -> Listing:
     Returns:
         Created listing instance
 
+    Note:
+        Does NOT apply metrics - caller should call apply_listing_metrics separately
+    """
+    (listing,) = await create_listings(session, [payload])
+    return listing
+
+
+async def create_listings(session: AsyncSession, payloads: Sequence[dict]) -> list[Listing]:
+    """Create several listings with a single flush.
+
+    Payloads are handled exactly as by ``create_listing()``, but the rows are
+    inserted together instead of one flush per listing.
+
+    Args:
+        session: Database session
+        payloads: Dictionaries of listing fields
+
+    Returns:
+        Created listing instances, in payload order
+
     Note:
         Does NOT apply metrics - caller should call apply_listing_metrics separately
     """
     from .components import _prepare_component_relationships
 
-    # Map "attributes" to "attributes_json" for SQLAlchemy model
-    if "attributes" in payload:
-        payload["attributes_json"] = payload.pop("attributes")
-    payload = _normalize_listing_payload(payload)
-    await _prepare_component_relationships(session, payload)
-    listing = Listing(**payload)
-    session.add(listing)
+    listings: list[Listing] = []
+    for payload in payloads:
+        # Map "attributes" to "attributes_json" for SQLAlchemy model
+        if "attributes" in payload:
+            payload["attributes_json"] = payload.pop("attributes")
+        payload = _normalize_listing_payload(payload)
+        await _prepare_component_relationships(session, payload)
+        listings.append(Listing(**payload))
+    session.add_all(listings)
     await session.flush()
-    logger.info(
-        "listing.created",
-        listing_id=listing.id,
-        title=listing.title,
-        price=listing.price_usd,
-        ruleset_id=listing.ruleset_id,
-    )
 
-    # Publish SSE event
-    await publish_event(
-        EventType.LISTING_CREATED,
-        {"listing_id": listing.id, "timestamp": datetime.utcnow().isoformat()},
-    )
+    for listing in listings:
+        logger.info(
+            "listing.created",
+            listing_id=listing.id,
+            title=listing.title,
+            price=listing.price_usd,
+            ruleset_id=listing.ruleset_id,
+        )
 
-    return listing
+        # Publish SSE event
+        await publish_event(
+            EventType.LISTING_CREATED,
+            {"listing_id": listing.id, "timestamp": datetime.utcnow().isoformat()},
+        )
+
+    return listings
 
 
 async def update_listing(session: AsyncSession, listing: Listing, payload: dict) -> Listing:
@@ -196,37 +222,62 @@ async def update_listing(session: AsyncSession, listing: Listing, payload: dict)
     Note:
         Does NOT apply metrics - caller should call apply_listing_metrics separately
     """
-    from .components import _prepare_component_relationships
+    (listing,) = await update_listings(session, [(listing, payload)])
+    return listing
 
-    payload = _normalize_listing_payload(payload)
-    await _prepare_component_relationships(session, payload, listing=listing)
 
-    # Track changed fields for event
-    changed_fields = list(payload.keys())
+async def update_listings(
+    session: AsyncSession, updates: Sequence[tuple[Listing, dict]]
+) -> list[Listing]:
+    """Update several existing listings with a single flush.
 
-    for field, value in payload.items():
-        setattr(listing, field, value)
+    Payloads are handled exactly as by ``update_listing()``, but the changes
+    are written together instead of one flush per listing.
+
+    Args:
+        session: Database session
+        updates: (listing, payload) pairs
+
+    Returns:
+        Updated listing instances, in input order
+
+    Note:
+        Does NOT apply metrics - caller should call apply_listing_metrics separately
+    """
+    from .components import _prepare_component_relationships
+
+    applied: list[tuple[Listing, dict]] = []
+    for listing, payload in updates:
+        payload = _normalize_listing_payload(payload)
+        await _prepare_component_relationships(session, payload, listing=listing)
+        for field, value in payload.items():
+            setattr(listing, field, value)
+        applied.append((listing, payload))
     await session.flush()
-    logger.info(
-        "listing.updated",
-        listing_id=listing.id,
-        updated_fields=changed_fields,
-        ruleset_id=listing.ruleset_id,
-    )
 
-    # Publish SSE event
-    await publish_event(
-        EventType.LISTING_UPDATED,
-        {
-            "listing_id": listing.id,
-            "changes": changed_fields,
-            "timestamp": datetime.utcnow().isoformat(),
-        },
-    )
-    # Invalidate card image cache if price or components changed
-    await _invalidate_card_cache_if_needed(session, listing, payload)
+    for listing, payload in applied:
+        # Track changed fields for event
+        changed_fields = list(payload.keys())
+        logger.info(
+            "listing.updated",
+            listing_id=listing.id,
+            updated_fields=changed_fields,
+            ruleset_id=listing.ruleset_id,
+        )
 
-    return listing
+        # Publish SSE event
+        await publish_event(
+            EventType.LISTING_UPDATED,
+            {
+                "listing_id": listing.id,
+                "changes": changed_fields,
+                "timestamp": datetime.utcnow().isoformat(),
+            },
+        )
+        # Invalidate card image cache if price or components changed
+        await _invalidate_card_cache_if_needed(session, listing, payload)
+
+    return [listing for listing, _ in applied]
 
 
 async def partial_update_listing(
@@ -438,6 +489,7 @@ async def delete_listing(
 
     await session.delete(listing)
     await session.commit()
+    forget_listing(session, listing_id)
 
     logger.info(
         "listing.deleted",
@@ -0,0 +1,333 @@
+"""Near-duplicate listing index (MinHash + LSH over normalized title tokens).
+
+Exact deduplication (vendor id, dedup hash, URL) misses re-listed or
+re-imported deals whose titles differ slightly ("Mini PC i7-12700H 32GB" vs
+"i7-12700H Mini PC 32GB RAM"). Comparing every incoming listing against every
+stored listing does not scale, so the import preview used to compare against
+the 100 most recent listings only.
+
+This module keeps a process-wide MinHash signature per listing title,
+bucketed by LSH bands. A query hashes the incoming title once, collects the
+listings sharing at least one band bucket, and only scores those candidates:
+
+- title similarity: token Jaccard (same measure the import preview used)
+- price similarity: 1 - |a - b| / max(a, b)
+- score: 70% title + 30% price; candidates with conflicting CPU ids are dropped
+
+With 32 bands of 4 rows a pair at title Jaccard 0.57 (the lowest that can
+still reach the 0.7 score threshold) becomes a candidate ~97% of the time,
+while unrelated titles rarely share a bucket.
+
+The index is cached per database (see ``db.database_key``, so it survives the
+engine being recreated for each Celery task). Listings written in-process are
+added immediately via ``record_listing()``; writes from other processes are
+picked up by an incremental ``updated_at`` catch-up query at most every
+``REFRESH_INTERVAL_S`` seconds. Listings deleted in-process are removed via
+``forget_listing()``; deletions elsewhere are only noticed when a caller
+checks its matches with ``existing_listing_ids()``, which prunes the missing
+ones.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import time
+from collections.abc import Hashable, Iterable
+from dataclasses import dataclass
+from datetime import datetime
+
+import numpy as np
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..db import database_key
+from ..models.core import Listing
+
+logger = logging.getLogger(__name__)
+
+NUM_PERMUTATIONS = 128
+LSH_BANDS = 32
+LSH_ROWS = NUM_PERMUTATIONS // LSH_BANDS
+
+DEFAULT_THRESHOLD = 0.7
+TITLE_WEIGHT = 0.7
+PRICE_WEIGHT = 0.3
+
+REFRESH_INTERVAL_S = 30.0
+
+# Keeps IN (...) lists well below database bind-parameter limits
+LOOKUP_CHUNK_SIZE = 500
+
+_PRIME = np.uint64((1 << 31) - 1)
+_rng = np.random.default_rng(0x5EED)
+_PERM_A = _rng.integers(1, int(_PRIME), NUM_PERMUTATIONS, dtype=np.uint64)[:, None]
+_PERM_B = _rng.integers(0, int(_PRIME), NUM_PERMUTATIONS, dtype=np.uint64)[:, None]
+
+
+def title_tokens(title: str | None) -> frozenset[str]:
+    """Lowercased whitespace tokens of a listing title."""
+    return frozenset((title or "").lower().split())
+
+
+def _token_hash(token: str) -> int:
+    return int.from_bytes(hashlib.blake2b(token.encode("utf-8"), digest_size=4).digest(), "little")
+
+
+def minhash_signature(tokens: Iterable[str]) -> np.ndarray:
+    """
+    MinHash signature of a token set.
+
+    Each permutation is a universal hash ``(a * x + b) mod p`` over 32-bit
+    token hashes; products stay below 2**63 so uint64 arithmetic is exact.
+    """
+    hashes = np.fromiter((_token_hash(token) for token in tokens), dtype=np.uint64)
+    if hashes.size == 0:
+        return np.full(NUM_PERMUTATIONS, _PRIME, dtype=np.uint64)
+    return ((_PERM_A * hashes[None, :] + _PERM_B) % _PRIME).min(axis=1)
+
+
+def band_keys(signature: np.ndarray) -> list[tuple[int, bytes]]:
+    """LSH bucket keys (band index, band bytes) for a signature."""
+    return [
+        (band, signature[band * LSH_ROWS : (band + 1) * LSH_ROWS].tobytes())
+        for band in range(LSH_BANDS)
+    ]
+
+
+def jaccard(tokens_a: frozenset[str], tokens_b: frozenset[str]) -> float:
+    """Token Jaccard similarity (0.0 when either side is empty)."""
+    if not tokens_a or not tokens_b:
+        return 0.0
+    return len(tokens_a & tokens_b) / len(tokens_a | tokens_b)
+
+
+def price_similarity(price_a: float | None, price_b: float | None) -> float:
+    """1 - relative price difference, or 0.0 when either price is missing."""
+    if not price_a or not price_b:
+        return 0.0
+    return 1.0 - abs(price_a - price_b) / max(price_a, price_b)
+
+
+@dataclass(frozen=True)
+class NearDuplicate:
+    """Scored near-duplicate candidate."""
+
+    listing_id: int
+    score: float
+    title_similarity: float
+    price_similarity: float
+
+
+@dataclass
+class _IndexedListing:
+    tokens: frozenset[str]
+    price_usd: float | None
+    cpu_id: int | None
+    buckets: list[tuple[int, bytes]]
+
+
+class NearDuplicateIndex:
+    """In-memory MinHash/LSH index over listing titles."""
+
+    def __init__(self) -> None:
+        self._listings: dict[int, _IndexedListing] = {}
+        self._buckets: dict[tuple[int, bytes], set[int]] = {}
+        self.watermark: datetime | None = None
+        self.refreshed_at = 0.0
+
+    def __len__(self) -> int:
+        return len(self._listings)
+
+    def __contains__(self, listing_id: object) -> bool:
+        return listing_id in self._listings
+
+    def add(
+        self,
+        listing_id: int,
+        title: str | None,
+        price_usd: float | None = None,
+        cpu_id: int | None = None,
+    ) -> None:
+        """Add or replace a listing."""
+        self.remove(listing_id)
+        tokens = title_tokens(title)
+        if not tokens:
+            return
+        buckets = band_keys(minhash_signature(tokens))
+        self._listings[listing_id] = _IndexedListing(tokens, price_usd, cpu_id, buckets)
+        for bucket in buckets:
+            self._buckets.setdefault(bucket, set()).add(listing_id)
+
+    def remove(self, listing_id: int) -> None:
+        """Remove a listing if present."""
+        entry = self._listings.pop(listing_id, None)
+        if entry is None:
+            return
+        for bucket in entry.buckets:
+            members = self._buckets.get(bucket)
+            if members is None:
+                continue
+            members.discard(listing_id)
+            if not members:
+                del self._buckets[bucket]
+
+    def candidates(self, tokens: frozenset[str]) -> set[int]:
+        """Listing ids sharing at least one LSH bucket with ``tokens``."""
+        if not tokens:
+            return set()
+        found: set[int] = set()
+        for bucket in band_keys(minhash_signature(tokens)):
+            members = self._buckets.get(bucket)
+            if members:
+                found |= members
+        return found
+
+    def query(
+        self,
+        title: str | None,
+        price_usd: float | None = None,
+        cpu_id: int | None = None,
+        *,
+        threshold: float = DEFAULT_THRESHOLD,
+        exclude: Iterable[int] = (),
+        limit: int | None = None,
+    ) -> list[NearDuplicate]:
+        """
+        Find near-duplicates of a listing.
+
+        Args:
+            title: Listing title
+            price_usd: Listing price, if known
+            cpu_id: Listing CPU id, if known; candidates with a different CPU are skipped
+            threshold: Minimum combined score (exclusive)
+            exclude: Listing ids to skip (e.g. the listing itself or exact matches)
+            limit: Maximum number of results
+
+        Returns:
+            Matches sorted by score, highest first
+        """
+        tokens = title_tokens(title)
+        skip = set(exclude)
+        matches: list[NearDuplicate] = []
+        for listing_id in self.candidates(tokens):
+            if listing_id in skip:
+                continue
+            entry = self._listings[listing_id]
+            if cpu_id and entry.cpu_id and cpu_id != entry.cpu_id:
+                continue
+            title_score = jaccard(tokens, entry.tokens)
+            price_score = price_similarity(price_usd, entry.price_usd)
+            score = TITLE_WEIGHT * title_score + PRICE_WEIGHT * price_score
+            if score > threshold:
+                matches.append(NearDuplicate(listing_id, score, title_score, price_score))
+
+        matches.sort(key=lambda match: (-match.score, match.listing_id))
+        return matches if limit is None else matches[:limit]
+
+
+_indexes: dict[Hashable, NearDuplicateIndex] = {}
+
+
+async def _catch_up(session: AsyncSession, index: NearDuplicateIndex) -> int:
+    """Load listings written since the index watermark (all listings on first load)."""
+    stmt = select(Listing.id, Listing.title, Listing.price_usd, Listing.cpu_id, Listing.updated_at)
+    if index.watermark is not None:
+        # >= so rows sharing the watermark timestamp are not missed; re-adding is idempotent
+        stmt = stmt.where(Listing.updated_at >= index.watermark)
+    result = await session.execute(stmt)
+
+    count = 0
+    for listing_id, title, price_usd, cpu_id, updated_at in result.all():
+        index.add(listing_id, title, price_usd, cpu_id)
+        if updated_at is not None and (index.watermark is None or updated_at > index.watermark):
+            index.watermark = updated_at
+        count += 1
+    index.refreshed_at = time.monotonic()
+    return count
+
+
+async def get_near_duplicate_index(session: AsyncSession) -> NearDuplicateIndex:
+    """
+    Return the process-wide near-duplicate index for the session's database.
+
+    The first call loads every listing; later calls run the incremental
+    catch-up query at most once per ``REFRESH_INTERVAL_S``.
+    """
+    key = database_key(session.get_bind())
+    index = _indexes.get(key)
+    if index is None:
+        index = NearDuplicateIndex()
+        loaded = await _catch_up(session, index)
+        _indexes[key] = index
+        logger.info(f"Built near-duplicate index with {loaded} listings")
+    elif time.monotonic() - index.refreshed_at >= REFRESH_INTERVAL_S:
+        await _catch_up(session, index)
+    return index
+
+
+def record_listing(session: AsyncSession, listing: Listing) -> None:
+    """Add a just-written listing to the cached index, if one is loaded."""
+    if listing.id is not None:
+        record_listing_values(session, listing.id, listing.title, listing.price_usd, listing.cpu_id)
+
+
+def record_listing_values(
+    session: AsyncSession,
+    listing_id: int,
+    title: str | None,
+    price_usd: float | None = None,
+    cpu_id: int | None = None,
+) -> None:
+    """Add a listing written without an ORM instance (e.g. a bulk INSERT)."""
+    index = _indexes.get(database_key(session.get_bind()))
+    if index is not None:
+        index.add(listing_id, title, price_usd, cpu_id)
+
+
+def forget_listing(session: AsyncSession, listing_id: int) -> None:
+    """Remove a just-deleted listing from the cached index, if one is loaded."""
+    index = _indexes.get(database_key(session.get_bind()))
+    if index is not None:
+        index.remove(listing_id)
+
+
+async def existing_listing_ids(
+    session: AsyncSession, index: NearDuplicateIndex, listing_ids: Iterable[int]
+) -> set[int]:
+    """
+    Return the listing ids that still exist, removing the others from ``index``.
+
+    The catch-up query cannot see deletions made by other processes, so
+    matches must be checked against the database before they are reported.
+    """
+    wanted = sorted(set(listing_ids))
+    existing: set[int] = set()
+    for start in range(0, len(wanted), LOOKUP_CHUNK_SIZE):
+        chunk = wanted[start : start + LOOKUP_CHUNK_SIZE]
+        result = await session.execute(select(Listing.id).where(Listing.id.in_(chunk)))
+        existing.update(result.scalars())
+    for listing_id in set(wanted) - existing:
+        index.remove(listing_id)
+    return existing
+
+
+def invalidate_near_duplicate_index() -> None:
+    """Drop all cached indexes."""
+    _indexes.clear()
+
+
+__all__ = [
+    "NearDuplicate",
+    "NearDuplicateIndex",
+    "existing_listing_ids",
+    "forget_listing",
+    "get_near_duplicate_index",
+    "invalidate_near_duplicate_index",
+    "jaccard",
+    "minhash_signature",
+    "price_similarity",
+    "record_listing",
+    "record_listing_values",
+    "title_tokens",
+]
@@ -5,19 +5,50 @@ from __future__ import annotations
 import csv
 import html
 import json
+import logging
 import re
+from collections.abc import Callable
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
 from sqlalchemy import func, select
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ..db import session_scope
 from ..models import Cpu
+from .cpu_analytics import CPUAnalyticsService
+
+logger = logging.getLogger(__name__)
 
 NUMERIC_NA = {"", "na", "n/a", "null", "none"}
 
+# Rows per INSERT ... ON CONFLICT statement (13 bound parameters per row)
+BULK_CHUNK_SIZE = 1000
+
+# Columns written by the bulk upsert; ``name`` is the conflict target
+UPSERT_COLUMNS = (
+    "name",
+    "manufacturer",
+    "socket",
+    "cores",
+    "threads",
+    "tdp_w",
+    "igpu_model",
+    "cpu_mark_multi",
+    "cpu_mark_single",
+    "igpu_mark",
+    "release_year",
+    "notes",
+    "attributes_json",
+)
+
+_UPSERT_INSERTS = {"postgresql": postgresql_insert, "sqlite": sqlite_insert}
+
+ProgressCallback = Callable[[int, int], None]
+
 
 @dataclass(frozen=True, slots=True)
 class PassmarkImportSummary:
@@ -25,6 +56,7 @@ class PassmarkImportSummary:
     created: int
     failed: int
     not_found: list[str]
+    analytics_updated: int = 0
 
     def to_dict(self) -> dict[str, Any]:
         return {
@@ -32,6 +64,7 @@ class PassmarkImportSummary:
             "created": self.created,
             "failed": self.failed,
             "not_found": self.not_found,
+            "analytics_updated": self.analytics_updated,
         }
 
 
@@ -112,7 +145,14 @@ def build_passmark_url(href: str | None) -> tuple[str | None, str | None]:
     return slug, url
 
 
-def update_cpu_from_passmark(cpu: Cpu, data: dict[str, Any]) -> None:
+def passmark_updates(
+    data: dict[str, Any], name: str, attributes: dict[str, Any] | None = None
+) -> dict[str, Any]:
+    """Column values a PassMark entry sets on the CPU called ``name``.
+
+    Only fields present in the entry are returned; ``attributes`` is the CPU's
+    current ``attributes_json``, merged with the PassMark slug and URL.
+    """
     cpu_mark_multi = parse_int(
         data.get("rating")
         or data.get("cpumark")
@@ -151,7 +191,7 @@ def update_cpu_from_passmark(cpu: Cpu, data: dict[str, Any]) -> None:
 
     manufacturer = parse_string(data.get("manufacturer") or data.get("brand"))
     if manufacturer is None:
-        manufacturer = infer_manufacturer(cpu.name)
+        manufacturer = infer_manufacturer(name)
 
     socket = parse_string(data.get("socket") or data.get("socketType"))
     igpu_model = parse_string(
@@ -159,139 +199,138 @@ def update_cpu_from_passmark(cpu: Cpu, data: dict[str, Any]) -> None:
     )
     notes = parse_string(data.get("notes") or data.get("comment"))
 
-    if cpu_mark_single is not None:
-        cpu.cpu_mark_single = cpu_mark_single
-    if cpu_mark_multi is not None:
-        cpu.cpu_mark_multi = cpu_mark_multi
-    if igpu_mark is not None:
-        cpu.igpu_mark = igpu_mark
-    if tdp_w is not None:
-        cpu.tdp_w = tdp_w
-    if release_year is not None:
-        cpu.release_year = release_year
-    if cores is not None:
-        cpu.cores = cores
-    if threads is not None:
-        cpu.threads = threads
-    if socket is not None:
-        cpu.socket = socket
-    if igpu_model is not None:
-        cpu.igpu_model = igpu_model
-    if notes:
-        cpu.notes = notes
-    if manufacturer and manufacturer != cpu.manufacturer:
-        cpu.manufacturer = manufacturer
-
-    attributes = dict(cpu.attributes_json or {})
+    values: dict[str, Any] = {
+        "cpu_mark_single": cpu_mark_single,
+        "cpu_mark_multi": cpu_mark_multi,
+        "igpu_mark": igpu_mark,
+        "tdp_w": tdp_w,
+        "release_year": release_year,
+        "cores": cores,
+        "threads": threads,
+        "socket": socket,
+        "igpu_model": igpu_model,
+        "notes": notes,
+        "manufacturer": manufacturer,
+    }
+    updates = {key: value for key, value in values.items() if value is not None}
+
+    merged = dict(attributes or {})
     slug, url = build_passmark_url(parse_string(data.get("href") or data.get("url")))
     if slug:
-        attributes["passmark_slug"] = slug
+        merged["passmark_slug"] = slug
     if url:
-        attributes["passmark_url"] = url
-    if attributes:
-        cpu.attributes_json = attributes
+        merged["passmark_url"] = url
+    if merged:
+        updates["attributes_json"] = merged
+    return updates
 
 
-async def import_passmark_file(path: Path) -> PassmarkImportSummary:
+def update_cpu_from_passmark(cpu: Cpu, data: dict[str, Any]) -> None:
+    for key, value in passmark_updates(data, cpu.name, cpu.attributes_json).items():
+        setattr(cpu, key, value)
+
+
+async def import_passmark_file(
+    path: Path,
+    *,
+    bulk: bool = True,
+    chunk_size: int = BULK_CHUNK_SIZE,
+    progress: ProgressCallback | None = None,
+) -> PassmarkImportSummary:
+    """Import a PassMark CSV or JSON export into the CPU catalog.
+
+    Bulk mode (default) upserts the file in chunks of ``chunk_size`` rows, one
+    transaction per chunk, and then refreshes analytics for the CPUs whose
+    marks changed. ``progress`` is called with (rows written, total rows)
+    after every chunk. Row mode updates CPUs one at a time in a single
+    transaction and is used for databases without ``ON CONFLICT`` support.
+    """
     suffix = path.suffix.lower()
     if suffix not in {".csv", ".json"}:
         raise ValueError("Unsupported PassMark file type; expected CSV or JSON.")
 
     if suffix == ".csv":
-        return await _import_csv(path)
-    return await _import_json(path)
-
-
-async def _import_csv(path: Path) -> PassmarkImportSummary:
-    updated_count = 0
-    created_count = 0
-    not_found: list[str] = []
-    failed = 0
-
-    async with session_scope() as session:
-        with path.open("r", encoding="utf-8") as handle:
-            reader = csv.DictReader(handle)
-            for row_num, row in enumerate(reader, start=2):
-                cpu_name = (row.get("cpu_name") or "").strip()
-                if not cpu_name:
-                    failed += 1
-                    continue
-
-                cpu = await _get_cpu_by_name(session, cpu_name)
-
-                try:
-                    row_data = dict(row)
-                    row_data["name"] = cpu_name
-                    if cpu:
-                        update_cpu_from_passmark(cpu, row_data)
-                        updated_count += 1
-                    else:
-                        manufacturer = infer_manufacturer(cpu_name) or "Unknown"
-                        cpu = Cpu(name=cpu_name, manufacturer=manufacturer)
-                        update_cpu_from_passmark(cpu, row_data)
-                        session.add(cpu)
-                        created_count += 1
-                except Exception:
-                    failed += 1
-                    not_found.append(cpu_name)
+        entries, failed = _read_csv(path)
+    else:
+        entries, failed = _read_json(path)
 
-    return PassmarkImportSummary(
-        updated=updated_count,
-        created=created_count,
-        failed=failed,
-        not_found=not_found,
-    )
+    if bulk:
+        async with session_scope() as session:
+            dialect = session.get_bind().dialect.name
+        if dialect in _UPSERT_INSERTS:
+            return await _import_bulk(entries, failed, dialect, chunk_size, progress)
+        logger.info(f"PassMark bulk import not supported on {dialect}; importing row by row")
+    return await _import_rows(entries, failed)
 
 
-async def _import_json(path: Path) -> PassmarkImportSummary:
-    updated_count = 0
-    created_count = 0
-    not_found: list[str] = []
+def _read_csv(path: Path) -> tuple[list[tuple[str, dict[str, Any]]], int]:
+    entries: list[tuple[str, dict[str, Any]]] = []
     failed = 0
+    with path.open("r", encoding="utf-8") as handle:
+        for row in csv.DictReader(handle):
+            cpu_name = (row.get("cpu_name") or "").strip()
+            if not cpu_name:
+                failed += 1
+                continue
+            row_data = dict(row)
+            row_data["name"] = cpu_name
+            entries.append((cpu_name, row_data))
+    return entries, failed
+
 
+def _read_json(path: Path) -> tuple[list[tuple[str, dict[str, Any]]], int]:
     payload = json.loads(path.read_text())
 
     if isinstance(payload, dict):
         for candidate in ("cpus", "items", "data"):
             if candidate in payload and isinstance(payload[candidate], list):
-                entries = payload[candidate]
+                raw_entries = payload[candidate]
                 break
         else:
-            entries = list(payload.values())
+            raw_entries = list(payload.values())
     else:
-        entries = payload
+        raw_entries = payload
 
-    if not isinstance(entries, list):
+    if not isinstance(raw_entries, list):
         raise ValueError("Expected a list of CPU entries in PassMark JSON payload.")
 
-    async with session_scope() as session:
-        for entry in entries:
-            if not isinstance(entry, dict):
-                failed += 1
-                continue
-            cpu_name = parse_string(
-                entry.get("name")
-                or entry.get("cpu_name")
-                or entry.get("CPU Name")
-                or entry.get("model")
-            )
-            if not cpu_name:
-                failed += 1
-                continue
+    entries: list[tuple[str, dict[str, Any]]] = []
+    failed = 0
+    for entry in raw_entries:
+        if not isinstance(entry, dict):
+            failed += 1
+            continue
+        cpu_name = parse_string(
+            entry.get("name")
+            or entry.get("cpu_name")
+            or entry.get("CPU Name")
+            or entry.get("model")
+        )
+        if not cpu_name:
+            failed += 1
+            continue
+        entries.append((cpu_name, entry))
+    return entries, failed
+
+
+async def _import_rows(
+    entries: list[tuple[str, dict[str, Any]]], failed: int
+) -> PassmarkImportSummary:
+    updated_count = 0
+    created_count = 0
+    not_found: list[str] = []
 
+    async with session_scope() as session:
+        for cpu_name, data in entries:
             cpu = await _get_cpu_by_name(session, cpu_name)
             try:
                 if cpu:
-                    update_cpu_from_passmark(cpu, entry)
+                    update_cpu_from_passmark(cpu, data)
                     updated_count += 1
                 else:
-                    manufacturer = (
-                        parse_string(entry.get("manufacturer"))
-                        or infer_manufacturer(cpu_name)
-                        or "Unknown"
-                    )
+                    manufacturer = infer_manufacturer(cpu_name) or "Unknown"
                     cpu = Cpu(name=cpu_name, manufacturer=manufacturer)
-                    update_cpu_from_passmark(cpu, entry)
+                    update_cpu_from_passmark(cpu, data)
                     session.add(cpu)
                     created_count += 1
             except Exception:
@@ -306,6 +345,122 @@ async def _import_json(path: Path) -> PassmarkImportSummary:
     )
 
 
+async def _import_bulk(
+    entries: list[tuple[str, dict[str, Any]]],
+    failed: int,
+    dialect: str,
+    chunk_size: int,
+    progress: ProgressCallback | None,
+) -> PassmarkImportSummary:
+    not_found: list[str] = []
+
+    async with session_scope() as session:
+        existing = await _load_existing_cpus(session)
+
+    # Merge every entry onto the stored row (or earlier entries for the same CPU)
+    # so each CPU is written once with its final values.
+    rows: dict[str, dict[str, Any]] = {}
+    for cpu_name, data in entries:
+        key = cpu_name.lower()
+        current = rows.get(key) or existing.get(key)
+        if current is None:
+            current = dict.fromkeys(UPSERT_COLUMNS)
+            current.update(
+                name=cpu_name,
+                manufacturer=infer_manufacturer(cpu_name) or "Unknown",
+                attributes_json={},
+            )
+        try:
+            updates = passmark_updates(data, current["name"], current["attributes_json"])
+        except Exception:
+            failed += 1
+            not_found.append(cpu_name)
+            continue
+        rows[key] = {**current, **updates}
+
+    insert = _UPSERT_INSERTS[dialect]
+    pending = list(rows.items())
+    written = 0
+    updated_count = 0
+    created_count = 0
+    changed_ids: list[int] = []
+
+    for start in range(0, len(pending), chunk_size):
+        chunk = pending[start : start + chunk_size]
+        stmt = insert(Cpu).values([row for _, row in chunk])
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[Cpu.name],
+            set_={
+                **{column: stmt.excluded[column] for column in UPSERT_COLUMNS if column != "name"},
+                "updated_at": func.now(),
+            },
+        ).returning(Cpu.id, Cpu.name)
+        try:
+            async with session_scope() as session:
+                ids = {name.lower(): cpu_id for cpu_id, name in (await session.execute(stmt)).all()}
+        except Exception:
+            logger.exception(f"PassMark upsert failed for rows {start + 1}-{start + len(chunk)}")
+            failed += len(chunk)
+            not_found.extend(row["name"] for _, row in chunk)
+            continue
+
+        for key, row in chunk:
+            previous = existing.get(key)
+            if previous is None:
+                created_count += 1
+            else:
+                updated_count += 1
+            previous_marks = _marks(previous) if previous else (None, None)
+            if _marks(row) != previous_marks and key in ids:
+                changed_ids.append(ids[key])
+
+        written += len(chunk)
+        logger.info(f"PassMark import: {written}/{len(pending)} CPUs written")
+        if progress is not None:
+            progress(written, len(pending))
+
+    analytics_updated = await _refresh_cpu_analytics(changed_ids)
+
+    return PassmarkImportSummary(
+        updated=updated_count,
+        created=created_count,
+        failed=failed,
+        not_found=not_found,
+        analytics_updated=analytics_updated,
+    )
+
+
+def _marks(row: dict[str, Any]) -> tuple[int | None, int | None]:
+    return row["cpu_mark_single"], row["cpu_mark_multi"]
+
+
+async def _load_existing_cpus(session: AsyncSession) -> dict[str, dict[str, Any]]:
+    """Stored CPUs keyed by lowercased name, with the columns an import can change."""
+    columns = [getattr(Cpu, column) for column in UPSERT_COLUMNS]
+    result = await session.execute(select(*columns).order_by(Cpu.id))
+    existing: dict[str, dict[str, Any]] = {}
+    for row in result.mappings():
+        existing.setdefault(row["name"].lower(), dict(row))
+    return existing
+
+
+async def _refresh_cpu_analytics(cpu_ids: list[int]) -> int:
+    """Recalculate analytics for CPUs whose benchmark marks changed."""
+    if not cpu_ids:
+        return 0
+
+    updated = 0
+    async with session_scope() as session:
+        for cpu_id in cpu_ids:
+            try:
+                await CPUAnalyticsService.update_cpu_analytics(session, cpu_id)
+                updated += 1
+            except Exception as e:
+                logger.error(f"Failed to update analytics for CPU {cpu_id}: {e}")
+    logger.info(f"PassMark import: refreshed analytics for {updated}/{len(cpu_ids)} CPUs")
+    return updated
+
+
 async def _get_cpu_by_name(session: AsyncSession, name: str) -> Cpu | None:
     stmt = select(Cpu).where(func.lower(Cpu.name) == func.lower(name))
     result = await session.execute(stmt)
@@ -58,17 +58,133 @@ class PlaywrightAdapterConfig(BaseModel):
         description="Maximum retry attempts",
     )
     pool_size: int = Field(
-        default=3,
+        default=2,
         ge=1,
         le=10,
         description="Number of browser instances in pool",
     )
+    max_contexts_per_browser: int = Field(
+        default=10,
+        ge=1,
+        le=32,
+        description=(
+            "Concurrent scraping contexts multiplexed over each browser instance "
+            "(card rendering slots are added on top)"
+        ),
+    )
+    block_resources: bool = Field(
+        default=True,
+        description="Abort image, font, media and ad requests during extraction",
+    )
+    max_browser_memory_mb: int | None = Field(
+        default=1024,
+        ge=128,
+        description="Recycle a browser once its resident memory exceeds this (None disables)",
+    )
     headless: bool = Field(
         default=True,
         description="Run browsers in headless mode (required for Docker)",
     )
 
 
+class AdapterHedgingConfig(BaseModel):
+    """Configuration for hedged (parallel) adapter fallback in AdapterRouter."""
+
+    enabled: bool = Field(
+        default=False,
+        description="Start the next adapter in parallel when the current one is slow",
+    )
+    delay_ms: int = Field(
+        default=2000,
+        ge=0,
+        le=60000,
+        description="Hedge delay used until enough latency samples are recorded",
+    )
+    adaptive: bool = Field(
+        default=True,
+        description="Derive the hedge delay from each adapter's recorded latency",
+    )
+    latency_percentile: float = Field(
+        default=0.9,
+        ge=0.5,
+        le=0.99,
+        description="Latency percentile of the running adapter used as its hedge delay",
+    )
+    min_delay_ms: int = Field(
+        default=250,
+        ge=0,
+        description="Lower bound for adaptive hedge delays",
+    )
+    max_delay_ms: int = Field(
+        default=8000,
+        ge=0,
+        description="Upper bound for adaptive hedge delays",
+    )
+    min_samples: int = Field(
+        default=20,
+        ge=1,
+        description="Successful extractions required before adaptive delays are used",
+    )
+
+
+class AdapterCircuitBreakerConfig(BaseModel):
+    """Configuration for per-adapter, per-domain circuit breakers in AdapterRouter."""
+
+    enabled: bool = Field(
+        default=False,
+        description="Skip adapters whose circuit is open for a domain",
+    )
+    failure_threshold: int = Field(
+        default=5,
+        ge=1,
+        le=100,
+        description="Consecutive failures that open the circuit",
+    )
+    open_duration_s: int = Field(
+        default=60,
+        ge=1,
+        le=3600,
+        description="Seconds an open circuit waits before allowing a half-open probe",
+    )
+    min_success_rate: float = Field(
+        default=0.2,
+        ge=0.0,
+        le=1.0,
+        description="Open the circuit when the recent success rate falls below this",
+    )
+    degraded_success_rate: float = Field(
+        default=0.7,
+        ge=0.0,
+        le=1.0,
+        description="Adapters below this success rate are tried after healthy ones",
+    )
+    slow_latency_s: float = Field(
+        default=10.0,
+        gt=0.0,
+        description="Adapters slower than this (EWMA) are tried after healthy ones",
+    )
+    min_samples: int = Field(
+        default=10,
+        ge=1,
+        description="Attempts required before success rate affects routing",
+    )
+    ewma_alpha: float = Field(
+        default=0.2,
+        gt=0.0,
+        le=1.0,
+        description="Weight of the newest attempt in the success rate and latency averages",
+    )
+    use_redis: bool = Field(
+        default=True,
+        description="Share breaker state across workers through Redis",
+    )
+    state_ttl_s: int = Field(
+        default=86400,
+        ge=60,
+        description="Expiry of breaker state in Redis after the last update",
+    )
+
+
 class IngestionSettings(BaseModel):
     """Configuration for URL ingestion system."""
 
@@ -107,11 +223,20 @@ class IngestionSettings(BaseModel):
             enabled=True,
             timeout_s=8,
             max_retries=2,
-            pool_size=3,
+            pool_size=2,
+            max_contexts_per_browser=10,
             headless=True,
         ),
         description="Playwright browser-based adapter configuration",
     )
+    hedging: AdapterHedgingConfig = Field(
+        default_factory=AdapterHedgingConfig,
+        description="Hedged adapter fallback configuration",
+    )
+    circuit_breaker: AdapterCircuitBreakerConfig = Field(
+        default_factory=AdapterCircuitBreakerConfig,
+        description="Adapter circuit breaker configuration",
+    )
 
     # Price change detection
     price_change_threshold_pct: float = Field(
@@ -126,6 +251,19 @@ class IngestionSettings(BaseModel):
         description="Emit price change event if price changes by this absolute amount (USD)",
     )
 
+    # Bulk jobs
+    bulk_batch_size: int = Field(
+        default=10,
+        ge=1,
+        le=100,
+        description="Bulk-job URLs ingested per Celery task (duplicates resolved once per batch)",
+    )
+    bulk_progress_interval_s: float = Field(
+        default=2.0,
+        ge=0.0,
+        description="Minimum seconds between rolled-up progress events and writes per bulk job",
+    )
+
     # Raw payload management
     raw_payload_ttl_days: int = Field(
         default=30,
@@ -234,7 +372,9 @@ class PlaywrightSettings(BaseModel):
         default=2,
         ge=1,
         le=10,
-        description="Maximum number of concurrent browser instances (default 2 to conserve memory)",
+        description=(
+            "Maximum concurrent card renders (rendering tenant quota in the shared browser pool)"
+        ),
     )
     browser_timeout_ms: int = Field(
         default=30000,
@@ -246,6 +386,26 @@ class PlaywrightSettings(BaseModel):
         default=True,
         description="Run browsers in headless mode (required for Docker)",
     )
+    warm_up_on_startup: bool = Field(
+        default=False,
+        description="Launch the shared browser pool when an API or worker process starts",
+    )
+
+
+class CardRenderSettings(BaseModel):
+    """Configuration for choosing the card image renderer."""
+
+    pillow_sizes: list[Literal["social", "instagram", "story"]] = Field(
+        default_factory=list,
+        description=(
+            "Card size presets drawn directly with Pillow instead of screenshotting "
+            "the HTML template in Chromium"
+        ),
+    )
+    font_dir: Path | None = Field(
+        default=None,
+        description="Directory with the TrueType fonts for Pillow cards (defaults to system fonts)",
+    )
 
 
 class S3Settings(BaseModel):
@@ -281,6 +441,62 @@ class S3Settings(BaseModel):
         default=None,
         description="Custom S3 endpoint URL (for LocalStack or MinIO in development)",
     )
+    local_cache_max_bytes: int = Field(
+        default=64 * 1024 * 1024,
+        ge=0,
+        description="In-process LRU tier in front of S3 for rendered cards (0 disables it)",
+    )
+
+
+class ImportPreviewSettings(BaseModel):
+    """Configuration for the shared import preview store."""
+
+    ttl_minutes: int = Field(
+        default=30,
+        ge=1,
+        description="Minutes a preview stays available for confirmation",
+    )
+    page_size: int = Field(
+        default=500,
+        ge=1,
+        description="Rows per stored page; one page is read per preview scroll window",
+    )
+    max_entries: int = Field(
+        default=200,
+        ge=1,
+        description="Previews kept before the least recently used is evicted",
+    )
+    max_preview_bytes: int = Field(
+        default=64 * 1024 * 1024,
+        ge=1024,
+        description="Largest compressed preview accepted",
+    )
+    max_total_bytes: int = Field(
+        default=512 * 1024 * 1024,
+        ge=1024,
+        description="Compressed size of all previews before LRU eviction starts",
+    )
+
+
+class FieldValueSettings(BaseModel):
+    """Configuration for the in-memory field value dictionaries behind autocomplete."""
+
+    dictionary_ttl_s: float = Field(
+        default=300.0,
+        ge=0,
+        description=(
+            "Seconds before a field's value dictionary is reloaded, picking up writes made "
+            "by other processes"
+        ),
+    )
+    dictionary_max_values: int = Field(
+        default=5000,
+        ge=0,
+        description=(
+            "Fields with more distinct values than this are searched in the database "
+            "instead of held in memory"
+        ),
+    )
 
 
 class Settings(BaseSettings):
@@ -334,12 +550,30 @@ class Settings(BaseSettings):
         description="Playwright headless browser configuration",
     )
 
+    # Card renderer selection (Pillow vs. Playwright) per size preset
+    cards: CardRenderSettings = Field(
+        default_factory=CardRenderSettings,
+        description="Card image renderer configuration",
+    )
+
     # S3 settings for card image caching
     s3: S3Settings = Field(
         default_factory=S3Settings,
         description="S3 card image caching configuration",
     )
 
+    # Field value dictionaries (autocomplete)
+    field_values: FieldValueSettings = Field(
+        default_factory=FieldValueSettings,
+        description="Field value autocomplete configuration",
+    )
+
+    # Import preview store (collection/listing JSON imports)
+    import_preview: ImportPreviewSettings = Field(
+        default_factory=ImportPreviewSettings,
+        description="Import preview storage configuration",
+    )
+
     # Environment variable overrides for adapter API keys
     ebay_api_key: str | None = Field(
         default=None,
@@ -394,6 +628,8 @@ def get_settings() -> Settings:
 
 __all__ = [
     "AdapterConfig",
+    "AdapterCircuitBreakerConfig",
+    "AdapterHedgingConfig",
     "PlaywrightAdapterConfig",
     "EmailSettings",
     "IngestionSettings",
@@ -8,7 +8,7 @@ from .admin import (
 )
 from .baseline import load_baseline_task
 from .cpu_metrics import recalculate_all_cpu_metrics
-from .ingestion import ingest_url_task
+from .ingestion import ingest_url_batch_task, ingest_url_task
 from .notifications import send_share_notification_email
 from .valuation import (
     enqueue_listing_recalculation,
@@ -24,6 +24,7 @@ __all__ = [
     "enqueue_listing_recalculation",
     "recalculate_listings_task",
     "ingest_url_task",
+    "ingest_url_batch_task",
     "recalculate_all_cpu_metrics",
     "send_share_notification_email",
 ]
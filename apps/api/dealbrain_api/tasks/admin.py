@@ -7,8 +7,8 @@ from pathlib import Path
 from typing import Iterable
 
 from ..db import dispose_engine, session_scope
-from ..importers.universal import ImporterError, load_seed_from_file
-from ..seeds import apply_seed
+from ..importers.bulk import import_entities_bulk
+from ..importers.universal import ImporterError
 from ..services import admin_tasks as admin_services
 from ..services.listings import bulk_update_listing_metrics
 from ..services.passmark import PassmarkImportSummary, import_passmark_file
@@ -86,8 +86,14 @@ def recalculate_cpu_mark_metrics_task(listing_ids: list[int] | None = None) -> d
             asyncio.set_event_loop(None)
 
 
+def _log_passmark_progress(written: int, total: int) -> None:
+    logger.info("admin.import_passmark.progress", written=written, total=total)
+
+
 async def _import_passmark_async(file_path: Path) -> dict[str, object]:
-    summary: PassmarkImportSummary = await import_passmark_file(file_path)
+    summary: PassmarkImportSummary = await import_passmark_file(
+        file_path, progress=_log_passmark_progress
+    )
     return summary.to_dict()
 
 
@@ -122,15 +128,12 @@ def import_passmark_task(file_path: str) -> dict[str, object]:
 
 async def _import_entities_async(entity: str, file_path: Path, dry_run: bool) -> dict[str, object]:
     try:
-        seed, count = load_seed_from_file(file_path, entity)
+        report = await import_entities_bulk(file_path, entity, dry_run=dry_run)
     except ImporterError as exc:
         return {"status": "FAILURE", "error": str(exc)}
 
-    if dry_run:
-        return {"status": "dry_run", "records": count}
-
-    await apply_seed(seed)
-    return {"status": "imported", "records": count}
+    status = "dry_run" if dry_run else "imported"
+    return {"status": status, **report.to_dict()}
 
 
 @celery_app.task(name="admin.import_entities")
@@ -150,7 +153,15 @@ def import_entities_task(entity: str, file_path: str, dry_run: bool = False) ->
         loop.run_until_complete(dispose_engine())
 
         result = loop.run_until_complete(_import_entities_async(entity, path, dry_run))
-        logger.info("admin.import_entities.complete", entity=entity, **result)
+        logger.info(
+            "admin.import_entities.complete",
+            entity=entity,
+            status=result["status"],
+            records=result.get("records"),
+            imported=result.get("imported"),
+            failed=result.get("failed"),
+            error=result.get("error"),
+        )
         return result
     finally:
         # Clean up loop after task completion
@@ -5,14 +5,67 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 from dealbrain_api.telemetry import get_logger
-from dealbrain_api.worker import celery_app
+from dealbrain_api.worker import celery_app, run_async
 
 if TYPE_CHECKING:
     from dealbrain_api.models.core import Listing
+    from sqlalchemy.ext.asyncio import AsyncSession
 
 logger = get_logger("dealbrain.tasks.card_images")
 
 
+# Ranking for warm_cache_top_listings: metric name -> (column, best first when ascending)
+TOP_LISTING_METRICS: dict[str, tuple[str, bool]] = {
+    "cpu_mark_per_dollar": ("dollar_per_cpu_mark_multi", True),
+    "single_mark_per_dollar": ("dollar_per_cpu_mark_single", True),
+    "score_composite": ("score_composite", False),
+    "perf_per_watt": ("perf_per_watt", False),
+    "adjusted_price": ("adjusted_price_usd", True),
+}
+
+
+async def _select_top_listings(session: AsyncSession, limit: int, metric: str) -> list[Listing]:
+    """Active listings ranked best-first by ``metric`` (see ``TOP_LISTING_METRICS``)."""
+    from dealbrain_api.models.core import Listing
+    from dealbrain_core.enums import ListingStatus
+    from sqlalchemy import select
+
+    column_name, ascending = TOP_LISTING_METRICS[metric]
+    column = getattr(Listing, column_name)
+    stmt = (
+        select(Listing)
+        .where(Listing.status == ListingStatus.ACTIVE.value, column.is_not(None))
+        .order_by(column.asc() if ascending else column.desc(), Listing.id)
+        .limit(limit)
+    )
+    return list((await session.scalars(stmt)).unique())
+
+
+async def _warm_cache_top_listings_async(
+    limit: int, metric: str, sizes: list[str]
+) -> dict[str, int | str]:
+    from dealbrain_api.db import session_scope
+    from dealbrain_api.services.image_generation import ImageGenerationService
+
+    async with session_scope() as session:
+        listings = await _select_top_listings(session, limit, metric)
+        logger.info(f"Found {len(listings)} listings to warm cache")
+
+        service = ImageGenerationService(session)
+        result = await service.render_cards_batch(listings, sizes=sizes)
+
+    logger.info(
+        f"Cache warm-up completed: {result.rendered} rendered, "
+        f"{result.skipped} unchanged, {result.failed} errors"
+    )
+    return {
+        "success_count": result.rendered,
+        "skipped_count": result.skipped,
+        "error_count": result.failed,
+        "status": "completed",
+    }
+
+
 @celery_app.task(name="card_images.warm_cache_top_listings", bind=True)
 def warm_cache_top_listings(
     self,
@@ -26,25 +79,36 @@ def warm_cache_top_listings(
     popular listings. By pre-generating these images, we avoid cold starts
     for the most frequently accessed cards.
 
+    Every style/size/format variant is rendered in one batch across a
+    bounded set of browser pages; variants whose cached image was rendered
+    from the same content are skipped.
+
     Args:
         limit: Number of top listings to pre-generate (default 100)
-        metric: Metric to sort by (default "cpu_mark_per_dollar")
+        metric: Metric to rank by, a key of ``TOP_LISTING_METRICS``
+            (default "cpu_mark_per_dollar")
 
     Returns:
-        Dict with success count, error count, and status message
+        Dict with success, skipped and error counts and status message
 
     Example:
         >>> warm_cache_top_listings.delay(limit=50)
     """
-    from dealbrain_api.db import session_scope
-    from dealbrain_api.models.core import Listing
+    from dealbrain_api.db import dispose_engine
+    from dealbrain_api.services.image_generation import CARD_DIMENSIONS
     from dealbrain_api.settings import get_settings
-    from sqlalchemy import select
 
     settings = get_settings()
 
+    # Without a browser only the sizes drawn with Pillow can be rendered
+    sizes = [
+        size
+        for size in CARD_DIMENSIONS
+        if settings.playwright.enabled or size in settings.cards.pillow_sizes
+    ]
+
     # Check if features are enabled
-    if not settings.playwright.enabled:
+    if not sizes:
         logger.warning("Playwright disabled, skipping cache warm-up")
         return {
             "success_count": 0,
@@ -62,48 +126,22 @@ def warm_cache_top_listings(
             "reason": "s3_disabled",
         }
 
-    logger.info(f"Starting cache warm-up for top {limit} listings by {metric}")
+    if metric not in TOP_LISTING_METRICS:
+        logger.warning(f"Unknown metric {metric!r}, skipping cache warm-up")
+        return {
+            "success_count": 0,
+            "error_count": 0,
+            "status": "skipped",
+            "reason": "unknown_metric",
+        }
 
-    success_count = 0
-    error_count = 0
+    logger.info(f"Starting cache warm-up for top {limit} listings by {metric}")
 
+    # Run on the worker's persistent loop so the shared browser pool stays warm
+    # between tasks; other tasks may have bound the engine to their own loop
     try:
-        with session_scope() as session:
-            # Get top listings by specified metric
-            # Note: This will be updated once the card image service is implemented
-            stmt = select(Listing).order_by(Listing.id.desc()).limit(limit)
-            result = session.execute(stmt)
-            listings = result.scalars().all()
-
-            logger.info(f"Found {len(listings)} listings to warm cache")
-
-            for listing in listings:
-                try:
-                    # TODO: Import and call card image generation service
-                    # from dealbrain_api.services.card_images import generate_card_image
-                    # generate_card_image(listing_id=listing.id, force_regenerate=False)
-
-                    # Placeholder for now - will be implemented in Phase 2b
-                    logger.debug(f"Would generate card image for listing {listing.id}")
-                    success_count += 1
-
-                except Exception as e:
-                    logger.error(
-                        f"Failed to generate card image for listing {listing.id}: {e}",
-                        exc_info=True,
-                    )
-                    error_count += 1
-                    # Continue with next listing even if one fails
-
-            logger.info(
-                f"Cache warm-up completed: {success_count} success, {error_count} errors"
-            )
-
-            return {
-                "success_count": success_count,
-                "error_count": error_count,
-                "status": "completed",
-            }
+        run_async(dispose_engine())
+        return run_async(_warm_cache_top_listings_async(limit, metric, sizes))
 
     except Exception as e:
         logger.error(f"Cache warm-up failed: {e}", exc_info=True)
@@ -2,26 +2,32 @@
 
 from __future__ import annotations
 
-import asyncio
+from collections.abc import Iterable
 from datetime import datetime, timedelta
 from typing import Any
 from uuid import UUID
 
 from sqlalchemy import delete, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from ..db import dispose_engine, session_scope
 from ..events import EventType, publish_event
 from ..models.core import ImportSession, RawPayload
-from ..services.ingestion import IngestionService
+from ..services.ingestion import IngestionResult, IngestionService
+from ..services.ingestion.progress import bulk_progress
 from ..settings import get_settings
 from ..telemetry import bind_request_context, clear_context, get_logger, new_request_id
-from ..worker import celery_app
+from ..worker import celery_app, run_async
 
 logger = get_logger("dealbrain.tasks.ingestion")
 
 INGEST_TASK_NAME = "ingestion.ingest_url"
+INGEST_BATCH_TASK_NAME = "ingestion.ingest_url_batch"
 CLEANUP_TASK_NAME = "ingestion.cleanup_expired_payloads"
 
+# Child statuses a (retried) batch still has to ingest
+_UNFINISHED_STATUSES = ("queued", "running")
+
 
 async def _ingest_url_async(
     *,
@@ -58,155 +64,46 @@ async def _ingest_url_async(
         try:
             # Milestone 1: Job started (10%)
             import_session.status = "running"
-            import_session.progress_pct = 10
-            await session.flush()
-            logger.info(
-                "ingestion.task.progress",
-                job_id=job_id,
-                progress=10,
-                message="Job started",
-            )
-
-            # Publish SSE event
-            await publish_event(
-                EventType.IMPORT_PROGRESS,
-                {
-                    "job_id": job_id,
-                    "progress_pct": 10,
-                    "status": "running",
-                    "message": "Job started",
-                    "timestamp": datetime.utcnow().isoformat(),
-                },
+            await _report_progress(
+                session, import_session, job_id=job_id, progress_pct=10, message="Job started"
             )
 
             # Initialize service
             service = IngestionService(session)
 
             # Milestone 2: Adapter extraction started (30%)
-            import_session.progress_pct = 30
-            await session.flush()
-            logger.info(
-                "ingestion.task.progress",
+            await _report_progress(
+                session,
+                import_session,
                 job_id=job_id,
-                progress=30,
+                progress_pct=30,
                 message="Extracting data from URL",
             )
 
-            # Publish SSE event
-            await publish_event(
-                EventType.IMPORT_PROGRESS,
-                {
-                    "job_id": job_id,
-                    "progress_pct": 30,
-                    "status": "running",
-                    "message": "Extracting data from URL",
-                    "timestamp": datetime.utcnow().isoformat(),
-                },
-            )
-
             # Execute the full ingestion (includes extraction, normalization, persistence)
             ingest_result = await service.ingest_single_url(url)
 
             # Milestone 3: Normalization complete (60%)
-            import_session.progress_pct = 60
-            await session.flush()
-            logger.info(
-                "ingestion.task.progress",
-                job_id=job_id,
-                progress=60,
-                message="Data normalized",
-            )
-
-            # Publish SSE event
-            await publish_event(
-                EventType.IMPORT_PROGRESS,
-                {
-                    "job_id": job_id,
-                    "progress_pct": 60,
-                    "status": "running",
-                    "message": "Data normalized",
-                    "timestamp": datetime.utcnow().isoformat(),
-                },
+            await _report_progress(
+                session, import_session, job_id=job_id, progress_pct=60, message="Data normalized"
             )
 
             # Milestone 4: Persistence starting (80%)
-            import_session.progress_pct = 80
-            await session.flush()
-            logger.info(
-                "ingestion.task.progress",
+            await _report_progress(
+                session,
+                import_session,
                 job_id=job_id,
-                progress=80,
+                progress_pct=80,
                 message="Saving to database",
             )
 
-            # Publish SSE event
-            await publish_event(
-                EventType.IMPORT_PROGRESS,
-                {
-                    "job_id": job_id,
-                    "progress_pct": 80,
-                    "status": "running",
-                    "message": "Saving to database",
-                    "timestamp": datetime.utcnow().isoformat(),
-                },
-            )
-
             # Milestone 5: Complete (100%)
-            if ingest_result.success:
-                # Map quality to status: full → complete, partial → partial
-                import_session.status = "complete" if ingest_result.quality == "full" else "partial"
-                import_session.progress_pct = 100
-                import_session.conflicts_json = {
-                    "listing_id": ingest_result.listing_id,
-                    "provenance": ingest_result.provenance,
-                    "quality": ingest_result.quality,
-                    "title": ingest_result.title,
-                    "price": float(ingest_result.price) if ingest_result.price else None,
-                    "vendor_item_id": ingest_result.vendor_item_id,
-                    "marketplace": ingest_result.marketplace,
-                }
-                logger.info(
-                    "ingestion.task.progress",
-                    job_id=job_id,
-                    progress=100,
-                    message="Import complete",
-                )
-
-                # Publish SSE event for success
-                await publish_event(
-                    EventType.IMPORT_PROGRESS,
-                    {
-                        "job_id": job_id,
-                        "progress_pct": 100,
-                        "status": import_session.status,
-                        "message": "Import complete",
-                        "timestamp": datetime.utcnow().isoformat(),
-                    },
-                )
-            else:
-                import_session.status = "failed"
-                import_session.progress_pct = 30  # Failed during extraction phase
-                import_session.conflicts_json = {"error": ingest_result.error}
-                logger.error(
-                    "ingestion.task.failed",
-                    job_id=job_id,
-                    progress=import_session.progress_pct,
-                    error=ingest_result.error,
-                )
-
-                # Publish SSE event for failure
-                await publish_event(
-                    EventType.IMPORT_PROGRESS,
-                    {
-                        "job_id": job_id,
-                        "progress_pct": import_session.progress_pct,
-                        "status": "failed",
-                        "message": f"Import failed: {ingest_result.error}",
-                        "timestamp": datetime.utcnow().isoformat(),
-                    },
-                )
+            await _record_result(
+                session, import_session, job_id=job_id, ingest_result=ingest_result
+            )
 
             await session.commit()
+            await _flush_bulk_progress([import_session])
 
             logger.info(
                 "ingestion.task.complete",
@@ -233,7 +130,7 @@ async def _ingest_url_async(
                 import_session.progress_pct = 10  # Failed at startup
             # Otherwise keep the current progress to show where it failed
             import_session.status = "failed"
-            import_session.conflicts_json = {"error": str(e)}
+            import_session.conflicts_json = {**_bulk_parent(import_session), "error": str(e)}
             await session.commit()
             logger.exception(
                 "ingestion.task.exception",
@@ -241,22 +138,231 @@ async def _ingest_url_async(
                 progress=import_session.progress_pct,
             )
 
-            # Publish SSE event for exception
-            await publish_event(
-                EventType.IMPORT_PROGRESS,
-                {
-                    "job_id": job_id,
-                    "progress_pct": import_session.progress_pct,
-                    "status": "failed",
-                    "message": f"Import failed with exception: {str(e)}",
-                    "timestamp": datetime.utcnow().isoformat(),
-                },
+            await _report_progress(
+                session,
+                import_session,
+                job_id=job_id,
+                progress_pct=import_session.progress_pct,
+                message=f"Import failed with exception: {str(e)}",
+                status="failed",
             )
             raise
         finally:
             clear_context()
 
 
+async def _ingest_url_batch_async(*, jobs: list[dict[str, str]]) -> dict[str, Any]:
+    """Async implementation of batched URL ingestion for bulk jobs.
+
+    Loads the batch's child ImportSessions in one query and ingests their URLs
+    with ``IngestionService.ingest_urls``, so duplicates are resolved with one
+    set-based lookup per batch instead of one per URL. Children an earlier
+    attempt already finished are skipped, so a retried batch only redoes the
+    rest; on error nothing is committed and the children stay queued.
+
+    Args:
+        jobs: One ``{"job_id": ..., "url": ...}`` entry per child ImportSession
+
+    Returns:
+        Dict with per-child results keyed by job_id and the number of skipped children
+    """
+    bind_request_context(new_request_id(), task=INGEST_BATCH_TASK_NAME, batch_size=len(jobs))
+    logger.info("ingestion.batch.start", jobs=len(jobs))
+    urls_by_job = {job["job_id"]: job["url"] for job in jobs}
+
+    try:
+        async with session_scope() as session:
+            stmt = select(ImportSession).where(
+                ImportSession.id.in_([UUID(job_id) for job_id in urls_by_job]),
+                ImportSession.status.in_(_UNFINISHED_STATUSES),
+            )
+            result = await session.execute(stmt)
+            unfinished = {str(row.id): row for row in result.scalars()}
+            import_sessions = {
+                job_id: unfinished[job_id] for job_id in urls_by_job if job_id in unfinished
+            }
+
+            for job_id, import_session in import_sessions.items():
+                import_session.status = "running"
+                await _report_progress(
+                    session,
+                    import_session,
+                    job_id=job_id,
+                    progress_pct=30,
+                    message="Extracting data from URL",
+                )
+
+            service = IngestionService(session)
+            ingest_results = await service.ingest_urls(
+                [urls_by_job[job_id] for job_id in import_sessions]
+            )
+
+            results: dict[str, dict[str, Any]] = {}
+            for job_id, import_session in import_sessions.items():
+                ingest_result = ingest_results[urls_by_job[job_id]]
+                await _record_result(
+                    session, import_session, job_id=job_id, ingest_result=ingest_result
+                )
+                results[job_id] = {
+                    "success": ingest_result.success,
+                    "listing_id": ingest_result.listing_id,
+                    "status": import_session.status,
+                    "error": ingest_result.error,
+                }
+
+            await session.commit()
+        await _flush_bulk_progress(import_sessions.values())
+
+        logger.info(
+            "ingestion.batch.complete",
+            jobs=len(jobs),
+            ingested=len(results),
+            succeeded=sum(result["success"] for result in results.values()),
+        )
+        return {"results": results, "skipped": len(jobs) - len(results)}
+    finally:
+        clear_context()
+
+
+async def _fail_batch_async(*, job_ids: list[str], error: str) -> None:
+    """Mark the unfinished children of a batch that exhausted its retries as failed."""
+    async with session_scope() as session:
+        stmt = select(ImportSession).where(
+            ImportSession.id.in_([UUID(job_id) for job_id in job_ids]),
+            ImportSession.status.in_(_UNFINISHED_STATUSES),
+        )
+        result = await session.execute(stmt)
+        import_sessions = list(result.scalars())
+        for import_session in import_sessions:
+            import_session.status = "failed"
+            import_session.conflicts_json = {**_bulk_parent(import_session), "error": error}
+            await _report_progress(
+                session,
+                import_session,
+                job_id=str(import_session.id),
+                progress_pct=import_session.progress_pct or 10,
+                message=f"Import failed with exception: {error}",
+                status="failed",
+            )
+        await session.commit()
+    await _flush_bulk_progress(import_sessions)
+
+
+async def _flush_bulk_progress(import_sessions: Iterable[ImportSession]) -> None:
+    """Publish the roll-up of every bulk job the committed children belong to."""
+    bulk_job_ids = {
+        _bulk_parent(import_session).get("parent_job_id") for import_session in import_sessions
+    }
+    for bulk_job_id in sorted(bulk_job_ids - {None}):
+        await bulk_progress.flush(bulk_job_id)
+
+
+async def _record_result(
+    session: AsyncSession,
+    import_session: ImportSession,
+    *,
+    job_id: str,
+    ingest_result: IngestionResult,
+) -> None:
+    """Store the outcome of one URL on its ImportSession and report the final milestone."""
+    if ingest_result.success:
+        # Map quality to status: full → complete, partial → partial
+        import_session.status = "complete" if ingest_result.quality == "full" else "partial"
+        import_session.conflicts_json = {
+            **_bulk_parent(import_session),
+            "listing_id": ingest_result.listing_id,
+            "provenance": ingest_result.provenance,
+            "quality": ingest_result.quality,
+            "title": ingest_result.title,
+            "price": float(ingest_result.price) if ingest_result.price else None,
+            "vendor_item_id": ingest_result.vendor_item_id,
+            "marketplace": ingest_result.marketplace,
+        }
+        if ingest_result.near_duplicates:
+            # Flagged for review; near-duplicates are never merged automatically
+            import_session.conflicts_json["near_duplicates"] = [
+                {"listing_id": match.listing_id, "score": round(match.score, 3)}
+                for match in ingest_result.near_duplicates
+            ]
+        await _report_progress(
+            session,
+            import_session,
+            job_id=job_id,
+            progress_pct=100,
+            message="Import complete",
+            status=import_session.status,
+        )
+    else:
+        import_session.status = "failed"
+        import_session.conflicts_json = {
+            **_bulk_parent(import_session),
+            "error": ingest_result.error,
+        }
+        logger.error(
+            "ingestion.task.failed",
+            job_id=job_id,
+            progress=30,
+            error=ingest_result.error,
+        )
+        await _report_progress(
+            session,
+            import_session,
+            job_id=job_id,
+            progress_pct=30,  # Failed during extraction phase
+            message=f"Import failed: {ingest_result.error}",
+            status="failed",
+        )
+
+
+def _bulk_parent(import_session: ImportSession) -> dict[str, Any]:
+    """The ``parent_job_id`` entry of a bulk child's conflicts_json (empty otherwise)."""
+    parent_job_id = (import_session.conflicts_json or {}).get("parent_job_id")
+    return {"parent_job_id": parent_job_id} if parent_job_id else {}
+
+
+async def _report_progress(
+    session: AsyncSession,
+    import_session: ImportSession,
+    *,
+    job_id: str,
+    progress_pct: int,
+    message: str,
+    status: str = "running",
+) -> None:
+    """Record a progress milestone for an ingestion job.
+
+    Single-URL jobs flush ``progress_pct`` and publish an ``import.progress``
+    event per milestone. Children of a bulk job keep ``progress_pct`` in their
+    own session, committed with the task, and hand the milestone to the bulk
+    progress aggregator, which publishes rolled-up progress once per interval.
+    """
+    import_session.progress_pct = progress_pct
+    if status == "running":
+        logger.info(
+            "ingestion.task.progress", job_id=job_id, progress=progress_pct, message=message
+        )
+
+    bulk_job_id = _bulk_parent(import_session).get("parent_job_id")
+    if bulk_job_id:
+        await bulk_progress.report(
+            bulk_job_id=bulk_job_id, job_id=job_id, progress_pct=progress_pct, status=status
+        )
+        return
+
+    if status == "running":
+        await session.flush()
+    await publish_event(
+        EventType.IMPORT_PROGRESS,
+        {
+            "job_id": job_id,
+            "progress_pct": progress_pct,
+            "status": status,
+            "message": message,
+            "timestamp": datetime.utcnow().isoformat(),
+        },
+    )
+
+
 @celery_app.task(name=INGEST_TASK_NAME, bind=True, max_retries=3)
 def ingest_url_task(
     self,
@@ -267,7 +373,7 @@ def ingest_url_task(
 ) -> dict[str, Any]:
     """Celery task for async URL ingestion.
 
-    Follows the async event loop pattern from valuation.py for consistency.
+    Runs on the worker's persistent event loop (see ``worker.run_async``).
     Implements retry logic with exponential backoff for transient errors.
 
     Args:
@@ -294,18 +400,12 @@ def ingest_url_task(
         retry=self.request.retries,
     )
 
-    # Create fresh event loop for each task execution
-    # This prevents "attached to a different loop" errors in forked worker processes
-    loop = asyncio.new_event_loop()
-
+    # Run on the worker's persistent loop so the shared browser pool stays warm
+    # between tasks; other tasks may have bound the engine to their own loop
     try:
-        asyncio.set_event_loop(loop)
+        run_async(dispose_engine())
 
-        # Dispose existing engine if present to prevent "attached to a different loop" errors
-        # The engine will be recreated with the new event loop on first use
-        loop.run_until_complete(dispose_engine())
-
-        result = loop.run_until_complete(_ingest_url_async(job_id=job_id, url=url))
+        result = run_async(_ingest_url_async(job_id=job_id, url=url))
 
         logger.info(
             "ingestion.task.success",
@@ -366,13 +466,47 @@ def ingest_url_task(
                 "provenance": "unknown",
                 "quality": "partial",
             }
-    finally:
-        # Clean up loop after task completion
-        try:
-            loop.run_until_complete(loop.shutdown_asyncgens())
-        finally:
-            loop.close()
-            asyncio.set_event_loop(None)
+
+
+@celery_app.task(name=INGEST_BATCH_TASK_NAME, bind=True, max_retries=3)
+def ingest_url_batch_task(self, *, jobs: list[dict[str, str]]) -> dict[str, Any]:
+    """Celery task ingesting a batch of bulk-job children.
+
+    Bulk URL imports queue one batch task per ``ingestion.bulk_batch_size``
+    children. Per-URL failures are recorded on the child ImportSession;
+    unexpected errors roll the batch back and retry it with exponential
+    backoff, and once retries are exhausted the remaining children are marked
+    failed.
+
+    Args:
+        jobs: One ``{"job_id": ..., "url": ...}`` entry per child ImportSession
+
+    Returns:
+        Dict with per-child results keyed by job_id and the number of skipped children
+    """
+    logger.info("ingestion.batch.dispatch", jobs=len(jobs), retry=self.request.retries)
+
+    # Run on the worker's persistent loop so the shared browser pool stays warm
+    # between tasks; other tasks may have bound the engine to their own loop
+    try:
+        run_async(dispose_engine())
+
+        return run_async(_ingest_url_batch_async(jobs=jobs))
+
+    except Exception as e:
+        if self.request.retries < self.max_retries:
+            retry_countdown = 2**self.request.retries * 5
+            logger.exception(
+                "ingestion.batch.retry",
+                jobs=len(jobs),
+                retry_count=self.request.retries,
+                countdown=retry_countdown,
+            )
+            raise self.retry(exc=e, countdown=retry_countdown) from e
+
+        logger.exception("ingestion.batch.max_retries_exceeded", jobs=len(jobs))
+        run_async(_fail_batch_async(job_ids=[job["job_id"] for job in jobs], error=str(e)))
+        return {"results": {}, "skipped": len(jobs), "error": str(e)}
 
 
 async def _cleanup_expired_payloads_async() -> dict[str, Any]:
@@ -449,18 +583,11 @@ def cleanup_expired_payloads_task() -> dict[str, Any]:
     bind_request_context(correlation_id, task=CLEANUP_TASK_NAME)
     logger.info("ingestion.cleanup.start")
 
-    # Create fresh event loop for each task execution
-    # This prevents "attached to a different loop" errors in forked worker processes
-    loop = asyncio.new_event_loop()
-
+    # Other tasks may have bound the engine to their own loop
     try:
-        asyncio.set_event_loop(loop)
-
-        # Dispose existing engine if present to prevent "attached to a different loop" errors
-        # The engine will be recreated with the new event loop on first use
-        loop.run_until_complete(dispose_engine())
+        run_async(dispose_engine())
 
-        result = loop.run_until_complete(_cleanup_expired_payloads_async())
+        result = run_async(_cleanup_expired_payloads_async())
 
         logger.info(
             "ingestion.cleanup.complete",
@@ -480,18 +607,14 @@ def cleanup_expired_payloads_task() -> dict[str, Any]:
             "error": str(e),
         }
     finally:
-        # Clean up loop after task completion
-        try:
-            loop.run_until_complete(loop.shutdown_asyncgens())
-        finally:
-            loop.close()
-            asyncio.set_event_loop(None)
-            clear_context()
+        clear_context()
 
 
 __all__ = [
     "ingest_url_task",
+    "ingest_url_batch_task",
     "cleanup_expired_payloads_task",
     "INGEST_TASK_NAME",
+    "INGEST_BATCH_TASK_NAME",
     "CLEANUP_TASK_NAME",
 ]
@@ -2,8 +2,13 @@
 
 from __future__ import annotations
 
+import asyncio
+from collections.abc import Coroutine
+from typing import Any, TypeVar
+
 from celery import Celery
 from celery.schedules import crontab
+from celery.signals import worker_init, worker_process_init, worker_process_shutdown
 
 from dealbrain_api.settings import get_settings
 from dealbrain_api.telemetry import get_logger, init_telemetry
@@ -23,6 +28,92 @@ celery_app.config_from_object(
 init_telemetry(get_settings())
 worker_logger = get_logger("dealbrain.celery")
 
+T = TypeVar("T")
+
+# Event loop shared by the async tasks of this worker process; browsers in the
+# shared pool are bound to it and stay alive between tasks
+_worker_loop: asyncio.AbstractEventLoop | None = None
+
+
+def worker_loop() -> asyncio.AbstractEventLoop:
+    """Return this process's persistent event loop, creating it on first use."""
+    global _worker_loop
+    if _worker_loop is None or _worker_loop.is_closed():
+        _worker_loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(_worker_loop)
+    return _worker_loop
+
+
+def run_async(coro: Coroutine[Any, Any, T]) -> T:
+    """Run a coroutine to completion on the worker's persistent event loop."""
+    return worker_loop().run_until_complete(coro)
+
+
+@worker_init.connect
+def _sync_custom_field_indexes(**_: Any) -> None:
+    """Build custom field indexes whose scheduled DDL was lost with its event loop.
+
+    Runs once in the main worker process, before the pool processes fork.
+    """
+    from .db import dispose_engine
+    from .services.custom_field_indexes import reconcile_custom_field_indexes
+
+    async def _sync():
+        try:
+            return await reconcile_custom_field_indexes()
+        finally:
+            # Keep connections bound to this loop out of the forked children
+            await dispose_engine()
+
+    try:
+        synced = asyncio.run(_sync())
+        worker_logger.info(
+            "worker.custom_field_indexes.synced",
+            created=len(synced.created),
+            dropped=len(synced.dropped),
+        )
+    except Exception as exc:
+        worker_logger.error("worker.custom_field_indexes.sync_failed", error=str(exc))
+
+
+@worker_process_init.connect
+def _init_worker_process(**_: Any) -> None:
+    """Start each forked worker process on its own loop with a warm browser pool."""
+    global _worker_loop
+    # A loop inherited through fork is unusable in the child
+    _worker_loop = None
+    settings = get_settings()
+    if not (settings.playwright.enabled and settings.playwright.warm_up_on_startup):
+        return
+    try:
+        from .adapters.browser_pool import BrowserPool
+
+        health = run_async(BrowserPool.shared().warm_up())
+        worker_logger.info("worker.browser_pool.warmed_up", **health)
+    except Exception as exc:
+        worker_logger.error("worker.browser_pool.warm_up_failed", error=str(exc))
+
+
+@worker_process_shutdown.connect
+def _shutdown_worker_process(**_: Any) -> None:
+    """Close the shared browser pool and the worker loop before the process exits."""
+    global _worker_loop
+    loop, _worker_loop = _worker_loop, None
+    if loop is None or loop.is_closed():
+        return
+    try:
+        from .adapters.browser_pool import BrowserPool
+
+        pool = BrowserPool._instance
+        if pool is not None and pool._initialized:
+            loop.run_until_complete(pool.close_all())
+        loop.run_until_complete(loop.shutdown_asyncgens())
+    except Exception as exc:
+        worker_logger.error("worker.shutdown.error", error=str(exc))
+    finally:
+        loop.close()
+        asyncio.set_event_loop(None)
+
 
 @celery_app.task
 def ping() -> str:
@@ -72,4 +163,4 @@ celery_app.conf.beat_schedule = {
     },
 }
 
-__all__ = ["celery_app"]
+__all__ = ["celery_app", "run_async", "worker_loop"]
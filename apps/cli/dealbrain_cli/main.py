@@ -43,11 +43,16 @@ def version() -> None:
 
 
 @app.command("import")
-def import_workbook(path: Path) -> None:
+def import_workbook(
+    path: Path,
+    chunk_size: Optional[int] = typer.Option(
+        None, help="Stream sheets in chunks of this many rows (for very large workbooks)"
+    ),
+) -> None:
     """Import an Excel workbook into the database."""
 
     async def runner() -> None:
-        await seed_from_workbook(path)
+        await seed_from_workbook(path, chunk_size=chunk_size)
 
     logger.info("cli.import_workbook.start", path=str(path))
     asyncio.run(runner())
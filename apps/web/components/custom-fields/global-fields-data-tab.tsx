@@ -50,6 +50,8 @@ interface RecordsListResponse {
     limit: number;
     offset: number;
     total: number;
+    next_cursor: string | null;
+    has_next: boolean;
   };
 }
 
@@ -140,6 +142,7 @@ export function GlobalFieldsDataTab({ entity }: GlobalFieldsDataTabProps) {
   const { data: schema, isLoading: schemaLoading } = useQuery<EntitySchemaResponse>({
     queryKey: ["fields-data", entity, "schema"],
     queryFn: () => apiFetch<EntitySchemaResponse>(`/v1/fields-data/${entity}/schema`),
+    staleTime: 5 * 60 * 1000, // 5 minutes
   });
 
   const { data: records, isLoading: recordsLoading } = useQuery<RecordsListResponse>({
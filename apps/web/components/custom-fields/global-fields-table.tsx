@@ -236,8 +236,16 @@ export function GlobalFieldsTable({ entity, hideEntityPicker = false }: GlobalFi
     queryKey: ["fields-data", entity ?? entityFilter, "schema"],
     queryFn: () => apiFetch<EntitySchemaResponse>(`/v1/fields-data/${entity ?? entityFilter}/schema`),
     enabled: Boolean(entity ?? (entityFilter !== "all" && entityFilter !== "")),
+    staleTime: 5 * 60 * 1000, // Schemas only change through the field mutations below
   });
 
+  const invalidateSchemas = () => {
+    queryClient.invalidateQueries({
+      predicate: (query) => query.queryKey[0] === "fields-data" && query.queryKey[2] === "schema",
+    });
+    queryClient.invalidateQueries({ queryKey: ["entities-metadata"] });
+  };
+
   // Create dynamic entity labels map from API response
   const entityLabelsMap = useMemo(() => {
     const map: Record<string, string> = { ...ENTITY_LABELS };
@@ -438,6 +446,7 @@ export function GlobalFieldsTable({ entity, hideEntityPicker = false }: GlobalFi
         return { fields: [...previous.fields, record] };
       });
       queryClient.invalidateQueries({ queryKey: usageKey });
+      invalidateSchemas();
     }
   });
 
@@ -461,6 +470,7 @@ export function GlobalFieldsTable({ entity, hideEntityPicker = false }: GlobalFi
         };
       });
       queryClient.invalidateQueries({ queryKey: usageKey });
+      invalidateSchemas();
     }
   });
 
@@ -484,6 +494,7 @@ export function GlobalFieldsTable({ entity, hideEntityPicker = false }: GlobalFi
         };
       });
       queryClient.invalidateQueries({ queryKey: usageKey });
+      invalidateSchemas();
     }
   });
 
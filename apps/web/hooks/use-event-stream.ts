@@ -83,6 +83,7 @@ export function useEventStream<T = unknown>(
   const { enabled = true, reconnectDelay = 5000 } = options || {};
   const eventSourceRef = useRef<EventSource | null>(null);
   const reconnectTimeoutRef = useRef<NodeJS.Timeout | null>(null);
+  const lastEventIdRef = useRef<string | null>(null);
   const handlerRef = useRef(handler);
 
   // Keep handler ref up to date
@@ -93,12 +94,18 @@ export function useEventStream<T = unknown>(
   const connect = useCallback(() => {
     if (!enabled) return;
 
-    // Create EventSource connection
-    const eventSource = new EventSource(`${API_URL}/api/v1/events`);
+    // Create EventSource connection, resuming after the last event we saw
+    const query = lastEventIdRef.current
+      ? `?last_event_id=${encodeURIComponent(lastEventIdRef.current)}`
+      : "";
+    const eventSource = new EventSource(`${API_URL}/api/v1/events${query}`);
     eventSourceRef.current = eventSource;
 
     // Listen for specific event type
     eventSource.addEventListener(eventType, (event) => {
+      if (event.lastEventId) {
+        lastEventIdRef.current = event.lastEventId;
+      }
       try {
         const data = JSON.parse(event.data) as T;
         handlerRef.current(data);
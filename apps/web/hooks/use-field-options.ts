@@ -65,6 +65,7 @@ export function useFieldOptions(entity: string, fieldKey: string) {
       queryClient.invalidateQueries({
         queryKey: ["field-options", variables.entity, variables.fieldKey],
       });
+      queryClient.invalidateQueries({ queryKey: ["fields-data", variables.entity, "schema"] });
     },
   });
 
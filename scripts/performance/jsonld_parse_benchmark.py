@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+Parsing benchmark for the JSON-LD adapter extraction pipeline.
+
+Compares the previous pipeline (full ``extruct.extract`` over every syntax,
+plus a separate ``html.parser`` BeautifulSoup parse per fallback extractor)
+with the single-parse pipeline used by ``JsonLdAdapter`` (shared
+``ParsedDocument``, per-syntax early exit, one lxml-backed soup).
+
+Runs over saved HTML pages (``--fixtures DIR`` with ``*.html`` files). Without
+fixtures it generates three representative retailer pages: JSON-LD product,
+meta-tag only, and Amazon-style markup with no structured data.
+
+Usage:
+    poetry run python scripts/performance/jsonld_parse_benchmark.py [options]
+
+Options:
+    --fixtures DIR    Directory of saved HTML pages (default: generated pages)
+    --runs N          Timed runs per page and pipeline (default: 10)
+    --size-kb N       Approximate size of generated pages in KB (default: 800)
+"""
+
+import argparse
+import json
+import statistics
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT / "apps" / "api"))
+sys.path.insert(0, str(ROOT / "packages" / "core"))
+
+import extruct  # noqa: E402
+from bs4 import BeautifulSoup  # noqa: E402
+from dealbrain_api.adapters.jsonld.document import ParsedDocument  # noqa: E402
+from dealbrain_api.adapters.jsonld.extractors.structured_data import (  # noqa: E402
+    StructuredDataExtractor,
+)
+
+URL = "https://shop.example.com/product/123"
+
+PRODUCT_JSONLD = {
+    "@context": "https://schema.org",
+    "@type": "Product",
+    "name": "Mini PC Intel Core i7-12700H 32GB DDR5 1TB NVMe",
+    "description": "Compact desktop with Intel Core i7-12700H, 32GB RAM and 1TB SSD",
+    "image": ["https://shop.example.com/img/1.jpg", "https://shop.example.com/img/2.jpg"],
+    "offers": {"@type": "Offer", "price": "649.99", "priceCurrency": "USD"},
+}
+
+
+def _filler(size_kb: int) -> str:
+    """Product-grid style markup to bring a page up to a realistic size."""
+    card = (
+        '<div class="s-result-item" data-asin="B0{i:08d}">'
+        '<span class="a-size-medium">Related product {i}</span>'
+        '<span class="a-price"><span class="a-offscreen">${i}.99</span></span>'
+        '<img src="https://shop.example.com/thumb/{i}.jpg" alt="thumb {i}">'
+        "<ul><li>Spec A</li><li>Spec B</li><li>Spec C</li></ul></div>\n"
+    )
+    sample = card.format(i=0)
+    count = max(1, size_kb * 1024 // len(sample))
+    return "".join(card.format(i=i) for i in range(count))
+
+
+def generated_pages(size_kb: int) -> dict[str, str]:
+    """Build representative pages for the three extraction paths."""
+    filler = _filler(size_kb)
+    return {
+        "jsonld_product": (
+            "<html><head><title>Mini PC</title>"
+            f'<script type="application/ld+json">{json.dumps(PRODUCT_JSONLD)}</script>'
+            f"</head><body>{filler}</body></html>"
+        ),
+        "meta_tags_only": (
+            '<html><head><meta property="og:title" content="Mini PC i7-12700H 32GB">'
+            '<meta property="og:price:amount" content="649.99">'
+            '<meta property="og:image" content="https://shop.example.com/img/1.jpg">'
+            f"</head><body>{filler}</body></html>"
+        ),
+        "amazon_style": (
+            "<html><head><title>Amazon.com</title></head><body>"
+            '<span id="productTitle">Mini PC i7-12700H 32GB DDR5 1TB</span>'
+            '<span class="a-price"><span class="a-offscreen">$649.99</span></span>'
+            f"{filler}</body></html>"
+        ),
+    }
+
+
+def legacy_pipeline(html: str) -> None:
+    """Previous behaviour: every syntax via extruct, then one soup per fallback."""
+    data = extruct.extract(html, base_url=URL)
+    if StructuredDataExtractor(timeout_s=1, rate_limiter_check=None).find_product_schema(data):
+        return
+    BeautifulSoup(html, "html.parser")  # MetaTagExtractor
+    BeautifulSoup(html, "html.parser")  # HtmlElementExtractor
+
+
+def single_parse_pipeline(html: str) -> None:
+    """Current behaviour: shared ParsedDocument with early exit."""
+    document = ParsedDocument(html, URL)
+    if StructuredDataExtractor(timeout_s=1, rate_limiter_check=None).find_product(document):
+        return
+    _ = document.soup  # shared by both fallback extractors
+
+
+def time_pipeline(pipeline, html: str, runs: int) -> list[float]:
+    pipeline(html)  # warm-up
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        pipeline(html)
+        timings.append((time.perf_counter() - start) * 1000)
+    return timings
+
+
+def main() -> None:
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description="Benchmark JSON-LD adapter HTML parsing")
+    parser.add_argument("--fixtures", type=Path, help="Directory of saved *.html pages")
+    parser.add_argument("--runs", type=int, default=10, help="Timed runs per page")
+    parser.add_argument("--size-kb", type=int, default=800, help="Generated page size in KB")
+    args = parser.parse_args()
+
+    if args.fixtures:
+        pages = {
+            path.stem: path.read_text(encoding="utf-8", errors="replace")
+            for path in sorted(args.fixtures.glob("*.html"))
+        }
+        if not pages:
+            parser.error(f"No *.html files found in {args.fixtures}")
+    else:
+        pages = generated_pages(args.size_kb)
+
+    print(f"{'page':<24} {'size':>8} {'legacy p50':>12} {'single p50':>12} {'speedup':>8}")
+    for name, html in pages.items():
+        legacy = statistics.median(time_pipeline(legacy_pipeline, html, args.runs))
+        single = statistics.median(time_pipeline(single_parse_pipeline, html, args.runs))
+        print(
+            f"{name:<24} {len(html) // 1024:>6}KB {legacy:>10.1f}ms {single:>10.1f}ms "
+            f"{legacy / single:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+"""
+Recall/latency benchmark for near-duplicate listing detection.
+
+Compares three strategies on a labeled set of (query listing, true duplicate)
+pairs:
+
+- ``window``: the previous import-preview behaviour, scoring only the 100
+  most recently created listings
+- ``brute``: scoring every listing (recall upper bound, linear cost)
+- ``lsh``: ``NearDuplicateIndex`` (MinHash/LSH candidates, then scoring)
+
+All strategies use the same score (70% title Jaccard + 30% price similarity,
+threshold 0.7), so differences in recall come from candidate selection only.
+
+Without ``--fixtures`` a labeled set is generated: catalog-style listing
+titles, and for a sample of them a re-listed variant (tokens reordered,
+a token dropped or added, price moved by up to 5%).
+
+Fixture format (JSON)::
+
+    {
+      "listings": [{"id": 1, "title": "...", "price_usd": 649.99}, ...],
+      "queries": [{"title": "...", "price_usd": 639.0, "duplicate_of": 1}, ...]
+    }
+
+Listings are assumed to be ordered oldest first.
+
+Usage:
+    poetry run python scripts/performance/near_duplicate_benchmark.py [options]
+
+Options:
+    --fixtures FILE   Labeled fixture set (default: generated)
+    --listings N      Generated catalog size (default: 20000)
+    --queries N       Generated labeled queries (default: 500)
+    --seed N          Random seed for generated data (default: 7)
+"""
+
+import argparse
+import json
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT / "apps" / "api"))
+sys.path.insert(0, str(ROOT / "packages" / "core"))
+
+from dealbrain_api.services.near_duplicates import (  # noqa: E402
+    DEFAULT_THRESHOLD,
+    PRICE_WEIGHT,
+    TITLE_WEIGHT,
+    NearDuplicateIndex,
+    jaccard,
+    price_similarity,
+    title_tokens,
+)
+
+WINDOW_SIZE = 100
+
+BRANDS = [
+    "Dell OptiPlex",
+    "HP EliteDesk",
+    "Lenovo ThinkCentre",
+    "Beelink",
+    "Minisforum",
+    "Geekom",
+    "ASUS NUC",
+    "Intel NUC",
+    "Acer Veriton",
+    "MSI Cubi",
+]
+MODELS = [
+    "3060",
+    "5090",
+    "7050",
+    "7080",
+    "800 G4",
+    "800 G6",
+    "M720q",
+    "M75q",
+    "SER5",
+    "UM790",
+    "A7",
+    "14 Pro",
+    "N100",
+    "MS-01",
+    "EQ12",
+]
+FORMS = ["Mini PC", "Micro", "Tiny", "SFF", "Desktop", "USFF"]
+CPUS = [
+    "i5-8500T",
+    "i7-8700T",
+    "i5-10500T",
+    "i7-10700T",
+    "i7-12700H",
+    "i9-12900H",
+    "Ryzen 5 5600H",
+    "Ryzen 7 5800H",
+    "Ryzen 9 7940HS",
+    "N100",
+    "Core Ultra 7 155H",
+]
+RAM = ["8GB", "16GB", "32GB", "64GB"]
+STORAGE = ["256GB SSD", "512GB SSD", "1TB NVMe", "2TB NVMe"]
+EXTRAS = ["Win11 Pro", "WiFi 6", "Bluetooth", "Refurbished", "Grade A", "No OS", "Dual HDMI"]
+
+
+def _title(rng: random.Random) -> str:
+    parts = [
+        rng.choice(BRANDS),
+        rng.choice(MODELS),
+        rng.choice(FORMS),
+        rng.choice(CPUS),
+        rng.choice(RAM),
+        rng.choice(STORAGE),
+    ]
+    parts.extend(rng.sample(EXTRAS, rng.randint(0, 2)))
+    return " ".join(parts)
+
+
+def _relist(rng: random.Random, title: str) -> str:
+    tokens = title.split()
+    rng.shuffle(tokens)
+    if len(tokens) > 6 and rng.random() < 0.5:
+        tokens.pop(rng.randrange(len(tokens)))
+    if rng.random() < 0.5:
+        tokens.append(rng.choice(EXTRAS).split()[0])
+    return " ".join(tokens)
+
+
+def generated_fixture(listings: int, queries: int, seed: int) -> dict:
+    """Generate a labeled fixture set."""
+    rng = random.Random(seed)  # noqa: S311 - reproducible test data
+    catalog = [
+        {"id": i, "title": _title(rng), "price_usd": round(rng.uniform(90, 1200), 2)}
+        for i in range(1, listings + 1)
+    ]
+    labeled = []
+    for original in rng.sample(catalog, queries):
+        labeled.append(
+            {
+                "title": _relist(rng, original["title"]),
+                "price_usd": round(original["price_usd"] * rng.uniform(0.95, 1.05), 2),
+                "duplicate_of": original["id"],
+            }
+        )
+    return {"listings": catalog, "queries": labeled}
+
+
+def _score(query_tokens, query_price, listing) -> float:
+    return TITLE_WEIGHT * jaccard(query_tokens, listing["tokens"]) + PRICE_WEIGHT * (
+        price_similarity(query_price, listing["price_usd"])
+    )
+
+
+def scan(candidates, query) -> set[int]:
+    """Score a list of candidates the way the import preview did."""
+    tokens = title_tokens(query["title"])
+    return {
+        listing["id"]
+        for listing in candidates
+        if _score(tokens, query["price_usd"], listing) > DEFAULT_THRESHOLD
+    }
+
+
+def run(name, find, queries) -> None:
+    hits = 0
+    timings = []
+    for query in queries:
+        start = time.perf_counter()
+        found = find(query)
+        timings.append((time.perf_counter() - start) * 1000)
+        hits += query["duplicate_of"] in found
+    timings.sort()
+    p95 = timings[int(len(timings) * 0.95) - 1]
+    print(
+        f"{name:<8} {hits / len(queries):>8.1%} {statistics.median(timings):>10.3f}ms "
+        f"{p95:>10.3f}ms"
+    )
+
+
+def main() -> None:
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description="Benchmark near-duplicate detection")
+    parser.add_argument("--fixtures", type=Path, help="Labeled fixture set (JSON)")
+    parser.add_argument("--listings", type=int, default=20000, help="Generated catalog size")
+    parser.add_argument("--queries", type=int, default=500, help="Generated labeled queries")
+    parser.add_argument("--seed", type=int, default=7, help="Random seed")
+    args = parser.parse_args()
+
+    if args.fixtures:
+        fixture = json.loads(args.fixtures.read_text(encoding="utf-8"))
+    else:
+        fixture = generated_fixture(args.listings, args.queries, args.seed)
+
+    listings = fixture["listings"]
+    queries = fixture["queries"]
+    for listing in listings:
+        listing["tokens"] = title_tokens(listing["title"])
+
+    start = time.perf_counter()
+    index = NearDuplicateIndex()
+    for listing in listings:
+        index.add(listing["id"], listing["title"], listing["price_usd"])
+    build_s = time.perf_counter() - start
+
+    recent = listings[-WINDOW_SIZE:]
+    print(f"{len(listings)} listings, {len(queries)} labeled queries, index build {build_s:.2f}s")
+    print(f"{'strategy':<8} {'recall':>8} {'p50':>12} {'p95':>12}")
+    run("window", lambda query: scan(recent, query), queries)
+    run("brute", lambda query: scan(listings, query), queries)
+    run(
+        "lsh",
+        lambda query: {
+            match.listing_id for match in index.query(query["title"], query["price_usd"])
+        },
+        queries,
+    )
+
+
+if __name__ == "__main__":
+    main()
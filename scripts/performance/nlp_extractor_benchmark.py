@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+"""
+Benchmark for NLPExtractor component extraction.
+
+Compares the previous extraction path (YAML loaded per extractor, every
+pattern run with ``re.search`` from its source string) with the current one
+(patterns compiled once per file, anchor pre-checks on a single lowercased
+copy of the text). Also checks that both paths extract identical results.
+
+Runs over retailer-style titles, bullet points and descriptions. A JSON file
+with a list of strings can be passed with ``--corpus`` instead.
+
+Usage:
+    poetry run python scripts/performance/nlp_extractor_benchmark.py [options]
+
+Options:
+    --corpus FILE     JSON list of titles/descriptions (default: built-in corpus)
+    --runs N          Timed runs over the corpus (default: 20)
+"""
+
+import argparse
+import json
+import re
+import statistics
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT / "apps" / "api"))
+sys.path.insert(0, str(ROOT / "packages" / "core"))
+
+import yaml  # noqa: E402
+from dealbrain_api.importers.nlp_extractor import (  # noqa: E402
+    DEFAULT_PATTERNS_FILE,
+    ExtractionResult,
+    NLPExtractor,
+)
+
+TITLES = [
+    "Beelink SER5 Mini PC, AMD Ryzen 7 5800H (8C/16T, up to 4.4GHz), 32GB DDR4 3200MHz "
+    "500GB NVMe SSD, Mini Desktop Computer Support 4K Triple Display, WiFi 6, BT5.2",
+    "GMKtec Mini PC Intel Alder Lake N100 (up to 3.4GHz) 16GB DDR4 RAM 512GB SSD, "
+    "Mini Desktop Computer Dual HDMI 4K@60Hz, WiFi 6, Gigabit Ethernet",
+    "Dell OptiPlex 7050 SFF Desktop PC Intel Core i7-7700 3.6GHz 16GB DDR4 512GB SSD "
+    "Windows 10 Pro (Renewed)",
+    "HP EliteDesk 800 G4 Mini Desktop, Intel Core i5-8500T 2.1GHz, 16GB RAM, 256GB NVMe SSD, "
+    "Windows 11 Pro (Renewed)",
+    "Lenovo ThinkCentre M720q Tiny Desktop Computer, Intel i5-8400T, 8GB DDR4, 240GB SSD, "
+    "Wi-Fi, Windows 10 Pro (Renewed)",
+    "MINISFORUM UM790 Pro Mini PC AMD Ryzen 9 7940HS, 32GB DDR5 5600MHz 1TB PCIe4.0 SSD, "
+    "Radeon 780M Graphics, USB4, 2x HDMI 2.1, Dual 2.5G LAN",
+    "ASUS ROG Strix G15CF Gaming Desktop PC, Intel Core i7-12700F, GeForce RTX 3060 Ti, "
+    "16GB DDR4 RAM, 1TB PCIe SSD, Wi-Fi 6, Windows 11",
+    "Skytech Gaming Nebula Gaming PC Desktop, AMD Ryzen 5 5600 3.5 GHz, NVIDIA RTX 4060, "
+    "1TB NVMe SSD, 16GB DDR4 RAM 3200, 600W Gold PSU, Windows 11 Home",
+    "Intel NUC 13 Pro Kit NUC13ANHi7, Core i7-1360P, Iris Xe Graphics, Thunderbolt 4, "
+    "Barebone (No RAM, No Storage, No OS)",
+    "ACEMAGICIAN Mini PC Intel Celeron N5095 8GB RAM 256GB SSD Micro PC Dual HDMI 4K",
+    "CyberPowerPC Gamer Xtreme VR Gaming PC, Intel Core i5-13400F 2.5GHz, AMD Radeon RX 6650 XT "
+    "8GB, 16GB DDR5, 1TB PCIe 4.0 SSD, WiFi Ready & Windows 11 Home",
+    "HP Z2 Tower G5 Workstation, Intel Xeon W-1290P, 64GB DDR4, 2TB HDD, NVIDIA Quadro P2200",
+    "Apple Mac mini with M2 chip, 8GB unified memory, 256GB SSD storage",
+    "Beelink EQ12 Mini PC Intel 12th Gen Alder Lake N100 16GB DDR5 500GB M.2 SSD",
+    "Dell Precision 3460 Small Form Factor, Intel Core i9-12900, 32GB DDR5 4800, "
+    "1TB M.2 PCIe NVMe SSD, NVIDIA T1000 8GB",
+]
+
+BULLETS = [
+    "【AMD Ryzen 7 5800H Processor】8 cores and 16 threads with a base clock of 3.2GHz and a max "
+    "boost of 4.4GHz, 16MB L3 cache, easily handles office work, photo editing and light gaming.",
+    "【32GB DDR4 RAM & 500GB NVMe SSD】Dual-channel 32GB DDR4 3200MHz memory and a 500GB M.2 "
+    "2280 NVMe SSD; expandable up to 64GB RAM and 2TB of additional 2.5-inch SATA storage.",
+    "【Triple 4K Display】HDMI 2.0, DisplayPort and USB-C outputs drive three 4K monitors at "
+    "60Hz, ideal for multitasking, trading and home theater setups.",
+    "【WiFi 6 & Bluetooth 5.2】Faster wireless speeds and lower latency; 2.5G Ethernet port "
+    "for stable wired connections.",
+    "【Compact & Quiet】Small enough to mount behind a monitor with the included VESA bracket; "
+    "the dual-fan cooling system keeps noise below 35dB under normal load.",
+    "Integrated Intel UHD Graphics 730 supports dual 4K output, hardware-accelerated AV1 "
+    "decoding and smooth 60fps playback.",
+    "Pre-installed Windows 11 Pro, supports Linux (Ubuntu) installation. 1 year warranty "
+    "and lifetime technical support from our US-based team.",
+]
+
+DESCRIPTIONS = [
+    " ".join(BULLETS) + " " + " ".join(TITLES[:3]),
+    "This renewed desktop has been professionally inspected, tested and cleaned. It comes with "
+    "a 90-day warranty. " * 12,
+]
+
+CORPUS = TITLES + BULLETS + DESCRIPTIONS
+
+
+def legacy_extract(text: str) -> dict:
+    """Previous behaviour: load YAML and run every pattern string with re.search."""
+    with open(DEFAULT_PATTERNS_FILE) as f:
+        patterns = yaml.safe_load(f)
+    return legacy_extract_cached_yaml(patterns, text)
+
+
+def legacy_extract_cached_yaml(patterns: dict, text: str) -> dict:
+    """Previous per-text regex work only (YAML load excluded)."""
+    results = {}
+    for key in (
+        "cpu_patterns",
+        "ram_patterns",
+        "storage_patterns",
+        "gpu_patterns",
+        "form_factor_patterns",
+    ):
+        results[key] = None
+        for pattern_def in patterns.get(key, []):
+            match = re.search(pattern_def["pattern"], text, re.IGNORECASE)
+            if match:
+                results[key] = (match.group(0), match.groups(), pattern_def["confidence"])
+                break
+    return results
+
+
+def current_extract(text: str) -> dict:
+    """Current behaviour, raw component hits for comparison with the legacy path."""
+    extractor = NLPExtractor()
+    lowered = text.lower()
+    results = {}
+    for key in (
+        "cpu_patterns",
+        "ram_patterns",
+        "storage_patterns",
+        "gpu_patterns",
+        "form_factor_patterns",
+    ):
+        result: ExtractionResult | None = extractor._extract_component(text, key, lowered)
+        results[key] = (result.value, result.match_groups, result.confidence) if result else None
+    return results
+
+
+def time_corpus(fn, corpus, runs) -> float:
+    """Median milliseconds to process the whole corpus."""
+    for text in corpus:
+        fn(text)
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        for text in corpus:
+            fn(text)
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings)
+
+
+def main() -> None:
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description="Benchmark NLPExtractor")
+    parser.add_argument("--corpus", type=Path, help="JSON list of titles/descriptions")
+    parser.add_argument("--runs", type=int, default=20, help="Timed runs over the corpus")
+    args = parser.parse_args()
+
+    corpus = json.loads(args.corpus.read_text(encoding="utf-8")) if args.corpus else CORPUS
+
+    mismatches = [text for text in corpus if legacy_extract(text) != current_extract(text)]
+    if mismatches:
+        print(f"{len(mismatches)} texts extract differently, e.g. {mismatches[0][:80]!r}")
+        sys.exit(1)
+
+    with open(DEFAULT_PATTERNS_FILE) as f:
+        patterns = yaml.safe_load(f)
+    extractor = NLPExtractor()
+
+    rows = [
+        ("legacy, YAML per text", time_corpus(legacy_extract, corpus, args.runs)),
+        (
+            "legacy, regex only",
+            time_corpus(lambda text: legacy_extract_cached_yaml(patterns, text), corpus, args.runs),
+        ),
+        ("current extract_all", time_corpus(extractor.extract_all, corpus, args.runs)),
+    ]
+
+    print(f"{len(corpus)} texts, {sum(len(text) for text in corpus) // 1024}KB, identical results")
+    print(f"{'path':<24} {'corpus p50':>12} {'per text':>10}")
+    for name, total_ms in rows:
+        print(f"{name:<24} {total_ms:>10.2f}ms {total_ms / len(corpus) * 1000:>8.0f}us")
+
+
+if __name__ == "__main__":
+    main()
@@ -15,14 +15,19 @@ if str(API_ROOT) not in sys.path:
 from dealbrain_api.services.passmark import import_passmark_file
 
 
+def _print_progress(written: int, total: int) -> None:
+    print(f"  {written}/{total} CPUs written")
+
+
 async def _run(path: Path) -> None:
-    summary = await import_passmark_file(path)
+    summary = await import_passmark_file(path, progress=_print_progress)
     result = summary.to_dict()
 
     print("\n=== PassMark Import Complete ===")
     print(f"Updated: {result['updated']}")
     print(f"Created: {result['created']}")
     print(f"Failed:  {result['failed']}")
+    print(f"Analytics refreshed: {result['analytics_updated']}")
     if result["not_found"]:
         print("\nEntries that could not be matched or created:")
         for name in result["not_found"][:20]:
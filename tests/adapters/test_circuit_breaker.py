@@ -0,0 +1,259 @@
+"""Tests for adapter circuit breakers and health-based routing."""
+
+import time
+from decimal import Decimal
+
+import pytest
+from dealbrain_api.adapters import circuit_breaker
+from dealbrain_api.adapters.base import AdapterError, AdapterException
+from dealbrain_api.adapters.circuit_breaker import (
+    AdapterHealth,
+    CircuitBreakerRegistry,
+    CircuitState,
+)
+from dealbrain_api.adapters.hedging import AdapterLatencyTracker, HedgingPolicy
+from dealbrain_api.adapters.router import AdapterRouter
+from dealbrain_api.settings import AdapterCircuitBreakerConfig
+from redis.exceptions import RedisError
+
+from packages.core.dealbrain_core.schemas.ingestion import NormalizedListingSchema
+
+DOMAIN = "example-shop.com"
+URL = f"https://www.{DOMAIN}/product/123"
+
+
+class _FakeRedis:
+    """Minimal async Redis stand-in supporting GET and SET NX/EX."""
+
+    def __init__(self):
+        self.data: dict[str, str] = {}
+
+    async def get(self, key):
+        return self.data.get(key)
+
+    async def set(self, key, value, ex=None, nx=False):
+        if nx and key in self.data:
+            return None
+        self.data[key] = value
+        return True
+
+
+class _FlakyRedis(_FakeRedis):
+    """Fake Redis whose commands fail while ``down`` is set."""
+
+    def __init__(self):
+        super().__init__()
+        self.down = False
+
+    async def get(self, key):
+        if self.down:
+            raise RedisError("connection lost")
+        return await super().get(key)
+
+    async def set(self, key, value, ex=None, nx=False):
+        if self.down:
+            raise RedisError("connection lost")
+        return await super().set(key, value, ex=ex, nx=nx)
+
+
+def _config(**overrides) -> AdapterCircuitBreakerConfig:
+    values = {"enabled": True, "use_redis": False, "failure_threshold": 3, "min_samples": 5}
+    values.update(overrides)
+    return AdapterCircuitBreakerConfig(**values)
+
+
+def _make_adapter(name: str, priority: int, error: AdapterException | None = None, calls=None):
+    class FakeAdapter:
+        _adapter_name = name
+        _priority = priority
+
+        async def extract(self, url: str) -> NormalizedListingSchema:
+            if calls is not None:
+                calls.append(name)
+            if error is not None:
+                raise error
+            return NormalizedListingSchema(
+                title=f"from {name}",
+                price=Decimal("100.00"),
+                currency="USD",
+                condition="used",
+                marketplace="other",
+                images=[],
+            )
+
+    return FakeAdapter
+
+
+def _router(adapters, breakers: CircuitBreakerRegistry) -> AdapterRouter:
+    router = AdapterRouter(
+        hedging=HedgingPolicy(enabled=False),
+        latency_tracker=AdapterLatencyTracker(),
+        circuit_breakers=breakers,
+    )
+    router._find_matching_adapters = lambda url, domain: list(adapters)
+    router._get_adapter_priority = lambda adapter_class: adapter_class._priority
+    router._is_adapter_class_enabled = lambda adapter_class: True
+    return router
+
+
+class TestCircuitBreakerRegistry:
+    """Test breaker state transitions."""
+
+    @pytest.mark.asyncio
+    async def test_opens_after_consecutive_failures(self):
+        breakers = CircuitBreakerRegistry(_config())
+
+        for _ in range(2):
+            await breakers.record_failure("jsonld", DOMAIN, AdapterError.TIMEOUT)
+        assert breakers.is_available("jsonld", DOMAIN)
+
+        await breakers.record_failure("jsonld", DOMAIN, AdapterError.NETWORK_ERROR)
+        assert breakers.health("jsonld", DOMAIN).state == CircuitState.OPEN
+        assert not breakers.is_available("jsonld", DOMAIN)
+        # Breakers are per domain
+        assert breakers.is_available("jsonld", "other.com")
+
+    @pytest.mark.asyncio
+    async def test_non_health_errors_do_not_count(self):
+        breakers = CircuitBreakerRegistry(_config(failure_threshold=1))
+
+        await breakers.record_failure("ebay", DOMAIN, AdapterError.ITEM_NOT_FOUND)
+        await breakers.record_failure("ebay", DOMAIN, AdapterError.CONFIGURATION_ERROR)
+
+        assert breakers.health("ebay", DOMAIN).state == CircuitState.CLOSED
+        assert breakers.health("ebay", DOMAIN).samples == 0
+
+    @pytest.mark.asyncio
+    async def test_half_open_probe_success_closes(self):
+        breakers = CircuitBreakerRegistry(_config(failure_threshold=1, open_duration_s=1))
+        await breakers.record_failure("jsonld", DOMAIN, AdapterError.TIMEOUT)
+        breakers.health("jsonld", DOMAIN).opened_at = time.time() - 5
+
+        await breakers.refresh(DOMAIN, ["jsonld"])
+        assert breakers.health("jsonld", DOMAIN).state == CircuitState.HALF_OPEN
+        assert breakers.is_available("jsonld", DOMAIN)
+        assert breakers.is_degraded("jsonld", DOMAIN)
+
+        await breakers.record_success("jsonld", DOMAIN, 0.5)
+        assert breakers.health("jsonld", DOMAIN).state == CircuitState.CLOSED
+        assert breakers.health("jsonld", DOMAIN).consecutive_failures == 0
+
+    @pytest.mark.asyncio
+    async def test_half_open_probe_failure_reopens(self):
+        breakers = CircuitBreakerRegistry(_config(failure_threshold=5, open_duration_s=1))
+        for _ in range(5):
+            await breakers.record_failure("jsonld", DOMAIN, AdapterError.TIMEOUT)
+        breakers.health("jsonld", DOMAIN).opened_at = time.time() - 5
+        await breakers.refresh(DOMAIN, ["jsonld"])
+
+        await breakers.record_failure("jsonld", DOMAIN, AdapterError.TIMEOUT)
+
+        health = breakers.health("jsonld", DOMAIN)
+        assert health.state == CircuitState.OPEN
+        assert time.time() - health.opened_at < 1
+
+    @pytest.mark.asyncio
+    async def test_state_shared_through_redis_with_single_probe(self):
+        redis = _FakeRedis()
+        worker_a = CircuitBreakerRegistry(
+            _config(use_redis=True, failure_threshold=1, open_duration_s=1), redis_client=redis
+        )
+        worker_b = CircuitBreakerRegistry(
+            _config(use_redis=True, failure_threshold=1, open_duration_s=1), redis_client=redis
+        )
+
+        await worker_a.record_failure("playwright", DOMAIN, AdapterError.RATE_LIMITED)
+        await worker_b.refresh(DOMAIN, ["playwright"])
+        assert not worker_b.is_available("playwright", DOMAIN)
+
+        # Once the cool-down elapses only one worker gets the half-open probe
+        key = CircuitBreakerRegistry._state_key("playwright", DOMAIN)
+        health = AdapterHealth.from_json(redis.data[key])
+        health.opened_at = time.time() - 5
+        redis.data[key] = health.to_json()
+        await worker_a.refresh(DOMAIN, ["playwright"])
+        await worker_b.refresh(DOMAIN, ["playwright"])
+        assert worker_a.is_available("playwright", DOMAIN)
+        assert not worker_b.is_available("playwright", DOMAIN)
+
+    @pytest.mark.asyncio
+    async def test_redis_retried_after_backoff(self, monkeypatch):
+        clock = [1000.0]
+        monkeypatch.setattr(circuit_breaker.time, "monotonic", lambda: clock[0])
+        redis = _FlakyRedis()
+        breakers = CircuitBreakerRegistry(_config(use_redis=True), redis_client=redis)
+        key = CircuitBreakerRegistry._state_key("playwright", DOMAIN)
+
+        redis.down = True
+        await breakers.record_failure("playwright", DOMAIN, AdapterError.TIMEOUT)
+        redis.down = False
+        # Still inside the back-off window: local state only
+        await breakers.record_failure("playwright", DOMAIN, AdapterError.TIMEOUT)
+        assert key not in redis.data
+        assert breakers.health("playwright", DOMAIN).consecutive_failures == 2
+
+        clock[0] += circuit_breaker.REDIS_RETRY_SECONDS
+        await breakers.record_failure("playwright", DOMAIN, AdapterError.TIMEOUT)
+        assert AdapterHealth.from_json(redis.data[key]).consecutive_failures == 1
+
+
+class TestHealthBasedRouting:
+    """Test AdapterRouter integration."""
+
+    @pytest.mark.asyncio
+    async def test_open_circuit_adapter_is_skipped(self):
+        calls: list[str] = []
+        primary = _make_adapter(
+            "primary", 1, AdapterException(AdapterError.TIMEOUT, "Timed out"), calls
+        )
+        secondary = _make_adapter("secondary", 5, calls=calls)
+        router = _router([primary, secondary], CircuitBreakerRegistry(_config()))
+
+        for _ in range(3):
+            _, adapter_name = await router.extract(URL)
+            assert adapter_name == "secondary"
+        assert calls.count("primary") == 3
+
+        calls.clear()
+        _, adapter_name = await router.extract(URL)
+        assert adapter_name == "secondary"
+        assert calls == ["secondary"]
+
+    @pytest.mark.asyncio
+    async def test_degraded_adapter_tried_after_healthy(self):
+        primary = _make_adapter("primary", 1)
+        secondary = _make_adapter("secondary", 5)
+        breakers = CircuitBreakerRegistry(_config(min_samples=2, failure_threshold=50))
+        router = _router([primary, secondary], breakers)
+
+        for _ in range(3):
+            await breakers.record_failure("primary", DOMAIN, AdapterError.TIMEOUT)
+            await breakers.record_success("primary", DOMAIN, 0.1)
+        assert breakers.is_degraded("primary", DOMAIN)
+
+        ordered = router._get_matching_adapters_sorted(URL, DOMAIN)
+        assert [a._adapter_name for a in ordered] == ["secondary", "primary"]
+
+    @pytest.mark.asyncio
+    async def test_all_circuits_open_fails_fast(self):
+        only = _make_adapter("only", 1)
+        breakers = CircuitBreakerRegistry(_config(failure_threshold=1))
+        await breakers.record_failure("only", DOMAIN, AdapterError.NETWORK_ERROR)
+        router = _router([only], breakers)
+
+        with pytest.raises(AdapterException) as exc:
+            await router.extract(URL)
+
+        assert exc.value.error_type == AdapterError.ALL_ADAPTERS_FAILED
+        assert exc.value.metadata["open_circuits"] == ["only"]
+
+    @pytest.mark.asyncio
+    async def test_disabled_breakers_do_not_filter(self):
+        primary = _make_adapter("primary", 1)
+        breakers = CircuitBreakerRegistry(_config(enabled=False, failure_threshold=1))
+        await breakers.record_failure("primary", DOMAIN, AdapterError.TIMEOUT)
+        router = _router([primary], breakers)
+
+        _, adapter_name = await router.extract(URL)
+
+        assert adapter_name == "primary"
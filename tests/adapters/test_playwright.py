@@ -76,7 +76,7 @@ def mock_browser_pool(mock_browser):
         pool_instance.get_pool_stats = MagicMock(
             return_value={"in_use": 1, "available": 2, "pool_size": 3, "total_requests": 10}
         )
-        mock_pool_class.get_instance = MagicMock(return_value=pool_instance)
+        mock_pool_class.shared = MagicMock(return_value=pool_instance)
         yield pool_instance
 
 
@@ -8,12 +8,32 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from dealbrain_api.adapters.base import AdapterError, AdapterException
-from dealbrain_api.adapters.browser_pool import BrowserPool
+from dealbrain_api.adapters.browser_pool import (
+    RENDERING_TENANT,
+    SCRAPING_TENANT,
+    BrowserPool,
+    is_blocked_request,
+)
 from dealbrain_api.adapters.playwright import PlaywrightAdapter
 from dealbrain_core.schemas.ingestion import NormalizedListingSchema
 from playwright.async_api import TimeoutError as PlaywrightTimeoutError
 
 
+def _mock_browser():
+    """Mock Playwright Browser that hands out fresh mock contexts."""
+    browser = AsyncMock()
+    browser.is_connected = MagicMock(return_value=True)
+    browser.close = AsyncMock()
+
+    async def new_context(**kwargs):
+        context = AsyncMock()
+        context.set_default_timeout = MagicMock()
+        return context
+
+    browser.new_context = AsyncMock(side_effect=new_context)
+    return browser
+
+
 @pytest.fixture
 def mock_settings():
     """Mock settings with Playwright configuration."""
@@ -68,7 +88,7 @@ def mock_browser_pool(mock_browser):
         pool_instance.get_pool_stats = MagicMock(
             return_value={"in_use": 1, "available": 2, "pool_size": 3, "total_requests": 10}
         )
-        mock_pool_class.get_instance = MagicMock(return_value=pool_instance)
+        mock_pool_class.shared = MagicMock(return_value=pool_instance)
         yield pool_instance
 
 
@@ -83,9 +103,7 @@ class TestPlaywrightBrowserPoolRecycling:
         # Mock Playwright context
         with patch("dealbrain_api.adapters.browser_pool.async_playwright") as mock_pw:
             mock_context = AsyncMock()
-            mock_browser = AsyncMock()
-            mock_browser.is_connected = MagicMock(return_value=True)
-            mock_browser.close = AsyncMock()
+            mock_browser = _mock_browser()
 
             mock_context.chromium.launch = AsyncMock(return_value=mock_browser)
             mock_pw.return_value.start = AsyncMock(return_value=mock_context)
@@ -93,16 +111,16 @@ class TestPlaywrightBrowserPoolRecycling:
             # Initialize pool
             await pool.initialize()
 
-            # Acquire and release browser 3 times
+            # Acquire and release a context 3 times
             for i in range(3):
-                browser = await pool.acquire()
-                assert browser.is_connected()
-                await pool.release(browser)
+                context = await pool.acquire()
+                await pool.release(context)
 
-            # On 4th acquire, browser should be recycled
-            browser = await pool.acquire()
+            # By the 4th acquire, the browser should have been recycled
+            context = await pool.acquire()
             assert mock_browser.close.called  # Old browser was closed
-            await pool.release(browser)
+            assert pool.get_pool_stats()["recycled_total"] == 1
+            await pool.release(context)
 
             # Cleanup
             await pool.close_all()
@@ -110,12 +128,11 @@ class TestPlaywrightBrowserPoolRecycling:
     @pytest.mark.asyncio
     async def test_browser_pool_stats(self):
         """Test get_pool_stats returns correct metrics."""
-        pool = BrowserPool(pool_size=2, max_requests_per_browser=50)
+        pool = BrowserPool(pool_size=2, max_requests_per_browser=50, max_contexts_per_browser=4)
 
         with patch("dealbrain_api.adapters.browser_pool.async_playwright") as mock_pw:
             mock_context = AsyncMock()
-            mock_browser = AsyncMock()
-            mock_browser.is_connected = MagicMock(return_value=True)
+            mock_browser = _mock_browser()
 
             mock_context.chromium.launch = AsyncMock(return_value=mock_browser)
             mock_pw.return_value.start = AsyncMock(return_value=mock_context)
@@ -125,23 +142,313 @@ class TestPlaywrightBrowserPoolRecycling:
             # Check initial stats
             stats = pool.get_pool_stats()
             assert stats["pool_size"] == 2
+            assert stats["capacity"] == 8
             assert stats["in_use"] == 0
-            assert stats["available"] == 2
+            assert stats["available"] == 8
             assert stats["initialized"] is True
             assert stats["total_requests"] == 0
 
-            # Acquire browser
-            browser = await pool.acquire()
+            # Acquire context
+            context = await pool.acquire()
             stats = pool.get_pool_stats()
             assert stats["in_use"] == 1
-            assert stats["available"] == 1
+            assert stats["available"] == 7
             assert stats["total_requests"] == 1
 
-            # Release browser
-            await pool.release(browser)
+            # Release context
+            await pool.release(context)
             stats = pool.get_pool_stats()
             assert stats["in_use"] == 0
-            assert stats["available"] == 2
+            assert stats["available"] == 8
+            context.close.assert_awaited_once()
+
+            await pool.close_all()
+
+
+class TestBrowserContextMultiplexing:
+    """Tests for lending many contexts from a few browsers."""
+
+    @pytest.mark.asyncio
+    async def test_contexts_spread_across_browsers(self):
+        """Test that new contexts go to the least-loaded browser."""
+        pool = BrowserPool(pool_size=2, max_contexts_per_browser=10)
+        browsers = [_mock_browser(), _mock_browser()]
+
+        with patch("dealbrain_api.adapters.browser_pool.async_playwright") as mock_pw:
+            mock_context = AsyncMock()
+            mock_context.chromium.launch = AsyncMock(side_effect=browsers)
+            mock_pw.return_value.start = AsyncMock(return_value=mock_context)
+
+            await pool.initialize()
+
+            contexts = await asyncio.gather(*(pool.acquire() for _ in range(20)))
+
+            assert len(contexts) == 20
+            assert browsers[0].new_context.await_count == 10
+            assert browsers[1].new_context.await_count == 10
+            assert pool.get_pool_stats()["available"] == 0
+
+            for context in contexts:
+                await pool.release(context)
+
+            await pool.close_all()
+
+    @pytest.mark.asyncio
+    async def test_acquire_waits_when_browser_saturated(self):
+        """Test that the per-browser context limit blocks further acquires."""
+        pool = BrowserPool(pool_size=1, max_contexts_per_browser=2)
+
+        with patch("dealbrain_api.adapters.browser_pool.async_playwright") as mock_pw:
+            mock_context = AsyncMock()
+            mock_context.chromium.launch = AsyncMock(return_value=_mock_browser())
+            mock_pw.return_value.start = AsyncMock(return_value=mock_context)
+
+            await pool.initialize()
+
+            first = await pool.acquire()
+            await pool.acquire()
+
+            waiter = asyncio.create_task(pool.acquire())
+            await asyncio.sleep(0.01)
+            assert not waiter.done()
+
+            await pool.release(first)
+            third = await asyncio.wait_for(waiter, timeout=1)
+            assert third is not None
+
+            await pool.close_all()
+
+    @pytest.mark.asyncio
+    async def test_context_installs_request_interception(self):
+        """Test that contexts block heavy resources via request routing."""
+        pool = BrowserPool(pool_size=1)
+        browser = _mock_browser()
+
+        with patch("dealbrain_api.adapters.browser_pool.async_playwright") as mock_pw:
+            mock_context = AsyncMock()
+            mock_context.chromium.launch = AsyncMock(return_value=browser)
+            mock_pw.return_value.start = AsyncMock(return_value=mock_context)
+
+            await pool.initialize()
+            context = await pool.acquire()
+
+            context.add_init_script.assert_awaited_once()
+            context.route.assert_awaited_once()
+            handler = context.route.await_args.args[1]
+
+            image_route = AsyncMock()
+            image_route.request = MagicMock(resource_type="image", url="https://a.com/x.png")
+            await handler(image_route)
+            image_route.abort.assert_awaited_once()
+
+            doc_route = AsyncMock()
+            doc_route.request = MagicMock(resource_type="document", url="https://a.com/item")
+            await handler(doc_route)
+            doc_route.continue_.assert_awaited_once()
+            assert pool.get_pool_stats()["blocked_requests_total"] == 1
+
+            await pool.release(context)
+            await pool.close_all()
+
+    @pytest.mark.asyncio
+    async def test_tenant_quota_limits_contexts(self):
+        """Test that a tenant cannot exceed its quota even with free capacity."""
+        pool = BrowserPool(pool_size=1, max_contexts_per_browser=4)
+        pool.register_tenant(RENDERING_TENANT, max_contexts=1, block_resources=False)
+
+        with patch("dealbrain_api.adapters.browser_pool.async_playwright") as mock_pw:
+            mock_context = AsyncMock()
+            mock_context.chromium.launch = AsyncMock(return_value=_mock_browser())
+            mock_pw.return_value.start = AsyncMock(return_value=mock_context)
+
+            await pool.initialize()
+
+            render = await pool.acquire(tenant=RENDERING_TENANT)
+            waiter = asyncio.create_task(pool.acquire(tenant=RENDERING_TENANT))
+            await asyncio.sleep(0.01)
+            assert not waiter.done()
+
+            # Scraping still has room on the same browser
+            scrape = await pool.acquire(tenant=SCRAPING_TENANT)
+
+            stats = pool.get_pool_stats()
+            assert stats["tenants"][RENDERING_TENANT]["in_use"] == 1
+            assert stats["tenants"][RENDERING_TENANT]["waits_total"] == 1
+            assert stats["tenants"][SCRAPING_TENANT]["in_use"] == 1
+
+            await pool.release(render)
+            await asyncio.wait_for(waiter, timeout=1)
+            await pool.release(waiter.result())
+            await pool.release(scrape)
+            await pool.close_all()
+
+    @pytest.mark.asyncio
+    async def test_rendering_tenant_context_options(self):
+        """Test that rendering contexts skip stealth/interception and take overrides."""
+        pool = BrowserPool(pool_size=1)
+        pool.register_tenant(RENDERING_TENANT, max_contexts=2, block_resources=False, stealth=False)
+        browser = _mock_browser()
+
+        with patch("dealbrain_api.adapters.browser_pool.async_playwright") as mock_pw:
+            mock_context = AsyncMock()
+            mock_context.chromium.launch = AsyncMock(return_value=browser)
+            mock_pw.return_value.start = AsyncMock(return_value=mock_context)
+
+            await pool.initialize()
+            context = await pool.acquire(
+                tenant=RENDERING_TENANT, viewport={"width": 1200, "height": 630}
+            )
+
+            browser.new_context.assert_awaited_once_with(viewport={"width": 1200, "height": 630})
+            context.route.assert_not_awaited()
+            context.add_init_script.assert_not_awaited()
+
+            await pool.release(context)
+            await pool.close_all()
+
+    @pytest.mark.asyncio
+    async def test_shared_pool_adds_rendering_slots(self, monkeypatch):
+        """Test that shared() adds rendering slots without shrinking scraping's quota."""
+        settings = MagicMock()
+        scraping = settings.ingestion.playwright
+        scraping.pool_size, scraping.max_contexts_per_browser = 1, 4
+        scraping.timeout_s, scraping.headless = 8, True
+        scraping.block_resources, scraping.max_browser_memory_mb = True, None
+        settings.playwright.max_concurrent_browsers = 2
+        settings.playwright.browser_timeout_ms = 30000
+        settings.playwright.headless = True
+        monkeypatch.setattr(BrowserPool, "_instance", None)
+        browser = _mock_browser()
+
+        with (
+            patch("dealbrain_api.adapters.browser_pool.get_settings", return_value=settings),
+            patch("dealbrain_api.adapters.browser_pool.async_playwright") as mock_pw,
+        ):
+            pool = BrowserPool.shared()
+            mock_context = AsyncMock()
+            mock_context.chromium.launch = AsyncMock(return_value=browser)
+            mock_pw.return_value.start = AsyncMock(return_value=mock_context)
+            await pool.initialize()
+
+            stats = pool.get_pool_stats()
+            # Rendering slots come on top of scraping's configured capacity
+            assert stats["capacity"] == 6
+            assert stats["tenants"][SCRAPING_TENANT]["max_contexts"] == 4
+            assert stats["tenants"][RENDERING_TENANT]["max_contexts"] == 2
+
+            scrape = await pool.acquire(tenant=SCRAPING_TENANT)
+            render = await pool.acquire(tenant=RENDERING_TENANT)
+            scrape.set_default_timeout.assert_called_once_with(8000)
+            render.set_default_timeout.assert_called_once_with(30000)
+
+            await pool.release(scrape)
+            await pool.release(render)
+            await pool.close_all()
+
+    @pytest.mark.asyncio
+    async def test_health_check_relaunches_crashed_idle_browser(self):
+        """Test that health_check replaces disconnected idle browsers."""
+        pool = BrowserPool(pool_size=1)
+        crashed, replacement = _mock_browser(), _mock_browser()
+
+        with patch("dealbrain_api.adapters.browser_pool.async_playwright") as mock_pw:
+            mock_context = AsyncMock()
+            mock_context.chromium.launch = AsyncMock(side_effect=[crashed, replacement])
+            mock_pw.return_value.start = AsyncMock(return_value=mock_context)
+
+            await pool.initialize()
+            crashed.is_connected.return_value = False
+
+            health = await pool.health_check()
+
+            assert health == {"healthy": True, "connected": 1, "total": 1, "relaunched": 1}
+            assert pool._browsers == [replacement]
+            await pool.close_all()
+
+    @pytest.mark.asyncio
+    async def test_relaunch_does_not_block_healthy_slots(self):
+        """Test that a slow browser relaunch runs without holding the pool lock."""
+        pool = BrowserPool(pool_size=2, max_contexts_per_browser=1)
+        crashed, healthy, replacement = _mock_browser(), _mock_browser(), _mock_browser()
+        launch_started = asyncio.Event()
+        finish_launch = asyncio.Event()
+
+        async def slow_launch(**kwargs):
+            launch_started.set()
+            await finish_launch.wait()
+            return replacement
+
+        with patch("dealbrain_api.adapters.browser_pool.async_playwright") as mock_pw:
+            mock_context = AsyncMock()
+            mock_context.chromium.launch = AsyncMock(side_effect=[crashed, healthy])
+            mock_pw.return_value.start = AsyncMock(return_value=mock_context)
+            await pool.initialize()
+
+            crashed.is_connected.return_value = False
+            mock_context.chromium.launch = AsyncMock(side_effect=slow_launch)
+            health_check = asyncio.create_task(pool.health_check())
+            await launch_started.wait()
+
+            # The healthy browser keeps serving while the crashed one relaunches
+            context = await asyncio.wait_for(pool.acquire(), 1)
+            assert pool._context_slots[context].browser is healthy
+            await asyncio.wait_for(pool.release(context), 1)
+
+            finish_launch.set()
+            health = await health_check
+            assert health["relaunched"] == 1
+            assert replacement in pool._browsers
+            await pool.close_all()
+
+    def test_pool_reinitializes_on_new_event_loop(self):
+        """Test that a pool initialized on a closed loop re-initializes on a new one."""
+        pool = BrowserPool(pool_size=1)
+
+        with patch("dealbrain_api.adapters.browser_pool.async_playwright") as mock_pw:
+            mock_context = AsyncMock()
+            mock_context.chromium.launch = AsyncMock(side_effect=[_mock_browser(), _mock_browser()])
+            mock_pw.return_value.start = AsyncMock(return_value=mock_context)
+
+            async def use_pool():
+                await pool.initialize()
+                context = await pool.acquire()
+                await pool.release(context)
+
+            asyncio.run(use_pool())
+            asyncio.run(use_pool())
+
+            assert mock_context.chromium.launch.await_count == 2
+            assert pool.get_pool_stats()["total_requests"] == 1
+
+    def test_is_blocked_request(self):
+        """Test resource type and ad host blocking rules."""
+        assert is_blocked_request("font", "https://example.com/f.woff2")
+        assert is_blocked_request("script", "https://securepubads.g.doubleclick.net/tag.js")
+        assert not is_blocked_request("script", "https://www.amazon.com/app.js")
+        assert not is_blocked_request("xhr", "https://notdoubleclick.net/api")
+
+    @pytest.mark.asyncio
+    async def test_browser_recycled_when_memory_exceeded(self):
+        """Test that a browser over its memory budget is recycled once idle."""
+        pool = BrowserPool(pool_size=1, max_browser_memory_mb=512, memory_check_interval=1)
+        old_browser, new_browser = _mock_browser(), _mock_browser()
+
+        with patch("dealbrain_api.adapters.browser_pool.async_playwright") as mock_pw:
+            mock_context = AsyncMock()
+            mock_context.chromium.launch = AsyncMock(side_effect=[old_browser, new_browser])
+            mock_pw.return_value.start = AsyncMock(return_value=mock_context)
+
+            await pool.initialize()
+
+            with patch.object(pool, "_sample_memory_mb", AsyncMock(return_value=900.0)):
+                context = await pool.acquire()
+                await pool.release(context)
+
+            old_browser.close.assert_awaited_once()
+            assert pool._browsers == [new_browser]
+            stats = pool.get_pool_stats()
+            assert stats["recycled_total"] == 1
+            assert stats["total_requests"] == 0
 
             await pool.close_all()
 
@@ -152,6 +459,7 @@ class TestPlaywrightTimeoutHandling:
     @pytest.mark.asyncio
     async def test_very_slow_page_timeout(self, adapter, mock_browser_pool, mock_page):
         """Test extraction fails gracefully on very slow pages (8s timeout)."""
+
         # Mock page load that exceeds timeout
         async def slow_goto(*args, **kwargs):
             await asyncio.sleep(0.1)  # Simulate slow page
@@ -241,17 +549,13 @@ class TestPlaywrightMemoryManagement:
     @pytest.mark.asyncio
     async def test_browser_pool_bounded_growth(self):
         """Test that browser pool doesn't grow unbounded."""
-        pool = BrowserPool(pool_size=3, max_requests_per_browser=50)
+        pool = BrowserPool(pool_size=3, max_requests_per_browser=50, max_contexts_per_browser=2)
 
         with patch("dealbrain_api.adapters.browser_pool.async_playwright") as mock_pw:
             mock_context = AsyncMock()
 
             # Create 3 distinct browser mocks
-            mock_browsers = []
-            for i in range(3):
-                browser = AsyncMock()
-                browser.is_connected = MagicMock(return_value=True)
-                mock_browsers.append(browser)
+            mock_browsers = [_mock_browser() for _ in range(3)]
 
             # Return different browser on each call
             mock_context.chromium.launch = AsyncMock(side_effect=mock_browsers)
@@ -264,25 +568,25 @@ class TestPlaywrightMemoryManagement:
             assert stats["pool_size"] == 3
             assert len(pool._browsers) == 3
 
-            # Try to acquire all browsers
-            browsers = []
-            for i in range(3):
-                browser = await pool.acquire()
-                browsers.append(browser)
+            # Acquire every context slot
+            contexts = []
+            for i in range(6):
+                contexts.append(await pool.acquire())
 
-            # Pool should be exhausted
+            # Pool should be exhausted without launching more browsers
             stats = pool.get_pool_stats()
-            assert stats["in_use"] == 3
+            assert stats["in_use"] == 6
             assert stats["available"] == 0
+            assert mock_context.chromium.launch.await_count == 3
 
             # Release all
-            for browser in browsers:
-                await pool.release(browser)
+            for context in contexts:
+                await pool.release(context)
 
             # Pool should be back to normal
             stats = pool.get_pool_stats()
             assert stats["in_use"] == 0
-            assert stats["available"] == 3
+            assert stats["available"] == 6
 
             await pool.close_all()
 
@@ -316,7 +620,7 @@ class TestPlaywrightMemoryManagement:
             # Verify pool state is reset
             assert pool._initialized is False
             assert len(pool._browsers) == 0
-            assert len(pool._in_use) == 0
+            assert len(pool._context_slots) == 0
 
 
 class TestPlaywrightPartialImports:
@@ -402,7 +706,7 @@ class TestPlaywrightConcurrency:
             pool_instance.get_pool_stats = MagicMock(
                 return_value={"in_use": 1, "available": 2, "pool_size": 3, "total_requests": 10}
             )
-            mock_pool_class.get_instance = MagicMock(return_value=pool_instance)
+            mock_pool_class.shared = MagicMock(return_value=pool_instance)
 
             # Execute 3 concurrent extractions
             tasks = [
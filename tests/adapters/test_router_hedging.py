@@ -0,0 +1,209 @@
+"""Tests for hedged adapter fallback in AdapterRouter."""
+
+import asyncio
+from decimal import Decimal
+
+import pytest
+from dealbrain_api.adapters.base import AdapterError, AdapterException
+from dealbrain_api.adapters.hedging import AdapterLatencyTracker, HedgingPolicy
+from dealbrain_api.adapters.router import AdapterRouter
+
+from packages.core.dealbrain_core.schemas.ingestion import NormalizedListingSchema
+
+URL = "https://www.ebay.com/itm/123456789012"
+
+
+def _listing(title: str) -> NormalizedListingSchema:
+    return NormalizedListingSchema(
+        title=title,
+        price=Decimal("100.00"),
+        currency="USD",
+        condition="used",
+        marketplace="ebay",
+        images=[],
+    )
+
+
+def _make_adapter(name: str, delay_s: float = 0.0, error: Exception | None = None, log=None):
+    """Build a fake adapter class that sleeps, then returns or raises."""
+
+    class FakeAdapter:
+        _adapter_name = name
+        cancelled = False
+
+        async def extract(self, url: str) -> NormalizedListingSchema:
+            if log is not None:
+                log.append(name)
+            try:
+                await asyncio.sleep(delay_s)
+            except asyncio.CancelledError:
+                FakeAdapter.cancelled = True
+                raise
+            if error is not None:
+                raise error
+            return _listing(f"from {name}")
+
+    return FakeAdapter
+
+
+def _router(adapters, policy: HedgingPolicy, tracker: AdapterLatencyTracker | None = None):
+    router = AdapterRouter(hedging=policy, latency_tracker=tracker or AdapterLatencyTracker())
+    router._get_matching_adapters_sorted = lambda url, domain: list(adapters)
+    router._is_adapter_class_enabled = lambda adapter_class: True
+    return router
+
+
+class TestHedgedExtraction:
+    """Test overlapping slow adapters with lower-priority fallbacks."""
+
+    @pytest.mark.asyncio
+    async def test_slow_primary_is_hedged_and_fast_secondary_wins(self):
+        """A slow primary is overtaken by the hedge and then cancelled."""
+        slow = _make_adapter("slow", delay_s=5)
+        fast = _make_adapter("fast", delay_s=0.01)
+        router = _router([slow, fast], HedgingPolicy(enabled=True, delay_ms=50, adaptive=False))
+
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        result, adapter_name = await router.extract(URL)
+
+        assert adapter_name == "fast"
+        assert result.title == "from fast"
+        assert loop.time() - start < 1
+        assert slow.cancelled is True
+
+    @pytest.mark.asyncio
+    async def test_primary_within_hedge_delay_runs_alone(self):
+        """No hedge is started when the primary answers before the delay."""
+        calls: list[str] = []
+        primary = _make_adapter("primary", delay_s=0.01, log=calls)
+        secondary = _make_adapter("secondary", log=calls)
+        router = _router(
+            [primary, secondary], HedgingPolicy(enabled=True, delay_ms=1000, adaptive=False)
+        )
+
+        _, adapter_name = await router.extract(URL)
+
+        assert adapter_name == "primary"
+        assert calls == ["primary"]
+
+    @pytest.mark.asyncio
+    async def test_failure_starts_next_adapter_immediately(self):
+        """A failed attempt does not wait for the hedge delay."""
+        failing = _make_adapter(
+            "failing", error=AdapterException(AdapterError.TIMEOUT, "Timed out")
+        )
+        fallback = _make_adapter("fallback")
+        router = _router(
+            [failing, fallback], HedgingPolicy(enabled=True, delay_ms=5000, adaptive=False)
+        )
+
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        _, adapter_name = await router.extract(URL)
+
+        assert adapter_name == "fallback"
+        assert loop.time() - start < 1
+
+    @pytest.mark.asyncio
+    async def test_item_not_found_cancels_hedges(self):
+        """ITEM_NOT_FOUND fast-fails even while a hedge is in flight."""
+        slow = _make_adapter("slow", delay_s=5)
+        not_found = _make_adapter(
+            "not_found",
+            delay_s=0.01,
+            error=AdapterException(AdapterError.ITEM_NOT_FOUND, "Item not found"),
+        )
+        router = _router(
+            [slow, not_found], HedgingPolicy(enabled=True, delay_ms=20, adaptive=False)
+        )
+
+        with pytest.raises(AdapterException) as exc:
+            await router.extract(URL)
+
+        assert exc.value.error_type == AdapterError.ITEM_NOT_FOUND
+        assert slow.cancelled is True
+
+    @pytest.mark.asyncio
+    async def test_all_hedged_adapters_failed(self):
+        """ALL_ADAPTERS_FAILED keeps the attempted adapters and last error."""
+        first = _make_adapter("first", error=AdapterException(AdapterError.TIMEOUT, "slow"))
+        second = _make_adapter("second", error=RuntimeError("boom"))
+        router = _router([first, second], HedgingPolicy(enabled=True, delay_ms=10, adaptive=False))
+
+        with pytest.raises(AdapterException) as exc:
+            await router.extract(URL)
+
+        assert exc.value.error_type == AdapterError.ALL_ADAPTERS_FAILED
+        assert exc.value.metadata["attempted_adapters"] == ["first", "second"]
+        assert exc.value.metadata["last_error_type"] == AdapterError.NETWORK_ERROR.value
+
+    @pytest.mark.asyncio
+    async def test_hedging_disabled_is_sequential(self):
+        """With hedging off, the secondary only runs after the primary finishes."""
+        calls: list[str] = []
+        primary = _make_adapter(
+            "primary",
+            delay_s=0.05,
+            error=AdapterException(AdapterError.TIMEOUT, "Timed out"),
+            log=calls,
+        )
+        secondary = _make_adapter("secondary", log=calls)
+        router = _router([primary, secondary], HedgingPolicy(enabled=False, delay_ms=1))
+
+        _, adapter_name = await router.extract(URL)
+
+        assert adapter_name == "secondary"
+        assert calls == ["primary", "secondary"]
+        assert primary.cancelled is False
+
+
+class TestHedgingPolicy:
+    """Test adaptive hedge delays and latency tracking."""
+
+    def test_fixed_delay_until_enough_samples(self):
+        tracker = AdapterLatencyTracker()
+        policy = HedgingPolicy(enabled=True, delay_ms=2000, min_samples=5)
+        for _ in range(4):
+            tracker.record("ebay", 0.5)
+
+        assert policy.hedge_delay_s("ebay", tracker) == 2.0
+
+    def test_adaptive_delay_uses_percentile_with_clamping(self):
+        tracker = AdapterLatencyTracker()
+        policy = HedgingPolicy(
+            enabled=True,
+            min_samples=10,
+            latency_percentile=0.9,
+            min_delay_ms=250,
+            max_delay_ms=3000,
+        )
+        for i in range(1, 11):
+            tracker.record("ebay", i / 10)  # 0.1s .. 1.0s
+
+        assert policy.hedge_delay_s("ebay", tracker) == pytest.approx(0.9)
+
+        for _ in range(10):
+            tracker.record("slow", 30.0)
+        assert policy.hedge_delay_s("slow", tracker) == 3.0
+
+    def test_only_successes_feed_percentiles(self):
+        tracker = AdapterLatencyTracker(window_size=3)
+        tracker.record("jsonld", 10.0, outcome="error")
+        tracker.record("jsonld", 10.0, outcome="cancelled")
+        for value in (1.0, 2.0, 3.0, 4.0):
+            tracker.record("jsonld", value)
+
+        assert tracker.sample_count("jsonld") == 3
+        assert tracker.percentile("jsonld", 0.5) == 3.0
+        assert tracker.percentile("missing", 0.5) is None
+
+    @pytest.mark.asyncio
+    async def test_router_records_latency(self):
+        tracker = AdapterLatencyTracker()
+        adapter = _make_adapter("recorded")
+        router = _router([adapter], HedgingPolicy(enabled=False), tracker)
+
+        await router.extract(URL)
+
+        assert tracker.sample_count("recorded") == 1
@@ -10,6 +10,7 @@ paths_to_add = [
     ROOT,
     ROOT / "apps",
     ROOT / "apps" / "api",
+    ROOT / "apps" / "cli",
     ROOT / "packages" / "core",
 ]
 for path in paths_to_add:
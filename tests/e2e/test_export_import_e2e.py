@@ -246,16 +246,16 @@ class TestDealExportImportE2E:
         preview_id = await export_service.import_listing_from_json(json_data)
 
         # Get preview from cache to check duplicates
-        from apps.api.dealbrain_api.services.export_import import _preview_cache
+        from apps.api.dealbrain_api.services.export_import import _preview_store
 
-        preview = _preview_cache.get(preview_id)
+        preview = await _preview_store.get(preview_id)
 
         # Verify duplicates detected
         assert preview is not None
         assert len(preview.duplicates) > 0
 
         # Clean up preview
-        _preview_cache.remove(preview_id)
+        await _preview_store.remove(preview_id)
 
 
 # ==================== Collection Export/Import E2E Tests ====================
@@ -0,0 +1,217 @@
+"""Tests for bulk universal entity imports."""
+
+from __future__ import annotations
+
+import json
+from contextlib import asynccontextmanager
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+try:
+    import aiosqlite  # type: ignore  # noqa: F401
+except ModuleNotFoundError:
+    aiosqlite = None
+
+from dealbrain_api.db import Base
+from dealbrain_api.importers import bulk
+from dealbrain_api.importers.bulk import import_entities_bulk, validate_records
+from dealbrain_api.importers.universal import ImporterError
+from dealbrain_api.models.core import Cpu, Gpu, Listing, Port, PortsProfile, Profile
+
+
+@pytest_asyncio.fixture
+async def session_factory(monkeypatch):
+    """Point the importer's session_scope at an isolated in-memory database."""
+    if aiosqlite is None:
+        pytest.skip("aiosqlite is not installed; skipping tests")
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    factory = async_sessionmaker(engine, expire_on_commit=False)
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    @asynccontextmanager
+    async def _session_scope_override():
+        session = factory()
+        try:
+            yield session
+            await session.commit()
+        except Exception:
+            await session.rollback()
+            raise
+        finally:
+            await session.close()
+
+    monkeypatch.setattr(bulk, "session_scope", _session_scope_override)
+    try:
+        yield factory
+    finally:
+        await engine.dispose()
+
+
+class TestValidation:
+    """Per-row validation."""
+
+    def test_collects_row_errors_in_file_order(self):
+        records = [
+            {"name": f"CPU {index}", "manufacturer": "Intel", "cores": str(index)}
+            for index in range(1, 6)
+        ]
+        records[1]["cores"] = "many"
+        records[3]["attributes"] = "{not json"
+
+        validated, errors = validate_records("cpu", records)
+
+        assert [row for row, _ in validated] == [1, 3, 5]
+        assert [(error.row, error.entity) for error in errors] == [(2, "cpu"), (4, "cpu")]
+        assert "attributes" in errors[1].message
+
+    def test_process_pool_matches_inline_validation(self, monkeypatch):
+        monkeypatch.setattr(bulk, "PARALLEL_THRESHOLD", 4)
+        monkeypatch.setattr(bulk, "VALIDATION_BATCH_SIZE", 3)
+        records = [
+            {"name": f"GPU {index}", "manufacturer": "NVIDIA", "gpu_mark": index}
+            for index in range(10)
+        ]
+        records[7]["gpu_mark"] = "fast"
+
+        pooled, pooled_errors = validate_records("gpu", records, workers=2)
+        inline, inline_errors = validate_records("gpu", records, workers=1)
+
+        assert [(row, item.name) for row, item in pooled] == [
+            (row, item.name) for row, item in inline
+        ]
+        assert pooled_errors == inline_errors
+        assert [error.row for error in pooled_errors] == [8]
+
+
+class TestBulkImport:
+    """import_entities_bulk persistence."""
+
+    @pytest.mark.asyncio
+    async def test_catalog_dump_writes_in_dependency_order(self, session_factory, tmp_path):
+        path = tmp_path / "catalog.json"
+        path.write_text(
+            json.dumps(
+                {
+                    # Listings first in the file; they still need the CPUs written before them
+                    "listings": [
+                        {"title": "Dell OptiPlex 7060", "price_usd": 240, "cpu_id": 1},
+                        {"title": "Broken", "price_usd": "free"},
+                        {"title": "HP EliteDesk 800 G4", "price_usd": 220, "cpu_id": 99},
+                    ],
+                    "cpu": [
+                        {"name": "Intel Core i7-8700T", "manufacturer": "Intel"},
+                        {"name": "Intel Core i5-8500T", "manufacturer": "Intel"},
+                        {"name": "No Manufacturer"},
+                    ],
+                    "gpus": [{"name": "Intel UHD 630", "manufacturer": "Intel"}],
+                }
+            )
+        )
+
+        report = await import_entities_bulk(path, "catalog", chunk_size=2)
+
+        result = report.to_dict()
+        assert (result["records"], result["imported"], result["failed"]) == (7, 5, 2)
+        assert result["entities"]["listing"] == {"records": 3, "imported": 2}
+        assert [(error["entity"], error["row"]) for error in result["errors"]] == [
+            ("cpu", 3),
+            ("listing", 2),
+        ]
+
+        async with session_factory() as session:
+            cpus = {cpu.name: cpu.id for cpu in (await session.execute(select(Cpu))).scalars()}
+            gpus = (await session.execute(select(Gpu.name))).scalars().all()
+            listings = {
+                listing.title: listing.cpu_id
+                for listing in (await session.execute(select(Listing))).scalars()
+            }
+        assert cpus["Intel Core i7-8700T"] == 1
+        assert gpus == ["Intel UHD 630"]
+        assert listings["Dell OptiPlex 7060"] == 1
+
+    @pytest.mark.asyncio
+    async def test_reference_entities_are_written_directly(self, session_factory, tmp_path):
+        async with session_factory() as session:
+            existing = PortsProfile(name="Mini PC", attributes_json={})
+            existing.ports.append(Port(type="hdmi", count=1))
+            session.add(existing)
+            await session.commit()
+
+        path = tmp_path / "catalog.json"
+        path.write_text(
+            json.dumps(
+                {
+                    "profiles": [{"name": "Balanced", "weights_json": {"cpu": 0.5}}],
+                    "ports_profiles": [
+                        {"name": "Mini PC", "ports": [{"type": "usb_a", "count": 4}]},
+                        {"name": "Tower", "ports": [{"type": "hdmi", "count": 2}]},
+                    ],
+                }
+            )
+        )
+
+        report = await import_entities_bulk(path, "catalog")
+
+        assert report.imported == {"ports_profile": 2, "profile": 1}
+        async with session_factory() as session:
+            profiles = (await session.execute(select(Profile.name))).scalars().all()
+            ports = {
+                (profile.name, port.type, port.count)
+                for profile in (await session.execute(select(PortsProfile))).scalars()
+                for port in profile.ports
+            }
+        assert profiles == ["Balanced"]
+        # Ports of an existing profile are replaced by the file's
+        assert ports == {("Mini PC", "usb_a", 4), ("Tower", "hdmi", 2)}
+
+    @pytest.mark.asyncio
+    async def test_failing_chunk_is_retried_row_by_row(
+        self, session_factory, tmp_path, monkeypatch
+    ):
+        original = bulk.ChunkWriter.upsert_catalog
+
+        async def _upsert(session, model, items):
+            if any(item.name == "Bad CPU" for item in items):
+                raise RuntimeError("constraint failed\n[SQL: INSERT ...]")
+            return await original(session, model, items)
+
+        monkeypatch.setattr(bulk.ChunkWriter, "upsert_catalog", _upsert)
+        path = tmp_path / "cpus.csv"
+        path.write_text(
+            "name,manufacturer\nGood CPU 1,Intel\nBad CPU,Intel\nGood CPU 2,AMD\nGood CPU 3,AMD\n"
+        )
+
+        report = await import_entities_bulk(path, "cpu", chunk_size=2)
+
+        assert report.imported == {"cpu": 3}
+        assert [error.to_dict() for error in report.errors] == [
+            {"entity": "cpu", "row": 2, "message": "constraint failed"}
+        ]
+        async with session_factory() as session:
+            names = set((await session.execute(select(Cpu.name))).scalars())
+        assert names == {"Good CPU 1", "Good CPU 2", "Good CPU 3"}
+
+    @pytest.mark.asyncio
+    async def test_dry_run_validates_without_writing(self, session_factory, tmp_path):
+        path = tmp_path / "gpus.json"
+        path.write_text(
+            json.dumps([{"name": "RTX 3060", "manufacturer": "NVIDIA"}, {"gpu_mark": 1}])
+        )
+
+        report = await import_entities_bulk(path, "gpu", dry_run=True)
+
+        assert (report.total_records, report.total_imported, len(report.errors)) == (2, 1, 1)
+        async with session_factory() as session:
+            assert (await session.execute(select(Gpu))).first() is None
+
+    @pytest.mark.asyncio
+    async def test_file_level_problems_raise(self, tmp_path):
+        with pytest.raises(ImporterError, match="Unsupported entity"):
+            await import_entities_bulk(tmp_path / "x.json", "widget")
+        with pytest.raises(ImporterError, match="File not found"):
+            await import_entities_bulk(tmp_path / "missing.json", "cpu")
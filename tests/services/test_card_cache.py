@@ -0,0 +1,132 @@
+"""Tests for the tiered card image cache."""
+
+from __future__ import annotations
+
+import io
+from unittest.mock import AsyncMock, MagicMock, Mock, patch
+
+import pytest
+from botocore.exceptions import ClientError
+from dealbrain_api.services.card_cache import (
+    CardCacheKey,
+    LocalCardCache,
+    card_cache_stats,
+    card_content_hash,
+)
+from dealbrain_api.services.image_generation import (
+    CARD_TEMPLATE,
+    TEMPLATE_DIR,
+    ImageGenerationService,
+)
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+def _key(listing_id: int = 1, content_hash: str = "abc", style: str = "light") -> CardCacheKey:
+    return CardCacheKey(listing_id, style, "social", "png", content_hash)
+
+
+class TestLocalCardCache:
+    """Byte-bounded LRU tier."""
+
+    def test_evicts_least_recently_used(self):
+        cache = LocalCardCache(max_bytes=10)
+        cache.put(_key(1), b"aaaa")
+        cache.put(_key(2), b"bbbb")
+        assert cache.get(_key(1)) == b"aaaa"  # 1 is now most recently used
+
+        cache.put(_key(3), b"cccc")
+
+        assert cache.get(_key(2)) is None
+        assert cache.get(_key(1)) == b"aaaa"
+        assert cache.size_bytes == 8
+
+    def test_skips_oversized_images_and_discards_listing(self):
+        cache = LocalCardCache(max_bytes=10)
+        cache.put(_key(1), b"x" * 11)
+        assert len(cache) == 0
+
+        cache.put(_key(1, style="light"), b"aa")
+        cache.put(_key(1, style="dark"), b"bb")
+        cache.put(_key(2), b"cc")
+
+        assert cache.discard_listing(1) == 2
+        assert len(cache) == 1
+        assert cache.size_bytes == 2
+
+
+def test_content_hash_tracks_rendered_inputs():
+    template = TEMPLATE_DIR / CARD_TEMPLATE
+    context = {"title": "NUC", "price": "600", "theme": "light"}
+
+    assert card_content_hash(context, template) == card_content_hash(dict(context), template)
+    assert card_content_hash(context, template) != card_content_hash(
+        {**context, "price": "550"}, template
+    )
+
+
+@pytest.fixture
+def s3_settings():
+    settings = Mock()
+    settings.s3.enabled = True
+    settings.s3.bucket_name = "test-bucket"
+    settings.s3.region = "us-east-1"
+    settings.s3.cache_ttl_seconds = 2592000
+    settings.s3.endpoint_url = None
+    settings.aws_access_key_id = None
+    settings.aws_secret_access_key = None
+    settings.aws_region = None
+    return settings
+
+
+def _service(settings, s3_client, local_cache):
+    with patch(
+        "dealbrain_api.services.image_generation.get_settings", return_value=settings
+    ), patch("dealbrain_api.services.image_generation.boto3.client", return_value=s3_client):
+        return ImageGenerationService(AsyncMock(spec=AsyncSession), local_cache=local_cache)
+
+
+@pytest.mark.asyncio
+class TestTieredLookup:
+    """Local tier in front of thread-offloaded S3."""
+
+    async def test_s3_hit_fills_local_tier(self, s3_settings):
+        s3_client = MagicMock()
+        s3_client.get_object.return_value = {
+            "Metadata": {"content_hash": "abc"},
+            "Body": io.BytesIO(b"card"),
+        }
+        service = _service(s3_settings, s3_client, LocalCardCache(max_bytes=1024))
+
+        for _ in range(2):
+            assert await service.get_cached_image(1, "light", "png", "social", "abc") == b"card"
+
+        s3_client.get_object.assert_called_once()
+        stats = card_cache_stats()
+        assert stats["local"]["hit"] >= 1
+        assert 0 < stats["local"]["hit_ratio"] <= 1
+
+    async def test_s3_object_from_other_content_is_stale(self, s3_settings):
+        s3_client = MagicMock()
+        s3_client.get_object.return_value = {
+            "Metadata": {"content_hash": "old"},
+            "Body": io.BytesIO(b"card"),
+        }
+        service = _service(s3_settings, s3_client, LocalCardCache(max_bytes=1024))
+
+        assert await service.get_cached_image(1, "light", "png", "social", "new") is None
+
+    async def test_missing_object_and_cache_write(self, s3_settings):
+        s3_client = MagicMock()
+        s3_client.get_object.side_effect = ClientError(
+            {"Error": {"Code": "NoSuchKey"}}, "GetObject"
+        )
+        local_cache = LocalCardCache(max_bytes=1024)
+        service = _service(s3_settings, s3_client, local_cache)
+
+        assert await service.get_cached_image(1, "light", "png", "social", "abc") is None
+        await service.cache_image(1, "light", "png", "social", b"card", content_hash="abc")
+
+        assert s3_client.put_object.call_args.kwargs["Metadata"]["content_hash"] == "abc"
+        assert local_cache.get(_key(1)) == b"card"
+        assert await service.invalidate_cache(1) == 13  # 1 local + 12 S3 variants
+        assert len(local_cache) == 0
@@ -0,0 +1,133 @@
+"""Tests for the Pillow card renderer."""
+
+from __future__ import annotations
+
+from io import BytesIO
+from typing import get_args
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+from dealbrain_api.models import Listing
+from dealbrain_api.services.card_renderer import PillowCardRenderer
+from dealbrain_api.services.image_generation import (
+    CARD_DIMENSIONS,
+    CARD_TEMPLATE,
+    TEMPLATE_DIR,
+    ImageGenerationService,
+)
+from dealbrain_api.settings import CardRenderSettings
+from jinja2 import Environment, FileSystemLoader, select_autoescape
+from PIL import Image, ImageChops, ImageStat
+from sqlalchemy.ext.asyncio import AsyncSession
+
+# Mean per-pixel difference (0-255) tolerated against the browser screenshot;
+# the background and boxes match exactly, glyph rasterization does not
+MAX_MEAN_PIXEL_DIFF = 3.0
+
+# Every size preset ``cards.pillow_sizes`` may route to the Pillow renderer
+PILLOW_SIZES = get_args(get_args(CardRenderSettings.model_fields["pillow_sizes"].annotation)[0])
+
+
+def _context(size: str = "social", theme: str = "light") -> dict:
+    return {
+        "title": "Intel NUC 11 Pro - Powerful Compact PC",
+        "price": "600",
+        "adjusted_price": "550",
+        "cpu": "Intel Core i7-1165G7",
+        "ram": "16GB",
+        "storage": "512GB NVMe SSD",
+        "score": "8.5",
+        "manufacturer": "Intel",
+        "series": "NUC 11 Pro",
+        "valuation_tier": "good",
+        "theme": theme,
+        "qr_code_url": None,
+        **CARD_DIMENSIONS[size],
+    }
+
+
+@pytest.fixture(scope="module")
+def renderer():
+    return PillowCardRenderer()
+
+
+@pytest.mark.parametrize("size", list(CARD_DIMENSIONS))
+@pytest.mark.parametrize("format", ["png", "jpeg"])
+def test_renders_each_size_preset(renderer, size, format):
+    image = Image.open(BytesIO(renderer.render(_context(size, "dark"), format)))
+
+    assert image.format == format.upper()
+    assert image.size == (CARD_DIMENSIONS[size]["width"], CARD_DIMENSIONS[size]["height"])
+
+
+def test_background_follows_theme_gradient(renderer):
+    image = renderer.draw(_context("social", "light"))
+
+    assert image.getpixel((0, 0)) == (0x66, 0x7E, 0xEA)
+    assert image.getpixel((1199, 629)) == (0x76, 0x4B, 0xA2)
+
+
+@pytest.mark.asyncio
+async def test_render_card_draws_configured_sizes_with_pillow():
+    settings = Mock()
+    settings.s3.enabled = False
+    settings.playwright.enabled = False
+    settings.cards.pillow_sizes = ["social"]
+    settings.cards.font_dir = None
+    listing = Mock(spec=Listing)
+    listing.configure_mock(
+        id=1,
+        title="Mini PC",
+        price_usd=300.0,
+        adjusted_price_usd=None,
+        cpu=None,
+        ram_gb=16,
+        primary_storage_gb=None,
+        score_composite=None,
+        manufacturer=None,
+        series=None,
+    )
+
+    with patch("dealbrain_api.services.image_generation.get_settings", return_value=settings):
+        service = ImageGenerationService(AsyncMock(spec=AsyncSession))
+        service._load_listing = AsyncMock(return_value=listing)
+        service._html_to_image = AsyncMock()
+
+        image_bytes = await service.render_card(listing_id=1, size="social")
+
+    service._html_to_image.assert_not_called()
+    assert Image.open(BytesIO(image_bytes)).size == (1200, 630)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("size", PILLOW_SIZES)
+@pytest.mark.parametrize("theme", ["light", "dark"])
+async def test_matches_playwright_screenshot(renderer, size, theme):
+    """Pixel-diff the Pillow card against Chromium rendering the HTML template."""
+    from playwright.async_api import async_playwright
+
+    context = _context(size, theme)
+    template = Environment(
+        loader=FileSystemLoader(TEMPLATE_DIR), autoescape=select_autoescape(["html"])
+    ).get_template(CARD_TEMPLATE)
+
+    async with async_playwright() as playwright:
+        try:
+            browser = await playwright.chromium.launch()
+        except Exception as exc:  # pragma: no cover - depends on the environment
+            pytest.skip(f"Chromium is not available: {exc}")
+        try:
+            page = await browser.new_page(
+                viewport={"width": context["width"], "height": context["height"]}
+            )
+            await page.set_content(template.render(**context), wait_until="networkidle")
+            screenshot = await page.screenshot(type="png")
+        finally:
+            await browser.close()
+
+    expected = Image.open(BytesIO(screenshot)).convert("RGB")
+    actual = renderer.draw(context)
+    assert actual.size == expected.size
+
+    diff = ImageStat.Stat(ImageChops.difference(actual, expected).convert("L"))
+    assert diff.mean[0] <= MAX_MEAN_PIXEL_DIFF
@@ -0,0 +1,150 @@
+"""Tests for the shared CPU/GPU catalog index."""
+
+from __future__ import annotations
+
+import pytest
+import pytest_asyncio
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+try:
+    import aiosqlite  # type: ignore  # noqa: F401
+except ModuleNotFoundError:
+    aiosqlite = None
+
+from dealbrain_api.db import Base
+from dealbrain_api.models.core import Cpu, Gpu
+from dealbrain_api.services.catalog_index import (
+    CatalogEntry,
+    ComponentIndex,
+    get_catalog_index,
+    invalidate_catalog_index,
+    model_tokens,
+)
+from dealbrain_api.services.imports.cpu_matcher import CpuMatcher
+
+
+def _index(*rows: tuple[int, str, list[str]]) -> ComponentIndex[CatalogEntry]:
+    return ComponentIndex(
+        (item_id, name, aliases, CatalogEntry(item_id, name)) for item_id, name, aliases in rows
+    )
+
+
+CPUS = _index(
+    (1, "Intel Core i7-12700H", []),
+    (2, "Intel Core i9-12900H", ["i9 12900H"]),
+    (3, "AMD Ryzen 5 5600X", []),
+)
+
+
+@pytest_asyncio.fixture
+async def db_session():
+    """Provide an isolated in-memory database session for tests."""
+    if aiosqlite is None:
+        pytest.skip("aiosqlite is not installed; skipping tests")
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async_session = async_sessionmaker(engine, expire_on_commit=False)
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    session = async_session()
+    try:
+        yield session
+    finally:
+        await session.close()
+        await engine.dispose()
+        invalidate_catalog_index()
+
+
+class TestComponentIndex:
+    """Lookups against an in-memory index."""
+
+    def test_model_tokens(self):
+        assert model_tokens("Intel Core i9-12900H") == {"12900h"}
+        assert model_tokens("GeForce RTX 3060 Ti") == {"3060"}
+
+    def test_exact_matches_names_and_aliases_case_insensitively(self):
+        assert CPUS.exact("intel core i7-12700h").item.id == 1
+        assert CPUS.exact("I9 12900H").item.id == 2
+        assert CPUS.exact("Ryzen 7") is None
+
+    def test_token_lookup_finds_model_number(self):
+        match = CPUS.by_model_token("Mini PC with 12900H processor")
+
+        assert match.item.id == 2
+        assert match.match_type == "token"
+
+    def test_fuzzy_respects_cutoff(self):
+        match = CPUS.fuzzy("Intel Core i7 12700H", score_cutoff=85)
+
+        assert match.item.id == 1
+        assert match.match_type == "fuzzy"
+        assert CPUS.fuzzy("Apple M2 Max", score_cutoff=85) is None
+
+    def test_search_order(self):
+        assert CPUS.search("Intel Core i9-12900H").match_type == "exact"
+        assert CPUS.search("ryzen 5").match_type == "substring"
+        assert CPUS.search("i9 12900H laptop").match_type == "token"
+        assert CPUS.search("unknown Ryzen chip").match_type == "keyword"
+        assert CPUS.search("   ") is None
+
+
+class TestCatalogIndexCache:
+    """Process-wide index built from the database."""
+
+    @pytest.mark.asyncio
+    async def test_index_reused_until_catalog_changes(self, db_session):
+        db_session.add_all(
+            [
+                Cpu(name="Intel Core i7-12700H", manufacturer="Intel"),
+                Gpu(name="NVIDIA GeForce RTX 3060", manufacturer="NVIDIA"),
+            ]
+        )
+        await db_session.commit()
+
+        first = await get_catalog_index(db_session)
+        assert await get_catalog_index(db_session) is first
+        assert len(first.cpus) == 1
+        assert first.gpus.search("RTX 3060").item.manufacturer == "NVIDIA"
+
+        db_session.add(Cpu(name="AMD Ryzen 7 7840HS", manufacturer="AMD"))
+        await db_session.commit()
+
+        second = await get_catalog_index(db_session)
+        assert second is not first
+        assert second.cpus.search("7840HS").item.name == "AMD Ryzen 7 7840HS"
+
+    @pytest.mark.asyncio
+    async def test_index_survives_engine_recreation(self, tmp_path):
+        """Celery tasks recreate the engine per run; the index is keyed by database URL."""
+        if aiosqlite is None:
+            pytest.skip("aiosqlite is not installed; skipping tests")
+        url = f"sqlite+aiosqlite:///{tmp_path / 'catalog.db'}"
+        indexes = []
+        try:
+            for run in range(2):
+                engine = create_async_engine(url)
+                async with engine.begin() as conn:
+                    await conn.run_sync(Base.metadata.create_all)
+                async with async_sessionmaker(engine, expire_on_commit=False)() as session:
+                    if run == 0:
+                        session.add(Cpu(name="Intel Core i7-12700H", manufacturer="Intel"))
+                        await session.commit()
+                    indexes.append(await get_catalog_index(session))
+                await engine.dispose()
+        finally:
+            invalidate_catalog_index()
+
+        assert indexes[1] is indexes[0]
+
+    @pytest.mark.asyncio
+    async def test_import_matcher_lookups_use_index(self, db_session):
+        db_session.add(Cpu(name="Intel Core i5-1235U", manufacturer="Intel"))
+        await db_session.commit()
+
+        lookup = await CpuMatcher.load_cpu_lookup(db_session)
+        names = await CpuMatcher.load_cpu_names(db_session)
+
+        assert list(lookup) == ["intel core i5 1235u"]
+        assert names == ["Intel Core i5-1235U"]
+        assert await CpuMatcher.load_gpu_lookup(db_session) == {}
@@ -0,0 +1,89 @@
+"""Tests for CPU auto-creation during import commits."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import event, select
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+try:
+    import aiosqlite  # type: ignore  # noqa: F401
+except ModuleNotFoundError:
+    aiosqlite = None
+
+from dealbrain_api.db import Base
+from dealbrain_api.models.core import Cpu
+from dealbrain_api.services.imports.cpu_matcher import CpuMatcher
+
+
+@pytest_asyncio.fixture
+async def db_session():
+    """Provide an isolated in-memory database session for tests."""
+    if aiosqlite is None:
+        pytest.skip("aiosqlite is not installed; skipping tests")
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async_session = async_sessionmaker(engine, expire_on_commit=False)
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    session = async_session()
+    try:
+        yield session
+    finally:
+        await session.close()
+        await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_auto_create_cpus_matches_and_inserts_in_bulk(db_session):
+    db_session.add(Cpu(name="Intel Core i5-8500T", manufacturer="Intel"))
+    await db_session.commit()
+    entries = [
+        {"name": "intel core i5-8500t", "row_index": 0, "manufacturer": "Intel"},
+        {"name": "AMD Ryzen 5 5600U", "row_index": 3, "manufacturer": "AMD"},
+        {"name": "Intel Core i7-8700T", "row_index": 5, "manufacturer": "Intel"},
+        {"name": "amd ryzen 5 5600u", "row_index": 8, "manufacturer": "AMD"},
+        {"name": "", "row_index": 9},
+    ]
+
+    statements: list[str] = []
+    sync_engine = db_session.bind.sync_engine
+    listener = lambda *args: statements.append(args[2])  # noqa: E731
+    event.listen(sync_engine, "before_cursor_execute", listener)
+    try:
+        created = await CpuMatcher.auto_create_cpus(
+            db_session, entries=entries, import_session=SimpleNamespace(id="session-1")
+        )
+    finally:
+        event.remove(sync_engine, "before_cursor_execute", listener)
+
+    assert [(cpu.name, cpu.manufacturer) for cpu in created] == [
+        ("AMD Ryzen 5 5600U", "AMD"),
+        ("Intel Core i7-8700T", "Intel"),
+    ]
+    assert all(cpu.id is not None for cpu in created)
+    assert created[1].attributes_json == {
+        "auto_created_from_import": "session-1",
+        "source_row_index": 5,
+    }
+    assert sum(statement.startswith("SELECT lower(cpu.name)") for statement in statements) == 1
+    assert sum(statement.startswith("INSERT INTO cpu") for statement in statements) == 1
+    assert len((await db_session.scalars(select(Cpu))).all()) == 3
+
+
+@pytest.mark.asyncio
+async def test_auto_create_cpus_skips_when_all_exist(db_session):
+    db_session.add(Cpu(name="Intel N100", manufacturer="Intel"))
+    await db_session.commit()
+
+    created = await CpuMatcher.auto_create_cpus(
+        db_session,
+        entries=[{"name": "INTEL N100", "row_index": 0}],
+        import_session=SimpleNamespace(id="session-1"),
+    )
+
+    assert created == []
@@ -0,0 +1,209 @@
+"""Tests for custom field expression indexes and the queries they serve."""
+
+from __future__ import annotations
+
+import asyncio
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import event, text
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import Session
+
+try:
+    import aiosqlite  # type: ignore  # noqa: F401
+except ModuleNotFoundError:
+    aiosqlite = None
+
+from dealbrain_api.db import Base
+from dealbrain_api.models.core import CustomFieldDefinition, Listing
+from dealbrain_api.services import custom_field_indexes
+from dealbrain_api.services.custom_field_indexes import (
+    index_name,
+    index_statements,
+    sync_custom_field_indexes,
+)
+from dealbrain_api.services.custom_fields import CustomFieldService
+from dealbrain_api.services.custom_fields_backfill import inventory_attribute_values
+from dealbrain_api.services.field_values import get_field_distinct_values
+
+
+@pytest_asyncio.fixture
+async def db_session():
+    """Provide an isolated in-memory database session for tests."""
+    if aiosqlite is None:
+        pytest.skip("aiosqlite is not installed; skipping tests")
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async_session = async_sessionmaker(engine, expire_on_commit=False)
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    session = async_session()
+    try:
+        yield session
+    finally:
+        await session.close()
+        await engine.dispose()
+
+
+async def _custom_indexes(session) -> set[str]:
+    rows = await session.execute(
+        text("SELECT name FROM sqlite_master WHERE type = 'index' AND name LIKE 'ix_cf_%'")
+    )
+    return set(rows.scalars())
+
+
+def _listing(title: str, **attributes) -> Listing:
+    return Listing(title=title, price_usd=500.0, attributes_json=attributes)
+
+
+def test_index_names_fit_postgres_identifiers():
+    assert index_name("listing", "Warranty-Months") == "ix_cf_listing_warranty_months_ad63a3a5"
+
+    long_name = index_name("ports_profile", "x" * 80, "_trgm")
+    assert len(long_name) == 63
+    assert long_name.endswith("_trgm")
+    assert long_name != index_name("ports_profile", "x" * 81, "_trgm")
+
+    statements = index_statements("listing", "it's", trigram=True)
+    assert "(attributes_json ->> 'it''s')" in statements["ix_cf_listing_it_s_24ceef1c"]
+    assert "gin_trgm_ops" in statements["ix_cf_listing_it_s_24ceef1c_trgm"]
+
+
+def test_index_names_distinguish_keys_that_sanitize_alike():
+    names = {index_name("listing", key) for key in ("ram-type", "ram_type", "RAM_TYPE")}
+    assert len(names) == 3
+
+
+@pytest.mark.asyncio
+async def test_indexes_follow_field_lifecycle(db_session):
+    warranty_index = index_name("listing", "warranty")
+    stepping_index = index_name("cpu", "stepping")
+    service = CustomFieldService()
+    warranty = await service.create_field(
+        db_session, entity="listing", key="warranty", label="Warranty"
+    )
+    await service.create_field(db_session, entity="cpu", key="stepping", label="Stepping")
+    assert await _custom_indexes(db_session) == {warranty_index, stepping_index}
+
+    await service.delete_field(db_session, field_id=warranty.id)
+    assert await _custom_indexes(db_session) == {stepping_index}
+
+    await db_session.execute(text(f"DROP INDEX {stepping_index}"))
+    await db_session.execute(text("CREATE INDEX ix_cf_gpu_orphan ON gpu (name)"))
+    result = await sync_custom_field_indexes(db_session)
+    assert (result.created, result.dropped) == ([stepping_index], ["ix_cf_gpu_orphan"])
+    assert await _custom_indexes(db_session) == {stepping_index}
+
+
+@pytest.mark.asyncio
+async def test_custom_field_values_and_usage(db_session):
+    service = CustomFieldService()
+    field = await service.create_field(
+        db_session, entity="listing", key="warranty", label="Warranty"
+    )
+    db_session.add_all(
+        [
+            _listing("A", warranty="2 years"),
+            _listing("B", warranty="1 year"),
+            _listing("C", warranty="2 years", color="black"),
+            _listing("D"),
+        ]
+    )
+    await db_session.flush()
+
+    assert await get_field_distinct_values(db_session, "listing.warranty") == [
+        "1 year",
+        "2 years",
+    ]
+    assert await get_field_distinct_values(db_session, "listing.warranty", search="YEARS") == [
+        "2 years"
+    ]
+    with pytest.raises(ValueError):
+        # Attribute without a definition
+        await get_field_distinct_values(db_session, "listing.color")
+
+    usage = await service.field_usage(db_session, field)
+    assert usage.counts == {"listing": 3}
+
+    inventory = await inventory_attribute_values(db_session, "listing")
+    assert sorted(inventory["warranty"]) == ["1 year", "2 years"]
+    assert inventory["color"] == ["black"]
+
+
+@pytest.mark.asyncio
+async def test_postgres_index_ddl_runs_concurrently_after_commit(db_session, monkeypatch):
+    monkeypatch.setattr(custom_field_indexes, "_dialect", lambda db: "postgresql")
+    monkeypatch.setattr(custom_field_indexes, "_has_trigram", AsyncMock(return_value=False))
+    executed: list[str] = []
+
+    async def _run(engine, statements):
+        executed.extend(statements.values())
+
+    monkeypatch.setattr(custom_field_indexes, "_run_concurrent_ddl", _run)
+    service = CustomFieldService()
+
+    warranty = await service.create_field(
+        db_session, entity="listing", key="warranty", label="Warranty"
+    )
+    # Nothing runs inside the request transaction
+    assert executed == []
+    await db_session.commit()
+    await custom_field_indexes.wait_for_index_ddl()
+    assert executed == [
+        f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {index_name('listing', 'warranty')} "
+        "ON listing ((attributes_json ->> 'warranty'))"
+    ]
+
+    await service.delete_field(db_session, field_id=warranty.id)
+    await db_session.rollback()
+    await custom_field_indexes.wait_for_index_ddl()
+    assert len(executed) == 1
+
+
+@pytest.mark.asyncio
+async def test_reconcile_waits_for_concurrent_ddl(db_session, monkeypatch):
+    monkeypatch.setattr(custom_field_indexes, "_dialect", lambda db: "postgresql")
+    monkeypatch.setattr(custom_field_indexes, "_has_trigram", AsyncMock(return_value=False))
+    monkeypatch.setattr(custom_field_indexes, "_existing_indexes", AsyncMock(return_value={}))
+    executed: list[str] = []
+
+    async def _run(engine, statements):
+        await asyncio.sleep(0)
+        executed.extend(statements)
+
+    @asynccontextmanager
+    async def _session_scope():
+        yield db_session
+        await db_session.commit()
+
+    monkeypatch.setattr(custom_field_indexes, "_run_concurrent_ddl", _run)
+    monkeypatch.setattr(custom_field_indexes, "session_scope", _session_scope)
+    db_session.add(CustomFieldDefinition(entity="listing", key="warranty", label="Warranty"))
+    await db_session.flush()
+
+    result = await custom_field_indexes.reconcile_custom_field_indexes()
+
+    assert result.created == [index_name("listing", "warranty")]
+    # The build finished before reconcile returned
+    assert executed == result.created
+
+
+@pytest.mark.asyncio
+async def test_commit_hook_is_scoped_to_sessions_with_index_ddl(db_session, monkeypatch):
+    monkeypatch.setattr(custom_field_indexes, "_dialect", lambda db: "postgresql")
+    monkeypatch.setattr(custom_field_indexes, "_has_trigram", AsyncMock(return_value=False))
+    session = db_session.sync_session
+    hook = custom_field_indexes._schedule_pending_ddl
+    assert not event.contains(Session, "after_commit", hook)
+    assert not event.contains(session, "after_commit", hook)
+
+    await CustomFieldService().create_field(
+        db_session, entity="listing", key="warranty", label="Warranty"
+    )
+
+    assert event.contains(session, "after_commit", hook)
+    await db_session.rollback()
@@ -23,12 +23,12 @@ import pytest
 import pytest_asyncio
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
-from apps.api.dealbrain_api.db import Base
-from apps.api.dealbrain_api.models.catalog import Cpu, Gpu, RamSpec, StorageProfile
-from apps.api.dealbrain_api.models.core import Listing
-from apps.api.dealbrain_api.models.ports import PortsProfile
-from apps.api.dealbrain_api.models.sharing import Collection, CollectionItem, User
-from apps.api.dealbrain_api.services.export_import import (
+from dealbrain_api.db import Base
+from dealbrain_api.models.catalog import Cpu, Gpu, RamSpec, StorageProfile
+from dealbrain_api.models.core import Listing, ListingComponent
+from dealbrain_api.models.ports import PortsProfile
+from dealbrain_api.models.sharing import Collection, CollectionItem, User
+from dealbrain_api.services.export_import import (
     ExportImportService,
     PreviewCache,
 )
@@ -386,6 +386,12 @@ class TestImportListing:
         assert listing.title == "Imported PC"
         assert listing.price_usd == 100.0
 
+        # Confirming again (e.g. a retried request) returns the same listing
+        repeated = await service.confirm_import_listing(
+            preview_id=preview_id, merge_strategy="create_new"
+        )
+        assert repeated.id == listing.id
+
     async def test_confirm_import_expired_preview(
         self,
         service: ExportImportService,
@@ -533,6 +539,97 @@ class TestImportCollection:
         assert preview_id is not None
         assert len(preview_id) > 0
 
+    async def test_confirm_import_collection_resolves_components_in_bulk(
+        self,
+        service: ExportImportService,
+        session: AsyncSession,
+        sample_user: User,
+        sample_cpu: Cpu,
+    ):
+        """Test that shared components are resolved once for the whole collection."""
+        from sqlalchemy import event, func, select
+
+        now = datetime.utcnow().isoformat()
+        cpu_names = [sample_cpu.name, "AMD Ryzen 5 5600G"]
+        items = [
+            {
+                "listing": {
+                    "listing": {
+                        "id": index,
+                        "title": f"Mini PC {index}",
+                        "price_usd": 200.0 + index,
+                        "condition": "used",
+                        "status": "active",
+                        "created_at": now,
+                        "updated_at": now,
+                    },
+                    "performance": {
+                        "cpu": {"name": cpu_names[index % 2], "manufacturer": "AMD"},
+                        "ram": {"total_gb": 16, "ddr_generation": "ddr4", "notes": "2x8"},
+                        "storage_primary": {"capacity_gb": 512, "medium": "nvme"},
+                        "ports": {
+                            "profile_name": "Mini PC ports",
+                            "ports": [{"type": "usb_a", "count": 4}],
+                        },
+                        "components": [{"component_type": "wifi", "name": "AX200"}],
+                    },
+                },
+                "status": "shortlisted",
+                "position": index,
+                "added_at": now,
+            }
+            for index in range(12)
+        ]
+        preview_id = await service.import_collection_from_json(
+            {
+                "deal_brain_export": {"version": "1.0.0", "exported_at": now, "type": "collection"},
+                "data": {
+                    "collection": {
+                        "id": 1,
+                        "name": "Homelab",
+                        "visibility": "private",
+                        "created_at": now,
+                        "updated_at": now,
+                    },
+                    "items": items,
+                },
+            },
+            user_id=sample_user.id,
+        )
+
+        statements = []
+        sync_engine = session.bind.sync_engine
+        listener = lambda *args: statements.append(args[2])  # noqa: E731
+        event.listen(sync_engine, "before_cursor_execute", listener)
+        try:
+            collection = await service.confirm_import_collection(
+                preview_id, merge_strategy="create_new", user_id=sample_user.id
+            )
+        finally:
+            event.remove(sync_engine, "before_cursor_execute", listener)
+
+        # One lookup per component type and one multi-row INSERT per child table,
+        # however many items reference them
+        def _count(prefix: str) -> int:
+            return sum(statement.startswith(prefix) for statement in statements)
+
+        for table in ("cpu", "ram_spec", "storage_profile", "ports_profile"):
+            assert _count(f"SELECT {table}.id") == 1
+            assert _count(f"INSERT INTO {table} ") == 1
+        assert _count("INSERT INTO listing_component ") == 1
+        assert _count("INSERT INTO collection_item ") == 1
+        assert len(collection.items) == 12
+        listings = (await session.execute(select(Listing).order_by(Listing.id))).scalars().all()
+        assert [listing.cpu_id == sample_cpu.id for listing in listings] == [
+            index % 2 == 0 for index in range(12)
+        ]
+        assert len({listing.ram_spec_id for listing in listings}) == 1
+        assert len({listing.ports_profile_id for listing in listings}) == 1
+        assert listings[0].ram_notes == "2x8"
+        for model, expected in ((Cpu, 2), (RamSpec, 1), (StorageProfile, 1), (PortsProfile, 1)):
+            assert await session.scalar(select(func.count()).select_from(model)) == expected
+        assert await session.scalar(select(func.count()).select_from(ListingComponent)) == 12
+
 
 # ==================== Duplicate Detection Tests ====================
 
@@ -560,7 +657,7 @@ class TestDuplicateDetection:
         await session.flush()
 
         # Create export with same title and seller
-        from apps.api.dealbrain_api.schemas.export_import import ListingExport
+        from dealbrain_api.schemas.export_import import ListingExport
 
         listing_export = ListingExport(
             id=1,
@@ -599,7 +696,7 @@ class TestDuplicateDetection:
         await session.flush()
 
         # Create export with same URL
-        from apps.api.dealbrain_api.schemas.export_import import ListingExport
+        from dealbrain_api.schemas.export_import import ListingExport
 
         listing_export = ListingExport(
             id=1,
@@ -636,7 +733,7 @@ class TestDuplicateDetection:
         await session.flush()
 
         # Create export with same name
-        from apps.api.dealbrain_api.schemas.export_import import CollectionExport
+        from dealbrain_api.schemas.export_import import CollectionExport
 
         collection_export = CollectionExport(
             id=1,
@@ -721,11 +818,11 @@ class TestPreviewCache:
 
     def test_preview_cache_store_and_retrieve(self):
         """Test storing and retrieving preview."""
-        from apps.api.dealbrain_api.services.export_import import (
+        from dealbrain_api.services.export_import import (
             ImportPreview,
             PreviewCache,
         )
-        from apps.api.dealbrain_api.schemas.export_import import (
+        from dealbrain_api.schemas.export_import import (
             PortableDealExport,
             ExportMetadata,
             DealDataExport,
@@ -772,11 +869,11 @@ class TestPreviewCache:
 
     def test_preview_cache_expired_returns_none(self):
         """Test that expired previews return None."""
-        from apps.api.dealbrain_api.services.export_import import (
+        from dealbrain_api.services.export_import import (
             ImportPreview,
             PreviewCache,
         )
-        from apps.api.dealbrain_api.schemas.export_import import (
+        from dealbrain_api.schemas.export_import import (
             PortableDealExport,
             ExportMetadata,
             DealDataExport,
@@ -822,11 +919,11 @@ class TestPreviewCache:
 
     def test_preview_cache_remove(self):
         """Test removing preview from cache."""
-        from apps.api.dealbrain_api.services.export_import import (
+        from dealbrain_api.services.export_import import (
             ImportPreview,
             PreviewCache,
         )
-        from apps.api.dealbrain_api.schemas.export_import import (
+        from dealbrain_api.schemas.export_import import (
             PortableDealExport,
             ExportMetadata,
             DealDataExport,
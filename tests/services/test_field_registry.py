@@ -0,0 +1,209 @@
+"""Tests for FieldRegistry schemas and record listing: keyset pages, cached totals, serializers."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+
+import pytest
+import pytest_asyncio
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+try:
+    import aiosqlite  # type: ignore  # noqa: F401
+except ModuleNotFoundError:
+    aiosqlite = None
+
+from dealbrain_api.cache import cache_manager
+from dealbrain_api.db import Base
+from dealbrain_api.models.core import Cpu, Listing, RamSpec
+from dealbrain_api.services.custom_fields import CustomFieldService
+from dealbrain_api.services.field_registry import FieldRegistry, InvalidCursorError
+from dealbrain_core.enums import RamGeneration
+
+
+@pytest_asyncio.fixture
+async def db_session():
+    """Provide an isolated in-memory database session for tests."""
+    if aiosqlite is None:
+        pytest.skip("aiosqlite is not installed; skipping tests")
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async_session = async_sessionmaker(engine, expire_on_commit=False)
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    session = async_session()
+    try:
+        yield session
+    finally:
+        await session.close()
+        await engine.dispose()
+
+
+@pytest.fixture
+def count_cache(monkeypatch) -> dict[str, str]:
+    """Back the record total cache with a dict instead of Redis."""
+    store: dict[str, str] = {}
+
+    async def _get(key):
+        return store.get(key)
+
+    async def _set(key, value, ttl=None):
+        store[key] = value
+        return True
+
+    async def _delete(key):
+        store.pop(key, None)
+        return True
+
+    monkeypatch.setattr(cache_manager, "get", _get)
+    monkeypatch.setattr(cache_manager, "set", _set)
+    monkeypatch.setattr(cache_manager, "delete", _delete)
+    return store
+
+
+async def _all_pages(registry, session, entity: str, limit: int) -> list[list[int]]:
+    pages: list[list[int]] = []
+    cursor = None
+    for _ in range(20):
+        page = await registry.list_records(session, entity=entity, limit=limit, cursor=cursor)
+        pages.append([record["id"] for record in page["records"]])
+        cursor = page["pagination"]["next_cursor"]
+        assert page["pagination"]["has_next"] is (cursor is not None)
+        if cursor is None:
+            return pages
+    raise AssertionError("keyset pagination did not terminate")
+
+
+@pytest.mark.asyncio
+async def test_keyset_pages_match_offset_order(db_session, count_cache):
+    # Inserted out of name order so pages cannot follow id order
+    names = ["Ryzen 5", "Core i5", "Ryzen 7", "Core i7", "Core i3", "Athlon"]
+    db_session.add_all([Cpu(name=name, manufacturer="x") for name in names])
+    await db_session.commit()
+    registry = FieldRegistry()
+
+    pages = await _all_pages(registry, db_session, "cpu", limit=4)
+    everything = await registry.list_records(db_session, entity="cpu", limit=50)
+    second = await registry.list_records(db_session, entity="cpu", limit=4, offset=4)
+
+    assert [len(page) for page in pages] == [4, 2]
+    assert sum(pages, []) == [record["id"] for record in everything["records"]]
+    assert pages[1] == [record["id"] for record in second["records"]]
+    assert [record["fields"]["name"] for record in everything["records"]] == sorted(names)
+
+
+@pytest.mark.asyncio
+async def test_descending_keysets(db_session, count_cache):
+    # Two listings share a timestamp to exercise the id tie-breaker
+    now = datetime(2026, 1, 1, 12, 0, 0)
+    offsets = [3, 2, 2, 1, 0]
+    db_session.add_all(
+        [
+            Listing(title=f"Listing {n}", price_usd=100.0, created_at=now - timedelta(hours=hours))
+            for n, hours in enumerate(offsets)
+        ]
+    )
+    db_session.add_all(
+        [RamSpec(ddr_generation=RamGeneration.DDR4, speed_mhz=speed) for speed in (2400, 3200)]
+    )
+    await db_session.commit()
+    registry = FieldRegistry()
+
+    listings = await _all_pages(registry, db_session, "listing", limit=2)
+    ram_specs = await _all_pages(registry, db_session, "ram_spec", limit=1)
+
+    assert sum(listings, []) == [5, 4, 3, 2, 1]
+    assert sum(ram_specs, []) == [2, 1]
+
+
+@pytest.mark.asyncio
+async def test_totals_are_cached_until_records_are_created(db_session, count_cache):
+    db_session.add(Cpu(name="Core i5", manufacturer="Intel"))
+    await db_session.commit()
+    registry = FieldRegistry()
+
+    assert (await registry.list_records(db_session, entity="cpu"))["pagination"]["total"] == 1
+    db_session.add(Cpu(name="Core i7", manufacturer="Intel"))
+    await db_session.commit()
+    assert (await registry.list_records(db_session, entity="cpu"))["pagination"]["total"] == 1
+
+    await registry.create_record(
+        db_session, entity="cpu", payload={"fields": {"name": "Core i9", "manufacturer": "Intel"}}
+    )
+    assert (await registry.list_records(db_session, entity="cpu"))["pagination"]["total"] == 3
+
+
+@pytest.mark.asyncio
+async def test_listing_records_serialize_core_fields_and_attributes(db_session, count_cache):
+    ram_spec = RamSpec(ddr_generation=RamGeneration.DDR5, speed_mhz=5600)
+    db_session.add(ram_spec)
+    await db_session.flush()
+    db_session.add(
+        Listing(
+            title="Mini PC",
+            price_usd=399.0,
+            ram_spec_id=ram_spec.id,
+            attributes_json={"warranty": "1 year"},
+        )
+    )
+    await db_session.commit()
+    db_session.expunge_all()
+    registry = FieldRegistry()
+
+    page = await registry.list_records(db_session, entity="listing")
+    record = page["records"][0]
+
+    assert list(record["fields"]) == [
+        field.key for field in registry.entities["listing"].core_fields
+    ]
+    assert record["fields"]["title"] == "Mini PC"
+    assert record["fields"]["ram_type"] == "ddr5"
+    assert record["fields"]["ram_speed_mhz"] == 5600
+    assert record["attributes"] == {"warranty": "1 year"}
+
+
+@pytest.mark.asyncio
+async def test_invalid_cursor(db_session, count_cache):
+    with pytest.raises(InvalidCursorError):
+        await FieldRegistry().list_records(db_session, entity="cpu", cursor="not-a-cursor")
+
+
+@pytest.mark.asyncio
+async def test_schemas_are_cached_until_definitions_change(db_session, monkeypatch):
+    service = CustomFieldService()
+    registry = FieldRegistry(custom_field_service=service)
+    loads: list[str] = []
+    list_fields = service.list_fields
+
+    async def _counting_list_fields(db, **kwargs):
+        loads.append(kwargs["entity"])
+        return await list_fields(db, **kwargs)
+
+    monkeypatch.setattr(service, "list_fields", _counting_list_fields)
+
+    assert FieldRegistry().entities is registry.entities
+    await registry.schema_for(db_session, "profile")
+    first = await registry.schema_for(db_session, "listing")
+    assert await registry.schema_for(db_session, "listing") is first
+    assert loads == ["listing"]
+
+    field = await service.create_field(
+        db_session, entity="listing", key="warranty", label="Warranty"
+    )
+    # The session sees its own uncommitted definition but does not cache it
+    pending = await registry.schema_for(db_session, "listing")
+    assert pending["fields"][-1]["key"] == "warranty"
+    await db_session.commit()
+    assert loads == ["listing", "listing"]
+
+    committed = await registry.schema_for(db_session, "listing")
+    assert await registry.schema_for(db_session, "listing") is committed
+    assert committed["fields"][: len(first["fields"])] == first["fields"]
+    assert loads == ["listing"] * 3
+
+    await service.update_field(db_session, field_id=field.id, label="Warranty Term")
+    await db_session.rollback()
+    assert (await registry.schema_for(db_session, "listing"))["fields"][-1]["label"] == "Warranty"
+    await registry.schema_for(db_session, "cpu")
+    assert loads == ["listing"] * 4 + ["cpu"]
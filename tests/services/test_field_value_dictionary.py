@@ -0,0 +1,175 @@
+"""Tests for the in-memory field value dictionaries behind autocomplete."""
+
+from __future__ import annotations
+
+import pytest
+import pytest_asyncio
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+try:
+    import aiosqlite  # type: ignore  # noqa: F401
+except ModuleNotFoundError:
+    aiosqlite = None
+
+from dealbrain_api.db import Base
+from dealbrain_api.models.core import Listing
+from dealbrain_api.services.custom_fields import CustomFieldService
+from dealbrain_api.services.field_value_dictionary import (
+    FieldValueDictionary,
+    field_value_dictionaries,
+)
+from dealbrain_api.services.field_values import get_field_distinct_values
+
+
+@pytest_asyncio.fixture
+async def session_factory():
+    """Provide a session factory over an isolated in-memory database."""
+    if aiosqlite is None:
+        pytest.skip("aiosqlite is not installed; skipping tests")
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    try:
+        yield async_sessionmaker(engine, expire_on_commit=False)
+    finally:
+        field_value_dictionaries.invalidate()
+        await engine.dispose()
+
+
+def _cached(session, field_name: str) -> FieldValueDictionary:
+    entry = field_value_dictionaries._entries[session.get_bind()][field_name]
+    assert entry.dictionary is not None
+    return entry.dictionary
+
+
+class TestFieldValueDictionary:
+    """Lookups and incremental updates on one dictionary."""
+
+    def test_search_modes(self):
+        dictionary = FieldValueDictionary(
+            {"Dell": 3, "HP": 1, "Lenovo": 2, "Beelink": 1, "Minisforum": 1}
+        )
+
+        assert dictionary.search(limit=3) == ["Beelink", "Dell", "HP"]
+        assert dictionary.search("EL") == ["Beelink", "Dell"]
+        assert dictionary.search("link") == ["Beelink"]
+        assert dictionary.search("len", prefix=True) == ["Lenovo"]
+        assert dictionary.search("ink", prefix=True) == []
+        assert dictionary.search("xyz") == []
+
+    def test_numbers_sort_by_value(self):
+        dictionary = FieldValueDictionary({"128": 1, "16": 4, "32": 2, "4": 1, "8.5": 1})
+
+        assert dictionary.search() == ["4", "8.5", "16", "32", "128"]
+        assert dictionary.search("1") == ["16", "128"]
+
+        dictionary.add("64")
+        dictionary.add("n/a")
+        dictionary.remove("16", 4)
+        assert dictionary.search() == ["4", "8.5", "32", "64", "128", "n/a"]
+
+    def test_add_and_remove_track_frequency(self):
+        dictionary = FieldValueDictionary({"Dell": 2})
+
+        dictionary.add("Dell")
+        dictionary.add("Asus")
+        assert dictionary.frequency("Dell") == 3
+        assert dictionary.search("sus") == ["Asus"]
+
+        dictionary.remove("Asus")
+        dictionary.remove("Dell", 2)
+        assert "Asus" not in dictionary
+        assert dictionary.search("sus") == []
+        assert dictionary.search() == ["Dell"]
+        assert dictionary.frequency("Dell") == 1
+
+
+@pytest.mark.asyncio
+class TestWriteTracking:
+    """Committed ORM writes update loaded dictionaries without a reload."""
+
+    async def test_core_column_writes(self, session_factory):
+        async with session_factory() as session:
+            used = Listing(title="A", price_usd=100.0, condition="used")
+            unbranded = Listing(title="B", price_usd=100.0, condition="new")
+            session.add_all([used, unbranded])
+            await session.commit()
+            # Work on rows as loaded from the database, with every column present
+            session.expunge_all()
+            used = await session.get(Listing, used.id)
+            unbranded = await session.get(Listing, unbranded.id)
+
+            assert await get_field_distinct_values(session, "listing.condition") == ["new", "used"]
+            assert await get_field_distinct_values(session, "listing.manufacturer") == []
+            condition = _cached(session, "listing.condition")
+            manufacturer = _cached(session, "listing.manufacturer")
+
+            session.add(Listing(title="C", price_usd=100.0, condition="refurb"))
+            used.condition = "new"
+            unbranded.manufacturer = "Dell"
+            await session.commit()
+
+            assert _cached(session, "listing.condition") is condition
+            assert _cached(session, "listing.manufacturer") is manufacturer
+            assert await get_field_distinct_values(session, "listing.condition") == [
+                "new",
+                "refurb",
+            ]
+            assert condition.frequency("new") == 2
+            assert await get_field_distinct_values(session, "listing.manufacturer") == ["Dell"]
+
+            await session.delete(unbranded)
+            await session.commit()
+            assert condition.frequency("new") == 1
+            assert await get_field_distinct_values(session, "listing.manufacturer") == []
+
+    async def test_rolled_back_writes_are_ignored(self, session_factory):
+        async with session_factory() as session:
+            session.add(Listing(title="A", price_usd=100.0, condition="used"))
+            await session.commit()
+            assert await get_field_distinct_values(session, "listing.condition") == ["used"]
+
+            session.add(Listing(title="B", price_usd=100.0, condition="new"))
+            await session.flush()
+            await session.rollback()
+
+            assert await get_field_distinct_values(session, "listing.condition") == ["used"]
+
+    async def test_custom_field_writes(self, session_factory):
+        async with session_factory() as session:
+            service = CustomFieldService()
+            field = await service.create_field(
+                session, entity="listing", key="warranty", label="Warranty"
+            )
+            listing = Listing(title="A", price_usd=100.0, attributes_json={"warranty": "1 year"})
+            session.add(listing)
+            await session.commit()
+
+            assert await get_field_distinct_values(session, "listing.warranty") == ["1 year"]
+
+            listing.attributes_json = {"warranty": "3 years", "color": "black"}
+            await session.commit()
+            assert await get_field_distinct_values(session, "listing.warranty", search="YEAR") == [
+                "3 years"
+            ]
+
+            await service.delete_field(session, field_id=field.id, force=True)
+            assert "listing.warranty" not in field_value_dictionaries.loaded_fields(
+                session.get_bind()
+            )
+
+
+@pytest.mark.asyncio
+async def test_high_cardinality_fields_use_the_database(session_factory, monkeypatch):
+    monkeypatch.setattr(field_value_dictionaries, "_max_values", 2)
+    async with session_factory() as session:
+        session.add_all(
+            [Listing(title=f"Listing {n}", price_usd=100.0, condition="used") for n in range(3)]
+        )
+        await session.commit()
+
+        assert await get_field_distinct_values(session, "listing.title", search="2") == [
+            "Listing 2"
+        ]
+        assert await get_field_distinct_values(session, "listing.condition") == ["used"]
+        assert field_value_dictionaries.loaded_fields(session.get_bind()) == {"listing.condition"}
@@ -7,12 +7,16 @@ from unittest.mock import AsyncMock, MagicMock, Mock, patch
 import pytest
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from dealbrain_api.models import Listing
+from dealbrain_api.adapters.browser_pool import RENDERING_TENANT
+from dealbrain_api.models import Cpu, Listing
+from dealbrain_api.services.card_cache import LocalCardCache, card_content_hash
 from dealbrain_api.services.image_generation import (
     CARD_DIMENSIONS,
-    BrowserPool,
+    CARD_TEMPLATE,
+    TEMPLATE_DIR,
     ImageGenerationService,
 )
+from playwright.async_api import Error as PlaywrightError
 
 
 @pytest.fixture
@@ -23,6 +27,8 @@ def mock_settings():
     settings.playwright.max_concurrent_browsers = 2
     settings.playwright.browser_timeout_ms = 30000
     settings.playwright.headless = True
+    settings.cards.pillow_sizes = []  # Render every size through Playwright
+    settings.cards.font_dir = None
     settings.s3.enabled = False  # Disabled by default for tests
     settings.s3.bucket_name = "test-bucket"
     settings.s3.region = "us-east-1"
@@ -44,7 +50,7 @@ def sample_listing():
     listing.title = "Intel NUC 11 Pro - Powerful Compact PC"
     listing.price_usd = 599.99
     listing.adjusted_price_usd = 549.99
-    listing.cpu = Mock(model="Intel Core i7-1165G7")
+    listing.cpu = Cpu(name="Intel Core i7-1165G7")
     listing.ram_gb = 16
     listing.primary_storage_gb = 512
     listing.primary_storage_type = "NVMe SSD"
@@ -54,82 +60,61 @@ def sample_listing():
     return listing
 
 
-class TestBrowserPool:
-    """Tests for BrowserPool class."""
+class TestSharedBrowserPoolRendering:
+    """Tests for card rendering through the shared browser pool."""
 
     @pytest.mark.asyncio
-    async def test_acquire_browser_initializes_on_first_call(self):
-        """Test that acquiring a browser initializes Playwright on first call."""
-        pool = BrowserPool(max_size=2, timeout_ms=30000)
+    async def test_html_to_image_uses_rendering_tenant(self, mock_settings):
+        """Test that rendering acquires a context as the rendering tenant."""
+        mock_page = AsyncMock()
+        mock_page.screenshot = AsyncMock(return_value=b"png_bytes")
+        mock_context = AsyncMock()
+        mock_context.new_page = AsyncMock(return_value=mock_page)
 
-        mock_playwright = AsyncMock()
-        mock_browser = AsyncMock()
-        mock_playwright.chromium.launch = AsyncMock(return_value=mock_browser)
+        mock_pool = AsyncMock()
+        mock_pool.acquire = AsyncMock(return_value=mock_context)
+        mock_pool.release = AsyncMock()
 
         with patch(
-            "dealbrain_api.services.image_generation.async_playwright"
-        ) as mock_async_playwright:
-            mock_async_playwright.return_value.start = AsyncMock(
-                return_value=mock_playwright
-            )
-
-            browser = await pool.acquire()
-
-            assert browser is mock_browser
-            mock_playwright.chromium.launch.assert_called_once()
-
-        pool.release()
-        await pool.close()
-
-    @pytest.mark.asyncio
-    async def test_browser_pool_semaphore_limits_concurrent_browsers(self):
-        """Test that semaphore limits concurrent browser instances."""
-        pool = BrowserPool(max_size=1, timeout_ms=30000)
-
-        mock_playwright = AsyncMock()
-        mock_browser = AsyncMock()
-        mock_playwright.chromium.launch = AsyncMock(return_value=mock_browser)
-
-        with patch(
-            "dealbrain_api.services.image_generation.async_playwright"
-        ) as mock_async_playwright:
-            mock_async_playwright.return_value.start = AsyncMock(
-                return_value=mock_playwright
-            )
-
-            # Acquire first browser
-            browser1 = await pool.acquire()
-            assert browser1 is mock_browser
-
-            # Semaphore should be at capacity (can't test easily without async)
-            # Just verify we got a browser
-            assert pool._semaphore.locked()
-
-        pool.release()
-        await pool.close()
+            "dealbrain_api.services.image_generation.get_settings",
+            return_value=mock_settings,
+        ), patch(
+            "dealbrain_api.services.image_generation.BrowserPool.shared",
+            return_value=mock_pool,
+        ), patch("dealbrain_api.services.image_generation.asyncio.sleep", AsyncMock()):
+            service = ImageGenerationService(AsyncMock(spec=AsyncSession))
+            image_bytes = await service._html_to_image("<html></html>", "png", "social")
+
+        assert image_bytes == b"png_bytes"
+        mock_pool.initialize.assert_awaited_once()
+        mock_pool.acquire.assert_awaited_once_with(
+            tenant=RENDERING_TENANT,
+            viewport={"width": 1200, "height": 630},
+        )
+        mock_pool.release.assert_awaited_once_with(mock_context)
 
     @pytest.mark.asyncio
-    async def test_close_shuts_down_browser_and_playwright(self):
-        """Test that close() properly shuts down resources."""
-        pool = BrowserPool(max_size=2, timeout_ms=30000)
+    async def test_html_to_image_releases_context_on_error(self, mock_settings):
+        """Test that the context is returned to the pool when rendering fails."""
+        mock_context = AsyncMock()
+        mock_context.new_page = AsyncMock(side_effect=PlaywrightError("boom"))
 
-        mock_playwright = AsyncMock()
-        mock_browser = AsyncMock()
-        mock_playwright.chromium.launch = AsyncMock(return_value=mock_browser)
+        mock_pool = AsyncMock()
+        mock_pool.acquire = AsyncMock(return_value=mock_context)
+        mock_pool.release = AsyncMock()
 
         with patch(
-            "dealbrain_api.services.image_generation.async_playwright"
-        ) as mock_async_playwright:
-            mock_async_playwright.return_value.start = AsyncMock(
-                return_value=mock_playwright
-            )
-
-            await pool.acquire()
-            await pool.close()
+            "dealbrain_api.services.image_generation.get_settings",
+            return_value=mock_settings,
+        ), patch(
+            "dealbrain_api.services.image_generation.BrowserPool.shared",
+            return_value=mock_pool,
+        ):
+            service = ImageGenerationService(AsyncMock(spec=AsyncSession))
+            with pytest.raises(PlaywrightError):
+                await service._html_to_image("<html></html>", "png", "social")
 
-            mock_browser.close.assert_called_once()
-            mock_playwright.stop.assert_called_once()
-            assert pool._browser is None
+        mock_pool.release.assert_awaited_once_with(mock_context)
 
 
 class TestImageGenerationService:
@@ -515,3 +500,112 @@ class TestCacheInvalidationIntegration:
             )
 
             mock_service.invalidate_cache.assert_not_called()
+
+
+class TestBatchRendering:
+    """Tests for batch pre-rendering of card variants."""
+
+    @pytest.mark.asyncio
+    async def test_render_cards_batch_skips_unchanged_and_shares_page_loads(
+        self, mock_settings, sample_listing
+    ):
+        """Unchanged variants are skipped; each page load serves every format."""
+        mock_settings.s3.enabled = True
+        mock_s3_client = MagicMock()
+        mock_page = AsyncMock()
+        mock_page.screenshot = AsyncMock(return_value=b"card")
+        mock_context = AsyncMock()
+        mock_context.new_page = AsyncMock(return_value=mock_page)
+        mock_pool = AsyncMock()
+        mock_pool.acquire = AsyncMock(return_value=mock_context)
+
+        with patch(
+            "dealbrain_api.services.image_generation.get_settings",
+            return_value=mock_settings,
+        ), patch(
+            "dealbrain_api.services.image_generation.boto3.client",
+            return_value=mock_s3_client,
+        ), patch(
+            "dealbrain_api.services.image_generation.BrowserPool.shared",
+            return_value=mock_pool,
+        ), patch("dealbrain_api.services.image_generation.asyncio.sleep", AsyncMock()):
+            service = ImageGenerationService(AsyncMock(spec=AsyncSession))
+            # The light/social PNG is already cached from the same content
+            cached = {
+                "cards/123/light/1200x630.png": card_content_hash(
+                    service._card_context(sample_listing, "light", "social"),
+                    TEMPLATE_DIR / CARD_TEMPLATE,
+                )
+            }
+
+            def _head_object(Bucket, Key):  # noqa: N803 - boto3 keyword names
+                return {"Metadata": {"content_hash": cached.get(Key, "stale")}}
+
+            mock_s3_client.head_object.side_effect = _head_object
+            result = await service.render_cards_batch(
+                [sample_listing], sizes=["social", "instagram"], concurrency=4
+            )
+
+        # 2 styles x 2 sizes x 2 formats, one of which is unchanged
+        assert (result.rendered, result.skipped, result.failed) == (7, 1, 0)
+        assert mock_page.set_content.await_count == 4
+        assert mock_s3_client.put_object.call_count == 7
+        # Bounded by the requested concurrency and the number of cards
+        assert mock_pool.acquire.await_count == 4
+        assert mock_pool.release.await_count == 4
+
+    @pytest.mark.asyncio
+    async def test_render_cards_batch_skips_locally_cached_without_s3(
+        self, mock_settings, sample_listing
+    ):
+        """With S3 disabled, variants already in the local tier are not re-rendered."""
+        mock_settings.cards.pillow_sizes = ["social"]
+        mock_renderer = Mock()
+        mock_renderer.render.return_value = b"card"
+
+        with patch(
+            "dealbrain_api.services.image_generation.get_settings",
+            return_value=mock_settings,
+        ):
+            service = ImageGenerationService(
+                AsyncMock(spec=AsyncSession), local_cache=LocalCardCache(max_bytes=1024)
+            )
+            service._pillow_renderer = Mock(return_value=mock_renderer)
+
+            first = await service.render_cards_batch([sample_listing], sizes=["social"])
+            second = await service.render_cards_batch([sample_listing], sizes=["social"])
+
+        # 2 styles x 2 formats
+        assert (first.rendered, first.skipped) == (4, 0)
+        assert (second.rendered, second.skipped) == (0, 4)
+        assert mock_renderer.render.call_count == 4
+
+    @pytest.mark.asyncio
+    async def test_render_cards_batch_counts_failed_context_per_card(
+        self, mock_settings, sample_listing
+    ):
+        """A listing whose card cannot be built fails alone; the CPU name is drawn."""
+        mock_settings.cards.pillow_sizes = ["social"]
+        mock_renderer = Mock()
+        mock_renderer.render.return_value = b"card"
+        broken_listing = Mock(spec=Listing)
+        broken_listing.id = 456
+        broken_listing.title = None  # Cannot be truncated into a card title
+
+        with patch(
+            "dealbrain_api.services.image_generation.get_settings",
+            return_value=mock_settings,
+        ):
+            service = ImageGenerationService(
+                AsyncMock(spec=AsyncSession), local_cache=LocalCardCache(max_bytes=1024)
+            )
+            service._pillow_renderer = Mock(return_value=mock_renderer)
+
+            result = await service.render_cards_batch(
+                [broken_listing, sample_listing], sizes=["social"]
+            )
+
+        # 2 styles x 2 formats per listing
+        assert (result.rendered, result.skipped, result.failed) == (4, 0, 4)
+        drawn_context = mock_renderer.render.call_args.args[0]
+        assert drawn_context["cpu"] == "Intel Core i7-1165G7"
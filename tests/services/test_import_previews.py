@@ -0,0 +1,208 @@
+"""Tests for the shared import preview store."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+
+import pytest
+import pytest_asyncio
+
+try:
+    from fakeredis import FakeAsyncRedis
+except ModuleNotFoundError:  # pragma: no cover - optional test dependency
+    FakeAsyncRedis = None
+
+from dealbrain_api.schemas.export_import import (
+    CollectionDataExport,
+    CollectionExport,
+    CollectionItemExport,
+    DealDataExport,
+    ExportMetadata,
+    ListingExport,
+    PortableCollectionExport,
+)
+from dealbrain_api.services.import_previews import (
+    DuplicateMatch,
+    ImportPreview,
+    PreviewCache,
+    PreviewStore,
+)
+from dealbrain_api.settings import ImportPreviewSettings
+from dealbrain_core.enums import (
+    CollectionItemStatus,
+    CollectionVisibility,
+    Condition,
+    ListingStatus,
+)
+
+
+def _collection_preview(preview_id: str, item_count: int) -> ImportPreview:
+    now = datetime.utcnow()
+    items = [
+        CollectionItemExport(
+            listing=DealDataExport(
+                listing=ListingExport(
+                    id=index,
+                    title=f"Mini PC {index}",
+                    price_usd=100.0 + index,
+                    condition=Condition.USED,
+                    status=ListingStatus.ACTIVE,
+                    created_at=now,
+                    updated_at=now,
+                )
+            ),
+            status=CollectionItemStatus.UNDECIDED,
+            position=index,
+            added_at=now,
+        )
+        for index in range(item_count)
+    ]
+    return ImportPreview(
+        preview_id=preview_id,
+        type="collection",
+        data=PortableCollectionExport(
+            deal_brain_export=ExportMetadata(exported_at=now, type="collection"),
+            data=CollectionDataExport(
+                collection=CollectionExport(
+                    id=1,
+                    name="Homelab",
+                    visibility=CollectionVisibility.PRIVATE,
+                    created_at=now,
+                    updated_at=now,
+                ),
+                items=items,
+            ),
+        ),
+        duplicates=[
+            DuplicateMatch(
+                entity_id=7,
+                entity_type="collection",
+                match_score=1.0,
+                match_reason="Exact name match",
+                entity_data={"id": 7, "name": "Homelab"},
+            )
+        ],
+        created_at=now,
+        expires_at=now + timedelta(minutes=30),
+    )
+
+
+@pytest_asyncio.fixture
+async def redis():
+    if FakeAsyncRedis is None:
+        pytest.skip("fakeredis is not installed; skipping tests")
+    client = FakeAsyncRedis()
+    try:
+        yield client
+    finally:
+        await client.aclose()
+
+
+def _store(redis, **settings) -> PreviewStore:
+    return PreviewStore(
+        redis_client=redis, settings=ImportPreviewSettings(**{"page_size": 4, **settings})
+    )
+
+
+@pytest.mark.asyncio
+async def test_previews_are_shared_between_store_instances(redis):
+    preview = _collection_preview("p1", 10)
+    await _store(redis).store(preview)
+
+    # A second store stands in for another API worker
+    loaded = await _store(redis).get("p1")
+
+    assert loaded is not None
+    assert loaded.data == preview.data
+    assert loaded.duplicates == preview.duplicates
+    assert loaded.expires_at == preview.expires_at
+
+
+@pytest.mark.asyncio
+async def test_get_rows_reads_only_the_requested_window(redis):
+    store = _store(redis)
+    await store.store(_collection_preview("p1", 10))
+
+    page = await store.get_rows("p1", offset=3, limit=4)
+
+    assert (page.offset, page.total) == (3, 10)
+    assert [row["position"] for row in page.rows] == [3, 4, 5, 6]
+    assert (await store.get_rows("p1", offset=8, limit=50)).rows[-1]["position"] == 9
+    assert (await store.get_rows("p1", offset=20, limit=5)).rows == []
+    assert await store.get_rows("missing", offset=0, limit=5) is None
+
+
+@pytest.mark.asyncio
+async def test_least_recently_used_previews_are_evicted(redis):
+    store = _store(redis, max_entries=2)
+    for preview_id in ("p1", "p2"):
+        await store.store(_collection_preview(preview_id, 1))
+    await store.get("p1")
+
+    await store.store(_collection_preview("p3", 1))
+
+    assert await store.get("p2") is None
+    assert await store.get("p1") is not None
+    assert await store.get("p3") is not None
+
+
+@pytest.mark.asyncio
+async def test_size_caps(redis):
+    store = _store(redis, max_preview_bytes=1024)
+    with pytest.raises(ValueError, match="too large"):
+        await store.store(_collection_preview("big", 200))
+
+    store = _store(redis)
+    await store.store(_collection_preview("p1", 20))
+    size = int(await redis.hget("import_preview:sizes", "p1"))
+    store = _store(redis, max_total_bytes=size + size // 2)
+    await store.store(_collection_preview("p2", 20))
+
+    assert await store.get("p1") is None
+    assert await store.get("p2") is not None
+
+
+@pytest.mark.asyncio
+async def test_confirmation_claims_and_results(redis):
+    first, second = _store(redis), _store(redis)
+    await first.store(_collection_preview("p1", 1))
+
+    assert await first.claim("p1") is True
+    assert await second.claim("p1") is False
+
+    await first.complete("p1", 42)
+
+    assert await second.completed_entity("p1") == 42
+    assert await second.get("p1") is None
+    assert await second.completed_entity("p2") is None
+
+
+@pytest.mark.asyncio
+async def test_falls_back_to_process_memory_without_redis(monkeypatch):
+    from dealbrain_api.services import import_previews
+
+    class _Unreachable:
+        @staticmethod
+        def from_url(url):
+            raise ConnectionRefusedError("redis down")
+
+    monkeypatch.setattr(import_previews, "Redis", _Unreachable)
+    store = PreviewStore(settings=ImportPreviewSettings(page_size=4))
+
+    await store.store(_collection_preview("p1", 6))
+
+    assert (await store.get("p1")).preview_id == "p1"
+    assert [row["position"] for row in (await store.get_rows("p1", 4, 10)).rows] == [4, 5]
+    assert await store.claim("p1") and not await store.claim("p1")
+
+
+def test_preview_cache_evicts_least_recently_used():
+    cache = PreviewCache(max_entries=2)
+    cache.store(_collection_preview("p1", 1))
+    cache.store(_collection_preview("p2", 1))
+    cache.get("p1")
+
+    cache.store(_collection_preview("p3", 1))
+
+    assert cache.get("p2") is None
+    assert cache.get("p1") is not None
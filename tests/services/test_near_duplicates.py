@@ -0,0 +1,209 @@
+"""Tests for the near-duplicate listing index."""
+
+from __future__ import annotations
+
+from decimal import Decimal
+from unittest.mock import AsyncMock
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import delete
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+try:
+    import aiosqlite  # type: ignore  # noqa: F401
+except ModuleNotFoundError:
+    aiosqlite = None
+
+from dealbrain_api.db import Base
+from dealbrain_api.models.core import Listing
+from dealbrain_api.services import near_duplicates
+from dealbrain_api.services.ingestion import DeduplicationService
+from dealbrain_api.services.listings import crud
+from dealbrain_api.services.near_duplicates import (
+    NearDuplicateIndex,
+    get_near_duplicate_index,
+    invalidate_near_duplicate_index,
+    record_listing,
+    record_listing_values,
+)
+from dealbrain_core.schemas.ingestion import NormalizedListingSchema
+
+
+@pytest_asyncio.fixture
+async def db_session():
+    """Provide an isolated in-memory database session for tests."""
+    if aiosqlite is None:
+        pytest.skip("aiosqlite is not installed; skipping tests")
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async_session = async_sessionmaker(engine, expire_on_commit=False)
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    session = async_session()
+    try:
+        yield session
+    finally:
+        await session.close()
+        await engine.dispose()
+        invalidate_near_duplicate_index()
+
+
+def _listing(title: str, price: float, cpu_id: int | None = None) -> Listing:
+    return Listing(title=title, price_usd=price, cpu_id=cpu_id, condition="used")
+
+
+class TestNearDuplicateIndex:
+    """In-memory index behaviour."""
+
+    def test_reordered_title_with_similar_price_matches(self):
+        index = NearDuplicateIndex()
+        index.add(1, "Mini PC Intel Core i7-12700H 32GB DDR5 1TB NVMe", 649.99)
+        index.add(2, "Gaming Laptop RTX 4070 16GB 1TB", 1299.0)
+
+        matches = index.query("Intel Core i7-12700H Mini PC 32GB DDR5 1TB NVMe", 639.0)
+
+        assert [match.listing_id for match in matches] == [1]
+        assert matches[0].title_similarity == 1.0
+        assert matches[0].score > 0.95
+
+    def test_dissimilar_title_does_not_match(self):
+        index = NearDuplicateIndex()
+        index.add(1, "Mini PC Intel Core i7-12700H 32GB DDR5 1TB NVMe", 649.99)
+
+        assert index.query("Dell OptiPlex 7050 i5-7500 8GB 256GB", 649.99) == []
+
+    def test_conflicting_cpu_and_excluded_ids_are_skipped(self):
+        index = NearDuplicateIndex()
+        index.add(1, "HP EliteDesk 800 G6 Mini 16GB 512GB", 300.0, cpu_id=10)
+        index.add(2, "HP EliteDesk 800 G6 Mini 16GB 512GB", 300.0, cpu_id=11)
+        index.add(3, "HP EliteDesk 800 G6 Mini 16GB 512GB", 300.0)
+
+        matches = index.query("HP EliteDesk 800 G6 Mini 16GB 512GB", 300.0, cpu_id=10, exclude=[3])
+
+        assert [match.listing_id for match in matches] == [1]
+
+    def test_readd_and_remove_update_buckets(self):
+        index = NearDuplicateIndex()
+        index.add(1, "Beelink SER5 Ryzen 7 5800H 16GB 500GB", 299.0)
+        index.add(1, "Lenovo ThinkCentre M75q Gen 2 Ryzen 5 PRO 4650GE", 249.0)
+
+        assert index.query("Beelink SER5 Ryzen 7 5800H 16GB 500GB", 299.0) == []
+        assert len(index) == 1
+
+        index.remove(1)
+        assert len(index) == 0
+        assert index._buckets == {}
+
+
+class TestNearDuplicateIndexCache:
+    """Process-wide index maintained from the database."""
+
+    @pytest.mark.asyncio
+    async def test_loads_all_listings_and_records_new_ones(self, db_session):
+        db_session.add_all(
+            [_listing(f"Filler listing number {i} desktop", 100.0 + i) for i in range(150)]
+        )
+        old = _listing("Minisforum UM790 Pro Ryzen 9 7940HS 32GB 1TB", 599.0)
+        db_session.add(old)
+        await db_session.commit()
+
+        index = await get_near_duplicate_index(db_session)
+        assert len(index) == 151
+        assert [
+            m.listing_id for m in index.query("Minisforum UM790 Pro 7940HS 32GB 1TB", 589.0)
+        ] == [old.id]
+
+        new = _listing("Geekom A7 Ryzen 9 7940HS 32GB 2TB Mini PC", 699.0)
+        db_session.add(new)
+        await db_session.flush()
+        record_listing(db_session, new)
+
+        assert new.id in index
+
+    @pytest.mark.asyncio
+    async def test_records_bulk_inserted_values(self, db_session):
+        # No index loaded yet: nothing to update
+        record_listing_values(db_session, 41, "Beelink SER7 7840HS 32GB", 549.0)
+
+        index = await get_near_duplicate_index(db_session)
+        record_listing_values(db_session, 42, "Beelink SER7 Ryzen 7 7840HS 32GB 1TB", 549.0, 7)
+
+        assert 41 not in index
+        assert [m.listing_id for m in index.query("Beelink SER7 7840HS 32GB 1TB", 539.0, 7)] == [42]
+
+    @pytest.mark.asyncio
+    async def test_catch_up_picks_up_external_writes(self, db_session, monkeypatch):
+        index = await get_near_duplicate_index(db_session)
+        assert len(index) == 0
+
+        db_session.add(_listing("ASUS NUC 14 Pro Core Ultra 7 155H 32GB", 799.0))
+        await db_session.commit()
+
+        # Within the refresh interval the cached index is returned as-is
+        assert len(await get_near_duplicate_index(db_session)) == 0
+
+        monkeypatch.setattr(near_duplicates, "REFRESH_INTERVAL_S", 0.0)
+        assert len(await get_near_duplicate_index(db_session)) == 1
+
+    @pytest.mark.asyncio
+    async def test_dedup_service_reports_near_duplicates(self, db_session):
+        existing = _listing("Dell OptiPlex 7080 Micro i7-10700T 16GB 512GB SSD", 349.0)
+        db_session.add(existing)
+        await db_session.commit()
+
+        incoming = NormalizedListingSchema(
+            title="Dell OptiPlex 7080 Micro i7-10700T 16GB 512GB SSD Win11",
+            price=Decimal("339.00"),
+            seller="another-seller",
+            marketplace="other",
+            condition="used",
+        )
+        service = DeduplicationService(db_session)
+
+        # The index is only queried on request
+        assert (await service.find_existing_listing(incoming)).near_duplicates == []
+        result = await service.find_existing_listing(incoming, near_duplicates=True)
+
+        assert not result.exists
+        assert [match.listing_id for match in result.near_duplicates] == [existing.id]
+
+    @pytest.mark.asyncio
+    async def test_dedup_service_skips_listings_deleted_elsewhere(self, db_session):
+        deleted = _listing("HP EliteDesk 800 G6 Mini i5-10500T 16GB 256GB", 279.0)
+        db_session.add(deleted)
+        await db_session.commit()
+        index = await get_near_duplicate_index(db_session)
+
+        # Deleted by another process: the cached index still holds it
+        await db_session.execute(delete(Listing).where(Listing.id == deleted.id))
+        await db_session.commit()
+        assert deleted.id in index
+
+        incoming = NormalizedListingSchema(
+            title="HP EliteDesk 800 G6 Mini i5-10500T 16GB 256GB SSD",
+            price=Decimal("269.00"),
+            seller="another-seller",
+            marketplace="other",
+            condition="used",
+        )
+        result = await DeduplicationService(db_session).find_existing_listing(
+            incoming, near_duplicates=True
+        )
+
+        assert result.near_duplicates == []
+        assert deleted.id not in index
+
+    @pytest.mark.asyncio
+    async def test_deleting_a_listing_removes_it_from_the_index(self, db_session, monkeypatch):
+        monkeypatch.setattr(crud, "publish_event", AsyncMock())
+        listing = _listing("Lenovo ThinkCentre M75q Gen 2 Ryzen 5 PRO 16GB", 299.0)
+        db_session.add(listing)
+        await db_session.commit()
+        index = await get_near_duplicate_index(db_session)
+        assert listing.id in index
+
+        await crud.delete_listing(db_session, listing.id)
+
+        assert listing.id not in index
@@ -0,0 +1,184 @@
+"""Tests for PassMark benchmark imports."""
+
+from __future__ import annotations
+
+import json
+from contextlib import asynccontextmanager
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+try:
+    import aiosqlite  # type: ignore  # noqa: F401
+except ModuleNotFoundError:
+    aiosqlite = None
+
+from dealbrain_api.db import Base
+from dealbrain_api.models.core import Cpu
+from dealbrain_api.services import passmark
+from dealbrain_api.services.passmark import import_passmark_file
+
+CSV_HEADER = "cpu_name,cpumark,thread,tdp,cores,socket,href\n"
+
+
+@pytest_asyncio.fixture
+async def session_factory(monkeypatch):
+    """Point the importer's session_scope at an isolated in-memory database."""
+    if aiosqlite is None:
+        pytest.skip("aiosqlite is not installed; skipping tests")
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    factory = async_sessionmaker(engine, expire_on_commit=False)
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    @asynccontextmanager
+    async def _session_scope_override():
+        session = factory()
+        try:
+            yield session
+            await session.commit()
+        except Exception:
+            await session.rollback()
+            raise
+        finally:
+            await session.close()
+
+    monkeypatch.setattr(passmark, "session_scope", _session_scope_override)
+    try:
+        yield factory
+    finally:
+        await engine.dispose()
+
+
+async def _cpus(factory) -> dict[str, Cpu]:
+    async with factory() as session:
+        result = await session.execute(select(Cpu))
+        return {cpu.name: cpu for cpu in result.scalars()}
+
+
+@pytest.fixture
+def analytics_calls(monkeypatch):
+    calls: list[int] = []
+
+    async def _record(session, cpu_id):
+        calls.append(cpu_id)
+
+    monkeypatch.setattr(passmark.CPUAnalyticsService, "update_cpu_analytics", _record)
+    return calls
+
+
+class TestBulkImport:
+    """Chunked INSERT ... ON CONFLICT import."""
+
+    @pytest.mark.asyncio
+    async def test_upserts_in_chunks_and_reports_progress(
+        self, session_factory, analytics_calls, tmp_path
+    ):
+        async with session_factory() as session:
+            session.add_all(
+                [
+                    Cpu(
+                        name="Intel Core i7-12700H",
+                        manufacturer="Intel",
+                        cpu_mark_multi=26000,
+                        cpu_mark_single=3500,
+                        notes="keep me",
+                        attributes_json={"alias": "i7 12700H"},
+                    ),
+                    Cpu(
+                        name="AMD Ryzen 5 5600X",
+                        manufacturer="AMD",
+                        cpu_mark_multi=21900,
+                        cpu_mark_single=3360,
+                    ),
+                ]
+            )
+            await session.commit()
+
+        path = tmp_path / "passmark.csv"
+        path.write_text(
+            CSV_HEADER
+            + 'intel core i7-12700H,"26,812",3802,45,14,FCBGA1744,cpu=Intel+Core+i7-12700H\n'
+            + "AMD Ryzen 5 5600X,21900,3360,65,6,AM4,\n"
+            + "Intel Core i3-N305,10350,1890,15,8,,\n"
+            + ",100,100,,,,\n",
+            encoding="utf-8",
+        )
+        progress: list[tuple[int, int]] = []
+
+        summary = await import_passmark_file(
+            path, chunk_size=2, progress=lambda written, total: progress.append((written, total))
+        )
+
+        assert summary.to_dict() == {
+            "updated": 2,
+            "created": 1,
+            "failed": 1,
+            "not_found": [],
+            "analytics_updated": 2,
+        }
+        assert progress == [(2, 3), (3, 3)]
+
+        cpus = await _cpus(session_factory)
+        assert set(cpus) == {"Intel Core i7-12700H", "AMD Ryzen 5 5600X", "Intel Core i3-N305"}
+        i7 = cpus["Intel Core i7-12700H"]
+        assert (i7.cpu_mark_multi, i7.cpu_mark_single, i7.cores) == (26812, 3802, 14)
+        assert i7.notes == "keep me"
+        assert i7.attributes_json == {
+            "alias": "i7 12700H",
+            "passmark_slug": "Intel+Core+i7-12700H",
+            "passmark_url": "https://www.cpubenchmark.net/cpu.php?cpu=Intel+Core+i7-12700H",
+        }
+        assert cpus["AMD Ryzen 5 5600X"].socket == "AM4"
+        assert cpus["Intel Core i3-N305"].manufacturer == "Intel"
+
+        # Only CPUs whose marks changed get analytics recalculated
+        assert sorted(analytics_calls) == sorted([i7.id, cpus["Intel Core i3-N305"].id])
+
+    @pytest.mark.asyncio
+    async def test_repeated_entries_merge_into_one_row(
+        self, session_factory, analytics_calls, tmp_path
+    ):
+        path = tmp_path / "passmark.json"
+        path.write_text(
+            json.dumps(
+                {
+                    "data": [
+                        {"name": "Apple M2", "cpumark": 15000},
+                        {"name": "apple m2", "singleThread": 4000},
+                        "not an entry",
+                    ]
+                }
+            ),
+            encoding="utf-8",
+        )
+
+        summary = await import_passmark_file(path)
+
+        assert (summary.created, summary.failed) == (1, 1)
+        cpus = await _cpus(session_factory)
+        assert list(cpus) == ["Apple M2"]
+        assert (cpus["Apple M2"].cpu_mark_multi, cpus["Apple M2"].cpu_mark_single) == (
+            15000,
+            4000,
+        )
+        assert cpus["Apple M2"].manufacturer == "Apple"
+
+    @pytest.mark.asyncio
+    async def test_row_mode_updates_existing_cpu(self, session_factory, analytics_calls, tmp_path):
+        async with session_factory() as session:
+            session.add(Cpu(name="AMD Ryzen 7 7840HS", manufacturer="AMD", cpu_mark_multi=1))
+            await session.commit()
+
+        path = tmp_path / "passmark.csv"
+        path.write_text(CSV_HEADER + "amd ryzen 7 7840hs,29000,3900,35,8,FP7,\n", encoding="utf-8")
+
+        summary = await import_passmark_file(path, bulk=False)
+
+        assert (summary.updated, summary.created, summary.analytics_updated) == (1, 0, 0)
+        cpu = (await _cpus(session_factory))["AMD Ryzen 7 7840HS"]
+        assert (cpu.cpu_mark_multi, cpu.cpu_mark_single, cpu.socket) == (29000, 3900, "FP7")
+        assert analytics_calls == []
@@ -0,0 +1,303 @@
+"""Tests for chunked (streaming) spreadsheet imports."""
+
+from __future__ import annotations
+
+from contextlib import asynccontextmanager
+
+import pandas as pd
+import pytest
+import pytest_asyncio
+from openpyxl import Workbook
+from sqlalchemy import event, select
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+try:
+    import aiosqlite  # type: ignore  # noqa: F401
+except ModuleNotFoundError:
+    aiosqlite = None
+
+from dealbrain_api.db import Base
+from dealbrain_api.models.core import Cpu, ImportSession, Listing, ListingComponent
+from dealbrain_api.services.imports import ChunkWriter, ImportSessionService, WorkbookParser
+from dealbrain_core.schemas import CpuCreate, ListingCreate
+
+
+def _write_workbook(path, sheets):
+    workbook = Workbook()
+    workbook.remove(workbook.active)
+    for name, rows in sheets.items():
+        sheet = workbook.create_sheet(name)
+        for row in rows:
+            sheet.append(row)
+    workbook.save(path)
+    return path
+
+
+@pytest_asyncio.fixture
+async def session_factory(monkeypatch):
+    """Isolated in-memory database for the service's per-chunk sessions."""
+    if aiosqlite is None:
+        pytest.skip("aiosqlite is not installed; skipping tests")
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    factory = async_sessionmaker(engine, expire_on_commit=False)
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    @asynccontextmanager
+    async def _session_scope_override():
+        session = factory()
+        try:
+            yield session
+            await session.commit()
+        except Exception:
+            await session.rollback()
+            raise
+        finally:
+            await session.close()
+
+    monkeypatch.setattr(
+        "dealbrain_api.services.imports.service.session_scope", _session_scope_override
+    )
+    try:
+        yield factory
+    finally:
+        await engine.dispose()
+
+
+class TestWorkbookChunks:
+    """Streaming readers return the same data as load_workbook."""
+
+    def test_xlsx_chunks_match_full_load(self, tmp_path):
+        path = _write_workbook(
+            tmp_path / "book.xlsx",
+            {
+                "Listings": [
+                    ["Title", "Price", None, "Price"],
+                    ["Dell OptiPlex 7050", 199, None, 3],
+                    [None, None, None, None],
+                    ["HP EliteDesk 800 G4", 249.5, "note", None],
+                    ["Lenovo M720q", None, None, None],
+                    [None, None, None, None],
+                ],
+                "CPUs": [["Name"]] + [[f"CPU {i}"] for i in range(5)],
+            },
+        )
+        full = WorkbookParser.load_workbook(path)
+
+        assert WorkbookParser.sheet_names(path) == ["Listings", "CPUs"]
+        for sheet, dataframe in full.items():
+            chunks = list(WorkbookParser.iter_sheet_chunks(path, sheet, chunk_size=2))
+            assert [offset for offset, _ in chunks] == list(range(0, len(dataframe), 2))
+            pd.testing.assert_frame_equal(
+                pd.concat(chunk for _, chunk in chunks), dataframe, check_index_type=False
+            )
+
+    def test_csv_chunks_keep_row_positions(self, tmp_path):
+        path = tmp_path / "listings.csv"
+        path.write_text("Title,Price\n" + "".join(f"Item {i},{i}\n" for i in range(5)))
+
+        chunks = list(WorkbookParser.iter_sheet_chunks(path, "listings", chunk_size=2))
+
+        assert [offset for offset, _ in chunks] == [0, 2, 4]
+        assert list(chunks[1][1].index) == [2, 3]
+        pd.testing.assert_frame_equal(
+            pd.concat(chunk for _, chunk in chunks),
+            WorkbookParser.load_workbook(path)["listings"],
+        )
+
+
+class TestChunkWriter:
+    """Set-based catalog writes."""
+
+    @pytest.mark.asyncio
+    async def test_upsert_catalog_updates_by_name_without_clearing_fields(self, session_factory):
+        async with session_factory() as session:
+            session.add(Cpu(name="Intel Core i5-8500T", manufacturer="Intel", cores=6))
+            await session.commit()
+
+        async with session_factory() as session:
+            written = await ChunkWriter.upsert_catalog(
+                session,
+                Cpu,
+                [
+                    CpuCreate(
+                        name="Intel Core i5-8500T", manufacturer="Intel", cpu_mark_multi=9000
+                    ),
+                    CpuCreate(name="AMD Ryzen 5 5600G", manufacturer="AMD", cores=6),
+                    CpuCreate(name="AMD Ryzen 5 5600G", manufacturer="AMD", threads=12),
+                ],
+            )
+            await session.commit()
+
+        assert written == 2
+        async with session_factory() as session:
+            cpus = {cpu.name: cpu for cpu in (await session.execute(select(Cpu))).scalars()}
+        assert (cpus["Intel Core i5-8500T"].cores, cpus["Intel Core i5-8500T"].cpu_mark_multi) == (
+            6,
+            9000,
+        )
+        assert (cpus["AMD Ryzen 5 5600G"].cores, cpus["AMD Ryzen 5 5600G"].threads) == (6, 12)
+        assert cpus["AMD Ryzen 5 5600G"].attributes_json == {}
+
+    @pytest.mark.asyncio
+    async def test_write_listings_batches_inserts_and_components(self, session_factory):
+        async with session_factory() as session:
+            existing = Listing(title="Dell OptiPlex 3060 Micro", price_usd=200, seller="Dell")
+            session.add(existing)
+            await session.flush()
+            session.add(ListingComponent(listing_id=existing.id, component_type="misc"))
+            await session.commit()
+
+        statements: list[tuple[str, bool]] = []
+
+        def _record(conn, cursor, statement, parameters, context, executemany):
+            statements.append((statement.split("(")[0].strip(), executemany))
+
+        async with session_factory() as session:
+            engine = session.bind.sync_engine
+            event.listen(engine, "before_cursor_execute", _record)
+            try:
+                written = await ChunkWriter.write_listings(
+                    session,
+                    [
+                        ListingCreate(title="Dell OptiPlex 3060 Micro", price_usd=180),
+                        ListingCreate(title="HP EliteDesk 800 G4 Mini", price_usd=220),
+                        ListingCreate(title="Lenovo M75q Gen 2", price_usd=260),
+                        # Later rows with the same title win
+                        ListingCreate(title="HP EliteDesk 800 G4 Mini", price_usd=210),
+                    ],
+                )
+            finally:
+                event.remove(engine, "before_cursor_execute", _record)
+            await session.commit()
+
+        assert written == 4
+        # New listings are flushed together (an executemany, one statement on PostgreSQL)
+        inserts = [many for statement, many in statements if statement == "INSERT INTO listing"]
+        assert inserts and all(inserts)
+        deletes = [
+            statement
+            for statement, _ in statements
+            if statement.startswith("DELETE FROM listing_component")
+        ]
+        assert len(deletes) == 1
+        async with session_factory() as session:
+            listings = {
+                listing.title: listing
+                for listing in (await session.execute(select(Listing))).scalars()
+            }
+            components = (await session.execute(select(ListingComponent))).scalars().all()
+        assert len(listings) == 3
+        assert (
+            listings["Dell OptiPlex 3060 Micro"].price_usd,
+            listings["Dell OptiPlex 3060 Micro"].seller,
+        ) == (
+            180,
+            "Dell",
+        )
+        assert listings["HP EliteDesk 800 G4 Mini"].price_usd == 210
+        # Components of every written listing are replaced by the sheet's (none here)
+        assert components == []
+
+
+class TestStreamingCommit:
+    """ImportSessionService.commit in streaming mode."""
+
+    @pytest.mark.asyncio
+    async def test_commit_streams_sheets_in_chunks(self, session_factory, tmp_path, monkeypatch):
+        # apply_seed only receives the default profiles here; its seed helpers use
+        # PostgreSQL-only SQL
+        reference_seeds = []
+
+        async def _apply_seed(seed):
+            reference_seeds.append(seed)
+
+        monkeypatch.setattr("dealbrain_api.services.imports.service.apply_seed", _apply_seed)
+        path = _write_workbook(
+            tmp_path / "partner.xlsx",
+            {
+                "CPUs": [
+                    ["CPU Name", "Manufacturer", "CPU Mark"],
+                    ["Intel Core i5-8500T", "Intel", 9000],
+                    ["Intel Core i7-8700T", "Intel", 12000],
+                    ["AMD Ryzen 5 5600G", "AMD", 19800],
+                ],
+                "Listings": [
+                    ["Title", "Price", "CPU"],
+                    ["Dell OptiPlex 3060 Micro", 180, "Intel Core i5-8500T"],
+                    ["HP EliteDesk 800 G4 Mini", 220, "Intel Core i7-8700T"],
+                    ["Lenovo M75q Gen 2", 260, "AMD Ryzen 5 5600G"],
+                    ["Dell OptiPlex 7060 Micro", 240, None],
+                    ["Intel NUC 8", 150, "Intel Core i3-8109U"],
+                ],
+            },
+        )
+        mappings = {
+            "cpu": {
+                "sheet": "CPUs",
+                "fields": {
+                    "name": {"column": "CPU Name"},
+                    "manufacturer": {"column": "Manufacturer"},
+                    "cpu_mark_multi": {"column": "CPU Mark"},
+                },
+            },
+            "listing": {
+                "sheet": "Listings",
+                "fields": {
+                    "title": {"column": "Title"},
+                    "price_usd": {"column": "Price"},
+                    "cpu_name": {"column": "CPU"},
+                },
+            },
+        }
+
+        async with session_factory() as db:
+            db.add_all(
+                [
+                    Cpu(name="Intel Core i5-8500T", manufacturer="Intel"),
+                    Cpu(name="Intel Core i7-8700T", manufacturer="Intel"),
+                    Cpu(name="AMD Ryzen 5 5600G", manufacturer="AMD"),
+                ]
+            )
+            import_session = ImportSession(
+                filename=path.name,
+                upload_path=str(path),
+                status="mapping_required",
+                mappings_json=mappings,
+            )
+            db.add(import_session)
+            await db.flush()
+
+            counts, auto_created = await ImportSessionService().commit(
+                db,
+                import_session,
+                conflict_resolutions={},
+                # Override row indexes are sheet positions; row 3 is in the second chunk
+                component_overrides={
+                    0: {"cpu_match": "Intel Core i5-8500T"},
+                    3: {"cpu_match": "Intel Core i7-8700T"},
+                },
+                streaming=True,
+                chunk_size=2,
+            )
+            await db.commit()
+
+        assert counts["cpus"] == 3
+        assert counts["listings"] == 5
+        assert auto_created == ["Intel Core i3-8109U"]
+        assert import_session.status == "completed"
+        assert [len(seed.ports_profiles) for seed in reference_seeds] == [1]
+
+        async with session_factory() as session:
+            cpus = {cpu.name: cpu for cpu in (await session.execute(select(Cpu))).scalars()}
+            listings = {
+                listing.title: listing.cpu_id
+                for listing in (await session.execute(select(Listing))).scalars()
+            }
+        cpu_ids = {name: cpu.id for name, cpu in cpus.items()}
+        assert cpus["AMD Ryzen 5 5600G"].cpu_mark_multi == 19800
+        assert len(listings) == 5
+        assert listings["Dell OptiPlex 3060 Micro"] == cpu_ids["Intel Core i5-8500T"]
+        assert listings["Dell OptiPlex 7060 Micro"] == cpu_ids["Intel Core i7-8700T"]
+        assert "Intel Core i3-8109U" in cpu_ids
@@ -9,6 +9,7 @@ These tests cover:
 
 from __future__ import annotations
 
+import re
 from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -272,6 +273,36 @@ class TestNLPExtractor:
         assert results["gpu"] is not None
         assert "RTX" in results["gpu"].value or "3060" in results["gpu"].value
 
+    def test_patterns_compiled_once_and_shared(self):
+        """Test that extractors share one compiled pattern set per file."""
+        first = NLPExtractor()
+        second = NLPExtractor()
+
+        assert first._compiled is second._compiled
+        assert all(
+            isinstance(compiled.regex, re.Pattern)
+            for group in first._compiled.values()
+            for compiled in group
+        )
+
+    def test_pattern_anchors_cover_examples(self):
+        """Test that every documented example passes its pattern's anchor pre-check."""
+        extractor = NLPExtractor()
+
+        for key, compiled_group in extractor._compiled.items():
+            for compiled, pattern_def in zip(compiled_group, extractor.patterns[key], strict=True):
+                for example in pattern_def.get("examples", []):
+                    if compiled.regex.search(example):
+                        assert compiled.may_match(example.lower()), (key, example)
+
+    def test_anchor_precheck_skips_absent_components(self):
+        """Test that texts without any anchors extract nothing."""
+        extractor = NLPExtractor()
+
+        results = extractor.extract_all("Renewed, tested and cleaned with a 90-day warranty")
+
+        assert all(value is None for value in results.values())
+
 
 class TestCatalogMatcher:
     """Test suite for fuzzy catalog matching."""
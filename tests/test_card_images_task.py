@@ -0,0 +1,63 @@
+"""Tests for card image background tasks."""
+
+from __future__ import annotations
+
+import pytest
+import pytest_asyncio
+from dealbrain_api.db import Base
+from dealbrain_core.enums import ListingStatus
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+try:  # pragma: no cover - optional dependency check
+    import aiosqlite  # type: ignore  # noqa: F401
+except ModuleNotFoundError:  # pragma: no cover - skip when unavailable
+    aiosqlite = None
+
+from dealbrain_api.models.core import Listing
+from dealbrain_api.tasks.card_images import _select_top_listings
+
+
+@pytest_asyncio.fixture
+async def db_session():
+    """Provide an isolated in-memory database session for task tests."""
+    if aiosqlite is None:
+        pytest.skip("aiosqlite is not installed; skipping card image task tests")
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async_session = async_sessionmaker(engine, expire_on_commit=False)
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    session = async_session()
+    try:
+        yield session
+    finally:
+        await session.close()
+        await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_select_top_listings_ranks_active_listings_by_metric(db_session: AsyncSession):
+    db_session.add_all(
+        [
+            Listing(title="mid", price_usd=400, dollar_per_cpu_mark_multi=0.05, score_composite=7),
+            Listing(title="best", price_usd=300, dollar_per_cpu_mark_multi=0.02, score_composite=6),
+            Listing(
+                title="worst", price_usd=900, dollar_per_cpu_mark_multi=0.09, score_composite=9
+            ),
+            Listing(title="unscored", price_usd=100),
+            Listing(
+                title="archived",
+                price_usd=100,
+                dollar_per_cpu_mark_multi=0.01,
+                status=ListingStatus.ARCHIVED.value,
+            ),
+        ]
+    )
+    await db_session.commit()
+
+    by_value = await _select_top_listings(db_session, 2, "cpu_mark_per_dollar")
+    by_score = await _select_top_listings(db_session, 10, "score_composite")
+
+    assert [listing.title for listing in by_value] == ["best", "mid"]
+    assert [listing.title for listing in by_score] == ["worst", "mid", "best"]
@@ -0,0 +1,17 @@
+"""Smoke tests for the Typer CLI entrypoint."""
+
+from __future__ import annotations
+
+from typer.testing import CliRunner
+
+from dealbrain_cli.main import app
+
+runner = CliRunner()
+
+
+def test_import_help_renders():
+    """Building the app and rendering ``import --help`` must not fail."""
+    result = runner.invoke(app, ["import", "--help"])
+
+    assert result.exit_code == 0, result.output
+    assert "--chunk-size" in result.output
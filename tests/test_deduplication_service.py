@@ -1183,3 +1183,129 @@ class TestDedupAdvancedEdgeCases:
 
         # Should normalize to same hash
         assert hash1 == hash2
+
+
+@pytest.mark.asyncio
+class TestBatchDeduplication:
+    """Tests for set-based batch deduplication."""
+
+    async def test_batch_resolves_vendor_and_hash_matches(self, db_session: AsyncSession):
+        """Test that a batch resolves vendor, hash and missing listings in input order."""
+        service = DeduplicationService(db_session)
+
+        by_vendor = Listing(
+            title="eBay Mini PC",
+            price_usd=199.99,
+            marketplace=Marketplace.EBAY.value,
+            vendor_item_id="111111111111",
+            condition="used",
+        )
+        hashed_data = NormalizedListingSchema(
+            title="Store Gaming PC",
+            price=Decimal("899.00"),
+            seller="Store",
+            marketplace="other",
+            condition="new",
+        )
+        by_hash = Listing(
+            title="Store Gaming PC",
+            price_usd=899.00,
+            seller="Store",
+            marketplace=Marketplace.OTHER.value,
+            condition="new",
+            dedup_hash=service._generate_hash(hashed_data),
+        )
+        db_session.add_all([by_vendor, by_hash])
+        await db_session.commit()
+
+        batch = {
+            "https://www.ebay.com/itm/111111111111": NormalizedListingSchema(
+                title="eBay Mini PC (relisted)",
+                price=Decimal("189.99"),
+                marketplace="ebay",
+                vendor_item_id="111111111111",
+                condition="used",
+            ),
+            "https://www.amazon.com/dp/111111111111": NormalizedListingSchema(
+                title="Amazon listing with the same item id",
+                price=Decimal("189.99"),
+                marketplace="amazon",
+                vendor_item_id="111111111111",
+                condition="used",
+            ),
+            "https://store.example.com/gaming-pc": hashed_data,
+        }
+
+        results = await service.find_existing_listings(batch)
+
+        assert list(results) == list(batch)
+        assert [r.exists for r in results.values()] == [True, False, True]
+        by_vendor_result = results["https://www.ebay.com/itm/111111111111"]
+        assert by_vendor_result.existing_listing.id == by_vendor.id
+        assert by_vendor_result.is_exact_match is True
+        by_hash_result = results["https://store.example.com/gaming-pc"]
+        assert by_hash_result.existing_listing.id == by_hash.id
+        assert by_hash_result.confidence == 0.95
+
+    async def test_batch_detects_intra_batch_duplicates(self, db_session: AsyncSession):
+        """Test that repeated rows in one batch point at the key of their first occurrence."""
+        service = DeduplicationService(db_session)
+
+        row = NormalizedListingSchema(
+            title="Beelink SER5 Ryzen 7 5800H",
+            price=Decimal("299.00"),
+            seller="Beelink Store",
+            marketplace="other",
+            condition="new",
+        )
+        other = NormalizedListingSchema(
+            title="Minisforum UM790 Pro",
+            price=Decimal("599.00"),
+            marketplace="ebay",
+            vendor_item_id="222222222222",
+            condition="new",
+        )
+        same_vendor_id = other.model_copy(update={"price": Decimal("579.00")})
+
+        results = await service.find_existing_listings(
+            {"row-1": row, "row-2": other, "row-3": row, "row-4": same_vendor_id}
+        )
+
+        assert [r.exists for r in results.values()] == [False, False, False, False]
+        assert {key: r.batch_duplicate_of for key, r in results.items()} == {
+            "row-1": None,
+            "row-2": None,
+            "row-3": "row-1",
+            "row-4": "row-2",
+        }
+
+    async def test_batch_uses_two_queries(self, db_session: AsyncSession):
+        """Test that lookups are set-based rather than one query per listing."""
+        service = DeduplicationService(db_session)
+        batch = {
+            i: NormalizedListingSchema(
+                title=f"Listing {i}",
+                price=Decimal("100.00") + i,
+                marketplace="ebay" if i % 2 else "other",
+                vendor_item_id=f"{i:012d}" if i % 2 else None,
+                condition="used",
+            )
+            for i in range(50)
+        }
+
+        statements: list[str] = []
+        original_execute = db_session.execute
+
+        async def counting_execute(statement, *args, **kwargs):
+            statements.append(str(statement))
+            return await original_execute(statement, *args, **kwargs)
+
+        db_session.execute = counting_execute
+        results = await service.find_existing_listings(batch)
+
+        assert len(results) == 50
+        assert len(statements) == 2
+
+    async def test_empty_batch(self, db_session: AsyncSession):
+        """Test that an empty batch makes no queries."""
+        assert await DeduplicationService(db_session).find_existing_listings({}) == {}
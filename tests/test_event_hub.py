@@ -0,0 +1,233 @@
+"""Tests for the process-wide SSE event hub."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+
+import pytest
+
+try:
+    from fakeredis import FakeAsyncRedis
+except ModuleNotFoundError:  # pragma: no cover - optional test dependency
+    FakeAsyncRedis = None
+
+from dealbrain_api.api.events import event_stream
+from dealbrain_api.events import Event, EventType, publish_event, stream
+from dealbrain_api.events.hub import EventFilter, EventHub
+from dealbrain_api.events.stream import MemoryEventLog, RedisEventLog, parse_event_id
+
+
+def _message(event_type: EventType, **data) -> str:
+    return Event(type=event_type, data=data).model_dump_json()
+
+
+class _UnavailableLog(MemoryEventLog):
+    async def read(self, after_id, **kwargs):
+        raise ConnectionError("redis unavailable")
+
+
+class TestEventFilter:
+    """Per-client topic filters."""
+
+    def test_empty_filter_matches_everything(self):
+        assert EventFilter().matches("listing.created", {"listing_id": 1})
+
+    def test_types_and_job(self):
+        event_filter = EventFilter.from_params(["import.progress", " "], job_id="job-1")
+
+        assert event_filter.types == frozenset({"import.progress"})
+        assert event_filter.matches("import.progress", {"job_id": "job-1"})
+        assert not event_filter.matches("import.progress", {"job_id": "job-2"})
+        assert not event_filter.matches("listing.created", {"job_id": "job-1"})
+        assert EventFilter(job_id="7").matches("import.completed", {"import_job_id": 7})
+
+
+@pytest.mark.asyncio
+class TestDispatch:
+    """Fan-out to subscriber queues without a live Redis connection."""
+
+    async def test_dispatch_filters_and_drops_slow_consumers(self):
+        hub = EventHub(log=_UnavailableLog(), queue_size=2)
+        everything = await hub.subscribe()
+        one_job = await hub.subscribe(EventFilter(job_id="job-1"))
+        try:
+            for pct in (10, 30, 60):
+                delivered = hub.dispatch(
+                    f"0-{pct}",
+                    _message(EventType.IMPORT_PROGRESS, job_id="job-2", progress_pct=pct),
+                )
+                assert delivered == (1 if pct < 60 else 0)
+
+            # The unfiltered client fell behind on the third event and was dropped
+            assert everything.dropped
+            assert [event async for event in everything] == []
+            assert hub.subscriber_count == 1
+
+            hub.dispatch(
+                "0-70", _message(EventType.IMPORT_PROGRESS, job_id="job-1", progress_pct=10)
+            )
+            event = await anext(one_job)
+            assert (event["id"], event["event"]) == ("0-70", "import.progress")
+            assert json.loads(event["data"]) == {"job_id": "job-1", "progress_pct": 10}
+        finally:
+            await hub.close()
+
+    async def test_dispatch_ignores_malformed_messages(self):
+        hub = EventHub(log=_UnavailableLog())
+        subscription = await hub.subscribe()
+        try:
+            assert hub.dispatch("0-1", "not json") == 0
+            assert subscription.queue.empty()
+        finally:
+            await hub.close()
+
+    async def test_subscriber_task_stops_with_last_client(self):
+        hub = EventHub(log=_UnavailableLog())
+        first = await hub.subscribe()
+        second = await hub.subscribe()
+
+        await hub.unsubscribe(first)
+        assert hub._task is not None
+
+        await hub.unsubscribe(second)
+        assert hub._task is None
+
+
+def test_parse_event_id():
+    assert parse_event_id("1732017600000-3") == (1732017600000, 3)
+    assert parse_event_id("0-12") < parse_event_id("1-0")
+    assert parse_event_id("garbage") is None
+    assert parse_event_id(None) is None
+
+
+@pytest.mark.asyncio
+class TestReplay:
+    """Resuming a stream from Last-Event-ID."""
+
+    async def test_reconnect_replays_only_missed_events(self, monkeypatch):
+        log = MemoryEventLog()
+        monkeypatch.setattr(stream, "event_log", log)
+        hub = EventHub(log=log)
+
+        first = event_stream(EventFilter(), hub)
+        assert (await anext(first))["event"] == "connected"
+        await publish_event(EventType.LISTING_CREATED, {"listing_id": 1})
+        seen = await asyncio.wait_for(anext(first), 1)
+        await first.aclose()
+
+        # Published while the client was disconnected
+        await publish_event(EventType.LISTING_UPDATED, {"listing_id": 1})
+        await publish_event(EventType.IMPORT_PROGRESS, {"job_id": "j", "progress_pct": 50})
+
+        resumed = event_stream(
+            EventFilter.from_params(["listing.updated", "listing.deleted"]),
+            hub,
+            last_event_id=seen["id"],
+        )
+        try:
+            assert (await anext(resumed))["event"] == "connected"
+            replayed = await asyncio.wait_for(anext(resumed), 1)
+            assert replayed["event"] == "listing.updated"
+
+            await publish_event(EventType.LISTING_DELETED, {"listing_id": 1})
+            live = await asyncio.wait_for(anext(resumed), 1)
+            assert live["event"] == "listing.deleted"
+            assert parse_event_id(live["id"]) > parse_event_id(replayed["id"])
+        finally:
+            await resumed.aclose()
+
+    async def test_live_events_during_replay_are_not_duplicated(self):
+        class _RacingLog(MemoryEventLog):
+            async def since(self, after_id, count):
+                missed = await super().since(after_id, count)
+                # A lagging reader delivers the newest missed event and a new one mid-replay
+                hub.dispatch(*missed[-1])
+                hub.dispatch("0-3", _message(EventType.LISTING_CREATED, listing_id=3))
+                return missed
+
+        log = _RacingLog()
+        hub = EventHub(log=log)
+        ids = [await log.append(_message(EventType.LISTING_CREATED, listing_id=n)) for n in (1, 2)]
+        try:
+            subscription = await hub.subscribe(last_event_id=ids[0])
+
+            assert [(await anext(subscription))["id"] for _ in range(2)] == [ids[1], "0-3"]
+            assert subscription.queue.empty()
+        finally:
+            await hub.close()
+
+    async def test_replay_pages_past_filtered_events(self):
+        log = MemoryEventLog()
+        hub = EventHub(log=log, queue_size=4)
+        start = await log.last_id()
+        for n in range(10):
+            await log.append(_message(EventType.LISTING_UPDATED, listing_id=n))
+            await log.append(_message(EventType.LISTING_CREATED, listing_id=n))
+        try:
+            subscription = await hub.subscribe(
+                EventFilter.from_params(["listing.created"]), last_event_id=start
+            )
+            # Only matching events count against the queue; the rest are paged past
+            for _ in range(3):
+                await anext(subscription)
+            assert subscription.dropped
+            assert [event async for event in subscription] == []
+        finally:
+            await hub.close()
+
+    async def test_replay_larger_than_queue_ends_stream_for_resume(self):
+        log = MemoryEventLog()
+        hub = EventHub(log=log, queue_size=4)
+        start = await log.last_id()
+        ids = [
+            await log.append(_message(EventType.LISTING_CREATED, listing_id=n)) for n in range(6)
+        ]
+        try:
+            first = await hub.subscribe(last_event_id=start)
+            received = [event["id"] async for event in first]
+            assert received == ids[:3]
+
+            # Resuming from the last ID received delivers the rest
+            resumed = await hub.subscribe(last_event_id=received[-1])
+            assert [(await anext(resumed))["id"] for _ in range(3)] == ids[3:]
+            assert not resumed.dropped
+            assert resumed.queue.empty()
+        finally:
+            await hub.close()
+
+
+@pytest.mark.asyncio
+async def test_redis_stream_serves_all_clients():
+    if FakeAsyncRedis is None:
+        pytest.skip("fakeredis is not installed; skipping tests")
+    redis = FakeAsyncRedis(decode_responses=True)
+
+    async def _redis():
+        return redis
+
+    log = RedisEventLog(redis_factory=_redis, maxlen=100)
+    hub = EventHub(log=log)
+    streams = [
+        event_stream(EventFilter(), hub),
+        event_stream(EventFilter.from_params(["listing.created"]), hub),
+    ]
+    try:
+        for client in streams:
+            assert (await anext(client))["event"] == "connected"
+
+        await log.append(_message(EventType.LISTING_DELETED, listing_id=2))
+        created_id = await log.append(_message(EventType.LISTING_CREATED, listing_id=3))
+
+        first = [await asyncio.wait_for(anext(streams[0]), 1) for _ in range(2)]
+        second = await asyncio.wait_for(anext(streams[1]), 1)
+        assert [event["event"] for event in first] == ["listing.deleted", "listing.created"]
+        assert second == {"id": created_id, "event": "listing.created", "data": '{"listing_id": 3}'}
+        assert [event_id for event_id, _ in await log.since(first[0]["id"], 10)] == [created_id]
+    finally:
+        for client in streams:
+            await client.aclose()
+        await redis.aclose()
+
+    assert hub.subscriber_count == 0
+    assert hub._task is None
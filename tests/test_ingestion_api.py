@@ -14,6 +14,7 @@ import pytest
 import pytest_asyncio
 from dealbrain_api.db import Base
 from dealbrain_api.models.core import ImportSession
+from dealbrain_api.settings import get_settings
 from dealbrain_core.enums import SourceType
 from fastapi import FastAPI
 from fastapi.testclient import TestClient
@@ -460,7 +461,7 @@ def test_create_bulk_import_csv_success(client, db_session):
     """Test successful bulk import with CSV file."""
     csv_content = b"url\nhttps://www.ebay.com/itm/111\nhttps://www.ebay.com/itm/222\nhttps://www.ebay.com/itm/333"
 
-    with patch("dealbrain_api.api.ingestion.ingest_url_task") as mock_task:
+    with patch("dealbrain_api.api.ingestion.ingest_url_batch_task") as mock_task:
         response = client.post(
             "/api/v1/ingest/bulk",
             files={"file": ("urls.csv", csv_content, "text/csv")},
@@ -478,8 +479,9 @@ def test_create_bulk_import_csv_success(client, db_session):
     bulk_job_id = UUID(data["bulk_job_id"])
     assert isinstance(bulk_job_id, UUID)
 
-    # Assert 3 Celery tasks were queued
-    assert mock_task.delay.call_count == 3
+    # Assert the 3 URLs were queued in one batch
+    mock_task.delay.assert_called_once()
+    assert len(mock_task.delay.call_args.kwargs["jobs"]) == 3
 
 
 def test_create_bulk_import_json_success(client, db_session):
@@ -488,7 +490,7 @@ def test_create_bulk_import_json_success(client, db_session):
         b'[{"url": "https://www.amazon.com/dp/A111"},{"url": "https://www.amazon.com/dp/A222"}]'
     )
 
-    with patch("dealbrain_api.api.ingestion.ingest_url_task") as mock_task:
+    with patch("dealbrain_api.api.ingestion.ingest_url_batch_task") as mock_task:
         response = client.post(
             "/api/v1/ingest/bulk",
             files={"file": ("urls.json", json_content, "application/json")},
@@ -502,8 +504,9 @@ def test_create_bulk_import_json_success(client, db_session):
     assert "bulk_job_id" in data
     assert data["total_urls"] == 2
 
-    # Assert 2 Celery tasks were queued
-    assert mock_task.delay.call_count == 2
+    # Assert the 2 URLs were queued in one batch
+    mock_task.delay.assert_called_once()
+    assert len(mock_task.delay.call_args.kwargs["jobs"]) == 2
 
 
 def test_create_bulk_import_empty_file(client):
@@ -578,7 +581,7 @@ def test_create_bulk_import_deduplicates_urls(client, db_session):
     # CSV with duplicate URLs
     csv_content = b"url\nhttps://www.ebay.com/itm/111\nhttps://www.ebay.com/itm/222\nhttps://www.ebay.com/itm/111\nhttps://www.ebay.com/itm/222"
 
-    with patch("dealbrain_api.api.ingestion.ingest_url_task") as mock_task:
+    with patch("dealbrain_api.api.ingestion.ingest_url_batch_task") as mock_task:
         response = client.post(
             "/api/v1/ingest/bulk",
             files={"file": ("duplicates.csv", csv_content, "text/csv")},
@@ -589,8 +592,8 @@ def test_create_bulk_import_deduplicates_urls(client, db_session):
     data = response.json()
     assert data["total_urls"] == 2  # Only 2 unique URLs
 
-    # Assert only 2 tasks queued
-    assert mock_task.delay.call_count == 2
+    # Assert only 2 URLs queued
+    assert len(mock_task.delay.call_args.kwargs["jobs"]) == 2
 
 
 @pytest.mark.asyncio
@@ -598,7 +601,7 @@ async def test_create_bulk_import_creates_parent_child_sessions(client, db_sessi
     """Test bulk import creates parent and child ImportSession records."""
     csv_content = b"url\nhttps://www.ebay.com/itm/111\nhttps://www.ebay.com/itm/222"
 
-    with patch("dealbrain_api.api.ingestion.ingest_url_task"):
+    with patch("dealbrain_api.api.ingestion.ingest_url_batch_task"):
         response = client.post(
             "/api/v1/ingest/bulk",
             files={"file": ("urls.csv", csv_content, "text/csv")},
@@ -634,11 +637,12 @@ async def test_create_bulk_import_creates_parent_child_sessions(client, db_sessi
 
 
 @pytest.mark.asyncio
-async def test_create_bulk_import_queues_celery_tasks(client, db_session):
-    """Test bulk import queues Celery tasks for each URL."""
+async def test_create_bulk_import_queues_celery_tasks(client, db_session, monkeypatch):
+    """Test bulk import queues a Celery batch task per bulk_batch_size URLs."""
+    monkeypatch.setattr(get_settings().ingestion, "bulk_batch_size", 2)
     csv_content = b"url\nhttps://www.ebay.com/itm/111\nhttps://www.ebay.com/itm/222\nhttps://www.ebay.com/itm/333"
 
-    with patch("dealbrain_api.api.ingestion.ingest_url_task") as mock_task:
+    with patch("dealbrain_api.api.ingestion.ingest_url_batch_task") as mock_task:
         response = client.post(
             "/api/v1/ingest/bulk",
             files={"file": ("urls.csv", csv_content, "text/csv")},
@@ -646,17 +650,18 @@ async def test_create_bulk_import_queues_celery_tasks(client, db_session):
 
     assert response.status_code == 202
 
-    # Verify 3 tasks were queued
-    assert mock_task.delay.call_count == 3
+    # Verify the 3 URLs were split into batches of 2
+    assert mock_task.delay.call_count == 2
+    jobs = [job for call in mock_task.delay.call_args_list for job in call.kwargs["jobs"]]
+    assert [len(call.kwargs["jobs"]) for call in mock_task.delay.call_args_list] == [2, 1]
 
-    # Verify each call has job_id and url
-    for call in mock_task.delay.call_args_list:
-        assert "job_id" in call.kwargs
-        assert "url" in call.kwargs
+    # Verify each job has job_id and url
+    for job in jobs:
         # Verify job_id is valid UUID string
-        UUID(call.kwargs["job_id"])
+        UUID(job["job_id"])
         # Verify URL is valid
-        assert call.kwargs["url"].startswith("https://www.ebay.com/itm/")
+        assert job["url"].startswith("https://www.ebay.com/itm/")
+    assert len({job["job_id"] for job in jobs}) == 3
 
 
 def test_create_bulk_import_no_valid_urls(client):
@@ -183,7 +183,7 @@ async def test_bulk_import_complete_flow(client, db_session, monkeypatch):
     """
     csv_content = b"url\nhttps://www.ebay.com/itm/111\nhttps://www.ebay.com/itm/222"
 
-    with patch("dealbrain_api.api.ingestion.ingest_url_task"):
+    with patch("dealbrain_api.api.ingestion.ingest_url_batch_task"):
         response = client.post(
             "/api/v1/ingest/bulk",
             files={"file": ("urls.csv", csv_content, "text/csv")},
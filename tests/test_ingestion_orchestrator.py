@@ -162,6 +162,125 @@ async def test_ingest_duplicate_listing_updates(db_session, mock_normalized_data
     assert existing.last_seen_at is not None
 
 
+@pytest.mark.asyncio
+async def test_ingest_urls_resolves_duplicates_once_per_batch(db_session, mock_normalized_data):
+    """Test batch ingestion dedups with one lookup and merges repeats within the batch."""
+    service = IngestionService(db_session)
+    extracted = {
+        "https://ebay.com/itm/123": mock_normalized_data,
+        # Same eBay item relisted under another URL
+        "https://ebay.com/itm/123?var=2": mock_normalized_data.model_copy(
+            update={"price": Decimal("579.99")}
+        ),
+        "https://ebay.com/itm/456": mock_normalized_data.model_copy(
+            update={"title": "Office PC", "vendor_item_id": "456456456456"}
+        ),
+    }
+
+    async def fake_extract(url):
+        if url not in extracted:
+            raise AdapterException(AdapterError.TIMEOUT, "Request timed out")
+        return extracted[url], "ebay"
+
+    dedup = service.dedup_service
+    with (
+        patch.object(service.router, "extract", side_effect=fake_extract),
+        patch.object(
+            dedup, "find_existing_listings", wraps=dedup.find_existing_listings
+        ) as dedup_spy,
+    ):
+        results = await service.ingest_urls([*extracted, "https://ebay.com/itm/789"])
+
+    assert dedup_spy.await_count == 1
+    assert list(results) == [*extracted, "https://ebay.com/itm/789"]
+    assert [result.status for result in results.values()] == [
+        "created",
+        "updated",
+        "created",
+        "failed",
+    ]
+    first, relisted, other, failed = results.values()
+    assert relisted.listing_id == first.listing_id
+    assert relisted.dedup_result.batch_duplicate_of == "https://ebay.com/itm/123"
+    assert other.listing_id != first.listing_id
+    assert "timed out" in failed.error
+
+    listings = (await db_session.execute(select(Listing))).scalars().all()
+    assert len(listings) == 2
+    assert next(listing for listing in listings if listing.id == first.listing_id).price_usd == (
+        579.99
+    )
+
+
+@pytest.mark.asyncio
+async def test_ingest_urls_rolls_back_only_the_failing_url(db_session, mock_normalized_data):
+    """Test a write error on one URL leaves the rest of the batch committable."""
+    service = IngestionService(db_session)
+    extracted = {
+        "https://ebay.com/itm/123": mock_normalized_data,
+        "https://ebay.com/itm/456": mock_normalized_data.model_copy(
+            update={"title": "Office PC", "vendor_item_id": "456456456456"}
+        ),
+    }
+    store_raw_payload = service._store_raw_payload
+
+    async def failing_store(listing, adapter_name, normalized):
+        if listing.title == "Office PC":
+            # The listing row is already flushed; a NOT NULL violation breaks the flush
+            db_session.add(RawPayload(listing_id=listing.id, adapter=adapter_name))
+            await db_session.flush()
+        await store_raw_payload(listing, adapter_name, normalized)
+
+    with (
+        patch.object(service.router, "extract", side_effect=lambda url: (extracted[url], "ebay")),
+        patch.object(service, "_store_raw_payload", side_effect=failing_store),
+    ):
+        results = await service.ingest_urls(list(extracted))
+    await db_session.commit()
+
+    assert [result.status for result in results.values()] == ["created", "failed"]
+    assert "NOT NULL" in results["https://ebay.com/itm/456"].error
+    listings = (await db_session.execute(select(Listing.title))).scalars().all()
+    assert listings == ["Gaming PC Intel i7"]
+    payloads = (await db_session.execute(select(RawPayload))).scalars().all()
+    assert [payload.listing_id for payload in payloads] == [
+        results["https://ebay.com/itm/123"].listing_id
+    ]
+    assert [event.listing_id for event in service.event_service.get_events()] == [
+        results["https://ebay.com/itm/123"].listing_id
+    ]
+
+
+@pytest.mark.asyncio
+async def test_ingest_urls_reports_near_duplicates(db_session):
+    """Test a new listing similar to an existing one is flagged, not merged."""
+    existing = Listing(
+        title="Dell OptiPlex 7080 Micro i7-10700T 16GB 512GB SSD",
+        price_usd=349.0,
+        condition="used",
+        marketplace="other",
+    )
+    db_session.add(existing)
+    await db_session.commit()
+
+    service = IngestionService(db_session)
+    relisted = NormalizedListingSchema(
+        title="Dell OptiPlex 7080 Micro i7-10700T 16GB 512GB SSD Win11",
+        price=Decimal("339.00"),
+        currency="USD",
+        condition="used",
+        marketplace="other",
+        seller="another-seller",
+    )
+
+    with patch.object(service.router, "extract", return_value=(relisted, "jsonld")):
+        result = await service.ingest_single_url("https://shop.example.com/optiplex-7080")
+
+    assert result.status == "created"
+    assert result.listing_id != existing.id
+    assert [match.listing_id for match in result.near_duplicates] == [existing.id]
+
+
 @pytest.mark.asyncio
 async def test_ingest_normalizes_data(db_session):
     """Test that data normalization is applied during ingestion."""
@@ -0,0 +1,283 @@
+"""Tests for coalesced bulk ingestion progress."""
+
+from __future__ import annotations
+
+from contextlib import asynccontextmanager
+from decimal import Decimal
+from unittest.mock import AsyncMock, patch
+from uuid import UUID, uuid4
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+try:  # pragma: no cover - optional dependency check
+    import aiosqlite  # type: ignore  # noqa: F401
+except ModuleNotFoundError:  # pragma: no cover - skip when unavailable
+    aiosqlite = None
+
+from dealbrain_api.db import Base
+from dealbrain_api.events import EventType
+from dealbrain_api.models.core import ImportSession
+from dealbrain_api.services.ingestion import IngestionResult, progress
+from dealbrain_api.services.ingestion.progress import BulkProgressAggregator
+from dealbrain_api.tasks.ingestion import _ingest_url_async, _ingest_url_batch_async
+from dealbrain_core.enums import SourceType
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest_asyncio.fixture
+async def db_session(monkeypatch: pytest.MonkeyPatch, tmp_path):
+    """File database shared by the aggregator and the task.
+
+    Unlike ``:memory:``, every session gets its own connection, so a child's
+    open transaction is isolated from the aggregator as it is on PostgreSQL.
+    """
+    if aiosqlite is None:
+        pytest.skip("aiosqlite is not installed; skipping ingestion progress tests")
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'progress.db'}")
+    session_factory = async_sessionmaker(engine, expire_on_commit=False)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    @asynccontextmanager
+    async def _session_scope_override():
+        session = session_factory()
+        try:
+            yield session
+        finally:
+            await session.close()
+
+    monkeypatch.setattr(progress, "session_scope", _session_scope_override)
+    monkeypatch.setattr("dealbrain_api.tasks.ingestion.session_scope", _session_scope_override)
+
+    session = session_factory()
+    try:
+        yield session
+    finally:
+        await session.close()
+        await engine.dispose()
+
+
+async def _bulk_children(
+    session: AsyncSession, bulk_job_id: str, count: int, *, status: str = "queued"
+) -> list[str]:
+    children = [
+        ImportSession(
+            id=uuid4(),
+            filename=f"bulk_{n}",
+            upload_path=f"bulk_upload_{n}",
+            status=status,
+            progress_pct=100 if status == "complete" else 0,
+            source_type=SourceType.URL_BULK.value,
+            url=f"https://example.com/{n}",
+            conflicts_json={"parent_job_id": bulk_job_id},
+        )
+        for n in range(count)
+    ]
+    session.add_all(children)
+    await session.commit()
+    return [str(child.id) for child in children]
+
+
+@pytest.mark.asyncio
+async def test_reports_are_coalesced_per_interval(db_session: AsyncSession):
+    bulk_job_id = str(uuid4())
+    first, second = await _bulk_children(db_session, bulk_job_id, 2)
+    # Finished by another worker; only its committed row is visible here
+    await _bulk_children(db_session, bulk_job_id, 1, status="complete")
+    clock = _Clock()
+    aggregator = BulkProgressAggregator(interval_s=2.0, clock=clock)
+
+    with patch.object(progress, "publish_event", new_callable=AsyncMock) as publish:
+        # The first report emits; the rest of the interval is buffered
+        assert await aggregator.report(bulk_job_id=bulk_job_id, job_id=first, progress_pct=10)
+        for pct in (30, 60, 80):
+            assert not await aggregator.report(
+                bulk_job_id=bulk_job_id, job_id=first, progress_pct=pct
+            )
+        assert not await aggregator.report(bulk_job_id=bulk_job_id, job_id=second, progress_pct=30)
+        assert publish.await_count == 1
+
+        clock.now += 2.0
+        assert await aggregator.report(
+            bulk_job_id=bulk_job_id, job_id=first, progress_pct=100, status="complete"
+        )
+
+    assert publish.await_count == 2
+    event_type, data = publish.await_args.args
+    assert event_type == EventType.IMPORT_PROGRESS
+    assert data["job_id"] == bulk_job_id
+    # Buffered milestones replace the committed rows of this worker's children
+    assert data["progress_pct"] == 77
+    assert data["message"] == "2 of 3 URLs finished"
+    assert data["children"][second] == {"progress_pct": 30, "status": "running"}
+
+    # Child rows are only written by the tasks that own them
+    rows = {
+        str(row.id): row for row in (await db_session.execute(ImportSession.__table__.select()))
+    }
+    assert {
+        (rows[child_id].status, rows[child_id].progress_pct) for child_id in (first, second)
+    } == {("queued", 0)}
+
+    # Reported finished children are not carried into the next rollup
+    assert list(aggregator._jobs[bulk_job_id].children) == [second]
+
+
+@pytest.mark.asyncio
+async def test_report_does_not_wait_on_a_flushed_child_row(db_session: AsyncSession):
+    bulk_job_id = str(uuid4())
+    first, second = await _bulk_children(db_session, bulk_job_id, 2)
+    aggregator = BulkProgressAggregator(interval_s=2.0, clock=_Clock())
+
+    # The child task has flushed its own row, so its transaction holds the row lock
+    child_session = AsyncSession(db_session.bind)
+    try:
+        child = await child_session.get(ImportSession, UUID(first))
+        child.status = "running"
+        child.progress_pct = 60
+        await child_session.flush()
+
+        statements: list[str] = []
+
+        def _record(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        engine = db_session.bind.sync_engine
+        event.listen(engine, "before_cursor_execute", _record)
+        try:
+            with patch.object(progress, "publish_event", new_callable=AsyncMock) as publish:
+                assert await aggregator.report(
+                    bulk_job_id=bulk_job_id, job_id=first, progress_pct=60
+                )
+        finally:
+            event.remove(engine, "before_cursor_execute", _record)
+        # The roll-up only reads; a write would wait on the child's row lock
+        assert statements
+        assert not [statement for statement in statements if statement.startswith("UPDATE")]
+
+        await child_session.commit()
+    finally:
+        await child_session.close()
+
+    data = publish.await_args.args[1]
+    assert (data["progress_pct"], data["message"]) == (30, "0 of 2 URLs finished")
+    row = (
+        await db_session.execute(
+            ImportSession.__table__.select().where(ImportSession.id == UUID(first))
+        )
+    ).one()
+    assert (row.status, row.progress_pct) == ("running", 60)
+
+
+@pytest.mark.asyncio
+async def test_bulk_child_task_does_not_publish_per_milestone(
+    db_session: AsyncSession,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    bulk_job_id = str(uuid4())
+    (child_id,) = await _bulk_children(db_session, bulk_job_id, 1)
+    clock = _Clock()
+    monkeypatch.setattr(
+        "dealbrain_api.tasks.ingestion.bulk_progress",
+        BulkProgressAggregator(interval_s=60.0, clock=clock),
+    )
+    mock_result = IngestionResult(
+        success=True,
+        listing_id=1,
+        status="created",
+        provenance="jsonld",
+        quality="full",
+        url="https://example.com/0",
+        title="PC",
+        price=Decimal("399.99"),
+        vendor_item_id=None,
+        marketplace="other",
+    )
+
+    with (
+        patch("dealbrain_api.tasks.ingestion.IngestionService") as service_cls,
+        patch("dealbrain_api.tasks.ingestion.publish_event", new_callable=AsyncMock) as direct,
+        patch.object(progress, "publish_event", new_callable=AsyncMock) as rolled_up,
+    ):
+        service_cls.return_value.ingest_single_url = AsyncMock(return_value=mock_result)
+        result = await _ingest_url_async(job_id=child_id, url="https://example.com/0")
+
+    assert result["status"] == "complete"
+    direct.assert_not_awaited()
+    # The first milestone fell outside the interval; the rest are covered by the
+    # roll-up published after the commit, which sees the only child finished
+    assert rolled_up.await_count == 2
+    final = rolled_up.await_args.args[1]
+    assert (final["job_id"], final["status"], final["progress_pct"]) == (
+        bulk_job_id,
+        "complete",
+        100,
+    )
+
+    child = await db_session.get(ImportSession, UUID(child_id))
+    await db_session.refresh(child)
+    assert (child.status, child.progress_pct) == ("complete", 100)
+    assert child.conflicts_json["parent_job_id"] == bulk_job_id
+
+
+@pytest.mark.asyncio
+async def test_batch_publishes_final_rollup_after_commit(
+    db_session: AsyncSession,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    bulk_job_id = str(uuid4())
+    first, second = await _bulk_children(db_session, bulk_job_id, 2)
+    monkeypatch.setattr(
+        "dealbrain_api.tasks.ingestion.bulk_progress",
+        BulkProgressAggregator(interval_s=60.0, clock=_Clock()),
+    )
+    results = {
+        "https://example.com/0": IngestionResult(
+            success=True,
+            listing_id=1,
+            status="created",
+            provenance="jsonld",
+            quality="full",
+            url="https://example.com/0",
+        ),
+        "https://example.com/1": IngestionResult(
+            success=False,
+            listing_id=None,
+            status="failed",
+            provenance=None,
+            quality=None,
+            url="https://example.com/1",
+            error="Timed out",
+        ),
+    }
+
+    with (
+        patch("dealbrain_api.tasks.ingestion.IngestionService") as service_cls,
+        patch.object(progress, "publish_event", new_callable=AsyncMock) as rolled_up,
+    ):
+        service_cls.return_value.ingest_urls = AsyncMock(return_value=results)
+        await _ingest_url_batch_async(
+            jobs=[
+                {"job_id": first, "url": "https://example.com/0"},
+                {"job_id": second, "url": "https://example.com/1"},
+            ]
+        )
+
+    # Both children finished inside the interval; only the post-commit flush reports them
+    assert rolled_up.await_count == 2
+    final = rolled_up.await_args.args[1]
+    assert (final["status"], final["progress_pct"], final["message"]) == (
+        "partial",
+        100,
+        "2 of 2 URLs finished",
+    )
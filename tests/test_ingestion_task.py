@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 from contextlib import asynccontextmanager
 from datetime import datetime, timedelta
 from decimal import Decimal
@@ -17,14 +18,18 @@ try:  # pragma: no cover - optional dependency check
 except ModuleNotFoundError:  # pragma: no cover - skip when unavailable
     aiosqlite = None
 
+from dealbrain_api.adapters.browser_pool import BrowserPool
 from dealbrain_api.db import Base
 from dealbrain_api.events import EventType
 from dealbrain_api.models.core import ImportSession, Listing, RawPayload
 from dealbrain_api.services.ingestion import IngestionResult
+from dealbrain_api.services.near_duplicates import NearDuplicate
 from dealbrain_api.tasks.ingestion import (
     _cleanup_expired_payloads_async,
     _ingest_url_async,
+    _ingest_url_batch_async,
     cleanup_expired_payloads_task,
+    ingest_url_batch_task,
 )
 from dealbrain_core.enums import Condition, SourceType
 
@@ -96,10 +101,10 @@ async def test_successful_ingestion_complete_quality(
         marketplace="ebay",
     )
 
-    with patch("dealbrain_api.tasks.ingestion.IngestionService") as MockService:
+    with patch("dealbrain_api.tasks.ingestion.IngestionService") as mock_service:
         mock_service_instance = AsyncMock()
         mock_service_instance.ingest_single_url.return_value = mock_result
-        MockService.return_value = mock_service_instance
+        mock_service.return_value = mock_service_instance
 
         # Execute task async function directly
         result = await _ingest_url_async(
@@ -172,10 +177,10 @@ async def test_successful_ingestion_partial_quality(
         marketplace="other",
     )
 
-    with patch("dealbrain_api.tasks.ingestion.IngestionService") as MockService:
+    with patch("dealbrain_api.tasks.ingestion.IngestionService") as mock_service:
         mock_service_instance = AsyncMock()
         mock_service_instance.ingest_single_url.return_value = mock_result
-        MockService.return_value = mock_service_instance
+        mock_service.return_value = mock_service_instance
 
         # Execute task async function directly
         result = await _ingest_url_async(
@@ -239,10 +244,10 @@ async def test_failed_ingestion(
         error="Adapter not found for domain",
     )
 
-    with patch("dealbrain_api.tasks.ingestion.IngestionService") as MockService:
+    with patch("dealbrain_api.tasks.ingestion.IngestionService") as mock_service:
         mock_service_instance = AsyncMock()
         mock_service_instance.ingest_single_url.return_value = mock_result
-        MockService.return_value = mock_service_instance
+        mock_service.return_value = mock_service_instance
 
         # Execute task
         result = await _ingest_url_async(
@@ -329,10 +334,10 @@ async def test_transient_error_propagates(
     await db_session.commit()
 
     # Mock IngestionService to raise TimeoutError
-    with patch("dealbrain_api.tasks.ingestion.IngestionService") as MockService:
+    with patch("dealbrain_api.tasks.ingestion.IngestionService") as mock_service:
         mock_service_instance = AsyncMock()
         mock_service_instance.ingest_single_url.side_effect = TimeoutError("Request timed out")
-        MockService.return_value = mock_service_instance
+        mock_service.return_value = mock_service_instance
 
         # Execute task async function - should propagate exception
         with pytest.raises(TimeoutError, match="Request timed out"):
@@ -377,10 +382,10 @@ async def test_permanent_error_propagates(
     await db_session.commit()
 
     # Mock IngestionService to raise ValueError (permanent error)
-    with patch("dealbrain_api.tasks.ingestion.IngestionService") as MockService:
+    with patch("dealbrain_api.tasks.ingestion.IngestionService") as mock_service:
         mock_service_instance = AsyncMock()
         mock_service_instance.ingest_single_url.side_effect = ValueError("Invalid URL format")
-        MockService.return_value = mock_service_instance
+        mock_service.return_value = mock_service_instance
 
         # Execute task async function - should propagate exception
         with pytest.raises(ValueError, match="Invalid URL format"):
@@ -438,10 +443,10 @@ async def test_status_transition_queued_to_running(
         marketplace="ebay",
     )
 
-    with patch("dealbrain_api.tasks.ingestion.IngestionService") as MockService:
+    with patch("dealbrain_api.tasks.ingestion.IngestionService") as mock_service:
         mock_service_instance = AsyncMock()
         mock_service_instance.ingest_single_url.return_value = mock_result
-        MockService.return_value = mock_service_instance
+        mock_service.return_value = mock_service_instance
 
         # Execute task
         await _ingest_url_async(
@@ -502,10 +507,10 @@ async def test_result_storage_in_conflicts_json(
         marketplace="ebay",
     )
 
-    with patch("dealbrain_api.tasks.ingestion.IngestionService") as MockService:
+    with patch("dealbrain_api.tasks.ingestion.IngestionService") as mock_service:
         mock_service_instance = AsyncMock()
         mock_service_instance.ingest_single_url.return_value = mock_result
-        MockService.return_value = mock_service_instance
+        mock_service.return_value = mock_service_instance
 
         # Execute task
         await _ingest_url_async(
@@ -526,6 +531,102 @@ async def test_result_storage_in_conflicts_json(
     assert stored["marketplace"] == "ebay"
 
 
+@pytest.mark.asyncio
+async def test_batch_ingestion_records_each_child(
+    db_session: AsyncSession,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    """Batch task should ingest unfinished children together and record each outcome."""
+    session_factory = async_sessionmaker(db_session.bind, expire_on_commit=False)
+
+    @asynccontextmanager
+    async def _session_scope_override():
+        session = session_factory()
+        try:
+            yield session
+        finally:
+            await session.close()
+
+    monkeypatch.setattr("dealbrain_api.tasks.ingestion.session_scope", _session_scope_override)
+    monkeypatch.setattr("dealbrain_api.tasks.ingestion.bulk_progress", AsyncMock())
+
+    bulk_job_id = str(uuid4())
+    urls = ["https://ebay.com/itm/1", "https://ebay.com/itm/2", "https://ebay.com/itm/3"]
+    children = [
+        ImportSession(
+            id=uuid4(),
+            filename=f"url_import_{index}",
+            upload_path=url,
+            status=status,
+            source_type=SourceType.URL_SINGLE.value,
+            url=url,
+            conflicts_json={"parent_job_id": bulk_job_id},
+        )
+        # The third child was finished by an earlier attempt of the batch
+        for index, (url, status) in enumerate(
+            zip(urls, ["queued", "queued", "complete"], strict=True)
+        )
+    ]
+    db_session.add_all(children)
+    await db_session.commit()
+
+    ingest_results = {
+        urls[0]: IngestionResult(
+            success=True,
+            listing_id=7,
+            status="created",
+            provenance="ebay_api",
+            quality="full",
+            url=urls[0],
+            title="Gaming PC",
+            price=Decimal("599.99"),
+            near_duplicates=[NearDuplicate(3, 0.91234, 0.9, 0.95)],
+        ),
+        urls[1]: IngestionResult(
+            success=False,
+            listing_id=None,
+            status="failed",
+            provenance="unknown",
+            quality="partial",
+            url=urls[1],
+            error="Request timed out",
+        ),
+    }
+
+    with patch("dealbrain_api.tasks.ingestion.IngestionService") as mock_service:
+        mock_service_instance = AsyncMock()
+        mock_service_instance.ingest_urls.return_value = ingest_results
+        mock_service.return_value = mock_service_instance
+
+        result = await _ingest_url_batch_async(
+            jobs=[{"job_id": str(child.id), "url": child.url} for child in children]
+        )
+
+    mock_service_instance.ingest_urls.assert_awaited_once_with(urls[:2])
+    assert result["skipped"] == 1
+    assert result["results"][str(children[0].id)]["status"] == "complete"
+    assert result["results"][str(children[1].id)]["status"] == "failed"
+
+    for child in children:
+        await db_session.refresh(child)
+    assert [child.status for child in children] == ["complete", "failed", "complete"]
+    assert children[0].conflicts_json == {
+        "parent_job_id": bulk_job_id,
+        "listing_id": 7,
+        "provenance": "ebay_api",
+        "quality": "full",
+        "title": "Gaming PC",
+        "price": 599.99,
+        "vendor_item_id": None,
+        "marketplace": "other",
+        "near_duplicates": [{"listing_id": 3, "score": 0.912}],
+    }
+    assert children[1].conflicts_json == {
+        "parent_job_id": bulk_job_id,
+        "error": "Request timed out",
+    }
+
+
 # ========================================
 # Raw Payload Cleanup Tests
 # ========================================
@@ -774,6 +875,31 @@ def test_cleanup_task_error_handling(monkeypatch: pytest.MonkeyPatch):
     assert "Database connection failed" in result["error"]
 
 
+def test_batch_tasks_keep_browser_pool_on_persistent_loop(
+    monkeypatch: pytest.MonkeyPatch,
+):
+    """Tasks share the worker's loop, so the pool's browsers survive between them."""
+    pool = BrowserPool.__new__(BrowserPool)
+    pool._initialized = True
+    pool.close_all = AsyncMock()
+    monkeypatch.setattr(BrowserPool, "_instance", pool)
+    monkeypatch.setattr("dealbrain_api.tasks.ingestion.dispose_engine", AsyncMock())
+    loops = []
+
+    async def _batch(*, jobs):
+        loops.append(asyncio.get_running_loop())
+        return {"results": {}, "skipped": 0}
+
+    monkeypatch.setattr("dealbrain_api.tasks.ingestion._ingest_url_batch_async", _batch)
+
+    results = [ingest_url_batch_task(jobs=[]) for _ in range(2)]
+
+    assert results == [{"results": {}, "skipped": 0}] * 2
+    assert loops[0] is loops[1]
+    assert not loops[0].is_closed()
+    pool.close_all.assert_not_awaited()
+
+
 @pytest.mark.asyncio
 async def test_cleanup_respects_ttl_boundary(
     db_session: AsyncSession,
@@ -893,10 +1019,10 @@ async def test_ingestion_task_updates_progress(
         marketplace="ebay",
     )
 
-    with patch("dealbrain_api.tasks.ingestion.IngestionService") as MockService:
+    with patch("dealbrain_api.tasks.ingestion.IngestionService") as mock_service:
         mock_service_instance = AsyncMock()
         mock_service_instance.ingest_single_url.return_value = mock_result
-        MockService.return_value = mock_service_instance
+        mock_service.return_value = mock_service_instance
 
         # Execute task
         result = await _ingest_url_async(
@@ -957,10 +1083,10 @@ async def test_ingestion_task_sets_progress_on_failure(
         error="Adapter not found",
     )
 
-    with patch("dealbrain_api.tasks.ingestion.IngestionService") as MockService:
+    with patch("dealbrain_api.tasks.ingestion.IngestionService") as mock_service:
         mock_service_instance = AsyncMock()
         mock_service_instance.ingest_single_url.return_value = mock_result
-        MockService.return_value = mock_service_instance
+        mock_service.return_value = mock_service_instance
 
         # Execute task
         result = await _ingest_url_async(
@@ -1010,10 +1136,10 @@ async def test_ingestion_task_sets_progress_on_exception(
     await db_session.commit()
 
     # Mock adapter to raise exception at 30% progress
-    with patch("dealbrain_api.tasks.ingestion.IngestionService") as MockService:
+    with patch("dealbrain_api.tasks.ingestion.IngestionService") as mock_service:
         mock_service_instance = AsyncMock()
         mock_service_instance.ingest_single_url.side_effect = Exception("Network error")
-        MockService.return_value = mock_service_instance
+        mock_service.return_value = mock_service_instance
 
         # Execute task (should catch exception)
         with pytest.raises(Exception, match="Network error"):
@@ -1095,10 +1221,10 @@ async def test_ingestion_task_publishes_sse_progress_events(
         marketplace="ebay",
     )
 
-    with patch("dealbrain_api.tasks.ingestion.IngestionService") as MockService:
+    with patch("dealbrain_api.tasks.ingestion.IngestionService") as mock_service:
         mock_service_instance = AsyncMock()
         mock_service_instance.ingest_single_url.return_value = mock_result
-        MockService.return_value = mock_service_instance
+        mock_service.return_value = mock_service_instance
 
         # Execute task
         await _ingest_url_async(
@@ -1195,10 +1321,10 @@ async def test_ingestion_task_publishes_sse_event_on_failure(
         error="Adapter not found",
     )
 
-    with patch("dealbrain_api.tasks.ingestion.IngestionService") as MockService:
+    with patch("dealbrain_api.tasks.ingestion.IngestionService") as mock_service:
         mock_service_instance = AsyncMock()
         mock_service_instance.ingest_single_url.return_value = mock_result
-        MockService.return_value = mock_service_instance
+        mock_service.return_value = mock_service_instance
 
         # Execute task
         await _ingest_url_async(
@@ -1272,10 +1398,10 @@ async def test_ingestion_task_publishes_sse_event_on_exception(
     await db_session.commit()
 
     # Mock adapter to raise exception
-    with patch("dealbrain_api.tasks.ingestion.IngestionService") as MockService:
+    with patch("dealbrain_api.tasks.ingestion.IngestionService") as mock_service:
         mock_service_instance = AsyncMock()
         mock_service_instance.ingest_single_url.side_effect = Exception("Network error")
-        MockService.return_value = mock_service_instance
+        mock_service.return_value = mock_service_instance
 
         # Execute task (should catch exception)
         with pytest.raises(Exception, match="Network error"):
@@ -1714,3 +1714,66 @@ class TestJsonLdAdapterHtmlElementFallback:
         assert result.quality == "partial"
         assert result.missing_fields == ["price"]
         assert result.extraction_metadata["price"] == "extraction_failed"
+
+
+class TestJsonLdAdapterSingleParse:
+    """Test that a page is parsed once and extraction stops at the first Product."""
+
+    @pytest.fixture
+    def adapter(self):
+        """Create JsonLdAdapter instance."""
+        return JsonLdAdapter()
+
+    @pytest.mark.asyncio
+    async def test_jsonld_product_skips_other_syntaxes_and_fallbacks(self, adapter):
+        """A JSON-LD Product short-circuits Microdata/RDFa and the soup fallbacks."""
+        html = """
+        <html>
+        <head>
+            <script type="application/ld+json">
+            {"@context": "https://schema.org", "@type": "Product", "name": "Mini PC",
+             "offers": {"@type": "Offer", "price": "249.00", "priceCurrency": "USD"}}
+            </script>
+        </head>
+        <body><div itemscope itemtype="https://schema.org/Product"></div></body>
+        </html>
+        """
+
+        with (
+            patch.object(adapter, "_fetch_html", return_value=html),
+            patch("dealbrain_api.adapters.jsonld.document.parse_soup") as mock_soup,
+            patch(
+                "dealbrain_api.adapters.jsonld.extractors.structured_data.MicrodataExtractor"
+            ) as mock_microdata,
+            patch(
+                "dealbrain_api.adapters.jsonld.extractors.structured_data.RDFaExtractor"
+            ) as mock_rdfa,
+        ):
+            result = await adapter.extract("https://example.com/product")
+
+        assert result.title == "Mini PC"
+        assert result.price == Decimal("249.00")
+        mock_soup.assert_not_called()
+        mock_microdata.assert_not_called()
+        mock_rdfa.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_fallbacks_share_one_soup(self, adapter):
+        """Meta tag and HTML element fallbacks reuse the same parsed soup."""
+        html = """
+        <html>
+        <head><title>Page Title</title></head>
+        <body><p>No structured data here</p></body>
+        </html>
+        """
+
+        from dealbrain_api.adapters.jsonld import document
+
+        with (
+            patch.object(adapter, "_fetch_html", return_value=html),
+            patch.object(document, "parse_soup", wraps=document.parse_soup) as mock_soup,
+        ):
+            result = await adapter.extract("https://example.com/product")
+
+        assert result.title == "Page Title"
+        assert mock_soup.call_count == 1
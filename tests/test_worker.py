@@ -0,0 +1,61 @@
+"""Tests for the Celery worker process hooks."""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from dealbrain_api import worker
+from dealbrain_api.adapters.browser_pool import BrowserPool
+
+
+def _settings(warm_up: bool) -> Mock:
+    settings = Mock()
+    settings.playwright.enabled = True
+    settings.playwright.warm_up_on_startup = warm_up
+    return settings
+
+
+def test_process_init_warms_pool_on_the_worker_loop(monkeypatch: pytest.MonkeyPatch):
+    warmed_on = []
+    pool = Mock()
+
+    async def _warm_up():
+        warmed_on.append(asyncio.get_running_loop())
+        return {"healthy": True}
+
+    pool.warm_up = _warm_up
+    monkeypatch.setattr(worker, "get_settings", lambda: _settings(warm_up=True))
+    monkeypatch.setattr(BrowserPool, "shared", classmethod(lambda cls: pool))
+
+    worker._init_worker_process()
+    try:
+        # Tasks then run on the loop the browsers were launched on
+        assert warmed_on == [worker.worker_loop()]
+    finally:
+        worker._shutdown_worker_process()
+
+
+def test_process_init_skips_warm_up_when_disabled(monkeypatch: pytest.MonkeyPatch):
+    shared = Mock()
+    monkeypatch.setattr(worker, "get_settings", lambda: _settings(warm_up=False))
+    monkeypatch.setattr(BrowserPool, "shared", shared)
+
+    worker._init_worker_process()
+
+    shared.assert_not_called()
+
+
+def test_process_shutdown_closes_pool_and_loop(monkeypatch: pytest.MonkeyPatch):
+    pool = BrowserPool.__new__(BrowserPool)
+    pool._initialized = True
+    pool.close_all = AsyncMock()
+    monkeypatch.setattr(BrowserPool, "_instance", pool)
+    loop = worker.worker_loop()
+
+    worker._shutdown_worker_process()
+
+    pool.close_all.assert_awaited_once()
+    assert loop.is_closed()